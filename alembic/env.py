@@ -12,6 +12,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 # Import Base and models so metadata is available to Alembic
 from src.infrastructure.db import models  # noqa: F401,E402
 from src.infrastructure.db.base import Base  # noqa: E402
+from src.infrastructure.db.schema_registry import invalidate_schema_cache  # noqa: E402
 
 # this is the Alembic Config object, which provides access to the values
 # within the .ini file in use.
@@ -62,6 +63,8 @@ def run_migrations_online() -> None:
         with context.begin_transaction():
             context.run_migrations()
         connection.commit()
+    # Drop columns cached by engines on this database when migrating in-process (tests)
+    invalidate_schema_cache(connectable)
 
 
 if context.is_offline_mode():
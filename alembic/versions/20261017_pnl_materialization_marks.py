@@ -0,0 +1,44 @@
+"""Add pnl_materialization_marks (incremental pnl_daily state per user and trade mode).
+
+Revision ID: 20261017_pnl_marks
+Revises: 20260626_add_max_order_value
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20261017_pnl_marks"
+down_revision = "20260626_add_max_order_value"
+branch_labels = None
+depends_on = None
+
+_TABLE = "pnl_materialization_marks"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if _TABLE in inspector.get_table_names():
+        return
+    op.create_table(
+        _TABLE,
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("trade_mode", sa.String(16), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("through_date", sa.Date(), nullable=False),
+        sa.Column("as_of", sa.DateTime(), nullable=False),
+        sa.Column("closed_positions", sa.JSON(), nullable=False),
+        sa.UniqueConstraint("user_id", "trade_mode", name="uq_pnl_materialization_marks_user_mode"),
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    if _TABLE in inspector.get_table_names():
+        op.drop_table(_TABLE)
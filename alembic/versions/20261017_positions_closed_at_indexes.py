@@ -0,0 +1,46 @@
+"""Add (user_id, closed_at) and (user_id, symbol, closed_at) indexes to positions.
+
+Closed-trade exports and realized P&L filter positions by user and a closed_at range;
+open-position lookups filter by user, symbol and closed_at IS NULL.
+
+Revision ID: 20261017_positions_closed_idx
+Revises: 20261017_pnl_marks
+Create Date: 2026-10-17
+"""
+
+from sqlalchemy import inspect
+
+from alembic import op
+
+revision = "20261017_positions_closed_idx"
+down_revision = "20261017_pnl_marks"
+branch_labels = None
+depends_on = None
+
+_TABLE = "positions"
+_INDEXES = {
+    "ix_positions_user_closed_at": ["user_id", "closed_at"],
+    "ix_positions_user_symbol_closed_at": ["user_id", "symbol", "closed_at"],
+}
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    if _TABLE not in inspector.get_table_names():
+        return
+    existing = {idx["name"] for idx in inspector.get_indexes(_TABLE)}
+    for name, columns in _INDEXES.items():
+        if name not in existing:
+            op.create_index(name, _TABLE, columns, unique=False)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = inspect(conn)
+    if _TABLE not in inspector.get_table_names():
+        return
+    existing = {idx["name"] for idx in inspector.get_indexes(_TABLE)}
+    for name in _INDEXES:
+        if name in existing:
+            op.drop_index(name, table_name=_TABLE)
@@ -5,12 +5,20 @@ This module implements the core backtesting logic for the trading strategy.
 It handles the day-by-day iteration, signal detection, and trade execution.
 """
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 from datetime import datetime, timedelta
 from typing import Optional, Dict, List, Tuple
 import warnings
 
+from .vectorized_kernel import (
+    KERNEL_VECTORIZED,
+    column_values,
+    next_row_positions,
+    resolve_kernel,
+)
+
 warnings.filterwarnings("ignore")
 
 from .backtest_config import BacktestConfig
@@ -420,6 +428,17 @@ class BacktestEngine:
         if pd.isna(rsi) or pd.isna(ema200):
             return False, "Missing indicator data"
 
+        return self._entry_decision(close_price, rsi, ema200)
+
+    def _entry_decision(self, close_price: float, rsi: float, ema200: float) -> tuple[bool, str]:
+        """
+        Entry and pyramiding rules shared by the iterrows and vectorized kernels
+
+        Updates the RSI level flags when a pyramiding entry is taken.
+
+        Returns:
+            Tuple of (should_enter, entry_reason)
+        """
         if not self.first_entry_made:
             # Adaptive initial entry condition based on EMA200 position
             # Above EMA200: RSI < 30, Below EMA200: RSI < 20 (more selective)
@@ -522,42 +541,51 @@ class BacktestEngine:
 
             next_day = next_day_data.index[0]
             entry_price = next_day_data.iloc[0]["Open"]
+            return self._open_position(next_day, entry_price, entry_reason)
 
-            if pd.isna(entry_price) or entry_price <= 0:
-                print(f"Invalid entry price {entry_price} on {next_day.date()}")
-                return False
+        except Exception as e:
+            print(f"Error executing trade: {e}")
+            return False
 
-            # Execute the trade
-            position = self.position_manager.add_position(
-                entry_date=next_day, entry_price=entry_price, entry_reason=entry_reason
-            )
+    def _open_position(self, next_day: pd.Timestamp, entry_price: float, entry_reason: str) -> bool:
+        """Add a position at ``entry_price`` on ``next_day`` (the execution session)"""
+        if pd.isna(entry_price) or entry_price <= 0:
+            print(f"Invalid entry price {entry_price} on {next_day.date()}")
+            return False
 
-            if position:
-                self.first_entry_made = True
-                if self.config.DETAILED_LOGGING:
-                    print(
-                        f"? TRADE EXECUTED: {next_day.date()} | "
-                        f"Price: {entry_price:.2f} | "
-                        f"Quantity: {position.quantity} | "
-                        f"Capital: {position.capital:.0f} | "
-                        f"Reason: {entry_reason}"
-                    )
-                return True
-            else:
-                print(f"Failed to add position on {next_day.date()}")
-                return False
+        # Execute the trade
+        position = self.position_manager.add_position(
+            entry_date=next_day, entry_price=entry_price, entry_reason=entry_reason
+        )
 
-        except Exception as e:
-            print(f"Error executing trade: {e}")
+        if position:
+            self.first_entry_made = True
+            if self.config.DETAILED_LOGGING:
+                print(
+                    f"? TRADE EXECUTED: {next_day.date()} | "
+                    f"Price: {entry_price:.2f} | "
+                    f"Quantity: {position.quantity} | "
+                    f"Capital: {position.capital:.0f} | "
+                    f"Reason: {entry_reason}"
+                )
+            return True
+        else:
+            print(f"Failed to add position on {next_day.date()}")
             return False
 
-    def run_backtest(self) -> Dict:
+    def run_backtest(self, kernel: str | None = None) -> dict:
         """
         Run the complete backtest
 
+        Args:
+            kernel: Daily loop implementation - "vectorized" (array kernel) or "iterrows"
+                    (row-by-row reference loop). Both produce identical trades.
+                    Default: settings.BACKTEST_KERNEL
+
         Returns:
             Dictionary containing backtest results
         """
+        kernel = resolve_kernel(kernel)
         print(f"Starting backtest for {self.symbol}")
         print(f"Period: {self.start_date.date()} to {self.end_date.date()}")
         print(f"Strategy: EMA200 + RSI10 with Pyramiding")
@@ -579,24 +607,27 @@ class BacktestEngine:
         trade_count = 0
 
         try:
-            # Get RSI column name from config
-            rsi_col = f"RSI{self.config.RSI_PERIOD}"
+            if kernel == KERNEL_VECTORIZED:
+                trade_count = self._run_vectorized_kernel()
+            else:
+                # Get RSI column name from config
+                rsi_col = f"RSI{self.config.RSI_PERIOD}"
 
-            # Iterate through each trading day
-            for current_date, row in self.data.iterrows():
+                # Iterate through each trading day
+                for current_date, row in self.data.iterrows():
 
-                # Update RSI state tracking
-                rsi_value = row[rsi_col] if rsi_col in row.index else row.get("RSI10")
-                if not pd.isna(rsi_value):
-                    self._update_rsi_state(rsi_value, current_date)
+                    # Update RSI state tracking
+                    rsi_value = row[rsi_col] if rsi_col in row.index else row.get("RSI10")
+                    if not pd.isna(rsi_value):
+                        self._update_rsi_state(rsi_value, current_date)
 
-                # Check entry conditions
-                should_enter, entry_reason = self._check_entry_conditions(row, current_date)
+                    # Check entry conditions
+                    should_enter, entry_reason = self._check_entry_conditions(row, current_date)
 
-                if should_enter:
-                    # Execute trade at next day's open
-                    if self._execute_trade(current_date, entry_reason):
-                        trade_count += 1
+                    if should_enter:
+                        # Execute trade at next day's open
+                        if self._execute_trade(current_date, entry_reason):
+                            trade_count += 1
 
             # Close all remaining positions at end of backtest period
             if self.position_manager.get_open_positions():
@@ -622,6 +653,74 @@ class BacktestEngine:
             print(f"Error during backtesting: {e}")
             raise
 
+    def _run_vectorized_kernel(self) -> int:
+        """
+        Array version of the daily loop in ``run_backtest``.
+
+        Every entry rule needs RSI below ``RSI_OVERSOLD_LEVEL_1`` with both indicators present,
+        and the only state change on other days is the first RSI-above-level-1 day that resets
+        the level flags. Both are boolean masks computed once with NumPy, so the Python loop
+        visits only the candidate rows and replays the first reset day before each of them
+        through ``_update_rsi_state``. Trades (and the RSI reset / level flags left on the
+        engine) are identical to the iterrows loop.
+
+        Returns:
+            Number of trades executed
+        """
+        rsi_col = f"RSI{self.config.RSI_PERIOD}"
+        dates = self.data.index
+        close = column_values(self.data, "Close")
+        rsi = column_values(self.data, rsi_col if rsi_col in self.data.columns else "RSI10")
+        ema200 = column_values(self.data, "EMA200")
+        open_prices = column_values(self.data, "Open")
+        next_rows = next_row_positions(dates)
+
+        # NaN compares False, so rows the iterrows loop skips drop out of both masks
+        with np.errstate(invalid="ignore"):
+            above_rows = np.flatnonzero(rsi > self.config.RSI_OVERSOLD_LEVEL_1)
+            candidates = np.flatnonzero(
+                (rsi < self.config.RSI_OVERSOLD_LEVEL_1) & ~np.isnan(ema200)
+            )
+
+        def replay_reset(start: int, stop: int) -> None:
+            # Only the first above-level day in a stretch can change the reset state
+            k = np.searchsorted(above_rows, start)
+            if k < len(above_rows) and above_rows[k] < stop:
+                j = above_rows[k]
+                self._update_rsi_state(rsi[j], dates[j])
+
+        trade_count = 0
+        start = 0
+        for i in candidates.tolist():
+            replay_reset(start, i)
+            start = i + 1
+            should_enter, entry_reason = self._entry_decision(close[i], rsi[i], ema200[i])
+            if should_enter and self._execute_trade_at(i, next_rows, open_prices, entry_reason):
+                trade_count += 1
+        replay_reset(start, len(rsi))
+
+        return trade_count
+
+    def _execute_trade_at(
+        self, signal_row: int, next_rows: np.ndarray, open_prices: np.ndarray, entry_reason: str
+    ) -> bool:
+        """``_execute_trade`` using the precomputed next-session row positions"""
+        try:
+            next_row = next_rows[signal_row]
+            if next_row >= len(self.data):
+                print(
+                    f"No next day data available for trade execution on "
+                    f"{self.data.index[signal_row].date()}"
+                )
+                return False
+            return self._open_position(
+                self.data.index[next_row], open_prices[next_row], entry_reason
+            )
+
+        except Exception as e:
+            print(f"Error executing trade: {e}")
+            return False
+
     def _generate_results(self) -> Dict:
         """Generate comprehensive backtest results"""
         try:
@@ -0,0 +1,59 @@
+"""
+Array helpers for the daily backtest loops.
+
+``BacktestEngine.run_backtest`` and ``integrated_backtest.run_integrated_backtest`` originally
+walked ``DataFrame.iterrows()``, building a ``Series`` per trading day and slicing the frame
+again to find the next session for every signal. The vectorized kernel extracts each column
+once, precomputes the signal masks and next-session positions with NumPy, and runs the same
+sequential pyramiding state machine over plain arrays. Trade lists are identical to the
+row-by-row loop, which stays selectable as ``kernel="iterrows"``.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from config.settings import BACKTEST_KERNEL
+
+KERNEL_VECTORIZED = "vectorized"
+KERNEL_ITERROWS = "iterrows"
+BACKTEST_KERNELS = (KERNEL_VECTORIZED, KERNEL_ITERROWS)
+
+
+def resolve_kernel(kernel: str | None = None) -> str:
+    """
+    Normalize a kernel name, defaulting to ``settings.BACKTEST_KERNEL``.
+
+    Raises:
+        ValueError: For an unknown kernel name
+    """
+    name = (kernel or BACKTEST_KERNEL).strip().lower()
+    if name not in BACKTEST_KERNELS:
+        raise ValueError(f"Unknown backtest kernel {kernel!r} (expected one of {BACKTEST_KERNELS})")
+    return name
+
+
+def column_values(frame: pd.DataFrame, column: str | None) -> np.ndarray:
+    """``frame[column]`` as float64 (all NaN when the column is missing)."""
+    if column is None or column not in frame.columns:
+        return np.full(len(frame), np.nan)
+    return pd.to_numeric(frame[column], errors="coerce").to_numpy(dtype="float64")
+
+
+def next_row_positions(index: pd.Index) -> np.ndarray:
+    """
+    Position of the first row whose index is strictly greater than each row's index.
+
+    Mirrors ``frame.loc[frame.index > date].iloc[0]``; ``len(index)`` marks "no next row".
+    """
+    values = index.to_numpy()
+    n = len(values)
+    if index.is_monotonic_increasing:
+        return np.searchsorted(values, values, side="right")
+    positions = np.full(n, n, dtype=np.int64)
+    for i in range(n):
+        later = np.flatnonzero(values > values[i])
+        if len(later):
+            positions[i] = later[0]
+    return positions
@@ -147,6 +147,88 @@ API_RATE_LIMIT_DELAY = float(os.getenv("API_RATE_LIMIT_DELAY", "1.0"))  # second
 # For ML training with >3000 stocks, set MAX_CONCURRENT_ANALYSES=10 in .env for faster processing
 MAX_CONCURRENT_ANALYSES = int(os.getenv("MAX_CONCURRENT_ANALYSES", "5"))  # concurrent analyses
 
+# Daily backtest loop implementation (BacktestEngine / integrated backtest)
+# vectorized = NumPy array kernel (default), iterrows = original row-by-row reference loop
+BACKTEST_KERNEL = os.getenv("BACKTEST_KERNEL", "vectorized").strip().lower()
+
+# Bulk backtest scoring (BacktestService.add_backtest_scores_to_results)
+# Worker processes for per-stock backtests: 1 = serial (default), 0 = one per CPU core.
+# Each worker has its own Yahoo rate limiter, so only raise this with OHLCV_CACHE_ENABLED
+# (the parent then prefetches every candidate's history before the pool starts)
+BACKTEST_SCORING_WORKERS = int(os.getenv("BACKTEST_SCORING_WORKERS", "1"))
+# Max seconds each stock's backtest may run in parallel mode
+BACKTEST_SCORING_TASK_TIMEOUT_S = float(os.getenv("BACKTEST_SCORING_TASK_TIMEOUT_S", "600"))
+# Warm the OHLCV DB cache for all candidates before starting the worker processes
+BACKTEST_SCORING_PREFETCH = os.getenv("BACKTEST_SCORING_PREFETCH", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+# multiprocessing start method for scoring workers (spawn: no forked DB connections/threads)
+BACKTEST_SCORING_START_METHOD = os.getenv("BACKTEST_SCORING_START_METHOD", "spawn").strip()
+
+# Paper trading store (PaperTradeStore): mutations are appended to journal.jsonl and folded
+# into the JSON snapshot files every N journal entries (and on save_all)
+PAPER_TRADE_JOURNAL_COMPACT_OPS = int(os.getenv("PAPER_TRADE_JOURNAL_COMPACT_OPS", "500"))
+# Root of the paper trading stores (user_<id>/ per user, data/ for the standalone broker);
+# read through paper_trading_dir() by the store, the adapters and the pnl router
+PAPER_TRADING_ROOT = os.getenv("PAPER_TRADING_ROOT", "paper_trading")
+
+# Multi-user trading: shared market data hub (daily OHLCV + RSI10 per ticker, all users)
+# Seconds between polls of a subscribed ticker; matches the 1-minute sell-monitor cycle
+MARKET_DATA_HUB_INTERVAL_S = float(os.getenv("MARKET_DATA_HUB_INTERVAL_S", "60"))
+# Poll interval during market hours: sell-monitor exit checks read the live bar from the hub,
+# so snapshots are never older than the 15s market-hours OHLCV cache TTL they replace
+MARKET_DATA_HUB_MARKET_HOURS_INTERVAL_S = float(
+    os.getenv("MARKET_DATA_HUB_MARKET_HOURS_INTERVAL_S", "15")
+)
+# Concurrent OHLCV fetches per hub poll (bounded pool; one fetch per ticker)
+MARKET_DATA_HUB_FETCH_WORKERS = int(os.getenv("MARKET_DATA_HUB_FETCH_WORKERS", "8"))
+
+# Kotak REST client: one pooled keep-alive HTTP session per user login
+KOTAK_HTTP_POOL_CONNECTIONS = int(os.getenv("KOTAK_HTTP_POOL_CONNECTIONS", "4"))
+# Keep-alive connections per host; bounds concurrent calls (AMO placement burst, snapshots)
+KOTAK_HTTP_POOL_MAXSIZE = int(os.getenv("KOTAK_HTTP_POOL_MAXSIZE", "16"))
+KOTAK_HTTP_TIMEOUT_S = float(os.getenv("KOTAK_HTTP_TIMEOUT_S", "10"))
+# Per endpoint group overrides (orders, reports, portfolio, limits, quotes), unset = default
+KOTAK_HTTP_TIMEOUTS = {
+    group: float(os.environ[f"KOTAK_HTTP_{group.upper()}_TIMEOUT_S"])
+    for group in ("orders", "reports", "portfolio", "limits", "quotes")
+    if os.getenv(f"KOTAK_HTTP_{group.upper()}_TIMEOUT_S")
+}
+
+# Broker snapshot per scheduler cycle: order book / holdings / positions are fetched at most
+# once per TTL while a cycle is open and shared by sell engine, order monitor and verifier
+BROKER_SNAPSHOT_TTL_S = float(os.getenv("BROKER_SNAPSHOT_TTL_S", "5"))
+
+# Share one analysis artifact per completed NSE session and analysis-config hash across users
+ANALYSIS_SHARED_ARTIFACTS = os.getenv("ANALYSIS_SHARED_ARTIFACTS", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+# Session directories under analysis_results/artifacts older than this are pruned
+ANALYSIS_ARTIFACT_RETENTION_DAYS = int(os.getenv("ANALYSIS_ARTIFACT_RETENTION_DAYS", "7"))
+# Streamed analysis rows are written to Signals in batches of ANALYSIS_STREAM_BATCH_SIZE, or
+# every ANALYSIS_STREAM_FLUSH_INTERVAL_S while trade_agent is still running
+ANALYSIS_STREAM_BATCH_SIZE = int(os.getenv("ANALYSIS_STREAM_BATCH_SIZE", "50"))
+ANALYSIS_STREAM_FLUSH_INTERVAL_S = float(os.getenv("ANALYSIS_STREAM_FLUSH_INTERVAL_S", "15"))
+
+# Per-user JSONL service logs: queue records to one background writer thread that writes
+# batches of USER_LOG_BATCH_SIZE or every USER_LOG_FLUSH_INTERVAL_S (false = write inline)
+USER_LOG_ASYNC = os.getenv("USER_LOG_ASYNC", "true").lower() in ("1", "true", "yes", "on")
+USER_LOG_FLUSH_INTERVAL_S = float(os.getenv("USER_LOG_FLUSH_INTERVAL_S", "0.5"))
+USER_LOG_BATCH_SIZE = int(os.getenv("USER_LOG_BATCH_SIZE", "256"))
+# Records queued beyond this are dropped (counted and reported in the log file)
+USER_LOG_QUEUE_SIZE = int(os.getenv("USER_LOG_QUEUE_SIZE", "10000"))
+
+# Nifty / India VIX close history behind MarketRegimeService (empty = keep in memory only)
+MARKET_REGIME_HISTORY_DIR = os.getenv("MARKET_REGIME_HISTORY_DIR", "data/market_regime")
+# Regime history is fetched from this date on the first lookup
+MARKET_REGIME_HISTORY_START = os.getenv("MARKET_REGIME_HISTORY_START", "2010-01-01")
+
 # Telegram API config (put real tokens in .env)
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "xxxxxx")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "xxxx")
@@ -189,6 +271,13 @@ OHLCV_LISTING_START_GAP_WINDOW_TRADING_DAYS = int(
     os.getenv("OHLCV_LISTING_START_GAP_WINDOW_TRADING_DAYS", "60")
 )
 OHLCV_LISTING_START_GAP_MIN_MISSING = int(os.getenv("OHLCV_LISTING_START_GAP_MIN_MISSING", "5"))
+# Build weekly bars by resampling the cached daily series; Yahoo 1wk becomes a fallback only
+OHLCV_WEEKLY_FROM_DAILY = os.getenv("OHLCV_WEEKLY_FROM_DAILY", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
 CHUNK_DELAY_SECONDS = float(os.getenv("CHUNK_DELAY_SECONDS", "30"))
 
 # Daily OHLCV source for price_cache gap-fill (1d interval): nse | yahoo | nse_with_yahoo_fallback
@@ -200,6 +289,9 @@ NSE_BHAVCOPY_USE_DISK_CACHE = os.getenv("NSE_BHAVCOPY_USE_DISK_CACHE", "true").l
     "yes",
     "on",
 )
+# Days buffered as small per-day files before they are compacted into the yearly
+# symbol-sorted columnar partitions of the on-disk bhavcopy store.
+NSE_BHAVCOPY_STORE_COMPACT_DAYS = int(os.getenv("NSE_BHAVCOPY_STORE_COMPACT_DAYS", "20"))
 NSE_BHAVCOPY_REQUEST_DELAY_S = float(os.getenv("NSE_BHAVCOPY_REQUEST_DELAY_S", "0.15"))
 NSE_BHAVCOPY_REQUEST_TIMEOUT_S = float(os.getenv("NSE_BHAVCOPY_REQUEST_TIMEOUT_S", "30"))
 # Earliest IST clock time to attempt same-day UDiFF bhavcopy ingest (HH:MM). NSE final
@@ -223,3 +315,8 @@ def daily_ohlcv_uses_nse() -> bool:
 def daily_ohlcv_yahoo_fallback() -> bool:
     """True when NSE gap-fill may fall back to Yahoo on failure."""
     return OHLCV_DAILY_SOURCE == "nse_with_yahoo_fallback"
+
+
+def paper_trading_dir(*parts: str) -> str:
+    """Directory under PAPER_TRADING_ROOT, e.g. ``paper_trading_dir(f"user_{user_id}")``."""
+    return os.path.join(PAPER_TRADING_ROOT, *parts)
@@ -456,6 +456,13 @@ def _with_backtest_mode(result: dict, mode: str) -> dict:
     return result
 
 
+def backtest_date_range(years_back: int) -> tuple[str, str]:
+    """``(start, end)`` YYYY-MM-DD window of a ``years_back`` integrated backtest ending today."""
+    end_date = ist_now_naive()
+    start_date = end_date - timedelta(days=years_back * 365)
+    return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+
+
 def _run_stock_backtest_impl(
     stock_symbol: str, years_back: int = 5, dip_mode: bool = False, config=None
 ) -> dict:
@@ -483,10 +490,7 @@ def _run_stock_backtest_impl(
         # Use integrated backtest
         try:
             # Calculate date range
-            end_date = ist_now_naive()
-            start_date = end_date - timedelta(days=years_back * 365)
-
-            date_range = (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"))
+            date_range = backtest_date_range(years_back)
 
             logger.info(f"Running {years_back}-year integrated backtest for {stock_symbol}")
 
@@ -581,7 +585,11 @@ def run_stock_backtest(
 
 
 def add_backtest_scores_to_results(
-    stock_results: list, years_back: int = 5, dip_mode: bool = False, config=None
+    stock_results: list,
+    years_back: int = 5,
+    dip_mode: bool = False,
+    config=None,
+    workers: int | None = None,
 ) -> list:
     """
     Add backtest scores to existing stock analysis results.
@@ -599,6 +607,9 @@ def add_backtest_scores_to_results(
         stock_results: List of stock analysis results
         years_back: Years of historical data to analyze
         dip_mode: Enable dip-buying mode
+        config: Strategy config for the backtests; a stock result's own ``_config`` wins
+        workers: Backtest worker processes (default settings.BACKTEST_SCORING_WORKERS;
+                 more than one runs the backtests in a process pool, results in input order)
 
     Returns:
         Enhanced stock results with backtest scores
@@ -615,6 +626,25 @@ def add_backtest_scores_to_results(
 
     logger.info(f"Adding backtest scores for {len(stock_results)} stocks...")
 
+    from services.backtest_pool import (  # noqa: PLC0415
+        BacktestTask,
+        resolve_backtest_workers,
+        run_backtests_parallel,
+    )
+
+    outcomes = None
+    workers = resolve_backtest_workers(workers)
+    if workers > 1 and len(stock_results) > 1:
+        outcomes = run_backtests_parallel(
+            [
+                BacktestTask(
+                    r.get("ticker", "Unknown"), years_back, dip_mode, r.get("_config") or config
+                )
+                for r in stock_results
+            ],
+            workers=workers,
+        )
+
     enhanced_results = []
 
     for i, stock_result in enumerate(stock_results, 1):
@@ -622,8 +652,17 @@ def add_backtest_scores_to_results(
             ticker = stock_result.get("ticker", "Unknown")
             logger.info(f"Processing {i}/{len(stock_results)}: {ticker}")
 
-            # Run backtest for this stock
-            backtest_data = _run_stock_backtest_impl(ticker, years_back, dip_mode, config)
+            # Run backtest for this stock (a per-stock _config overrides config, as in
+            # BacktestService)
+            if outcomes is None:
+                backtest_data = _run_stock_backtest_impl(
+                    ticker, years_back, dip_mode, stock_result.get("_config") or config
+                )
+            else:
+                outcome = outcomes[i - 1]
+                if outcome.error:
+                    raise RuntimeError(outcome.error)
+                backtest_data = outcome.result
 
             # Add backtest data to stock result
             stock_result["backtest"] = {
@@ -657,11 +696,11 @@ def add_backtest_scores_to_results(
             # Use configurable thresholds from StrategyConfig
             from config.strategy_config import StrategyConfig
 
-            config = StrategyConfig.default()
+            strategy_config = StrategyConfig.default()
 
             rsi_factor = 1.0
-            extreme_oversold = config.rsi_extreme_oversold  # Default: 20
-            rsi_oversold = config.rsi_oversold  # Default: 30
+            extreme_oversold = strategy_config.rsi_extreme_oversold  # Default: 20
+            rsi_oversold = strategy_config.rsi_oversold  # Default: 30
 
             if current_rsi < extreme_oversold:  # Extremely oversold
                 rsi_factor = 0.7  # 30% lower thresholds
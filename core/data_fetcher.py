@@ -15,6 +15,9 @@ from config.settings import (
     RETRY_MAX_ATTEMPTS,
     RETRY_MAX_DELAY,
 )
+from core.ohlcv_series_store import OhlcvSeriesStore
+from core.single_flight_cache import SingleFlightCache
+from core.weekly_bars import MIN_WEEKLY_BARS, resample_daily_to_weekly
 from src.infrastructure.db.timezone_utils import ist_now, ist_now_naive
 from utils.circuit_breaker import CircuitBreaker
 from utils.logger import logger
@@ -24,17 +27,21 @@ from utils.retry_handler import exponential_backoff_retry
 OHLCV_MINUTE_INTERVAL = "1m"
 
 # Shared OHLCV cache across ALL users (paper + broker trading) - market data is public
-# Format: {cache_key: (DataFrame, cached_time)}
-_shared_ohlcv_cache: dict[str, tuple[pd.DataFrame, datetime]] = {}
-_ohlcv_cache_lock = threading.Lock()
+# Per-key single-flight: different tickers fetch concurrently, same-key callers share one fetch
 _ohlcv_cache_ttl_market_hours = (
     15  # Cache for 15 seconds during market hours (fresh data for exit conditions)
 )
 _ohlcv_cache_ttl_after_hours = 60  # Cache for 60 seconds after market hours (historical data)
 _ohlcv_cache_max_size = 100  # Maximum number of cached entries
-
-# Thread lock for yfinance to prevent concurrent data fetching issues
-_yfinance_lock = threading.Lock()
+_ohlcv_cache = SingleFlightCache(max_size=_ohlcv_cache_max_size, name="OHLCVCache")
+# Daily/weekly series are window-agnostic: one stored history per (ticker, interval, end_date)
+# serves every ``days`` request as a tail slice; only the live bar uses the short TTL.
+# Lambdas resolve the module-level fetchers at call time (defined below; patched in tests).
+_ohlcv_series_store = OhlcvSeriesStore(
+    fetch_history=lambda *args, **kwargs: fetch_ohlcv_yf(*args, **kwargs),  # noqa: PLW0108
+    fetch_live_bar=lambda ticker: _get_current_day_data(ticker),  # noqa: PLW0108
+    max_series=_ohlcv_cache_max_size,
+)
 
 # Shared session for yfinance to reduce 401/Invalid Crumb errors (Yahoo blocks anonymous requests)
 # Session is recreated on 401/Invalid Crumb so next request gets fresh cookie/crumb
@@ -44,7 +51,6 @@ _yf_session_lock = threading.Lock()
 # LOCK ORDER (deadlock prevention): Never hold more than one of these at a time.
 # - _rate_limit_lock: only in _enforce_rate_limit(); released before any other lock.
 # - _yf_session_lock: only in _get_yfinance_session() / _invalidate_yfinance_session() (currently unused; yfinance uses curl_cffi).
-# - _yfinance_lock: only around yf.download(); do not call session helpers while holding it.
 
 # User-Agent that mimics a browser to reduce Yahoo Finance 401/Invalid Crumb rate
 _YF_USER_AGENT = (
@@ -313,6 +319,31 @@ def fetch_ohlcv_yf(ticker, days=365, interval="1d", end_date=None, add_current_d
     )
 
 
+def _download_history(ticker: str, start: str, end: str, interval: str) -> pd.DataFrame:
+    """
+    One ticker's OHLCV from Yahoo, safe to call from several threads at once.
+
+    ``yf.download`` keeps its results in module-level dicts it resets on every call, so
+    concurrent downloads overwrite each other's frames. ``Ticker.history`` (which
+    ``yf.download`` calls per ticker) keeps no shared state, so different tickers fetch in
+    parallel without a global lock. Timestamps follow ``yf.download``: daily and longer
+    bars keep the exchange-local date, intraday bars are returned in UTC.
+    """
+    df = yf.Ticker(ticker).history(
+        start=start,
+        end=end,
+        interval=interval,
+        auto_adjust=False,
+        actions=False,
+    )
+    if df is not None and isinstance(df.index, pd.DatetimeIndex) and df.index.tz is not None:
+        if interval[-1] in ("m", "h"):
+            df.index = df.index.tz_convert("UTC")
+        else:
+            df.index = df.index.tz_localize(None)
+    return df
+
+
 @yfinance_circuit_breaker
 @api_retry_configured
 def fetch_ohlcv_yf_raw(ticker, days=365, interval="1d", end_date=None, add_current_day=True):
@@ -343,20 +374,15 @@ def fetch_ohlcv_yf_raw(ticker, days=365, interval="1d", end_date=None, add_curre
 
         for auth_attempt in range(max_auth_retries):
             try:
-                # Use lock to prevent concurrent yfinance calls (not thread-safe)
                 # NOTE: Using unadjusted prices (auto_adjust=False) to match TradingView
-                with _yfinance_lock:
-                    df = yf.download(
-                        ticker,
-                        start=start.strftime("%Y-%m-%d"),
-                        end=end.strftime("%Y-%m-%d"),
-                        interval=interval,
-                        progress=False,
-                        auto_adjust=False,
-                    )
+                df = _download_history(
+                    ticker,
+                    start.strftime("%Y-%m-%d"),
+                    end.strftime("%Y-%m-%d"),
+                    interval,
+                )
                 break
             except Exception as e:
-                # Lock already released (exited "with _yfinance_lock")
                 if _is_yfinance_auth_error(e) and auth_attempt < max_auth_retries - 1:
                     logger.warning(
                         "yfinance 401/Invalid Crumb (attempt %s/%s), retrying: %s",
@@ -526,6 +552,14 @@ def get_cached_ohlcv(
     This cache is shared across ALL users (paper + broker trading) since market data is public.
     Reduces redundant API calls when multiple users monitor the same symbol.
 
+    Daily/weekly requests are served from one stored series per (ticker, interval, end_date):
+    the longest history fetched so far is kept and smaller ``days`` windows are tail slices
+    of it, so 200/365/800-day callers share one copy and one fetch. With
+    ``add_current_day=True`` only the live current-day bar is refreshed on the short TTL.
+    Intraday (``1m``) requests are cached per exact key. Fetches for different keys run
+    concurrently; concurrent requests for the same key wait on a single in-flight fetch
+    (see ``get_ohlcv_cache_stats`` for hit/miss/wait counts).
+
     Args:
         ticker: Stock ticker symbol (e.g., 'RELIANCE.NS')
         days: Number of days of data to fetch
@@ -537,10 +571,6 @@ def get_cached_ohlcv(
         DataFrame with OHLCV data, or None if fetch fails
     """
     from core.volume_analysis import is_market_hours
-    from src.infrastructure.db.timezone_utils import ist_now
-
-    # Use IST for consistency with codebase (all trading operations use IST)
-    now = ist_now()
 
     # Determine TTL based on market hours and data type
     # During market hours: shorter TTL for current day data (fresh prices for exit conditions)
@@ -552,80 +582,148 @@ def get_cached_ohlcv(
     else:
         ttl_seconds = _ohlcv_cache_ttl_after_hours  # 60 seconds after hours or for historical data
 
+    if interval != OHLCV_MINUTE_INTERVAL:
+        include_live_bar = live_current_day_scope_allowed(
+            end_date=end_date, add_current_day=add_current_day, interval=interval
+        )
+        try:
+            # Completed bars don't change intraday - only the live bar needs the short TTL
+            data = _ohlcv_series_store.get(
+                ticker,
+                days,
+                interval,
+                end_date,
+                include_live_bar=include_live_bar,
+                history_ttl=_ohlcv_cache_ttl_after_hours,
+                live_ttl=ttl_seconds,
+                today=ist_now().date(),
+            )
+        except Exception as e:
+            logger.debug(f"Failed to fetch OHLCV for {ticker}: {e}")
+            return None
+        if data is None or data.empty:
+            return None
+        # Tail slice of the shared series; Copy-on-Write keeps the stored series intact
+        return data
+
     # Include all parameters in cache key to avoid collisions
     # Format: ticker_days_interval_add_current_day_end_date
     end_date_str = end_date or "today"
     cache_key = f"{ticker}_{days}_{interval}_{add_current_day}_{end_date_str}"
 
-    with _ohlcv_cache_lock:
-        # Check cache
-        if cache_key in _shared_ohlcv_cache:
-            cached_data, cached_time = _shared_ohlcv_cache[cache_key]
-            age = (now - cached_time).total_seconds()
+    def _load():
+        logger.debug(
+            f"Fetching OHLCV data for {ticker} (days={days}, interval={interval}, "
+            f"add_current_day={add_current_day}, end_date={end_date})"
+        )
+        return fetch_ohlcv_yf_raw(
+            ticker,
+            days=days,
+            interval=interval,
+            add_current_day=add_current_day,
+            end_date=end_date,
+        )
 
-            if age < ttl_seconds:
-                # Cache hit - return cached data (copy to avoid mutations)
-                logger.debug(
-                    f"OHLCV cache hit for {ticker} (key: {cache_key[:50]}, age: {age:.1f}s, "
-                    f"TTL: {ttl_seconds}s, market_hours: {is_market_hours()})"
-                )
-                return cached_data.copy()
-            else:
-                # Cache expired - remove it
-                logger.debug(
-                    f"OHLCV cache expired for {ticker} (key: {cache_key[:50]}, age: {age:.1f}s, "
-                    f"TTL: {ttl_seconds}s, market_hours: {is_market_hours()})"
-                )
-                del _shared_ohlcv_cache[cache_key]
+    try:
+        data = _ohlcv_cache.get_or_load(
+            cache_key,
+            _load,
+            ttl_seconds,
+            cache_if=lambda df: df is not None and not df.empty,
+        )
+    except Exception as e:
+        logger.debug(f"Failed to fetch OHLCV for {ticker}: {e}")
+        return None
 
-        # Cache miss or expired - fetch new data
-        try:
-            logger.debug(
-                f"Fetching OHLCV data for {ticker} (days={days}, interval={interval}, "
-                f"add_current_day={add_current_day}, end_date={end_date})"
+    if data is None or data.empty:
+        return None
+    # Cached frame is shared across callers - hand out a copy to avoid mutations
+    return data.copy()
+
+
+def get_ohlcv_cache_stats() -> dict[str, int]:
+    """
+    Return shared OHLCV cache counters.
+
+    ``hits``/``misses``/``waits``/``errors``/``evictions``/``size``/``inflight`` are summed over
+    the daily/weekly series store and the intraday cache; ``extends`` (window grown), ``rows``
+    (stored series rows) and ``live_hits``/``live_misses`` (current-day bar) are series-only.
+    """
+    series = _ohlcv_series_store.get_stats()
+    intraday = _ohlcv_cache.get_stats()
+    stats = {
+        name: series[name] + intraday[name]
+        for name in ("hits", "misses", "waits", "errors", "evictions", "size", "inflight")
+    }
+    for name in ("extends", "rows", "live_hits", "live_misses"):
+        stats[name] = series[name]
+    return stats
+
+
+def clear_ohlcv_cache() -> None:
+    """Drop all entries from the shared OHLCV caches and reset their counters (tests / admin)."""
+    _ohlcv_series_store.clear()
+    _ohlcv_series_store.reset_stats()
+    _ohlcv_cache.clear()
+    _ohlcv_cache.reset_stats()
+
+
+def weekly_from_daily(  # noqa: PLR0913
+    ticker, daily_data, days, *, daily_days=None, end_date=None, add_current_day=True
+):
+    """
+    Weekly OHLCV for ``ticker`` built from an already fetched daily series.
+
+    Resamples ``daily_data`` into NSE-calendar weekly bars (see ``core.weekly_bars``), which
+    saves the second network fetch per ticker. Falls back to ``fetch_ohlcv_yf(interval="1wk")``
+    when ``OHLCV_WEEKLY_FROM_DAILY`` is off, when the daily request (``daily_days``) was
+    shorter than the weekly window, or when there is no daily data to resample.
+
+    Args:
+        ticker: Stock ticker symbol
+        daily_data: Daily frame from ``fetch_ohlcv_yf`` (may be None)
+        days: Calendar-day lookback of the weekly window
+        daily_days: Lookback the daily frame was fetched with (None = assume it covers ``days``)
+        end_date: End date of both windows (None for current date)
+        add_current_day: Forwarded to the Yahoo fallback
+
+    Returns:
+        Weekly DataFrame with columns: date, open, high, low, close, volume
+
+    Raises:
+        ValueError: Fewer than ``MIN_WEEKLY_BARS`` weekly bars (same as the Yahoo path)
+    """
+    from config.settings import OHLCV_WEEKLY_FROM_DAILY  # noqa: PLC0415
+
+    covers_window = daily_days is None or daily_days >= days
+    has_daily = daily_data is not None and not daily_data.empty
+    if OHLCV_WEEKLY_FROM_DAILY and covers_window and has_daily:
+        weekly = resample_daily_to_weekly(daily_data, days=days, end_date=_as_date(end_date))
+        if len(weekly) < MIN_WEEKLY_BARS:
+            raise ValueError(
+                f"Insufficient weekly data for {ticker}: only {len(weekly)} rows "
+                f"(minimum: {MIN_WEEKLY_BARS} weeks for basic analysis)"
             )
-            if interval == OHLCV_MINUTE_INTERVAL:
-                data = fetch_ohlcv_yf_raw(
-                    ticker,
-                    days=days,
-                    interval=interval,
-                    add_current_day=add_current_day,
-                    end_date=end_date,
-                )
-            else:
-                data = fetch_ohlcv_yf(
-                    ticker,
-                    days=days,
-                    interval=interval,
-                    add_current_day=add_current_day,
-                    end_date=end_date,
-                )
-            if data is not None and not data.empty:
-                # Update cache
-                _shared_ohlcv_cache[cache_key] = (data.copy(), now)
-                logger.debug(
-                    f"Cached OHLCV data for {ticker} (key: {cache_key[:50]}, "
-                    f"cache size: {len(_shared_ohlcv_cache)})"
-                )
+        logger.debug(f"Resampled {len(weekly)} weekly candles for {ticker} from daily data")
+        return weekly
 
-                # Cleanup old entries if cache is too large
-                if len(_shared_ohlcv_cache) > _ohlcv_cache_max_size:
-                    # Remove oldest entries (by cached_time)
-                    sorted_entries = sorted(
-                        _shared_ohlcv_cache.items(),
-                        key=lambda x: x[1][1],  # Sort by cached_time
-                    )
-                    # Remove oldest entries to bring cache back to max_size
-                    to_remove = len(sorted_entries) - _ohlcv_cache_max_size + 10
-                    for key, _ in sorted_entries[:to_remove]:
-                        del _shared_ohlcv_cache[key]
-                    logger.debug(f"Cleaned up {to_remove} old cache entries")
+    return fetch_ohlcv_yf(
+        ticker,
+        days=days,
+        interval="1wk",
+        end_date=end_date,
+        add_current_day=add_current_day,
+    )
 
-                return data
-        except Exception as e:
-            logger.debug(f"Failed to fetch OHLCV for {ticker}: {e}")
 
-    return None
+def _as_date(end_date):
+    if end_date is None:
+        return None
+    if isinstance(end_date, str):
+        return datetime.strptime(end_date, "%Y-%m-%d").date()
+    if isinstance(end_date, datetime):
+        return end_date.date()
+    return end_date
 
 
 def fetch_multi_timeframe_data(ticker, days=800, end_date=None, add_current_day=True, config=None):
@@ -680,14 +778,15 @@ def fetch_multi_timeframe_data(ticker, days=800, end_date=None, add_current_day=
             logger.warning(f"Failed to fetch daily data for {ticker}: {e}")
             return None
 
-        # Fetch weekly data (need more days for sufficient weekly candles)
+        # Weekly candles are resampled from the daily series (Yahoo 1wk is only a fallback)
         # For dip-buying strategy: Weekly is optional, daily is primary
-        # Try to fetch weekly data, but continue with daily-only if weekly fails
+        # Try to build weekly data, but continue with daily-only if weekly fails
         try:
-            weekly_data = fetch_ohlcv_yf(
+            weekly_data = weekly_from_daily(
                 ticker,
+                daily_data,
                 days=weekly_days,
-                interval="1wk",
+                daily_days=daily_days,
                 end_date=end_date,
                 add_current_day=add_current_day,
             )
@@ -0,0 +1,267 @@
+"""
+Window-agnostic in-process OHLCV series store.
+
+Keeps one historical series per ``(ticker, interval, end_date)`` - the longest one
+fetched so far - and serves any smaller ``days`` request as a tail slice of it.
+The live current-day bar is cached separately (short TTL) and merged on top only
+for callers that ask for ``add_current_day=True``, so ``days=200`` / ``365`` / ``800``
+and live / non-live callers all share a single stored copy and a single fetch.
+
+Slices are plain ``iloc`` views; pandas Copy-on-Write makes them safe to hand out
+without an up-front copy (a caller that mutates its frame gets a private copy).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+from core.single_flight_cache import SingleFlightCache
+from utils.logger import logger
+
+# Matches the extra calendar padding used by fetch_ohlcv_yf_raw / OhlcvCacheService.get_ohlcv
+_WINDOW_PADDING_DAYS = 5
+
+
+@dataclass
+class _SeriesEntry:
+    frame: pd.DataFrame
+    days: int
+    stored_at: float
+
+
+def _window_end(end_date: str | datetime | date | None, today: date) -> date:
+    if end_date is None:
+        return today
+    if isinstance(end_date, datetime):
+        return end_date.date()
+    if isinstance(end_date, date):
+        return end_date
+    return datetime.strptime(end_date, "%Y-%m-%d").date()
+
+
+def tail_slice(frame: pd.DataFrame, days: int, end_day: date) -> pd.DataFrame:
+    """
+    Return the rows of ``frame`` inside the ``days`` calendar-day lookback ending at ``end_day``.
+
+    ``frame`` must be sorted by its ``date`` column; the result is an ``iloc`` slice (no copy).
+    """
+    if frame.empty:
+        return frame
+    cutoff = pd.Timestamp(end_day - timedelta(days=days + _WINDOW_PADDING_DAYS))
+    dates = frame["date"]
+    if getattr(dates.dt, "tz", None) is not None:
+        cutoff = cutoff.tz_localize(dates.dt.tz)
+    start = int(dates.searchsorted(cutoff, side="left"))
+    return frame.iloc[start:]
+
+
+def merge_live_bar(frame: pd.DataFrame, live_bar: dict | None) -> pd.DataFrame:
+    """
+    Overlay today's live bar on a historical series.
+
+    Replaces the last row if it is already dated today (partial bar from an earlier
+    refresh), otherwise appends. Returns ``frame`` unchanged when ``live_bar`` is None.
+    """
+    if not live_bar:
+        return frame
+    bar_ts = pd.to_datetime(live_bar["date"])
+    row = pd.DataFrame(
+        [
+            {
+                "date": bar_ts,
+                "open": live_bar["open"],
+                "high": live_bar["high"],
+                "low": live_bar["low"],
+                "close": live_bar["close"],
+                "volume": live_bar["volume"],
+            }
+        ]
+    )
+    if not frame.empty and pd.Timestamp(frame["date"].iloc[-1]).date() == bar_ts.date():
+        frame = frame.iloc[:-1]
+    if frame.empty:
+        return row
+    return pd.concat([frame, row], ignore_index=True)
+
+
+class OhlcvSeriesStore:
+    """
+    Per-(ticker, interval, end_date) series cache serving any ``days`` window.
+
+    History is fetched with ``add_current_day=False`` and refreshed on ``history_ttl``;
+    when a request needs more days than stored, the store refetches the larger window
+    and keeps it. Concurrent fetches of the same window are coalesced.
+    """
+
+    def __init__(
+        self,
+        fetch_history: Callable[..., pd.DataFrame | None],
+        fetch_live_bar: Callable[[str], dict | None],
+        max_series: int = 100,
+        name: str = "OHLCVSeriesStore",
+    ):
+        """
+        Args:
+            fetch_history: ``fetch(ticker, days=, interval=, end_date=, add_current_day=False)``
+            fetch_live_bar: ``fetch(ticker)`` returning today's bar dict or None
+            max_series: Maximum number of stored series before oldest are evicted
+            name: Name for logging
+        """
+        self._fetch_history = fetch_history
+        self._fetch_live_bar = fetch_live_bar
+        self.max_series = max_series
+        self.name = name
+        self._series: dict[tuple, _SeriesEntry] = {}
+        self._lock = threading.Lock()
+        # Coalesces concurrent network fetches only; results are kept in _series
+        self._history_flights = SingleFlightCache(max_size=max_series, name=f"{name}.history")
+        self._live_bars = SingleFlightCache(max_size=max_series * 2, name=f"{name}.live")
+        self._stats = {"hits": 0, "misses": 0, "extends": 0, "evictions": 0}
+
+    @staticmethod
+    def _series_key(ticker: str, interval: str, end_date) -> tuple:
+        return (ticker, interval, str(end_date) if end_date is not None else "today")
+
+    def get(  # noqa: PLR0913
+        self,
+        ticker: str,
+        days: int,
+        interval: str,
+        end_date: str | datetime | None,
+        *,
+        include_live_bar: bool,
+        history_ttl: float,
+        live_ttl: float,
+        today: date,
+    ) -> pd.DataFrame | None:
+        """
+        Return ``days`` of OHLCV for ``ticker``, merging the live bar when requested.
+
+        Args:
+            ticker: Yahoo ticker (e.g. ``RELIANCE.NS``)
+            days: Calendar-day lookback
+            interval: ``1d`` / ``1wk``
+            end_date: Window end (None = today)
+            include_live_bar: Merge today's live bar (caller has checked live scope)
+            history_ttl: Max age of the stored history series in seconds
+            live_ttl: Max age of the cached live bar in seconds
+            today: Current IST date (window end when ``end_date`` is None)
+
+        Returns:
+            DataFrame slice, or None when no history is available
+
+        Raises:
+            Exceptions from ``fetch_history`` (callers decide how to surface them)
+        """
+        key = self._series_key(ticker, interval, end_date)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._series.get(key)
+            fresh = entry is not None and now - entry.stored_at < history_ttl
+            if fresh and entry.days >= days:
+                self._stats["hits"] += 1
+                history = entry.frame
+            else:
+                history = None
+                # Keep the longest window we have seen so future smaller requests still hit
+                fetch_days = max(days, entry.days) if entry is not None else days
+                if fresh:
+                    self._stats["extends"] += 1
+                else:
+                    self._stats["misses"] += 1
+
+        if history is None:
+            history = self._load_history(key, ticker, fetch_days, interval, end_date)
+            if history is None:
+                return None
+
+        frame = tail_slice(history, days, _window_end(end_date, today))
+        if include_live_bar:
+            live_bar = self._live_bars.get_or_load(
+                ticker, lambda: self._fetch_live_bar(ticker), live_ttl
+            )
+            frame = merge_live_bar(frame, live_bar)
+        return frame
+
+    def _load_history(
+        self, key: tuple, ticker: str, fetch_days: int, interval: str, end_date
+    ) -> pd.DataFrame | None:
+        def _load():
+            logger.debug(
+                f"{self.name}: fetching {ticker} [{interval}] days={fetch_days} end_date={end_date}"
+            )
+            df = self._fetch_history(
+                ticker,
+                days=fetch_days,
+                interval=interval,
+                end_date=end_date,
+                add_current_day=False,
+            )
+            if df is None or df.empty:
+                return None
+            if not df["date"].is_monotonic_increasing:
+                df = df.sort_values("date").reset_index(drop=True)
+            return df
+
+        flight_key = f"{key}:{fetch_days}"
+        df = self._history_flights.get_or_load(flight_key, _load, 0, cache_if=lambda _: False)
+        if df is None:
+            return None
+
+        with self._lock:
+            current = self._series.get(key)
+            # A concurrent caller may have stored a longer window meanwhile; keep the longer one
+            if current is None or current.days <= fetch_days:
+                self._series[key] = _SeriesEntry(df, fetch_days, time.monotonic())
+                self._evict_locked()
+        return df
+
+    def _evict_locked(self) -> None:
+        if len(self._series) <= self.max_series:
+            return
+        to_remove = len(self._series) - self.max_series + 10
+        oldest = sorted(self._series.items(), key=lambda item: item[1].stored_at)[:to_remove]
+        for key, _ in oldest:
+            del self._series[key]
+        self._stats["evictions"] += len(oldest)
+        logger.debug(f"{self.name}: evicted {len(oldest)} old series")
+
+    def clear(self) -> None:
+        """Drop all stored series and live bars."""
+        with self._lock:
+            self._series.clear()
+        self._history_flights.clear()
+        self._live_bars.clear()
+
+    def reset_stats(self) -> None:
+        """Zero all counters (including the underlying flight caches)."""
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
+        self._history_flights.reset_stats()
+        self._live_bars.reset_stats()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Return counters: series ``hits``/``misses``/``extends``/``evictions``, ``waits`` for
+        coalesced history fetches, ``errors`` from history fetches, ``size`` (stored series),
+        ``rows`` (total stored rows) and ``live_hits``/``live_misses``.
+        """
+        flights = self._history_flights.get_stats()
+        live = self._live_bars.get_stats()
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._series)
+            stats["rows"] = sum(len(e.frame) for e in self._series.values())
+        stats["waits"] = flights["waits"]
+        stats["errors"] = flights["errors"]
+        stats["inflight"] = flights["inflight"]
+        stats["live_hits"] = live["hits"]
+        stats["live_misses"] = live["misses"]
+        return stats
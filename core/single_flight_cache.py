@@ -0,0 +1,183 @@
+"""
+In-process TTL cache with per-key single-flight loading.
+
+Used by ``core.data_fetcher.get_cached_ohlcv`` so that concurrent callers asking
+for *different* keys fetch in parallel, while concurrent callers asking for the
+*same* key share one in-flight fetch instead of each hitting Yahoo/NSE.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from utils.logger import logger
+
+
+@dataclass
+class _InFlight:
+    """One pending load; waiters block on ``event`` and read ``value``/``error``."""
+
+    event: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: BaseException | None = None
+    waiters: int = 0
+    generation: tuple[int, int] = (0, 0)
+
+
+class SingleFlightCache:
+    """
+    Thread-safe TTL cache where each key is loaded at most once at a time.
+
+    The internal lock only guards dictionary bookkeeping; the loader itself runs
+    outside the lock, so slow network fetches for different keys never serialize.
+
+    ``invalidate``/``clear`` bump a generation counter: a load that started under an
+    older generation still returns its value to its own callers but is not stored,
+    and later callers start a fresh load instead of joining it.
+
+    Counters:
+        hits: served from a fresh cached entry
+        misses: caller became the leader and ran the loader
+        waits: caller joined another caller's in-flight load for the same key
+        errors: loader raised (leader and its waiters all see the exception)
+        evictions: entries dropped by size-bound cleanup
+    """
+
+    def __init__(self, max_size: int = 100, name: str = "SingleFlightCache"):
+        self.max_size = max_size
+        self.name = name
+        self._entries: dict[str, tuple[Any, float]] = {}
+        self._inflight: dict[str, _InFlight] = {}
+        # Bumped by clear() (all keys) and invalidate() (one key)
+        self._epoch = 0
+        self._key_generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "waits": 0, "errors": 0, "evictions": 0}
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl_seconds: float,
+        *,
+        cache_if: Callable[[Any], bool] | None = None,
+    ) -> Any:
+        """
+        Return the cached value for ``key`` or run ``loader`` (once across threads).
+
+        Args:
+            key: Cache key
+            loader: Zero-arg callable producing the value
+            ttl_seconds: Max age of a cached entry to count as a hit
+            cache_if: Optional predicate; results failing it are returned to callers
+                but not stored (e.g. empty DataFrames)
+
+        Returns:
+            Cached or freshly loaded value (shared object; callers must copy if they mutate)
+
+        Raises:
+            Whatever ``loader`` raised, for the leader and every waiter of that flight
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                if time.monotonic() - stored_at < ttl_seconds:
+                    self._stats["hits"] += 1
+                    return value
+                del self._entries[key]
+
+            flight = self._inflight.get(key)
+            if flight is not None:
+                flight.waiters += 1
+                self._stats["waits"] += 1
+                leader = False
+            else:
+                flight = _InFlight(generation=self._generation_locked(key))
+                self._inflight[key] = flight
+                self._stats["misses"] += 1
+                leader = True
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            value = loader()
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self._stats["errors"] += 1
+                self._finish_flight_locked(key, flight)
+            flight.event.set()
+            raise
+
+        flight.value = value
+        with self._lock:
+            current = flight.generation == self._generation_locked(key)
+            if current and (cache_if is None or cache_if(value)):
+                self._entries[key] = (value, time.monotonic())
+                self._evict_locked()
+            self._finish_flight_locked(key, flight)
+        flight.event.set()
+        return value
+
+    def _generation_locked(self, key: str) -> tuple[int, int]:
+        """Current generation of ``key`` (caller holds ``_lock``)."""
+        return self._epoch, self._key_generations.get(key, 0)
+
+    def _finish_flight_locked(self, key: str, flight: _InFlight) -> None:
+        """Unregister ``flight`` unless an invalidation detached it (caller holds ``_lock``)."""
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+
+    def _evict_locked(self) -> None:
+        """Drop oldest entries when above ``max_size`` (caller holds ``_lock``)."""
+        if len(self._entries) <= self.max_size:
+            return
+        # Remove a small batch at once so we don't sort on every insert at the boundary
+        to_remove = len(self._entries) - self.max_size + 10
+        oldest = sorted(self._entries.items(), key=lambda item: item[1][1])[:to_remove]
+        for key, _ in oldest:
+            del self._entries[key]
+        self._stats["evictions"] += len(oldest)
+        logger.debug(f"{self.name}: evicted {len(oldest)} old cache entries")
+
+    def invalidate(self, key: str) -> None:
+        """Remove one cached entry; a load already in flight for it will not be stored."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._inflight.pop(key, None)
+            self._key_generations[key] = self._key_generations.get(key, 0) + 1
+
+    def clear(self) -> None:
+        """Remove all cached entries; loads already in flight will not be stored."""
+        with self._lock:
+            self._entries.clear()
+            self._inflight.clear()
+            self._key_generations.clear()
+            self._epoch += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_stats(self) -> dict[str, int]:
+        """Return counters plus current size and number of in-flight loads."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+            stats["inflight"] = len(self._inflight)
+        return stats
+
+    def reset_stats(self) -> None:
+        """Zero the hit/miss/wait/error/eviction counters."""
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
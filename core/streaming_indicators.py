@@ -0,0 +1,198 @@
+"""
+Incremental (streaming) RSI / EMA state for intraday monitoring.
+
+State is seeded once from completed daily closes using the same arithmetic as the
+``pandas_ta`` path in ``core.indicators.compute_indicators`` (Wilder RMA for RSI, SMA-seeded
+EMA). After that, the value for a live price is an O(1) update of the previous close's
+state, so the monitor loop no longer has to re-download history and rerun pandas on every
+tick. ``peek`` evaluates a provisional (still-forming) bar without committing it; ``update``
+commits a completed bar.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+RSI10_PERIOD = 10
+EMA9_PERIOD = 9
+EMA200_PERIOD = 200
+
+
+def _finite(value: float) -> float | None:
+    return None if value is None or not math.isfinite(value) else float(value)
+
+
+@dataclass
+class WilderRsiState:
+    """Wilder RSI (RMA of gains/losses, ``alpha = 1/period``), matching ``pandas_ta.rsi``."""
+
+    period: int
+    avg_gain: float
+    avg_loss: float
+    last_close: float
+
+    @classmethod
+    def seed(cls, closes: pd.Series, period: int = RSI10_PERIOD) -> WilderRsiState | None:
+        """Build state from completed closes; None when there are fewer than ``period + 1``."""
+        closes = pd.Series(closes, dtype="float64").dropna().reset_index(drop=True)
+        if len(closes) < period + 1:
+            return None
+        delta = closes.diff()
+        gain = delta.clip(lower=0)
+        loss = delta.clip(upper=0).abs()
+        alpha = 1.0 / period
+        avg_gain = gain.ewm(alpha=alpha, adjust=False).mean().iloc[-1]
+        avg_loss = loss.ewm(alpha=alpha, adjust=False).mean().iloc[-1]
+        return cls(period, float(avg_gain), float(avg_loss), float(closes.iloc[-1]))
+
+    def _next(self, price: float) -> tuple[float, float]:
+        alpha = 1.0 / self.period
+        change = float(price) - self.last_close
+        avg_gain = (1.0 - alpha) * self.avg_gain + alpha * max(change, 0.0)
+        avg_loss = (1.0 - alpha) * self.avg_loss + alpha * max(-change, 0.0)
+        return avg_gain, avg_loss
+
+    @staticmethod
+    def _rsi(avg_gain: float, avg_loss: float) -> float | None:
+        total = avg_gain + avg_loss
+        if total == 0:
+            return None
+        return _finite(100.0 * avg_gain / total)
+
+    @property
+    def value(self) -> float | None:
+        """RSI as of the last committed close."""
+        return self._rsi(self.avg_gain, self.avg_loss)
+
+    def peek(self, price: float) -> float | None:
+        """RSI if the current bar closed at ``price`` (state unchanged)."""
+        return self._rsi(*self._next(price))
+
+    def update(self, close: float) -> float | None:
+        """Commit a completed bar and return its RSI."""
+        self.avg_gain, self.avg_loss = self._next(close)
+        self.last_close = float(close)
+        return self.value
+
+
+@dataclass
+class EmaState:
+    """EMA with ``k = 2 / (period + 1)`` seeded by the SMA of the first bars (``pandas_ta.ema``)."""
+
+    period: int
+    value: float
+
+    @classmethod
+    def seed(cls, closes: pd.Series, period: int) -> EmaState | None:
+        """Build state from completed closes; None when there are fewer than ``period``."""
+        closes = pd.Series(closes, dtype="float64").dropna().reset_index(drop=True)
+        if len(closes) < period:
+            return None
+        seeded = closes.copy()
+        sma = seeded.iloc[0:period].mean()
+        seeded.iloc[: period - 1] = np.nan
+        seeded.iloc[period - 1] = sma
+        value = seeded.ewm(span=period, adjust=False).mean().iloc[-1]
+        return cls(period, float(value))
+
+    @property
+    def k(self) -> float:
+        return 2.0 / (self.period + 1)
+
+    def peek(self, price: float) -> float:
+        """EMA if the current bar closed at ``price`` (state unchanged)."""
+        return float(price) * self.k + self.value * (1.0 - self.k)
+
+    def update(self, close: float) -> float:
+        """Commit a completed bar and return the new EMA."""
+        self.value = self.peek(close)
+        return self.value
+
+
+@dataclass
+class StreamingIndicatorState:
+    """
+    Per-symbol RSI10 / EMA9 / EMA200 state seeded from the previous session's close.
+
+    ``session_date`` is the trading day the state is valid for; callers reseed when it
+    changes (the previous session's bar is then complete). ``last_bar_date`` is the date of
+    the newest completed bar in the seed (None when the frame carries no dates), so callers
+    can also reseed when a newer daily bar lands after seeding.
+    """
+
+    session_date: date
+    prev_close: float
+    rsi: WilderRsiState | None
+    ema9: EmaState | None
+    ema200: EmaState | None
+    rsi_period: int = RSI10_PERIOD
+    last_bar_date: date | None = None
+
+    @classmethod
+    def from_history(
+        cls,
+        df: pd.DataFrame,
+        session_date: date,
+        rsi_period: int = RSI10_PERIOD,
+    ) -> StreamingIndicatorState | None:
+        """
+        Seed from a daily OHLCV frame of completed bars.
+
+        Rows dated ``session_date`` or later (a partial live bar) are ignored so the
+        state always represents the previous close.
+        """
+        if df is None or df.empty:
+            return None
+        close_col = "Close" if "Close" in df.columns else "close"
+        if close_col not in df.columns:
+            return None
+        frame = df
+        last_bar_date = None
+        if "date" in frame.columns:
+            dates = pd.to_datetime(frame["date"])
+            completed = (dates.dt.date < session_date).to_numpy()
+            frame = frame[completed]
+            dates = dates[completed]
+            valid = pd.Series(frame[close_col], dtype="float64").notna().to_numpy()
+            if valid.any():
+                last_bar_date = dates[valid].iloc[-1].date()
+        closes = pd.Series(frame[close_col], dtype="float64").dropna()
+        if closes.empty:
+            return None
+        return cls(
+            session_date=session_date,
+            prev_close=float(closes.iloc[-1]),
+            rsi=WilderRsiState.seed(closes, rsi_period),
+            ema9=EmaState.seed(closes, EMA9_PERIOD),
+            ema200=EmaState.seed(closes, EMA200_PERIOD),
+            rsi_period=rsi_period,
+            last_bar_date=last_bar_date,
+        )
+
+    def snapshot(self, ltp: float | None = None) -> dict[str, Any]:
+        """
+        Indicator values with ``ltp`` as today's provisional close.
+
+        Without ``ltp`` the previous close's values are returned. Keys: ``close``,
+        ``rsi{period}`` (``rsi10`` by default), ``ema9``, ``ema200``; unavailable values are None.
+        """
+        live = ltp is not None
+        price = float(ltp) if live else self.prev_close
+
+        def _value(state):
+            if state is None:
+                return None
+            return state.peek(price) if live else state.value
+
+        return {
+            "close": price,
+            f"rsi{self.rsi_period}": _value(self.rsi),
+            "ema9": _value(self.ema9),
+            "ema200": _value(self.ema200),
+        }
@@ -0,0 +1,93 @@
+"""
+Weekly OHLCV bars derived from a daily series.
+
+Builds the weekly frame locally from daily bars that were already fetched (and cached)
+instead of a second ``interval="1wk"`` Yahoo download. Weeks follow the NSE calendar:
+one bar per ISO week (Mon-Fri session week), dated on the last session of that week
+(``holiday_calendar.iter_expected_weekly_bar_dates`` convention), so holiday-shortened
+weeks simply aggregate fewer sessions.
+
+The current week is usually still open: its bar aggregates the sessions so far (including
+a live current-day bar when the daily series has one) and is dated on the latest session,
+like Yahoo's partial current-week row.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import pandas as pd
+
+from src.infrastructure.utils.holiday_calendar import iter_expected_weekly_bar_dates
+
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Matches fetch_ohlcv_yf_raw: fewer weekly bars than this is not useful for analysis
+MIN_WEEKLY_BARS = 10
+
+
+def resample_daily_to_weekly(
+    daily: pd.DataFrame | None,
+    days: int | None = None,
+    end_date: date | None = None,
+    drop_partial_week: bool = False,
+) -> pd.DataFrame:
+    """
+    Aggregate a daily OHLCV frame into NSE weekly bars.
+
+    Args:
+        daily: Daily frame with a ``date`` column (or DatetimeIndex) and lowercase OHLCV
+        days: Optional calendar-day lookback for the weekly window, ending at ``end_date``
+              (or the last daily bar). The first week is kept whole.
+        end_date: Last session of the window (None = last daily bar)
+        drop_partial_week: Drop the last week when it has not reached its final session
+
+    Returns:
+        DataFrame with columns: date, open, high, low, close, volume (empty if no input)
+    """
+    if daily is None or daily.empty:
+        return pd.DataFrame(columns=["date", *OHLCV_COLUMNS])
+
+    frame = daily if "date" in daily.columns else daily.rename_axis("date").reset_index()
+    frame = frame[["date", *OHLCV_COLUMNS]].dropna(subset=["close"])
+    dates = pd.to_datetime(frame["date"])
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_localize(None)
+    frame = frame.assign(date=dates.dt.normalize()).sort_values("date")
+
+    if end_date is not None:
+        frame = frame[frame["date"] <= pd.Timestamp(end_date)]
+    if frame.empty:
+        return pd.DataFrame(columns=["date", *OHLCV_COLUMNS])
+
+    last_day = frame["date"].iloc[-1].date()
+    if days is not None:
+        window_start = (end_date or last_day) - timedelta(days=days)
+        week_start = window_start - timedelta(days=window_start.weekday())
+        frame = frame[frame["date"] >= pd.Timestamp(week_start)]
+
+    # ISO week bucket = Monday of the bar's week
+    week = frame["date"] - pd.to_timedelta(frame["date"].dt.weekday, unit="D")
+    weekly = (
+        frame.groupby(week, sort=True)
+        .agg(
+            date=("date", "last"),
+            open=("open", "first"),
+            high=("high", "max"),
+            low=("low", "min"),
+            close=("close", "last"),
+            volume=("volume", "sum"),
+        )
+        .reset_index(drop=True)
+    )
+
+    if drop_partial_week and not weekly.empty and not is_week_complete(last_day):
+        weekly = weekly.iloc[:-1].reset_index(drop=True)
+    return weekly
+
+
+def is_week_complete(session_day: date) -> bool:
+    """True if ``session_day`` is the last NSE trading day of its ISO week."""
+    monday = session_day - timedelta(days=session_day.weekday())
+    last_sessions = list(iter_expected_weekly_bar_dates(monday, monday + timedelta(days=6)))
+    return bool(last_sessions) and session_day >= last_sessions[-1]
@@ -18,8 +18,10 @@ when exit conditions are met.
 import os
 import sys
 import warnings
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 
 warnings.filterwarnings("ignore")
@@ -28,7 +30,13 @@ import pandas_ta as ta
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from core.data_fetcher import fetch_ohlcv_yf
+from backtest.vectorized_kernel import (
+    KERNEL_VECTORIZED,
+    column_values,
+    next_row_positions,
+    resolve_kernel,
+)
+from core.data_fetcher import fetch_ohlcv_yf, weekly_from_daily
 from utils.logger import logger
 
 
@@ -295,12 +303,354 @@ def validate_initial_entry_with_trade_agent(
         return None
 
 
+def backtest_fetch_days(start_date: str, end_date: str) -> int:
+    """Calendar days of OHLCV ``run_integrated_backtest`` fetches for ``date_range``"""
+    # EMA200 needs: 200 periods + ~100 warm-up = 300 trading days ? 420 calendar days
+    ema_buffer_days = int((200 + 100) * 1.4)  # EMA200 + warm-up, converted to calendar days
+    return (pd.to_datetime(end_date) - pd.to_datetime(start_date)).days + ema_buffer_days
+
+
+@dataclass
+class _BacktestState:
+    """Mutable state of one ``run_integrated_backtest`` call (never shared between calls)"""
+
+    stock_name: str
+    capital_per_position: float
+    skip_trade_agent_validation: bool
+    market_data: pd.DataFrame
+    weekly_data: pd.DataFrame | None
+    config: object = None
+    position: Position | None = None
+    all_positions: list[Position] = field(default_factory=list)  # Closed positions, in order
+    executed_trades: int = 0
+    skipped_signals: int = 0
+    signal_count: int = 0  # Counter for signal numbering
+    reentries_by_date: dict[str, int] = field(default_factory=dict)  # {date: count} for daily cap
+    # ML predictions with entry dates for the reversal strategy
+    # Format: (ml_verdict, ml_confidence, entry_date, position_index)
+    ml_predictions: list[tuple] = field(default_factory=list)
+
+
+def _close_open_position(state: _BacktestState) -> None:
+    """Print the closed position's summary and move it to ``all_positions``"""
+    position = state.position
+    print(
+        f"      Entry: {position.entry_date.strftime('%Y-%m-%d')} | Exit: {position.exit_date.strftime('%Y-%m-%d')} | Days: {(position.exit_date - position.entry_date).days}"
+    )
+    print(f"      P&L: ${position.get_pnl():,.0f} ({position.get_return_pct():+.1f}%)")
+    state.all_positions.append(position)  # Save closed position
+    state.position = None  # Clear position
+
+
+def _check_exit(state: _BacktestState, date_str: str, high: float, close: float, rsi: float) -> bool:
+    """Apply the exit rules (High >= Target, then RSI > 50); True when the position closed"""
+    position = state.position
+    # Exit condition 1: High >= Target
+    # Note: Can exit same day as re-entry if High hits target during the day
+    if high >= position.target_price:
+        position.close_position(date_str, position.target_price, "Target reached")
+        print(f"   ? TARGET HIT on {date_str}: Exit at {position.target_price:.2f}")
+        _close_open_position(state)
+        return True
+
+    # Exit condition 2: RSI > 50
+    if rsi > 50:
+        position.close_position(date_str, close, "RSI > 50")
+        print(f"   ? RSI EXIT on {date_str}: RSI {rsi:.1f} > 50, Exit at {close:.2f}")
+        _close_open_position(state)
+        return True
+
+    return False
+
+
+def _reentry_level(position: Position, rsi: float) -> int | None:
+    """
+    Track the RSI reset and return the level to re-enter at (None when no re-entry).
+
+    Reset cycle: RSI > 30 then < 30 again re-opens all levels; otherwise levels are taken
+    in order 30 -> 20 -> 10.
+    """
+    # RSI state tracking (for reset mechanism)
+    if rsi > 30:
+        position.reset_ready = True
+
+    levels = position.levels_taken
+    if rsi < 30 and position.reset_ready:
+        position.levels_taken = {"30": False, "20": False, "10": False}
+        position.reset_ready = False
+        return 30
+    if levels.get("30") and not levels.get("20") and rsi < 20:
+        return 20
+    if levels.get("20") and not levels.get("10") and rsi < 10:
+        return 10
+    return None
+
+
+def _reentry_capped(state: _BacktestState, date_str: str, rsi: float, next_level: int) -> bool:
+    """True (and report it) when the daily re-entry cap is already used"""
+    if state.reentries_by_date.get(date_str, 0) >= 1:
+        print(
+            f"   ?? RE-ENTRY SKIPPED on {date_str}: Daily cap reached (RSI {rsi:.1f} < {next_level})"
+        )
+        return True
+    return False
+
+
+def _execute_reentry(  # noqa: PLR0913
+    state: _BacktestState,
+    date_str: str,
+    rsi: float,
+    next_level: int,
+    exec_date_str: str,
+    exec_price: float,
+    exec_ema9: float,
+) -> None:
+    """Add a re-entry fill at the next session's open (no trade agent validation)"""
+    position = state.position
+    reentries_today = state.reentries_by_date.get(date_str, 0)
+
+    # Target is EMA9 (exit condition: High >= EMA9 OR RSI > 50)
+    new_target = exec_ema9
+    position.add_reentry(
+        exec_date_str, exec_price, state.capital_per_position, new_target, next_level
+    )
+    state.reentries_by_date[exec_date_str] = reentries_today + 1
+
+    print(
+        f"   ? RE-ENTRY on {exec_date_str}: RSI {rsi:.1f} < {next_level} | Add at {exec_price:.2f}"
+    )
+    print(f"      New Avg: {position.entry_price:.2f} | New Target: {position.target_price:.2f}")
+    state.executed_trades += 1
+
+
+def _execute_signal(  # noqa: PLR0913
+    state: _BacktestState,
+    date_str: str,
+    weekday_name: str,
+    rsi: float,
+    close: float,
+    ema200: float,
+    exec_date_str: str,
+    exec_price: float,
+    exec_ema9: float,
+) -> None:
+    """Validate an initial-entry signal and open a position at the next session's open"""
+    # Validate with trade agent (unless skipped for training data collection)
+    print(f"\n? Signal #{state.signal_count} detected on {date_str} ({weekday_name})")
+    print(f"   RSI: {rsi:.1f} < 30 | Close: {close:.2f} > EMA200: {ema200:.2f}")
+
+    if state.skip_trade_agent_validation:
+        # For training data: Skip trade agent validation, execute all RSI<30 & price>EMA200
+        print("   [WARN]?  Training mode: Skipping trade agent validation")
+        validation = {"approved": True, "target": exec_ema9}
+    else:
+        # Normal mode: Validate with trade agent
+        print("   ? Trade Agent analyzing...")
+        validation = validate_initial_entry_with_trade_agent(
+            state.stock_name,
+            date_str,
+            rsi,
+            ema200,
+            state.market_data,
+            config=state.config,
+            pre_fetched_weekly=state.weekly_data,
+        )
+
+    # Track ML predictions from validation (if available) with entry date
+    # For reversal strategy: we'll link this to position profitability later
+    if validation:
+        ml_verdict = validation.get("ml_verdict")
+        ml_confidence = validation.get("ml_confidence")
+        if ml_verdict and ml_confidence is not None:
+            # Normalize confidence to 0-1 range if needed
+            if ml_confidence > 1:
+                ml_confidence = ml_confidence / 100.0
+            # Store with entry date (will link to position index when position is created)
+            state.ml_predictions.append((ml_verdict, ml_confidence, exec_date_str, None))
+
+    if not (validation and validation.get("approved")):
+        print("   ?? SKIPPED: Trade agent rejected")
+        state.skipped_signals += 1
+        return
+
+    # Execute initial entry
+    # Target is EMA9 (exit condition: High >= EMA9 OR RSI > 50)
+    state.position = Position(
+        stock_name=state.stock_name,
+        entry_date=exec_date_str,
+        entry_price=exec_price,
+        target_price=exec_ema9,
+        capital=state.capital_per_position,
+        entry_rsi=rsi,  # Pass entry RSI to mark correct levels
+    )
+
+    # Link ML prediction to this position (for reversal strategy validation)
+    # Positions are matched by entry_date later; position_index is kept for backward
+    # compatibility (correct because positions are sequential)
+    if state.ml_predictions:
+        last_pred = state.ml_predictions[-1]
+        if len(last_pred) >= 4 and last_pred[3] is None:  # position_index not set yet
+            state.ml_predictions[-1] = (
+                last_pred[0],
+                last_pred[1],
+                last_pred[2],
+                len(state.all_positions),
+            )
+
+    print(f"   ? INITIAL ENTRY on {exec_date_str}: Buy at {exec_price:.2f}")
+    print(f"      Target: {state.position.target_price:.2f}")
+    state.executed_trades += 1
+
+
+def _run_daily_loop_iterrows(state: _BacktestState, backtest_data: pd.DataFrame) -> None:
+    """Reference daily loop: one ``iterrows`` row per trading day"""
+    for current_date, row in backtest_data.iterrows():
+        date_str = current_date.strftime("%Y-%m-%d")
+
+        # Validate trading day: Check if date is a weekday (Monday=0, Sunday=6)
+        weekday = current_date.weekday()
+        if weekday >= 5:  # Saturday (5) or Sunday (6)
+            print(f"   [WARN]? WARNING: Skipping non-trading day {date_str} (weekend)")
+            continue
+
+        rsi = row["RSI10"]
+        ema200 = row["EMA200"]
+        close = row["Close"]
+        high = row["High"]
+        low = row["Low"]
+
+        # Skip if RSI is NaN
+        if pd.isna(rsi):
+            continue
+
+        position = state.position
+        if position and not position.is_closed:
+            # Update drawdown tracking for open positions (ML Enhanced Features - Phase 3)
+            position.update_drawdown(date_str, low)
+
+            # Check exit conditions first (if position is open)
+            if _check_exit(state, date_str, high, close, rsi):
+                continue
+
+            # We have an open position - check for re-entry opportunities
+            next_level = _reentry_level(position, rsi)
+            if next_level:
+                if _reentry_capped(state, date_str, rsi, next_level):
+                    continue
+
+                # Find execution date (next trading day)
+                next_days = backtest_data.loc[backtest_data.index > current_date]
+                if next_days.empty:
+                    continue
+
+                _execute_reentry(
+                    state,
+                    date_str,
+                    rsi,
+                    next_level,
+                    next_days.index[0].strftime("%Y-%m-%d"),
+                    next_days.iloc[0]["Open"],
+                    next_days.iloc[0]["EMA9"],
+                )
+
+        # No position - check for initial entry
+        # Entry conditions: RSI < 30 AND Close > EMA200
+        elif rsi < 30 and close > ema200:
+            state.signal_count += 1
+
+            # Find execution date (next trading day)
+            next_days = backtest_data.loc[backtest_data.index > current_date]
+            if next_days.empty:
+                continue
+
+            _execute_signal(
+                state,
+                date_str,
+                current_date.strftime("%A"),
+                rsi,
+                close,
+                ema200,
+                next_days.index[0].strftime("%Y-%m-%d"),
+                next_days.iloc[0]["Open"],
+                next_days.iloc[0]["EMA9"],
+            )
+
+
+def _run_daily_loop_vectorized(state: _BacktestState, backtest_data: pd.DataFrame) -> None:
+    """
+    Array kernel with the same state machine as ``_run_daily_loop_iterrows``.
+
+    Columns are extracted once, the weekday / entry-signal masks and next-session row
+    positions are precomputed with NumPy, and the loop reads plain lists, so no per-day
+    ``Series`` is built and no frame is re-sliced to find the execution session.
+    """
+    dates = pd.DatetimeIndex(backtest_data.index)
+    n = len(dates)
+    date_strs = dates.strftime("%Y-%m-%d").tolist()
+    weekend = (dates.weekday >= 5).tolist()
+    next_rows = next_row_positions(backtest_data.index).tolist()
+
+    # Values stay NumPy scalars (as in iterrows rows) so P&L sums are bit-identical
+    rsi = column_values(backtest_data, "RSI10")
+    close = column_values(backtest_data, "Close")
+    ema200 = column_values(backtest_data, "EMA200")
+    high = column_values(backtest_data, "High")
+    low = column_values(backtest_data, "Low")
+    open_ = column_values(backtest_data, "Open")
+    ema9 = column_values(backtest_data, "EMA9")
+    rsi_ok = (~np.isnan(rsi)).tolist()
+    # Initial entry: RSI < 30 AND Close > EMA200 (NaN compares False)
+    entry_signal = ((rsi < 30) & (close > ema200)).tolist()
+
+    for i in range(n):
+        if weekend[i]:
+            print(f"   [WARN]? WARNING: Skipping non-trading day {date_strs[i]} (weekend)")
+            continue
+        if not rsi_ok[i]:
+            continue
+
+        position = state.position
+        if position and not position.is_closed:
+            position.update_drawdown(date_strs[i], low[i])
+            if _check_exit(state, date_strs[i], high[i], close[i], rsi[i]):
+                continue
+
+            next_level = _reentry_level(position, rsi[i])
+            if next_level:
+                if _reentry_capped(state, date_strs[i], rsi[i], next_level):
+                    continue
+                j = next_rows[i]
+                if j >= n:
+                    continue
+                _execute_reentry(
+                    state, date_strs[i], rsi[i], next_level, date_strs[j], open_[j], ema9[j]
+                )
+
+        elif entry_signal[i]:
+            state.signal_count += 1
+            j = next_rows[i]
+            if j >= n:
+                continue
+            _execute_signal(
+                state,
+                date_strs[i],
+                dates[i].strftime("%A"),
+                rsi[i],
+                close[i],
+                ema200[i],
+                date_strs[j],
+                open_[j],
+                ema9[j],
+            )
+
+
 def run_integrated_backtest(
     stock_name: str,
     date_range: tuple[str, str],
     capital_per_position: float = 50000,
     skip_trade_agent_validation: bool = False,
     config=None,
+    kernel: str | None = None,
 ) -> dict:
     """
     Single-pass integrated backtest - checks RSI daily and executes trades inline.
@@ -314,11 +664,15 @@ def run_integrated_backtest(
         skip_trade_agent_validation: If True, skip trade agent validation and execute
                                      all signals that meet RSI<30 & price>EMA200.
                                      Use for ML training data collection. Default: False
+        kernel: Daily loop implementation - "vectorized" (array kernel) or "iterrows"
+                (row-by-row reference loop). Both produce identical positions.
+                Default: settings.BACKTEST_KERNEL
 
     Returns:
         Backtest results dictionary
     """
     start_date, end_date = date_range
+    kernel = resolve_kernel(kernel)
 
     print(f"? Starting Integrated Backtest for {stock_name}")
     print(f"Period: {start_date} to {end_date}")
@@ -330,25 +684,26 @@ def run_integrated_backtest(
     # Fetch market data with buffer for indicators
     start_dt = pd.to_datetime(start_date)
     end_dt = pd.to_datetime(end_date)
-    # EMA200 needs: 200 periods + ~100 warm-up = 300 trading days ? 420 calendar days
-    ema_buffer_days = int((200 + 100) * 1.4)  # EMA200 + warm-up, converted to calendar days
-    days_needed = (end_dt - start_dt).days + ema_buffer_days
+    days_needed = backtest_fetch_days(start_date, end_date)
 
     market_data = fetch_ohlcv_yf(
         ticker=stock_name, days=days_needed, interval="1d", end_date=end_date, add_current_day=False
     )
 
-    weekly_data = fetch_ohlcv_yf(
-        ticker=stock_name,
-        days=days_needed,
-        interval="1wk",
-        end_date=end_date,
-        add_current_day=False,
-    )
-
     if market_data is None or market_data.empty:
         return {"error": "Failed to fetch market data"}
 
+    # Weekly bars resampled from the daily series (same window; no second network fetch).
+    # Too few weeks (or no Yahoo weekly data on the fallback path) is a ValueError; the
+    # backtest then runs daily-only
+    try:
+        weekly_data = weekly_from_daily(
+            stock_name, market_data, days=days_needed, end_date=end_date, add_current_day=False
+        )
+    except ValueError as e:
+        logger.info(f"Weekly data unavailable for {stock_name}: {e} - continuing daily-only")
+        weekly_data = None
+
     # Prepare data
     if "date" in market_data.columns:
         market_data = market_data.set_index("date")
@@ -399,231 +754,27 @@ def run_integrated_backtest(
     print()
 
     # Track state
-    position: Position | None = None
-    all_positions: list[Position] = []  # Track all positions for results
-    executed_trades = 0
-    skipped_signals = 0
-    signal_count = 0  # Counter for signal numbering
-    reentries_by_date = {}  # {date: count} for daily cap
-
-    # Track ML predictions during backtest with entry dates for reversal strategy
-    # Format: (ml_verdict, ml_confidence, entry_date, position_index)
-    # position_index will be set when position is created
-    backtest_ml_predictions = (
-        []
-    )  # List of (ml_verdict, ml_confidence, entry_date, position_index) tuples
-    ml_prediction_to_position = {}  # Map: entry_date -> position_index (set when position created)
+    state = _BacktestState(
+        stock_name=stock_name,
+        capital_per_position=capital_per_position,
+        skip_trade_agent_validation=skip_trade_agent_validation,
+        market_data=market_data,
+        weekly_data=weekly_data,
+        config=config,
+    )
 
     # Iterate through each trading day
-    for current_date, row in backtest_data.iterrows():
-        date_str = current_date.strftime("%Y-%m-%d")
-
-        # Validate trading day: Check if date is a weekday (Monday=0, Sunday=6)
-        weekday = current_date.weekday()
-        if weekday >= 5:  # Saturday (5) or Sunday (6)
-            print(f"   [WARN]? WARNING: Skipping non-trading day {date_str} (weekend)")
-            continue
-
-        rsi = row["RSI10"]
-        ema200 = row["EMA200"]
-        ema9 = row["EMA9"]
-        close = row["Close"]
-        high = row["High"]
-        low = row["Low"]
-
-        # Skip if RSI is NaN
-        if pd.isna(rsi):
-            continue
-
-        # Update drawdown tracking for open positions (ML Enhanced Features - Phase 3)
-        if position and not position.is_closed:
-            position.update_drawdown(date_str, low)
-
-        # Check exit conditions first (if position is open)
-        if position and not position.is_closed:
-            # Exit condition 1: High >= Target
-            # Note: Can exit same day as re-entry if High hits target during the day
-            if high >= position.target_price:
-                position.close_position(date_str, position.target_price, "Target reached")
-                print(f"   ? TARGET HIT on {date_str}: Exit at {position.target_price:.2f}")
-                print(
-                    f"      Entry: {position.entry_date.strftime('%Y-%m-%d')} | Exit: {position.exit_date.strftime('%Y-%m-%d')} | Days: {(position.exit_date - position.entry_date).days}"
-                )
-                print(f"      P&L: ${position.get_pnl():,.0f} ({position.get_return_pct():+.1f}%)")
-                # Store position index before appending (for ML prediction linking)
-                position_index = len(all_positions)
-                all_positions.append(position)  # Save closed position
-                position = None  # Clear position
-                continue
-
-            # Exit condition 2: RSI > 50
-            elif rsi > 50:
-                position.close_position(date_str, close, "RSI > 50")
-                print(f"   ? RSI EXIT on {date_str}: RSI {rsi:.1f} > 50, Exit at {close:.2f}")
-                print(
-                    f"      Entry: {position.entry_date.strftime('%Y-%m-%d')} | Exit: {position.exit_date.strftime('%Y-%m-%d')} | Days: {(position.exit_date - position.entry_date).days}"
-                )
-                print(f"      P&L: ${position.get_pnl():,.0f} ({position.get_return_pct():+.1f}%)")
-                # Store position index before appending (for ML prediction linking)
-                position_index = len(all_positions)
-                all_positions.append(position)  # Save closed position
-                position = None  # Clear position
-                continue
-
-        # RSI state tracking (for reset mechanism)
-        if position and not position.is_closed:
-            if rsi > 30:
-                position.reset_ready = True
-
-        # Check entry/re-entry conditions
-        if position and not position.is_closed:
-            # We have an open position - check for re-entry opportunities
-            next_level = None
-            levels = position.levels_taken
-
-            # Reset cycle: RSI > 30 then < 30 again
-            if rsi < 30 and position.reset_ready:
-                position.levels_taken = {"30": False, "20": False, "10": False}
-                position.reset_ready = False
-                levels = position.levels_taken
-                next_level = 30
-            # Normal progression through levels
-            elif levels.get("30") and not levels.get("20") and rsi < 20:
-                next_level = 20
-            elif levels.get("20") and not levels.get("10") and rsi < 10:
-                next_level = 10
-
-            if next_level:
-                # Check daily cap
-                reentries_today = reentries_by_date.get(date_str, 0)
-                if reentries_today >= 1:
-                    print(
-                        f"   ?? RE-ENTRY SKIPPED on {date_str}: Daily cap reached (RSI {rsi:.1f} < {next_level})"
-                    )
-                    continue
-
-                # Find execution date (next trading day)
-                next_days = backtest_data.loc[backtest_data.index > current_date]
-                if next_days.empty:
-                    continue
-
-                exec_date = next_days.index[0]
-                exec_date_str = exec_date.strftime("%Y-%m-%d")
-                exec_price = next_days.iloc[0]["Open"]
-                exec_ema9 = next_days.iloc[0]["EMA9"]
-
-                # Target is EMA9 (exit condition: High >= EMA9 OR RSI > 50)
-                new_target = exec_ema9
-
-                # Execute re-entry (no trade agent validation)
-                position.add_reentry(
-                    exec_date_str, exec_price, capital_per_position, new_target, next_level
-                )
-                reentries_by_date[exec_date_str] = reentries_today + 1
-
-                print(
-                    f"   ? RE-ENTRY on {exec_date_str}: RSI {rsi:.1f} < {next_level} | Add at {exec_price:.2f}"
-                )
-                print(
-                    f"      New Avg: {position.entry_price:.2f} | New Target: {position.target_price:.2f}"
-                )
-                executed_trades += 1
-
-        elif not position:
-            # No position - check for initial entry
-            # Entry conditions: RSI < 30 AND Close > EMA200
-            if rsi < 30 and close > ema200:
-                signal_count += 1
-
-                # Find execution date (next trading day)
-                next_days = backtest_data.loc[backtest_data.index > current_date]
-                if next_days.empty:
-                    continue
-
-                exec_date = next_days.index[0]
-                exec_date_str = exec_date.strftime("%Y-%m-%d")
-                exec_price = next_days.iloc[0]["Open"]
-                exec_ema9 = next_days.iloc[0]["EMA9"]
-
-                # Validate with trade agent (unless skipped for training data collection)
-                # Additional validation: Verify this is actually a trading day (weekday check already done above)
-                weekday_name = current_date.strftime("%A")
-                print(f"\n? Signal #{signal_count} detected on {date_str} ({weekday_name})")
-                print(f"   RSI: {rsi:.1f} < 30 | Close: {close:.2f} > EMA200: {ema200:.2f}")
-
-                if skip_trade_agent_validation:
-                    # For training data: Skip trade agent validation, execute all RSI<30 & price>EMA200
-                    print("   [WARN]?  Training mode: Skipping trade agent validation")
-                    validation = {"approved": True, "target": exec_ema9}
-                else:
-                    # Normal mode: Validate with trade agent
-                    print("   ? Trade Agent analyzing...")
-                    validation = validate_initial_entry_with_trade_agent(
-                        stock_name,
-                        date_str,
-                        rsi,
-                        ema200,
-                        market_data,
-                        config=config,
-                        pre_fetched_weekly=weekly_data,
-                    )
-
-                # Track ML predictions from validation (if available) with entry date
-                # For reversal strategy: we'll link this to position profitability later
-                if validation:
-                    ml_verdict = validation.get("ml_verdict")
-                    ml_confidence = validation.get("ml_confidence")
-                    if ml_verdict and ml_confidence is not None:
-                        # Normalize confidence to 0-1 range if needed
-                        if ml_confidence > 1:
-                            ml_confidence = ml_confidence / 100.0
-                        # Store with entry date (will link to position index when position is created)
-                        backtest_ml_predictions.append(
-                            (ml_verdict, ml_confidence, exec_date_str, None)
-                        )
-
-                if validation and validation.get("approved"):
-                    # Execute initial entry
-                    # Target is EMA9 (exit condition: High >= EMA9 OR RSI > 50)
-                    target = exec_ema9
-
-                    position = Position(
-                        stock_name=stock_name,
-                        entry_date=exec_date_str,
-                        entry_price=exec_price,
-                        target_price=target,
-                        capital=capital_per_position,
-                        entry_rsi=rsi,  # Pass entry RSI to mark correct levels
-                    )
-
-                    # Link ML prediction to this position (for reversal strategy validation)
-                    # Use entry_date as the link (more robust than position_index)
-                    # The position will be matched by entry_date when checking profitability
-                    # Note: We still store position_index for backward compatibility, but use entry_date for matching
-                    if backtest_ml_predictions:
-                        last_pred = backtest_ml_predictions[-1]
-                        if (
-                            len(last_pred) >= 4 and last_pred[3] is None
-                        ):  # position_index not set yet
-                            # Store entry_date in position_index field for now (will be used to find position later)
-                            # entry_date is already in last_pred[2], so we keep it
-                            # We'll match by entry_date when checking profitability
-                            position_index = len(
-                                all_positions
-                            )  # Estimate (will be correct if sequential)
-                            backtest_ml_predictions[-1] = (
-                                last_pred[0],
-                                last_pred[1],
-                                last_pred[2],
-                                position_index,
-                            )
-
-                    print(f"   ? INITIAL ENTRY on {exec_date_str}: Buy at {exec_price:.2f}")
-                    print(f"      Target: {position.target_price:.2f}")
-                    executed_trades += 1
-                else:
-                    print("   ?? SKIPPED: Trade agent rejected")
-                    skipped_signals += 1
+    if kernel == KERNEL_VECTORIZED:
+        _run_daily_loop_vectorized(state, backtest_data)
+    else:
+        _run_daily_loop_iterrows(state, backtest_data)
+
+    position = state.position
+    all_positions = state.all_positions
+    executed_trades = state.executed_trades
+    skipped_signals = state.skipped_signals
+    signal_count = state.signal_count
+    backtest_ml_predictions = state.ml_predictions
 
     # Close any remaining open position at period end
     if position and not position.is_closed:
@@ -22,7 +22,10 @@ try:
 except ImportError:
     pyotp = None
 
-from modules.kotak_neo_auto_trader.infrastructure.clients.kotak_rest_client import KotakRestClient
+from modules.kotak_neo_auto_trader.infrastructure.clients.kotak_rest_client import (
+    KotakHttpSettings,
+    KotakRestClient,
+)
 
 # IPv4 resolution control (scoped + configurable)
 _original_getaddrinfo = socket.getaddrinfo
@@ -296,7 +299,7 @@ class KotakNeoAuth:
             self.session_token = trade_token
             self.base_url = base_url  # type: ignore[attr-defined]
             self.trade_sid = trade_sid  # type: ignore[attr-defined]
-            self._rest_client = None  # Reset client cache on new login
+            self._discard_rest_client()  # Reset client cache on new login
             self.client = None  # Reset compatibility attribute on new login
 
             self.logger.info("Kotak REST login completed successfully")
@@ -334,15 +337,37 @@ class KotakNeoAuth:
             raise ConnectionError("Missing REST session details (base_url/session_token/trade_sid)")
 
         if self._rest_client is None:
+            from config.settings import (  # noqa: PLC0415
+                KOTAK_HTTP_POOL_CONNECTIONS,
+                KOTAK_HTTP_POOL_MAXSIZE,
+                KOTAK_HTTP_TIMEOUT_S,
+                KOTAK_HTTP_TIMEOUTS,
+            )
+
             self._rest_client = KotakRestClient(
                 base_url=self.base_url,
                 session_token=self.session_token,
                 session_sid=self.trade_sid,
                 access_token=self.consumer_key,
+                http=KotakHttpSettings(
+                    timeout=KOTAK_HTTP_TIMEOUT_S,
+                    timeouts=KOTAK_HTTP_TIMEOUTS,
+                    pool_connections=KOTAK_HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=KOTAK_HTTP_POOL_MAXSIZE,
+                ),
             )
             self.client = self._rest_client
         return self._rest_client
 
+    def _discard_rest_client(self) -> None:
+        """Drop the cached REST client and close its pooled connections."""
+        rest_client, self._rest_client = self._rest_client, None
+        if rest_client is not None:
+            try:
+                rest_client.close()
+            except OSError as e:
+                logger.debug(f"Error closing REST client connections: {e}")
+
     def login(self) -> bool:
         """
         Perform complete login process.
@@ -469,7 +494,7 @@ class KotakNeoAuth:
             self.session_token = None
             self.base_url = None
             self.trade_sid = None
-            self._rest_client = None
+            self._discard_rest_client()
             self.client = None
             self.logger.error(
                 f"[REAUTH_DEBUG] FAILED: re-authentication failed after {total_duration:.2f}s"
@@ -487,7 +512,7 @@ class KotakNeoAuth:
             self.session_token = None
             self.base_url = None
             self.trade_sid = None
-            self._rest_client = None
+            self._discard_rest_client()
             self.client = None
             return False
 
@@ -539,7 +564,7 @@ class KotakNeoAuth:
         self.session_token = None
         self.base_url = None
         self.trade_sid = None
-        self._rest_client = None
+        self._discard_rest_client()
         self.client = None
         self.logger.info("Logout successful (local session cleared)")
         return True
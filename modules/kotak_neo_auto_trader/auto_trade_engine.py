@@ -11,8 +11,10 @@ import os
 
 # Project logger
 import sys
+import threading
 import time
 from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import date, datetime
 from math import floor, isfinite
@@ -57,6 +59,7 @@ try:
     )
     from .orders import KotakNeoOrders
     from .portfolio import KotakNeoPortfolio
+    from .run_order_view import RunOrderView
     from .scrip_master import KotakNeoScripMaster
     from .storage import (
         add_failed_order,
@@ -78,6 +81,7 @@ try:
     from .trader import KotakNeoTrader
     from .utils.order_field_extractor import OrderFieldExtractor
     from .utils.order_sizing_helper import apply_max_order_value_cap
+    from .utils.symbol_utils import extract_base_symbol
 except ImportError:
     from modules.kotak_neo_auto_trader import config
     from modules.kotak_neo_auto_trader.auth import KotakNeoAuth
@@ -95,6 +99,7 @@ except ImportError:
     )
     from modules.kotak_neo_auto_trader.orders import KotakNeoOrders
     from modules.kotak_neo_auto_trader.portfolio import KotakNeoPortfolio
+    from modules.kotak_neo_auto_trader.run_order_view import RunOrderView
     from modules.kotak_neo_auto_trader.scrip_master import KotakNeoScripMaster
     from modules.kotak_neo_auto_trader.storage import (
         add_failed_order,
@@ -115,6 +120,7 @@ except ImportError:
     from modules.kotak_neo_auto_trader.utils.order_field_extractor import (
         OrderFieldExtractor,
     )
+    from modules.kotak_neo_auto_trader.utils.symbol_utils import extract_base_symbol
 
 
 @dataclass
@@ -164,6 +170,12 @@ class AutoTradeEngine:
         self.user_id = user_id
         self.db = db_session
 
+        # Run-scoped DB order/position view (loaded on first check inside a run); the
+        # lock guards the nesting depth and the view across threads sharing this engine
+        self._order_view: RunOrderView | None = None
+        self._order_view_depth = 0
+        self._order_view_lock = threading.RLock()
+
         # Phase 2.3: User-specific configuration
         if strategy_config is None:
             # Fallback to default config for backward compatibility
@@ -449,6 +461,76 @@ class AutoTradeEngine:
             return
         self._send_balance_shortfall_digest([item], dry_run=dry_run)
 
+    # ---------------------- Run-scoped Order View ----------------------
+    @contextmanager
+    def _order_view_run(self):
+        """
+        Serve per-symbol DB checks from one RunOrderView while the block runs.
+
+        The view is loaded lazily by the first check (after any pre-run reconciliation)
+        and dropped when the outermost run exits.
+        """
+        with self._order_view_lock:
+            self._order_view_depth += 1
+        try:
+            yield
+        finally:
+            with self._order_view_lock:
+                self._order_view_depth -= 1
+                if self._order_view_depth == 0:
+                    self._order_view = None
+
+    def _get_order_view(self) -> RunOrderView | None:
+        """Current run's view, or None outside a run (callers then query the repository)."""
+        orders_repo = getattr(self, "orders_repo", None)
+        with self._order_view_lock:
+            if self._order_view_depth == 0 or not orders_repo or not self.user_id:
+                return None
+            if self._order_view is None:
+                try:
+                    self._order_view = RunOrderView.load(
+                        orders_repo, getattr(self, "positions_repo", None), self.user_id
+                    )
+                    logger.debug(f"Loaded run order view: {len(self._order_view)} order(s)")
+                except Exception as e:
+                    logger.warning(f"Could not load run order view, querying per check: {e}")
+                    return None
+            return self._order_view
+
+    def _record_order_write(self, order: Any) -> None:
+        """Reflect an order created/updated during the run in the run view."""
+        with self._order_view_lock:
+            if self._order_view is not None:
+                self._order_view.record_order(order)
+
+    def _record_position_write(self, symbol: str, position: Any | None) -> None:
+        """Reflect a position upserted/closed during the run in the run view."""
+        with self._order_view_lock:
+            if self._order_view is not None:
+                self._order_view.record_position(symbol, position)
+
+    def _record_placed_order(self, order_id: str | None) -> None:
+        """Pull an order written by the order tracker (add_pending_order) into the run view."""
+        if not order_id:
+            return
+        with self._order_view_lock:
+            if self._order_view is None:
+                return
+            try:
+                self._order_view.record_order(
+                    self.orders_repo.get_by_order_id(self.user_id, str(order_id))
+                )
+            except Exception as e:
+                logger.debug(f"Dropping run order view after refresh failure for {order_id}: {e}")
+                self._order_view = None
+
+    def _get_open_position(self, symbol: str) -> Any | None:
+        """Most recent open position for ``symbol`` (run view first, then the repository)."""
+        order_view = self._get_order_view()
+        if order_view is not None:
+            return order_view.open_position(symbol)
+        return self.positions_repo.get_by_symbol(self.user_id, symbol)
+
     # ---------------------- Storage Abstraction (Phase 2.3) ----------------------
     def _load_trades_history(self) -> dict[str, Any]:
         """
@@ -459,20 +541,29 @@ class AutoTradeEngine:
             # Use repository-based storage
 
             # Get open positions
-            open_positions = self.positions_repo.list(self.user_id)
-            open_positions = [p for p in open_positions if p.closed_at is None]
-
-            # Get buy orders for these positions to reconstruct trade metadata
-            all_orders, _ = self.orders_repo.list(self.user_id)
-            buy_orders = [o for o in all_orders if o.side.lower() == "buy"]
+            all_positions = self.positions_repo.list(self.user_id)
+            open_positions = [p for p in all_positions if p.closed_at is None]
+
+            # Get buy orders for these positions to reconstruct trade metadata,
+            # grouped once by base symbol instead of re-scanned per position
+            order_view = self._get_order_view()
+            if order_view is not None:
+                all_orders = order_view.all_orders()
+            else:
+                all_orders, _ = self.orders_repo.list(self.user_id)
+            orders_by_base: dict[str, list[Any]] = defaultdict(list)
+            buy_orders_by_base: dict[str, list[Any]] = defaultdict(list)
+            for o in all_orders:
+                order_base = extract_base_symbol(o.symbol)
+                orders_by_base[order_base].append(o)
+                if o.side.lower() == "buy":
+                    buy_orders_by_base[order_base].append(o)
 
             # Convert positions to trades format
             trades = []
             for pos in open_positions:
                 # Find related buy orders for this position
-                symbol_orders = [
-                    o for o in buy_orders if o.symbol.upper().split("-")[0] == pos.symbol.upper()
-                ]
+                symbol_orders = buy_orders_by_base.get(extract_base_symbol(pos.symbol), [])
                 if symbol_orders:
                     # Use the first buy order's metadata
                     first_order = symbol_orders[0]
@@ -506,14 +597,10 @@ class AutoTradeEngine:
                 trades.append(trade)
 
             # Get closed positions (for historical reference)
-            closed_positions = [
-                p for p in self.positions_repo.list(self.user_id) if p.closed_at is not None
-            ]
+            closed_positions = [p for p in all_positions if p.closed_at is not None]
             for pos in closed_positions:
                 # Find related orders
-                symbol_orders = [
-                    o for o in all_orders if o.symbol.upper().split("-")[0] == pos.symbol.upper()
-                ]
+                symbol_orders = orders_by_base.get(pos.symbol.upper(), [])
                 if symbol_orders:
                     first_order = symbol_orders[0]
                     metadata = first_order.order_metadata or {}
@@ -622,7 +709,7 @@ class AutoTradeEngine:
             if existing_pos and existing_pos.entry_rsi is not None:
                 entry_rsi = None  # Don't update existing entry_rsi
 
-            self.positions_repo.upsert(
+            position = self.positions_repo.upsert(
                 user_id=self.user_id,
                 symbol=symbol,
                 quantity=qty,
@@ -636,6 +723,7 @@ class AutoTradeEngine:
                 last_reentry_price=last_reentry_price,
                 entry_rsi=entry_rsi,  # Set entry RSI for new positions
             )
+            self._record_position_write(symbol, position)
         elif status == "closed":
             # Close position using mark_closed() to ensure exit details are populated
             pos = self.positions_repo.get_by_symbol(self.user_id, symbol)
@@ -687,6 +775,7 @@ class AutoTradeEngine:
                     sell_order_id=sell_order_id,
                     auto_commit=True,
                 )
+                self._record_position_write(pos.symbol, None)
 
     def _save_trades_history(self, data: dict[str, Any]) -> None:
         """
@@ -850,11 +939,12 @@ class AutoTradeEngine:
                     order = existing_failed_orders[0]
                     try:
                         retry_count = order.retry_count or 0
-                        self.orders_repo.mark_failed(
+                        failed_db_order = self.orders_repo.mark_failed(
                             order=order,
                             failure_reason=failure_reason_str,
                             retry_pending=retry_pending,
                         )
+                        self._record_order_write(failed_db_order)
                         logger.debug(
                             f"Updated existing failed order for {symbol} "
                             f"(status: FAILED)"  # All failures are FAILED now
@@ -942,11 +1032,12 @@ class AutoTradeEngine:
                         return  # Exit early if order creation failed
                     # Phase 6: Mark as failed with proper status and metadata in columns
                     try:
-                        self.orders_repo.mark_failed(
+                        failed_db_order = self.orders_repo.mark_failed(
                             order=new_order,
                             failure_reason=failure_reason_str,
                             retry_pending=retry_pending,
                         )
+                        self._record_order_write(failed_db_order)
                         logger.debug(
                             f"Created new failed order for {symbol} "
                             f"(status: FAILED)"  # All failures are FAILED now
@@ -1016,8 +1107,10 @@ class AutoTradeEngine:
                         # Phase 6: Mark as closed instead of removing (keep record)
                         try:
                             retry_count = order.retry_count or 0
-                            self.orders_repo.mark_cancelled(
-                                order=order, cancelled_reason="Removed from retry queue"
+                            self._record_order_write(
+                                self.orders_repo.mark_cancelled(
+                                    order=order, cancelled_reason="Removed from retry queue"
+                                )
                             )
                             logger.debug(f"Removed failed order for {symbol} from retry queue")
                             # Phase 9: Send notification for retry queue removal
@@ -2397,7 +2490,11 @@ class AutoTradeEngine:
         # This prevents duplicates when broker API doesn't return pending orders or is unavailable
         if self.orders_repo and self.user_id:
             try:
-                existing_orders, _ = self.orders_repo.list(self.user_id)
+                order_view = self._get_order_view()
+                if order_view is not None:
+                    existing_orders = order_view.orders_for(base_symbol, side="buy")
+                else:
+                    existing_orders, _ = self.orders_repo.list(self.user_id)
                 for existing_order in existing_orders:
                     # Check if symbol matches (including variants)
                     order_symbol_base = (
@@ -2463,7 +2560,7 @@ class AutoTradeEngine:
                 )
                 return 0
 
-            position = self.positions_repo.get_by_symbol(self.user_id, base_symbol)
+            position = self._get_open_position(base_symbol)
             if not position or not position.reentries:
                 return 0
 
@@ -2650,7 +2747,7 @@ class AutoTradeEngine:
             if not self.positions_repo or not self.user_id:
                 return False
 
-            position = self.positions_repo.get_by_symbol(self.user_id, base_symbol)
+            position = self._get_open_position(base_symbol)
             if not position:
                 return False
 
@@ -2726,9 +2823,12 @@ class AutoTradeEngine:
             if not self.positions_repo or not self.user_id:
                 return False
 
-            position = self.positions_repo.get_by_symbol(self.user_id, base_symbol)
+            position = self._get_open_position(base_symbol)
             orders: list[Any] = []
-            if self.orders_repo:
+            order_view = self._get_order_view()
+            if order_view is not None:
+                orders = order_view.orders_for(base_symbol)
+            elif self.orders_repo:
                 orders_list, _ = self.orders_repo.list(self.user_id)
                 orders = list(orders_list or [])
 
@@ -3092,6 +3192,7 @@ class AutoTradeEngine:
             logger.warning(f"Order verification failed (non-critical): {e}")
             # Don't fail order placement if verification fails
 
+        self._record_placed_order(order_id)
         return (True, order_id)
 
     def _sync_order_status_snapshot(
@@ -4737,6 +4838,15 @@ class AutoTradeEngine:
         recommendations: list[Recommendation],
         *,
         dry_run: bool = False,
+    ) -> dict[str, int | list]:
+        with self._order_view_run():
+            return self._place_new_entries(recommendations, dry_run=dry_run)
+
+    def _place_new_entries(
+        self,
+        recommendations: list[Recommendation],
+        *,
+        dry_run: bool = False,
     ) -> dict[str, int | list]:
         summary = {
             "attempted": 0,
@@ -5265,12 +5375,13 @@ class AutoTradeEngine:
 
                         if existing_order:
                             # Update existing order
-                            self.orders_repo.update(
+                            updated_order = self.orders_repo.update(
                                 existing_order,
                                 quantity=manual_qty,
                                 price=manual_price if manual_price > 0 else None,
                                 status=DbOrderStatus.PENDING,
                             )
+                            self._record_order_write(updated_order)
                             logger.info(
                                 f"Updated existing DB order {existing_order.id} for {manual_symbol} "
                                 f"with manual order details"
@@ -5289,7 +5400,7 @@ class AutoTradeEngine:
                                 broker_order_id=manual_order_id,
                             )
                             db_order.status = DbOrderStatus.PENDING
-                            self.orders_repo.update(db_order)
+                            self._record_order_write(self.orders_repo.update(db_order))
                             logger.info(
                                 f"Created new DB order {db_order.id} for {manual_symbol} "
                                 f"with manual order details"
@@ -5314,6 +5425,7 @@ class AutoTradeEngine:
                     check_active_buy_order=True,
                     check_holdings=False,  # Already checked holdings above
                     cached_pending_orders=cached_pending_orders,
+                    order_view=self._get_order_view(),
                 )
             )
 
@@ -5338,7 +5450,11 @@ class AutoTradeEngine:
             existing_db_order = None
             if self.orders_repo and self.user_id:
                 try:
-                    existing_orders, _ = self.orders_repo.list(self.user_id)
+                    order_view = self._get_order_view()
+                    if order_view is not None:
+                        existing_orders = order_view.orders_for(broker_symbol, side="buy")
+                    else:
+                        existing_orders, _ = self.orders_repo.list(self.user_id)
                     for existing_order in existing_orders:
                         order_symbol_base = (
                             existing_order.symbol.upper()
@@ -5570,11 +5686,20 @@ class AutoTradeEngine:
 
                         # Update existing DB order status to CANCELLED (replaced due to parameter change)
                         try:
-                            self.orders_repo.update(
-                                existing_db_order,
+                            from src.infrastructure.persistence.orders_repository import (
+                                OrderRow,
+                            )
+
+                            db_order = existing_db_order
+                            if isinstance(db_order, OrderRow):
+                                # Run view rows are read-only snapshots; update the ORM row
+                                db_order = self.orders_repo.get(db_order.id)
+                            cancelled_order = self.orders_repo.update(
+                                db_order,
                                 status=DbOrderStatus.CANCELLED,
                                 cancelled_reason="Order cancelled due to parameter update (qty/price changed)",
                             )
+                            self._record_order_write(cancelled_order)
                             logger.info(
                                 f"Marked existing DB order {existing_db_order.id} as CANCELLED "
                                 f"(replaced with new order due to parameter update)"
@@ -5842,6 +5967,10 @@ class AutoTradeEngine:
         Returns:
             Summary dict with re-entry statistics
         """
+        with self._order_view_run():
+            return self._place_reentry_orders(dry_run=dry_run)
+
+    def _place_reentry_orders(self, *, dry_run: bool = False) -> dict[str, int]:
         summary = {
             "attempted": 0,
             "placed": 0,
@@ -6065,6 +6194,9 @@ class AutoTradeEngine:
 
                         # Refresh position object to get updated metadata
                         position = self.positions_repo.get_by_symbol(self.user_id, symbol)
+                        order_view = self._get_order_view()
+                        if order_view is not None:
+                            order_view.record_position(symbol, position)
                         if not position:
                             logger.warning(f"Position {symbol} not found after metadata update")
                             summary["skipped_missing_data"] += 1
@@ -6519,6 +6651,10 @@ class AutoTradeEngine:
         return (next_level, metadata_updates)
 
     def evaluate_reentries_and_exits(self) -> dict[str, int]:
+        with self._order_view_run():
+            return self._evaluate_reentries_and_exits()
+
+    def _evaluate_reentries_and_exits(self) -> dict[str, int]:
         summary = {"symbols_evaluated": 0, "exits": 0, "reentries": 0}
 
         # Check if authenticated - if not, try to re-authenticate
@@ -6935,6 +7071,7 @@ class AutoTradeEngine:
                                     },
                                 )
                                 logger.debug(f"Added reentry order {reentry_order_id} to tracking")
+                                self._record_placed_order(reentry_order_id)
                             except Exception as e:
                                 logger.warning(f"Failed to add reentry order to tracking: {e}")
 
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Per-cycle broker snapshot cache (one per authenticated user session).
+
+Within one scheduler tick the sell engine, unified order monitor, order status verifier,
+order state manager and AutoTradeEngine all read the order book, holdings and positions.
+While a cycle is open (``with get_broker_snapshot_service(auth).cycle("sell_monitor")``),
+``KotakNeoOrders.get_orders`` and ``KotakNeoPortfolio.get_holdings``/``get_positions``
+serve each resource from one broker call (re-fetched after ``BROKER_SNAPSHOT_TTL_S``);
+concurrent callers share a single in-flight request. Outside a cycle every call goes
+straight to the broker, as before. ``broker_snapshot_cycle(..., prefetch=True)`` loads all
+three up front with one concurrent ``KotakRestClient.get_account_snapshot`` call.
+
+Every caller gets its own deep copy of the snapshot payload, so one consumer editing its
+order book or holdings cannot corrupt another's.
+
+Order placement/modification/cancellation invalidates the cached order book (fetches
+already in flight across the mutation are not stored), and failed or auth-error
+responses are never cached (``handle_reauth`` retries hit the broker).
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import threading
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from config.settings import BROKER_SNAPSHOT_TTL_S
+from core.single_flight_cache import SingleFlightCache
+from utils.logger import logger
+
+try:
+    from .auth_handler import is_auth_error
+except ImportError:  # pragma: no cover
+    from modules.kotak_neo_auto_trader.auth_handler import is_auth_error
+
+ORDERS = "orders"
+HOLDINGS = "holdings"
+POSITIONS = "positions"
+RESOURCES = (ORDERS, HOLDINGS, POSITIONS)
+# KotakRestClient.get_account_snapshot key of each resource
+_ACCOUNT_SNAPSHOT_KEYS = {ORDERS: "order_book", HOLDINGS: "holdings", POSITIONS: "positions"}
+
+# Every field an order id may come from (REST order book, legacy SDK, normalized dicts)
+_ORDER_ID_FIELDS = ("neoOrdNo", "nOrdNo", "orderId", "order_id")
+_SYMBOL_FIELDS = ("trdSym", "tradingSymbol", "symbol")
+
+
+class BrokerOrderIndex:
+    """Order book rows indexed by order id and by upper-cased trading symbol."""
+
+    def __init__(self, orders: Iterable[dict[str, Any]] | None):
+        self.orders: list[dict[str, Any]] = [o for o in orders or [] if isinstance(o, dict)]
+        self.by_id: dict[str, dict[str, Any]] = {}
+        self.by_symbol: dict[str, list[dict[str, Any]]] = {}
+        for order in self.orders:
+            for field in _ORDER_ID_FIELDS:
+                order_id = order.get(field)
+                if order_id:
+                    # First row wins, matching the linear scans this replaces
+                    self.by_id.setdefault(str(order_id), order)
+            symbol = next((order[f] for f in _SYMBOL_FIELDS if order.get(f)), "")
+            if symbol:
+                self.by_symbol.setdefault(str(symbol).upper(), []).append(order)
+
+    @classmethod
+    def from_response(cls, response: Any) -> BrokerOrderIndex:
+        """Build from a ``get_orders()`` payload (``{"data": [...]}``) or a plain list."""
+        if isinstance(response, dict):
+            data = response.get("data")
+            return cls(data if isinstance(data, list) else [])
+        return cls(response if isinstance(response, list) else [])
+
+    def get(self, order_id: Any) -> dict[str, Any] | None:
+        return self.by_id.get(str(order_id)) if order_id else None
+
+    def for_symbol(self, symbol: str) -> list[dict[str, Any]]:
+        return self.by_symbol.get(symbol.upper(), [])
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+
+def _cacheable(response: Any) -> bool:
+    """Only successful broker payloads are shared; errors are re-fetched by the next caller."""
+    if not isinstance(response, dict):
+        return False
+    if "error" in response or str(response.get("stat") or "").lower() == "not_ok":
+        return False
+    return not is_auth_error(response)
+
+
+class BrokerSnapshotService:
+    """
+    Short-TTL, single-flight cache for broker reads, active only inside ``cycle()``.
+
+    Per-cycle counters (``get_cycle_stats``) per resource:
+        calls: reads requested while the cycle was open
+        hits: served from the snapshot (including callers that joined an in-flight fetch)
+        fetches: broker calls actually made
+    """
+
+    def __init__(self, ttl_seconds: float = BROKER_SNAPSHOT_TTL_S):
+        self.ttl_seconds = ttl_seconds
+        self._cache = SingleFlightCache(max_size=len(RESOURCES), name="BrokerSnapshot")
+        self._lock = threading.Lock()
+        self._depth = 0
+        self._cycle_name = ""
+        self._stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> dict[str, dict[str, int]]:
+        return {r: {"calls": 0, "hits": 0, "fetches": 0} for r in RESOURCES}
+
+    @property
+    def active(self) -> bool:
+        return self._depth > 0
+
+    @contextmanager
+    def cycle(self, name: str = "cycle") -> Iterator[BrokerSnapshotService]:
+        """
+        Open a snapshot cycle (re-entrant; nested/concurrent cycles join the outer one).
+
+        The snapshot starts empty and is dropped when the outermost cycle exits.
+        """
+        with self._lock:
+            self._depth += 1
+            if self._depth == 1:
+                self._cycle_name = name
+                self._stats = self._empty_stats()
+                self._cache.clear()
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._depth -= 1
+                closing = self._depth == 0
+                if closing:
+                    self._cache.clear()
+            if closing:
+                logger.debug(f"Broker snapshot [{name}]: {self._format_stats()}")
+
+    def fetch(self, resource: str, loader: Callable[[], Any]) -> Any:
+        """
+        Return ``resource`` from the snapshot, loading it via ``loader`` at most once per TTL.
+
+        Inside a cycle the result is a deep copy of the shared payload, private to the caller.
+        """
+        if not self.active:
+            return loader()
+
+        fetched = False
+
+        def _load() -> Any:
+            nonlocal fetched
+            fetched = True
+            return loader()
+
+        result = self._cache.get_or_load(resource, _load, self.ttl_seconds, cache_if=_cacheable)
+        with self._lock:
+            stats = self._stats.setdefault(resource, {"calls": 0, "hits": 0, "fetches": 0})
+            stats["calls"] += 1
+            stats["fetches" if fetched else "hits"] += 1
+        return copy.deepcopy(result)
+
+    def prefetch(self, rest_client: Any) -> None:
+        """
+        Load every resource with one concurrent ``get_account_snapshot`` call.
+
+        Only runs at the start of the outermost cycle, with nothing cached yet; failed
+        payloads are left out, so the first ``fetch`` of that resource calls the broker.
+        """
+        if not hasattr(rest_client, "get_account_snapshot"):
+            return
+        with self._lock:
+            if self._depth != 1 or len(self._cache):
+                return
+        snapshot = rest_client.get_account_snapshot(keys=_ACCOUNT_SNAPSHOT_KEYS.values())
+        for resource, key in _ACCOUNT_SNAPSHOT_KEYS.items():
+            payload = snapshot.get(key)
+            if not _cacheable(payload):
+                continue
+            self._cache.get_or_load(resource, lambda p=payload: p, self.ttl_seconds)
+            with self._lock:
+                self._stats[resource]["fetches"] += 1
+
+    def invalidate(self, *resources: str) -> None:
+        """Drop cached resources (all by default) so the next read hits the broker."""
+        for resource in resources or RESOURCES:
+            self._cache.invalidate(resource)
+
+    def get_cycle_stats(self) -> dict[str, dict[str, int]]:
+        """Counters of the current (or last finished) cycle."""
+        with self._lock:
+            return {r: dict(s) for r, s in self._stats.items()}
+
+    def _format_stats(self) -> str:
+        stats = self.get_cycle_stats()
+        return (
+            ", ".join(
+                f"{r} {s['fetches']} fetched/{s['hits']} hit"
+                for r, s in stats.items()
+                if s["calls"]
+            )
+            or "no broker reads"
+        )
+
+
+_services: weakref.WeakKeyDictionary[Any, BrokerSnapshotService] = weakref.WeakKeyDictionary()
+_services_lock = threading.Lock()
+
+
+def get_broker_snapshot_service(auth: Any) -> BrokerSnapshotService:
+    """Snapshot service shared by every component using the same auth session."""
+    with _services_lock:
+        try:
+            service = _services.get(auth)
+            if service is None:
+                service = BrokerSnapshotService()
+                _services[auth] = service
+        except TypeError:
+            # No usable session key (e.g. auth=None): a private, never-active service
+            return BrokerSnapshotService()
+        return service
+
+
+def invalidates_snapshot(*resources: str) -> Callable:
+    """
+    Method decorator: drop ``resources`` from ``self.auth``'s snapshot around the call.
+
+    Invalidating before the call stops a fetch already in flight from storing the
+    pre-mutation payload; invalidating again afterwards covers fetches started meanwhile.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            service = get_broker_snapshot_service(getattr(self, "auth", None))
+            service.invalidate(*resources)
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                service.invalidate(*resources)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def broker_snapshot_cycle(
+    auth: Any, name: str = "cycle", *, prefetch: bool = False
+) -> Iterator[BrokerSnapshotService | None]:
+    """
+    ``cycle()`` on the auth's snapshot service; no-op when there is no auth session.
+
+    With ``prefetch`` the order book, holdings and positions are fetched concurrently
+    when the cycle opens (for cycles known to read all three).
+    """
+    if auth is None:
+        yield None
+        return
+    with get_broker_snapshot_service(auth).cycle(name) as service:
+        get_rest_client = getattr(auth, "get_rest_client", None)
+        if prefetch and get_rest_client is not None:
+            try:
+                service.prefetch(get_rest_client())
+            except Exception as e:
+                logger.warning(f"Broker snapshot [{name}]: prefetch failed, reading lazily: {e}")
+        yield service
@@ -4,10 +4,12 @@ Settings for paper trading simulation
 """
 
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from config.settings import paper_trading_dir
+
 
 @dataclass
 class PaperTradingConfig:
@@ -50,7 +52,8 @@ class PaperTradingConfig:
     check_sufficient_funds: bool = True  # Reject orders if insufficient funds
 
     # ===== PERSISTENCE =====
-    storage_path: str = "paper_trading/data"  # Where to store data files
+    # Where to store data files (<PAPER_TRADING_ROOT>/data)
+    storage_path: str = field(default_factory=lambda: paper_trading_dir("data"))
     auto_save: bool = True  # Auto-save after each transaction
     backup_enabled: bool = True  # Create backups
     max_backups: int = 10  # Max number of backups to keep
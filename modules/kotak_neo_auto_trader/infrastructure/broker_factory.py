@@ -10,6 +10,7 @@ from pathlib import Path
 
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
+from config.settings import paper_trading_dir  # noqa: E402
 from utils.logger import logger  # noqa: E402
 
 from ..config.paper_trading_config import PaperTradingConfig  # noqa: E402
@@ -138,7 +139,7 @@ class BrokerFactory:
                 raise ValueError("user_id is required for paper trading broker")
             # Load config from environment
             initial_capital = float(os.getenv("PAPER_TRADING_CAPITAL", "100000.0"))
-            storage_path = os.getenv("PAPER_TRADING_PATH", "paper_trading/data")
+            storage_path = os.getenv("PAPER_TRADING_PATH", paper_trading_dir("data"))
 
             config = PaperTradingConfig(initial_capital=initial_capital, storage_path=storage_path)
 
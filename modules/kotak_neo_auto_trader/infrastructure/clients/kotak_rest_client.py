@@ -1,5 +1,3 @@
-from __future__ import annotations
-
 """
 Kotak Neo REST client (SDK-free).
 
@@ -13,34 +11,117 @@ Important: Kotak uses TWO kinds of auth headers:
 - **Quotes + Scripmaster**
   - Authorization: <access token from dashboard> (plain, no Bearer)
   - (no neo-fin-key, no Auth/Sid)
+
+Every call goes through one pooled keep-alive ``requests.Session`` per client (one client
+per user session), so only the first request to the host pays the TCP+TLS handshake.
+Pool sizes and per endpoint group timeouts (``ENDPOINT_GROUPS``) come from
+``KotakHttpSettings``; ``get_account_snapshot`` fetches order book, holdings, positions and
+limits concurrently over the same pool.
 """
 
+from __future__ import annotations
+
 import json
-from typing import Any, Dict, Optional
+import threading
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Self
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Endpoint groups that can be given their own timeout (seconds)
+ENDPOINT_GROUPS = ("orders", "reports", "portfolio", "limits", "quotes")
+
+# Calls issued in parallel by get_account_snapshot (snapshot key -> method name)
+SNAPSHOT_CALLS = {
+    "order_book": "get_order_book",
+    "holdings": "get_holdings",
+    "positions": "get_positions",
+    "limits": "get_limits",
+}
+
+
+@dataclass(frozen=True)
+class KotakHttpSettings:
+    """
+    Connection pool and timeouts of one client's HTTP session.
+
+    Attributes:
+        timeout: Default timeout (seconds) for every endpoint group
+        timeouts: Per-group overrides, e.g. ``{"orders": 3.0, "quotes": 5.0}``
+        pool_connections: Number of host pools kept by the session
+        pool_maxsize: Keep-alive connections per host (upper bound for concurrent calls)
+    """
+
+    timeout: float = 10.0
+    timeouts: Mapping[str, float] = field(default_factory=dict)
+    pool_connections: int = 4
+    pool_maxsize: int = 16
+
+    def __post_init__(self) -> None:
+        unknown = set(self.timeouts) - set(ENDPOINT_GROUPS)
+        if unknown:
+            raise ValueError(f"Unknown endpoint groups in timeouts: {sorted(unknown)}")
 
 
 class KotakRestClient:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         base_url: str,
         session_token: str,
         session_sid: str,
         access_token: str,
-        timeout: float = 10.0,
+        http: KotakHttpSettings | None = None,
+        timeout: float | None = None,
     ) -> None:
+        """
+        Args:
+            http: Pool sizes and timeouts (``KotakHttpSettings()`` defaults when None)
+            timeout: Default timeout (seconds) for every endpoint group; overrides
+                ``http.timeout`` (kept for callers predating ``http``)
+        """
+        http = http or KotakHttpSettings()
+        if timeout is not None:
+            http = replace(http, timeout=timeout)
         self.base_url = base_url.rstrip("/")
         self.session_token = session_token.strip()
         self.session_sid = session_sid.strip()
         self.access_token = access_token.strip()
-        self.timeout = timeout
+        self.timeout = http.timeout
+        self.timeouts: dict[str, float] = {group: http.timeout for group in ENDPOINT_GROUPS}
+        self.timeouts.update(http.timeouts)
+        self.pool_maxsize = http.pool_maxsize
+
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=http.pool_connections, pool_maxsize=http.pool_maxsize
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close pooled connections and the fan-out worker threads."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+        self._http.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     # -------------------- Headers --------------------
 
-    def _trade_headers(self, include_form: bool = False) -> Dict[str, str]:
-        headers: Dict[str, str] = {
+    def _trade_headers(self, include_form: bool = False) -> dict[str, str]:
+        headers: dict[str, str] = {
             "accept": "application/json",
             "Auth": self.session_token,
             "Sid": self.session_sid,
@@ -50,7 +131,7 @@ class KotakRestClient:
             headers["Content-Type"] = "application/x-www-form-urlencoded"
         return headers
 
-    def _access_headers(self) -> Dict[str, str]:
+    def _access_headers(self) -> dict[str, str]:
         return {
             "Authorization": self.access_token,
             "Content-Type": "application/json",
@@ -61,79 +142,129 @@ class KotakRestClient:
     def _url(self, path: str) -> str:
         return f"{self.base_url}/{path.lstrip('/')}"
 
-    def _post_form_jdata(self, path: str, jdata: Dict[str, Any]) -> Dict[str, Any]:
+    def _get(self, path: str, group: str, headers: dict[str, str]) -> Any:
+        resp = self._http.get(self._url(path), headers=headers, timeout=self.timeouts[group])
+        return resp.json()
+
+    def _post_form_jdata(self, path: str, jdata: dict[str, Any], group: str) -> dict[str, Any]:
         """
         Kotak expects: Content-Type application/x-www-form-urlencoded with a single field `jData`,
         where jData is a *stringified JSON object*.
         """
         url = self._url(path)
         headers = self._trade_headers(include_form=True)
-        resp = requests.post(
+        resp = self._http.post(
             url,
             headers=headers,
             data={"jData": json.dumps(jdata, separators=(",", ":"))},
-            timeout=self.timeout,
+            timeout=self.timeouts[group],
         )
         return resp.json()
 
     # -------------------- Orders --------------------
 
-    def place_order(self, jdata: Dict[str, Any]) -> Dict[str, Any]:
-        return self._post_form_jdata("/quick/order/rule/ms/place", jdata=jdata)
+    def place_order(self, jdata: dict[str, Any]) -> dict[str, Any]:
+        return self._post_form_jdata("/quick/order/rule/ms/place", jdata=jdata, group="orders")
 
-    def modify_order(self, jdata: Dict[str, Any]) -> Dict[str, Any]:
-        return self._post_form_jdata("/quick/order/vr/modify", jdata=jdata)
+    def modify_order(self, jdata: dict[str, Any]) -> dict[str, Any]:
+        return self._post_form_jdata("/quick/order/vr/modify", jdata=jdata, group="orders")
 
-    def cancel_order(self, order_no: str, amo: str = "NO") -> Dict[str, Any]:
-        return self._post_form_jdata("/quick/order/cancel", jdata={"on": order_no, "am": amo})
+    def cancel_order(self, order_no: str, amo: str = "NO") -> dict[str, Any]:
+        return self._post_form_jdata(
+            "/quick/order/cancel", jdata={"on": order_no, "am": amo}, group="orders"
+        )
 
-    def exit_cover_order(self, order_no: str, amo: str = "NO") -> Dict[str, Any]:
-        return self._post_form_jdata("/quick/order/co/exit", jdata={"on": order_no, "am": amo})
+    def exit_cover_order(self, order_no: str, amo: str = "NO") -> dict[str, Any]:
+        return self._post_form_jdata(
+            "/quick/order/co/exit", jdata={"on": order_no, "am": amo}, group="orders"
+        )
 
-    def exit_bracket_order(self, order_no: str, amo: str = "NO") -> Dict[str, Any]:
-        return self._post_form_jdata("/quick/order/bo/exit", jdata={"on": order_no, "am": amo})
+    def exit_bracket_order(self, order_no: str, amo: str = "NO") -> dict[str, Any]:
+        return self._post_form_jdata(
+            "/quick/order/bo/exit", jdata={"on": order_no, "am": amo}, group="orders"
+        )
 
     # -------------------- Reports --------------------
 
-    def get_order_book(self) -> Dict[str, Any]:
-        url = self._url("/quick/user/orders")
-        resp = requests.get(url, headers=self._trade_headers(include_form=False), timeout=self.timeout)
-        return resp.json()
+    def get_order_book(self) -> dict[str, Any]:
+        return self._get("/quick/user/orders", "reports", self._trade_headers(include_form=False))
 
-    def get_order_history(self, order_no: str) -> Dict[str, Any]:
-        return self._post_form_jdata("/quick/order/history", jdata={"nOrdNo": order_no})
+    def get_order_history(self, order_no: str) -> dict[str, Any]:
+        return self._post_form_jdata(
+            "/quick/order/history", jdata={"nOrdNo": order_no}, group="reports"
+        )
 
-    def get_trade_book(self) -> Dict[str, Any]:
-        url = self._url("/quick/user/trades")
-        resp = requests.get(url, headers=self._trade_headers(include_form=False), timeout=self.timeout)
-        return resp.json()
+    def get_trade_book(self) -> dict[str, Any]:
+        return self._get("/quick/user/trades", "reports", self._trade_headers(include_form=False))
 
     # -------------------- Portfolio / Positions --------------------
 
-    def get_positions(self) -> Dict[str, Any]:
-        url = self._url("/quick/user/positions")
-        resp = requests.get(url, headers=self._trade_headers(include_form=False), timeout=self.timeout)
-        return resp.json()
+    def get_positions(self) -> dict[str, Any]:
+        return self._get(
+            "/quick/user/positions", "portfolio", self._trade_headers(include_form=False)
+        )
 
-    def get_holdings(self) -> Dict[str, Any]:
-        url = self._url("/portfolio/v1/holdings")
-        resp = requests.get(url, headers=self._trade_headers(include_form=False), timeout=self.timeout)
-        return resp.json()
+    def get_holdings(self) -> dict[str, Any]:
+        return self._get(
+            "/portfolio/v1/holdings", "portfolio", self._trade_headers(include_form=False)
+        )
 
     # -------------------- Limits / Margin --------------------
 
-    def get_limits(self, seg: str = "ALL", exch: str = "ALL", prod: str = "ALL") -> Dict[str, Any]:
-        return self._post_form_jdata("/quick/user/limits", jdata={"seg": seg, "exch": exch, "prod": prod})
+    def get_limits(self, seg: str = "ALL", exch: str = "ALL", prod: str = "ALL") -> dict[str, Any]:
+        return self._post_form_jdata(
+            "/quick/user/limits", jdata={"seg": seg, "exch": exch, "prod": prod}, group="limits"
+        )
 
-    def check_margin(self, jdata: Dict[str, Any]) -> Dict[str, Any]:
-        return self._post_form_jdata("/quick/user/check-margin", jdata=jdata)
+    def check_margin(self, jdata: dict[str, Any]) -> dict[str, Any]:
+        return self._post_form_jdata("/quick/user/check-margin", jdata=jdata, group="limits")
+
+    # -------------------- Concurrent snapshot --------------------
+
+    def get_account_snapshot(self, keys: Iterable[str] = tuple(SNAPSHOT_CALLS)) -> dict[str, Any]:
+        """
+        Fetch order book, holdings, positions and limits in parallel.
+
+        At most ``pool_maxsize`` calls are in flight, so the fan-out never waits on the
+        connection pool.
+
+        Args:
+            keys: Subset of ``SNAPSHOT_CALLS`` to fetch (all by default)
+
+        Returns:
+            ``{"order_book": ..., "holdings": ..., "positions": ..., "limits": ...,
+            "errors": {key: message}}``; a failed call leaves its key as None and is
+            reported in ``errors`` instead of failing the whole snapshot.
+        """
+        executor = self._fan_out_executor()
+        futures = {key: executor.submit(getattr(self, SNAPSHOT_CALLS[key])) for key in keys}
+
+        snapshot: dict[str, Any] = {"errors": {}}
+        for key, future in futures.items():
+            try:
+                snapshot[key] = future.result()
+            except Exception as e:
+                snapshot[key] = None
+                snapshot["errors"][key] = str(e)
+        return snapshot
+
+    def _fan_out_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, min(len(SNAPSHOT_CALLS), self.pool_maxsize)),
+                    thread_name_prefix="kotak-rest",
+                )
+            return self._executor
 
     # -------------------- Quotes / Scripmaster (access token only) --------------------
 
     def get_scripmaster_file_paths(self) -> Any:
-        url = self._url("/script-details/1.0/masterscrip/file-paths")
-        resp = requests.get(url, headers={"Authorization": self.access_token}, timeout=self.timeout)
-        return resp.json()
+        return self._get(
+            "/script-details/1.0/masterscrip/file-paths",
+            "quotes",
+            {"Authorization": self.access_token},
+        )
 
     def get_quotes_neosymbol(self, query: str, filter_name: str = "all") -> Any:
         """
@@ -142,7 +273,8 @@ class KotakRestClient:
         - "nse_cm|26000"
         - "nse_cm|Nifty 50,nse_cm|Nifty Bank"
         """
-        url = self._url(f"/script-details/1.0/quotes/neosymbol/{query}/{filter_name}")
-        resp = requests.get(url, headers={"Authorization": self.access_token}, timeout=self.timeout)
-        return resp.json()
-
+        return self._get(
+            f"/script-details/1.0/quotes/neosymbol/{query}/{filter_name}",
+            "quotes",
+            {"Authorization": self.access_token},
+        )
@@ -1,15 +1,150 @@
 """
 Paper Trade Store
 Persists paper trading data to JSON files
+
+Orders, holdings and transactions are written through an append-only journal
+(``journal.jsonl``, one JSON operation per line) instead of rewriting the whole
+JSON file on every mutation. The journal is folded into the snapshot files
+(``orders.json``, ``holdings.json``, ``transactions.json``) every
+``PAPER_TRADE_JOURNAL_COMPACT_OPS`` entries and on ``save_all``; loading replays
+it on top of the snapshots. ``account.json`` is small and still written directly.
+
+Several processes may share one storage directory: journal appends and
+compaction hold an exclusive lock on ``.journal.lock``, and compaction folds in
+entries other processes appended instead of overwriting them.
 """
 
 import json
+import os
 import shutil
+from bisect import insort
 from pathlib import Path
 from threading import Lock
 from typing import Any
 
+from config.settings import PAPER_TRADE_JOURNAL_COMPACT_OPS, paper_trading_dir
 from src.infrastructure.db.timezone_utils import ist_now, ist_now_naive
+from utils.file_lock import locked_file
+from utils.logger import logger
+
+PENDING_ORDER_STATUSES = ("PENDING", "OPEN", "PARTIALLY_FILLED")
+
+JOURNAL_FILE_NAME = "journal.jsonl"
+JOURNAL_LOCK_FILE_NAME = ".journal.lock"
+
+
+def _read_json_file(path: Path, default: Any) -> Any:
+    """Load a snapshot file; missing, empty or corrupted files yield ``default``"""
+    if not path.exists():
+        return default
+    try:
+        # Check if file is empty before loading
+        if path.stat().st_size == 0:
+            return default
+        with open(path) as f:
+            return json.load(f)
+    except (json.JSONDecodeError, ValueError):
+        # File exists but is corrupted, treat as not initialized
+        return default
+
+
+def _write_json_file(path: Path, data: Any) -> None:
+    """Write a snapshot file atomically (temp file + rename)"""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _read_journal(path: Path) -> list[dict[str, Any]]:
+    """Read journal entries, skipping a torn or corrupted line"""
+    if not path.exists():
+        return []
+    entries = []
+    with open(path) as f:
+        for line_no, raw_line in enumerate(f, 1):
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except (json.JSONDecodeError, ValueError):
+                logger.warning(
+                    "Skipping corrupted paper trade journal line %s in %s", line_no, path
+                )
+    return entries
+
+
+def _replay_journal(
+    entries: list[dict[str, Any]],
+    orders: list[dict[str, Any]],
+    holdings: dict[str, dict[str, Any]],
+    transactions: list[dict[str, Any]],
+) -> None:
+    """
+    Apply journal entries to snapshot data in place
+
+    Replay is idempotent against snapshots that already contain the entries (a
+    compaction interrupted after rewriting the snapshots but before truncating
+    the journal): known order IDs are not added twice, updates and holding
+    writes overwrite, and journaled transactions already at the end of the
+    transactions snapshot are skipped.
+    """
+    order_positions = {}
+    for i, order in enumerate(orders):
+        order_positions.setdefault(order.get("order_id"), i)
+
+    journal_transactions = [e["transaction"] for e in entries if e.get("op") == "add_transaction"]
+    skip_transactions = bool(journal_transactions) and (
+        transactions[-len(journal_transactions) :] == journal_transactions
+    )
+
+    for entry in entries:
+        op = entry.get("op")
+        if op == "add_order":
+            order = entry["order"]
+            order_id = order.get("order_id")
+            if order_id is not None and order_id in order_positions:
+                continue
+            order_positions.setdefault(order_id, len(orders))
+            orders.append(order)
+        elif op == "update_order":
+            position = order_positions.get(entry["order_id"])
+            if position is not None:
+                orders[position].update(entry["updates"])
+        elif op == "put_holding":
+            holdings[entry["symbol"]] = entry["holding"]
+        elif op == "remove_holding":
+            holdings.pop(entry["symbol"], None)
+        elif op == "add_transaction":
+            if not skip_transactions:
+                transactions.append(entry["transaction"])
+        else:
+            logger.warning("Ignoring unknown paper trade journal op: %s", op)
+
+
+def read_paper_trade_state(storage_path: str | Path) -> dict[str, Any]:
+    """
+    Read a store directory without opening a ``PaperTradeStore``
+
+    For readers outside the trading process (e.g. API routes) that need the
+    current state, including journal entries not yet compacted into the
+    snapshot files. Nothing is created or written.
+
+    Returns:
+        Dict with ``account``, ``orders``, ``holdings`` and ``transactions``
+    """
+    path = Path(storage_path)
+    orders = _read_json_file(path / "orders.json", [])
+    holdings = _read_json_file(path / "holdings.json", {})
+    transactions = _read_json_file(path / "transactions.json", [])
+    _replay_journal(_read_journal(path / JOURNAL_FILE_NAME), orders, holdings, transactions)
+    return {
+        "account": _read_json_file(path / "account.json", None),
+        "orders": orders,
+        "holdings": holdings,
+        "transactions": transactions,
+    }
 
 
 class PaperTradeStore:
@@ -21,18 +156,31 @@ class PaperTradeStore:
     - Orders (all orders history)
     - Holdings (current portfolio)
     - Transactions (trade history)
+
+    Orders are indexed in memory by order_id, symbol and status, and
+    transactions by symbol, so lookups do not scan the full history.
     """
 
-    def __init__(self, storage_path: str = "paper_trading/data", auto_save: bool = True):
+    def __init__(
+        self,
+        storage_path: str | None = None,
+        auto_save: bool = True,
+        compact_every: int | None = None,
+    ):
         """
         Initialize storage
 
         Args:
-            storage_path: Directory to store data files
-            auto_save: Whether to auto-save after mutations
+            storage_path: Directory to store data files (default ``<PAPER_TRADING_ROOT>/data``)
+            auto_save: Whether to auto-save after mutations (journal append)
+            compact_every: Journal entries between snapshot compactions
+                (default ``PAPER_TRADE_JOURNAL_COMPACT_OPS``; 0 disables)
         """
-        self.storage_path = Path(storage_path)
+        self.storage_path = Path(storage_path or paper_trading_dir("data"))
         self.auto_save = auto_save
+        self.compact_every = (
+            PAPER_TRADE_JOURNAL_COMPACT_OPS if compact_every is None else compact_every
+        )
         self._lock = Lock()  # Thread safety
 
         # File paths
@@ -41,6 +189,8 @@ class PaperTradeStore:
         self.holdings_file = self.storage_path / "holdings.json"
         self.transactions_file = self.storage_path / "transactions.json"
         self.config_file = self.storage_path / "config.json"
+        self.journal_file = self.storage_path / JOURNAL_FILE_NAME
+        self.journal_lock_file = self.storage_path / JOURNAL_LOCK_FILE_NAME
 
         # In-memory cache
         self._account: dict[str, Any] | None = None
@@ -48,6 +198,15 @@ class PaperTradeStore:
         self._holdings: dict[str, dict[str, Any]] = {}
         self._transactions: list[dict[str, Any]] = []
 
+        # Indexes (positions in _orders / _transactions)
+        self._order_index: dict[Any, int] = {}
+        self._orders_by_symbol: dict[Any, list[int]] = {}
+        self._orders_by_status: dict[Any, set[int]] = {}
+        self._transactions_by_symbol: dict[Any, list[int]] = {}
+
+        # Journal entries not yet compacted into the snapshot files
+        self._journal_ops = 0
+
         # Initialize storage
         self._initialize_storage()
 
@@ -139,9 +298,10 @@ class PaperTradeStore:
         """
         with self._lock:
             self._orders.append(order)
+            self._index_order(len(self._orders) - 1)
 
             if self.auto_save:
-                self._save_orders()
+                self._append_journal({"op": "add_order", "order": order})
 
     def get_all_orders(self) -> list[dict[str, Any]]:
         """Get all orders"""
@@ -151,10 +311,8 @@ class PaperTradeStore:
     def get_order_by_id(self, order_id: str) -> dict[str, Any] | None:
         """Get order by ID"""
         with self._lock:
-            for order in self._orders:
-                if order.get("order_id") == order_id:
-                    return order.copy()
-            return None
+            position = self._order_index.get(order_id)
+            return self._orders[position].copy() if position is not None else None
 
     def update_order(self, order_id: str, updates: dict[str, Any]) -> bool:
         """
@@ -168,29 +326,38 @@ class PaperTradeStore:
             True if order found and updated, False otherwise
         """
         with self._lock:
-            for i, order in enumerate(self._orders):
-                if order.get("order_id") == order_id:
-                    self._orders[i].update(updates)
-                    self._orders[i]["last_updated"] = ist_now().isoformat()
-
-                    if self.auto_save:
-                        self._save_orders()
-                    return True
-            return False
+            position = self._order_index.get(order_id)
+            if position is None:
+                return False
+
+            order = self._orders[position]
+            self._unindex_order(position)
+            order.update(updates)
+            order["last_updated"] = ist_now().isoformat()
+            self._index_order(position)
+
+            if self.auto_save:
+                self._append_journal(
+                    {
+                        "op": "update_order",
+                        "order_id": order_id,
+                        "updates": {**updates, "last_updated": order["last_updated"]},
+                    }
+                )
+            return True
 
     def get_orders_by_symbol(self, symbol: str) -> list[dict[str, Any]]:
         """Get all orders for a symbol"""
         with self._lock:
-            return [o.copy() for o in self._orders if o.get("symbol") == symbol]
+            return [self._orders[i].copy() for i in self._orders_by_symbol.get(symbol, [])]
 
     def get_pending_orders(self) -> list[dict[str, Any]]:
         """Get all pending/open orders"""
         with self._lock:
-            return [
-                o.copy()
-                for o in self._orders
-                if o.get("status") in ["PENDING", "OPEN", "PARTIALLY_FILLED"]
-            ]
+            positions = set()
+            for status in PENDING_ORDER_STATUSES:
+                positions |= self._orders_by_status.get(status, set())
+            return [self._orders[i].copy() for i in sorted(positions)]
 
     # ===== HOLDING METHODS =====
 
@@ -207,7 +374,7 @@ class PaperTradeStore:
             self._holdings[symbol]["last_updated"] = ist_now().isoformat()
 
             if self.auto_save:
-                self._save_holdings()
+                self._append_journal({"op": "put_holding", "symbol": symbol, "holding": holding})
 
     def get_holding(self, symbol: str) -> dict[str, Any] | None:
         """Get holding by symbol"""
@@ -234,7 +401,7 @@ class PaperTradeStore:
                 del self._holdings[symbol]
 
                 if self.auto_save:
-                    self._save_holdings()
+                    self._append_journal({"op": "remove_holding", "symbol": symbol})
                 return True
             return False
 
@@ -250,9 +417,12 @@ class PaperTradeStore:
         with self._lock:
             transaction["timestamp"] = ist_now().isoformat()
             self._transactions.append(transaction)
+            self._transactions_by_symbol.setdefault(transaction.get("symbol"), []).append(
+                len(self._transactions) - 1
+            )
 
             if self.auto_save:
-                self._save_transactions()
+                self._append_journal({"op": "add_transaction", "transaction": transaction})
 
     def get_all_transactions(self) -> list[dict[str, Any]]:
         """Get all transactions"""
@@ -262,10 +432,67 @@ class PaperTradeStore:
     def get_transactions_by_symbol(self, symbol: str) -> list[dict[str, Any]]:
         """Get transactions for a symbol"""
         with self._lock:
-            return [t.copy() for t in self._transactions if t.get("symbol") == symbol]
+            return [
+                self._transactions[i].copy() for i in self._transactions_by_symbol.get(symbol, [])
+            ]
+
+    # ===== INDEXES =====
+
+    def _index_order(self, position: int) -> None:
+        """Add the order at ``position`` to the indexes (internal, assumes lock held)"""
+        order = self._orders[position]
+        # First order wins for duplicate IDs, like the former linear scan
+        self._order_index.setdefault(order.get("order_id"), position)
+        insort(self._orders_by_symbol.setdefault(order.get("symbol"), []), position)
+        self._orders_by_status.setdefault(order.get("status"), set()).add(position)
+
+    def _unindex_order(self, position: int) -> None:
+        """Drop the order at ``position`` from the symbol/status indexes (assumes lock held)"""
+        order = self._orders[position]
+        self._orders_by_symbol.get(order.get("symbol"), []).remove(position)
+        self._orders_by_status.get(order.get("status"), set()).discard(position)
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild all indexes from the in-memory data (internal, assumes lock held)"""
+        self._order_index = {}
+        self._orders_by_symbol = {}
+        self._orders_by_status = {}
+        self._transactions_by_symbol = {}
+        for position in range(len(self._orders)):
+            self._index_order(position)
+        for position, transaction in enumerate(self._transactions):
+            self._transactions_by_symbol.setdefault(transaction.get("symbol"), []).append(position)
 
     # ===== PERSISTENCE METHODS =====
 
+    def _append_journal(self, entry: dict[str, Any]) -> None:
+        """Append one operation to the journal (internal, assumes lock held)"""
+        line = json.dumps(entry)
+        with locked_file(self.journal_lock_file, exclusive=True):
+            with open(self.journal_file, "a") as f:
+                f.write(line + "\n")
+        self._journal_ops += 1
+
+        if self.compact_every > 0 and self._journal_ops >= self.compact_every:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Write all snapshot files and truncate the journal (internal, assumes lock held)"""
+        with locked_file(self.journal_lock_file, exclusive=True):
+            if self.auto_save:
+                # Every mutation is on disk, including ones other processes journaled
+                # since this store loaded; start from that rather than overwrite them
+                self._load_all()
+            self._save_account()
+            self._save_orders()
+            self._save_holdings()
+            self._save_transactions()
+            # Snapshots are complete; journal entries are now redundant
+            if self.journal_file.exists():
+                with open(self.journal_file, "w"):
+                    pass
+        self._journal_ops = 0
+
     def _save_account(self) -> None:
         """Save account to file (internal, assumes lock held)"""
         if self._account:
@@ -274,82 +501,33 @@ class PaperTradeStore:
 
     def _save_orders(self) -> None:
         """Save orders to file (internal, assumes lock held)"""
-        with open(self.orders_file, "w") as f:
-            json.dump(self._orders, f, indent=2)
+        _write_json_file(self.orders_file, self._orders)
 
     def _save_holdings(self) -> None:
         """Save holdings to file (internal, assumes lock held)"""
-        with open(self.holdings_file, "w") as f:
-            json.dump(self._holdings, f, indent=2)
+        _write_json_file(self.holdings_file, self._holdings)
 
     def _save_transactions(self) -> None:
         """Save transactions to file (internal, assumes lock held)"""
-        with open(self.transactions_file, "w") as f:
-            json.dump(self._transactions, f, indent=2)
+        _write_json_file(self.transactions_file, self._transactions)
 
     def save_all(self) -> None:
-        """Save all data to files"""
+        """Save all data to files (compacts the journal into the snapshots)"""
         with self._lock:
-            self._save_account()
-            self._save_orders()
-            self._save_holdings()
-            self._save_transactions()
+            self._compact()
 
     def _load_all(self) -> None:
-        """Load all data from files"""
-        # Load account
-        if self.account_file.exists():
-            try:
-                # Check if file is empty before loading
-                if self.account_file.stat().st_size > 0:
-                    with open(self.account_file) as f:
-                        self._account = json.load(f)
-                else:
-                    self._account = None
-            except (json.JSONDecodeError, ValueError):
-                # File exists but is corrupted, treat as not initialized
-                self._account = None
-        else:
-            self._account = None
+        """Load all data from files (snapshots, then journal replay)"""
+        self._account = _read_json_file(self.account_file, None)
+        self._orders = _read_json_file(self.orders_file, [])
+        self._holdings = _read_json_file(self.holdings_file, {})
+        self._transactions = _read_json_file(self.transactions_file, [])
 
-        # Load orders
-        if self.orders_file.exists():
-            try:
-                if self.orders_file.stat().st_size > 0:
-                    with open(self.orders_file) as f:
-                        self._orders = json.load(f)
-                else:
-                    self._orders = []
-            except (json.JSONDecodeError, ValueError):
-                self._orders = []
-        else:
-            self._orders = []
+        entries = _read_journal(self.journal_file)
+        _replay_journal(entries, self._orders, self._holdings, self._transactions)
+        self._journal_ops = len(entries)
 
-        # Load holdings
-        if self.holdings_file.exists():
-            try:
-                if self.holdings_file.stat().st_size > 0:
-                    with open(self.holdings_file) as f:
-                        self._holdings = json.load(f)
-                else:
-                    self._holdings = {}
-            except (json.JSONDecodeError, ValueError):
-                self._holdings = {}
-        else:
-            self._holdings = {}
-
-        # Load transactions
-        if self.transactions_file.exists():
-            try:
-                if self.transactions_file.stat().st_size > 0:
-                    with open(self.transactions_file) as f:
-                        self._transactions = json.load(f)
-                else:
-                    self._transactions = []
-            except (json.JSONDecodeError, ValueError):
-                self._transactions = []
-        else:
-            self._transactions = []
+        self._rebuild_indexes()
 
     def reload(self) -> None:
         """Reload all data from files"""
@@ -370,15 +548,17 @@ class PaperTradeStore:
         backup_dir.mkdir(parents=True, exist_ok=True)
 
         # Copy all files
-        for file in [
-            self.account_file,
-            self.orders_file,
-            self.holdings_file,
-            self.transactions_file,
-            self.config_file,
-        ]:
-            if file.exists():
-                shutil.copy2(file, backup_dir / file.name)
+        with self._lock:
+            for file in [
+                self.account_file,
+                self.orders_file,
+                self.holdings_file,
+                self.transactions_file,
+                self.config_file,
+                self.journal_file,
+            ]:
+                if file.exists():
+                    shutil.copy2(file, backup_dir / file.name)
 
         return backup_dir
 
@@ -399,10 +579,14 @@ class PaperTradeStore:
             self.holdings_file,
             self.transactions_file,
             self.config_file,
+            self.journal_file,
         ]:
             backup_file = backup_dir / file.name
             if backup_file.exists():
                 shutil.copy2(backup_file, file)
+            elif file == self.journal_file and file.exists():
+                # Backup predates the journal (or had none): drop ours so it is not replayed
+                file.unlink()
 
         # Reload data
         self.reload()
@@ -417,6 +601,8 @@ class PaperTradeStore:
             self._orders = []
             self._holdings = {}
             self._transactions = []
+            self._rebuild_indexes()
+            self._journal_ops = 0
 
             # Delete files
             for file in [
@@ -424,6 +610,7 @@ class PaperTradeStore:
                 self.orders_file,
                 self.holdings_file,
                 self.transactions_file,
+                self.journal_file,
             ]:
                 if file.exists():
                     file.unlink()
@@ -435,12 +622,12 @@ class PaperTradeStore:
         with self._lock:
             return {
                 "total_orders": len(self._orders),
-                "pending_orders": len(
-                    [o for o in self._orders if o.get("status") in ["PENDING", "OPEN"]]
-                ),
-                "completed_orders": len([o for o in self._orders if o.get("status") == "COMPLETE"]),
+                "pending_orders": len(self._orders_by_status.get("PENDING", ()))
+                + len(self._orders_by_status.get("OPEN", ())),
+                "completed_orders": len(self._orders_by_status.get("COMPLETE", ())),
                 "total_holdings": len(self._holdings),
                 "total_transactions": len(self._transactions),
                 "account_initialized": self._account is not None,
+                "journal_entries": self._journal_ops,
                 "storage_path": str(self.storage_path),
             }
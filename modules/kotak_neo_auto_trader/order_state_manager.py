@@ -11,13 +11,13 @@ Provides single source of truth for:
 """
 
 import threading
-from datetime import datetime
 from typing import Any
 
-from src.infrastructure.db.timezone_utils import ist_now, ist_now_naive
+from src.infrastructure.db.timezone_utils import ist_now
 from utils.logger import logger
 
 try:
+    from .broker_snapshot import BrokerOrderIndex
     from .domain.value_objects.order_enums import OrderStatus
     from .order_tracker import OrderTracker
     from .storage import (
@@ -30,6 +30,7 @@ try:
     from .utils.order_status_parser import OrderStatusParser
     from .utils.symbol_utils import extract_base_symbol
 except ImportError:
+    from modules.kotak_neo_auto_trader.broker_snapshot import BrokerOrderIndex
     from modules.kotak_neo_auto_trader.domain.value_objects.order_enums import OrderStatus
     from modules.kotak_neo_auto_trader.order_tracker import OrderTracker
     from modules.kotak_neo_auto_trader.storage import (
@@ -154,9 +155,7 @@ class OrderStateManager:
                         needs_update = True
 
                     if needs_update:
-                        self.active_sell_orders[base_symbol][
-                            "last_updated"
-                        ] = ist_now().isoformat()
+                        self.active_sell_orders[base_symbol]["last_updated"] = ist_now().isoformat()
                         return True
                     else:
                         # Order already registered with same price and has ticker
@@ -600,6 +599,7 @@ class OrderStateManager:
             if broker_orders is None:
                 orders_response = orders_api.get_orders() if orders_api else None
                 broker_orders = orders_response.get("data", []) if orders_response else []
+            order_index = BrokerOrderIndex(broker_orders)
 
             # Check each active sell order
             active_symbols = list(self.active_sell_orders.keys())
@@ -616,12 +616,7 @@ class OrderStateManager:
                 stats["checked"] += 1
 
                 # Find order in broker orders
-                broker_order = None
-                for bo in broker_orders:
-                    broker_order_id = OrderFieldExtractor.get_order_id(bo)
-                    if broker_order_id == order_id:
-                        broker_order = bo
-                        break
+                broker_order = order_index.get(order_id)
 
                 if broker_order:
                     # Check status
@@ -680,12 +675,7 @@ class OrderStateManager:
                 stats["buy_checked"] += 1
 
                 # Find order in broker orders
-                broker_order = None
-                for bo in broker_orders:
-                    broker_order_id = OrderFieldExtractor.get_order_id(bo)
-                    if broker_order_id == order_id:
-                        broker_order = bo
-                        break
+                broker_order = order_index.get(order_id)
 
                 if broker_order:
                     # Check status
@@ -21,6 +21,8 @@ from datetime import time as dt_time
 from pathlib import Path
 from typing import Any
 
+from .broker_snapshot import BrokerOrderIndex, broker_snapshot_cycle
+
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 from src.infrastructure.db.timezone_utils import ist_now, ist_now_naive
@@ -118,7 +120,11 @@ class OrderStatusVerifier:
 
         while self._running:
             try:
-                self.verify_pending_orders()
+                # Share the order book with other monitors polling the same session
+                with broker_snapshot_cycle(
+                    getattr(self.broker_client, "auth", None), "order_verifier"
+                ):
+                    self.verify_pending_orders()
                 self._last_check_time = ist_now_naive()
 
                 # Sleep in small intervals to allow responsive shutdown
@@ -197,6 +203,8 @@ class OrderStatusVerifier:
             "still_pending": 0,
         }
 
+        order_index = BrokerOrderIndex(broker_orders)
+
         # Check each pending order
         for pending_order in pending_orders:
             order_id = pending_order["order_id"]
@@ -212,7 +220,7 @@ class OrderStatusVerifier:
             }
 
             # Find order in broker's order book
-            broker_order = self._find_order_in_broker_orders(order_id, broker_orders)
+            broker_order = self._find_order_in_broker_orders(order_id, order_index)
 
             if not broker_order:
                 # Order not found in active orders - check if it was cancelled/executed
@@ -558,18 +566,21 @@ class OrderStatusVerifier:
             return False
 
     def _find_order_in_broker_orders(
-        self, order_id: str, broker_orders: list[dict[str, Any]]
+        self, order_id: str, broker_orders: list[dict[str, Any]] | BrokerOrderIndex
     ) -> dict[str, Any] | None:
         """
         Find order in broker's order list by order ID.
 
         Args:
             order_id: Order ID to find
-            broker_orders: List of orders from broker
+            broker_orders: List of orders from broker, or a prebuilt BrokerOrderIndex
 
         Returns:
             Order dict if found, None otherwise
         """
+        if isinstance(broker_orders, BrokerOrderIndex):
+            return broker_orders.get(order_id)
+
         for broker_order in broker_orders:
             broker_order_id = (
                 broker_order.get("nOrdNo")
@@ -15,9 +15,15 @@ from utils.logger import logger
 try:
     from .auth import KotakNeoAuth
     from .auth_handler import handle_reauth
+    from .broker_snapshot import ORDERS, get_broker_snapshot_service, invalidates_snapshot
 except ImportError:  # pragma: no cover
     from modules.kotak_neo_auto_trader.auth import KotakNeoAuth
     from modules.kotak_neo_auto_trader.auth_handler import handle_reauth
+    from modules.kotak_neo_auto_trader.broker_snapshot import (
+        ORDERS,
+        get_broker_snapshot_service,
+        invalidates_snapshot,
+    )
 
 
 class KotakNeoOrders:
@@ -33,6 +39,7 @@ class KotakNeoOrders:
     # -------------------- Placement --------------------
 
     @handle_reauth
+    @invalidates_snapshot(ORDERS)
     def place_equity_order(
         self,
         symbol: str,
@@ -190,6 +197,7 @@ class KotakNeoOrders:
     # -------------------- Modify / Cancel --------------------
 
     @handle_reauth
+    @invalidates_snapshot(ORDERS)
     def modify_order(
         self,
         order_id: str,
@@ -282,6 +290,7 @@ class KotakNeoOrders:
             return None
 
     @handle_reauth
+    @invalidates_snapshot(ORDERS)
     def cancel_order(self, order_id: str) -> dict | None:
         rest = self._rest()
         try:
@@ -301,6 +310,10 @@ class KotakNeoOrders:
 
     @handle_reauth
     def get_orders(self) -> dict | None:
+        # Shared per-cycle snapshot while a scheduler cycle is open (see broker_snapshot)
+        return get_broker_snapshot_service(self.auth).fetch(ORDERS, self._fetch_order_book)
+
+    def _fetch_order_book(self) -> dict | None:
         rest = self._rest()
         try:
             if hasattr(rest, "get_order_book"):
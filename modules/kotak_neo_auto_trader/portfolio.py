@@ -12,9 +12,15 @@ from utils.logger import logger
 try:
     from .auth import KotakNeoAuth
     from .auth_handler import handle_reauth
+    from .broker_snapshot import HOLDINGS, POSITIONS, get_broker_snapshot_service
 except ImportError:  # pragma: no cover
     from modules.kotak_neo_auto_trader.auth import KotakNeoAuth
     from modules.kotak_neo_auto_trader.auth_handler import handle_reauth
+    from modules.kotak_neo_auto_trader.broker_snapshot import (
+        HOLDINGS,
+        POSITIONS,
+        get_broker_snapshot_service,
+    )
 
 
 class KotakNeoPortfolio:
@@ -28,6 +34,9 @@ class KotakNeoPortfolio:
         """
         GET <baseUrl>/portfolio/v1/holdings
         """
+        return get_broker_snapshot_service(self.auth).fetch(HOLDINGS, self._fetch_holdings)
+
+    def _fetch_holdings(self) -> dict | None:
         rest = self.auth.get_rest_client()
         try:
             return rest.get_holdings()
@@ -40,6 +49,9 @@ class KotakNeoPortfolio:
         """
         GET <baseUrl>/quick/user/positions
         """
+        return get_broker_snapshot_service(self.auth).fetch(POSITIONS, self._fetch_positions)
+
+    def _fetch_positions(self) -> dict | None:
         rest = self.auth.get_rest_client()
         try:
             return rest.get_positions()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Run-scoped, in-memory view of a user's DB orders and open positions.
+
+``AutoTradeEngine.place_new_entries``, ``place_reentry_orders`` and
+``evaluate_reentries_and_exits`` ask the same questions once per recommendation or open
+position (active buy order for this symbol? re-entry at this level already placed?). Without
+a view each question is an ``orders_repo.list`` / ``positions_repo.get_by_symbol`` round
+trip over the user's whole order history. The view is loaded with one query per table on
+first use and answers from dict lookups keyed by base symbol and side, with placement date
+filtered per symbol.
+
+Orders are held as read-only ``OrderRow`` snapshots, never as session-bound ``Orders``:
+the session expires those on every commit, and reading them again would cost one SELECT
+per order. Writes made during the run must be fed back through ``record_order`` /
+``record_position`` (the engine does this at every order/position write it makes), so
+later checks in the same run see them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date, datetime
+from typing import Any
+
+from modules.kotak_neo_auto_trader.utils.symbol_utils import extract_base_symbol
+from src.infrastructure.db.models import Orders
+from src.infrastructure.persistence.orders_repository import OrderRow
+
+
+def _placed_date(order: Any) -> date | None:
+    placed_at = getattr(order, "placed_at", None)
+    if isinstance(placed_at, datetime):
+        return placed_at.date()
+    if isinstance(placed_at, date):
+        return placed_at
+    if placed_at:
+        try:
+            return datetime.fromisoformat(str(placed_at)).date()
+        except ValueError:
+            return None
+    return None
+
+
+def _snapshot(order: Any) -> Any:
+    """Detached ``OrderRow`` copy of an ORM order (other rows are returned unchanged)."""
+    if not isinstance(order, Orders):
+        return order
+    defaults = OrderRow._field_defaults
+    return OrderRow(**{name: getattr(order, name, defaults.get(name)) for name in OrderRow._fields})
+
+
+class RunOrderView:
+    """
+    Orders indexed by ``(base_symbol, side)`` plus open positions by symbol.
+
+    Lookups return rows in repository order (``orders_repo.list`` / ``positions_repo.list``,
+    newest ``placed_at`` first), so "first match" semantics of the scans this replaces are
+    preserved. Orders recorded during the run are newer than every loaded row and sort first.
+    """
+
+    def __init__(self, orders: Iterable[Any] = (), positions: Iterable[Any] = ()):
+        # base symbol -> side -> {order id: order}
+        self._by_base: dict[str, dict[str, dict[Any, Any]]] = {}
+        self._keys: dict[Any, tuple[str, str]] = {}
+        # Sort key matching repository order: load position, then negative (newest lowest)
+        # for orders recorded during the run
+        self._seq: dict[Any, int] = {}
+        self._loaded = False
+        self._open_positions: dict[str, Any] = {}
+        for order in orders:
+            self.record_order(order)
+        self._loaded = True
+        for position in positions:
+            if getattr(position, "closed_at", None) is None:
+                # Repository order is opened_at desc: first row is the most recent position
+                self._open_positions.setdefault(position.symbol, position)
+
+    @classmethod
+    def load(cls, orders_repo: Any, positions_repo: Any, user_id: int) -> RunOrderView:
+        """One orders query and one positions query for the whole run."""
+        orders, _ = orders_repo.list(user_id, projection=True)
+        positions = positions_repo.list(user_id) if positions_repo else []
+        return cls(orders, positions)
+
+    # ---------------------- Reads ----------------------
+
+    def orders_for(
+        self,
+        symbol: str,
+        side: str | None = None,
+        placed_on: date | None = None,
+    ) -> list[Any]:
+        """Orders for the base symbol of ``symbol``, optionally by side and placed day."""
+        rows: list[tuple[int, Any]] = []
+        for key_side, bucket in self._by_base.get(extract_base_symbol(symbol), {}).items():
+            if side is not None and key_side != side:
+                continue
+            rows.extend((self._seq[order_id], order) for order_id, order in bucket.items())
+        matches = [order for _, order in sorted(rows, key=lambda row: row[0])]
+        if placed_on is not None:
+            matches = [o for o in matches if _placed_date(o) == placed_on]
+        return matches
+
+    def all_orders(self) -> list[Any]:
+        """Every order, in repository order."""
+        rows = [
+            (self._seq[order_id], order)
+            for buckets in self._by_base.values()
+            for bucket in buckets.values()
+            for order_id, order in bucket.items()
+        ]
+        return [order for _, order in sorted(rows, key=lambda row: row[0])]
+
+    def open_position(self, symbol: str) -> Any | None:
+        """Most recent open position for the exact symbol (``positions_repo.get_by_symbol``)."""
+        return self._open_positions.get(symbol)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # ---------------------- Writes ----------------------
+
+    def record_order(self, order: Any) -> None:
+        """Insert or re-index an order after it was created or updated during the run."""
+        if order is None:
+            return
+        order = _snapshot(order)
+        order_id = getattr(order, "id", None)
+        if order_id is None:
+            order_id = id(order)
+        old_key = self._keys.pop(order_id, None)
+        if old_key is not None:
+            old_base, old_side = old_key
+            self._by_base[old_base][old_side].pop(order_id, None)
+
+        key = (extract_base_symbol(order.symbol), order.side)
+        self._keys[order_id] = key
+        if order_id not in self._seq:
+            self._seq[order_id] = -len(self._seq) if self._loaded else len(self._seq)
+        self._by_base.setdefault(key[0], {}).setdefault(key[1], {})[order_id] = order
+
+    def record_position(self, symbol: str, position: Any | None) -> None:
+        """Replace the open position for ``symbol`` (None or a closed position removes it)."""
+        if position is None or getattr(position, "closed_at", None) is not None:
+            self._open_positions.pop(symbol, None)
+        else:
+            self._open_positions[symbol] = position
@@ -45,6 +45,7 @@ try:
     from . import config
     from .auth import KotakNeoAuth
     from .auto_trade_engine import AutoTradeEngine, OrderPlacementError
+    from .broker_snapshot import broker_snapshot_cycle
     from .live_price_cache import LivePriceCache
     from .orders import KotakNeoOrders
     from .portfolio import KotakNeoPortfolio
@@ -56,6 +57,7 @@ except ImportError:
     from modules.kotak_neo_auto_trader import config
     from modules.kotak_neo_auto_trader.auth import KotakNeoAuth
     from modules.kotak_neo_auto_trader.auto_trade_engine import AutoTradeEngine, OrderPlacementError
+    from modules.kotak_neo_auto_trader.broker_snapshot import broker_snapshot_cycle
     from modules.kotak_neo_auto_trader.live_price_cache import LivePriceCache
     from modules.kotak_neo_auto_trader.orders import KotakNeoOrders
     from modules.kotak_neo_auto_trader.scrip_master import KotakNeoScripMaster
@@ -675,8 +677,6 @@ class TradingService:
         Not gated by performance-fee arrears: overdue invoices block only ``run_buy_orders``,
         so users can still place sells and complete exits on existing holdings.
         """
-        from src.application.services.task_execution_wrapper import execute_task
-
         # Respect stop request when used from unified service (do not place orders if stopped)
         if not getattr(self, "running", True) or getattr(self, "shutdown_requested", False):
             self.logger.warning(
@@ -687,6 +687,16 @@ class TradingService:
             )
             return
 
+        # One broker snapshot per tick: order book / holdings / positions fetched once
+        # (concurrently, when the tick starts) and shared by sell manager, unified order
+        # monitor and state manager
+        with broker_snapshot_cycle(self.auth, "sell_monitor", prefetch=True):
+            self._run_sell_monitor_cycle()
+
+    def _run_sell_monitor_cycle(self):
+        """One sell-monitor tick: market-open placement on the first run, then order monitoring."""
+        from src.application.services.task_execution_wrapper import execute_task
+
         # Only log to database on first start, not on every monitoring cycle
         if not self.tasks_completed["sell_monitor_started"]:
             with execute_task(
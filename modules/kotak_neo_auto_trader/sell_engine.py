@@ -6219,21 +6219,70 @@ class SellOrderManager:
             logger.debug(f"Error getting previous day RSI10 for {ticker}: {e}")
             return None
 
-    def _get_current_rsi10(self, symbol: str, ticker: str) -> float | None:
+    def _get_streaming_rsi10(
+        self, symbol: str, ticker: str, current_ltp: float | None = None
+    ) -> float | None:
+        """
+        O(1) RSI10 from the ticker's streaming indicator state with the LTP as today's close.
+
+        Updates ``rsi10_cache`` on success. Returns None when there is no seeded state or
+        no usable LTP, so the caller falls back to the snapshot/recalculation paths.
+        """
+        try:
+            state = self.indicator_service.get_streaming_state(ticker)
+            if state is None or state.rsi is None:
+                return None
+            if current_ltp is None:
+                current_ltp = self.get_current_ltp(ticker)
+            if current_ltp is None or current_ltp <= 0:
+                return None
+            streaming_rsi = state.rsi.peek(current_ltp)
+        except Exception as e:
+            logger.debug(f"Streaming RSI10 unavailable for {symbol}: {e}")
+            return None
+
+        if streaming_rsi is not None:
+            self.rsi10_cache[symbol] = streaming_rsi
+            logger.debug(
+                f"Updated RSI10 cache for {symbol} with streaming value: "
+                f"{streaming_rsi:.2f} (LTP {current_ltp:.2f})"
+            )
+        return streaming_rsi
+
+    def _get_current_rsi10(
+        self, symbol: str, ticker: str, current_ltp: float | None = None
+    ) -> float | None:
         """
         Get current RSI10 value with real-time calculation and fallback to cache.
 
         Priority:
-        1. Try to calculate real-time RSI10 (update cache if available)
-        2. Fallback to cached previous day's RSI10
+        1. O(1) streaming RSI10 with the current LTP as today's close (state seeded once
+           per day from completed bars; LTP shared with the EMA9 check via PriceService cache)
+        2. Real-time RSI10 from the shared market data hub snapshot (multi-user service)
+        3. Recalculate real-time RSI10 from daily bars (update cache if available)
+        4. Fallback to cached previous day's RSI10
 
         Args:
             symbol: Stock symbol (for cache lookup)
             ticker: Stock ticker (e.g., 'RELIANCE.NS')
+            current_ltp: Current LTP if already known (fetched when None)
 
         Returns:
             Current RSI10 value, or None if unavailable
         """
+        streaming_rsi = self._get_streaming_rsi10(symbol, ticker, current_ltp)
+        if streaming_rsi is not None:
+            return streaming_rsi
+
+        try:
+            hub_rsi = self.indicator_service.get_snapshot_rsi10(ticker)
+            if isinstance(hub_rsi, float):
+                self.rsi10_cache[symbol] = hub_rsi
+                logger.debug(f"Updated RSI10 cache for {symbol} with shared value: {hub_rsi:.2f}")
+                return hub_rsi
+        except Exception as e:
+            logger.debug(f"Shared RSI10 unavailable for {symbol}: {e}")
+
         try:
             # Try to get real-time RSI10 (include current day)
             df = self.price_service.get_price(ticker, days=200, interval="1d", add_current_day=True)
@@ -6892,6 +6941,12 @@ class SellOrderManager:
 
         logger.debug(f"Monitoring {len(self.active_sell_orders)} active sell orders in parallel...")
 
+        # Shared market data hub (multi-user service): one daily poll and RSI10 per ticker
+        # for all users instead of one per user
+        self.price_service.set_market_data_subscriptions(
+            self.user_id, [info.get("ticker") for info in self.active_sell_orders.values()]
+        )
+
         # Flaw #7 Fix: Get all orders once and use for both execution check and mismatch detection
         # This avoids duplicate API calls - we use the same data for multiple purposes
         all_orders_response = None
@@ -7288,8 +7343,11 @@ class SellOrderManager:
             logger.debug(f"No ticker found for {symbol}, skipping RSI exit check")
             return False
 
-        # Get current RSI10 (previous day first, then real-time)
-        rsi10 = self._get_current_rsi10(symbol, ticker)
+        # Get current RSI10 (streaming with LTP, then real-time recalculation, then cache).
+        # The LTP is fetched with the broker symbol, as the EMA9 check does, so both checks
+        # share one PriceService quote.
+        current_ltp = self.get_current_ltp(ticker, broker_symbol=order_info.get("placed_symbol"))
+        rsi10 = self._get_current_rsi10(symbol, ticker, current_ltp=current_ltp)
         if rsi10 is None:
             logger.debug(f"RSI10 unavailable for {symbol}, skipping exit check")
             return False
@@ -8,12 +8,15 @@ Features:
 - RSI calculation (configurable period)
 - EMA calculation (configurable period: 9, 20, 50, 200)
 - Real-time EMA9 calculation with current LTP
+- Streaming RSI10/EMA9/EMA200 state (seeded once per daily bar, O(1) per LTP)
 - Batch indicator calculation
 - Caching layer to reduce redundant calculations
 """
 
 import hashlib
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Any
 
@@ -29,15 +32,21 @@ from config.settings import VOLUME_LOOKBACK_DAYS  # noqa: E402
 from config.strategy_config import StrategyConfig  # noqa: E402
 from core.data_fetcher import fetch_ohlcv_yf  # noqa: E402
 from core.indicators import compute_indicators  # noqa: E402
+from core.streaming_indicators import StreamingIndicatorState  # noqa: E402
 from modules.kotak_neo_auto_trader.utils.symbol_utils import (  # noqa: E402
     extract_ticker_base,
 )
 from src.infrastructure.db.timezone_utils import ist_now_naive  # noqa: E402
+from src.infrastructure.utils.holiday_calendar import get_previous_trading_day  # noqa: E402
 from utils.logger import logger  # noqa: E402
 
 # Constants
 EMA9_PERIOD = 9
 MIN_DATA_POINTS_FOR_EMA9 = 9
+# History window used to seed streaming state (same window as the sell engine's pandas path)
+STREAMING_SEED_DAYS = 200
+# How often a seed still missing the previous session's daily bar is re-fetched
+STREAMING_BAR_RECHECK_S = 300.0
 
 
 def _ffill_close_trailing_nan(df: pd.DataFrame, ticker: str) -> pd.DataFrame:
@@ -136,6 +145,12 @@ class IndicatorService:
         # Phase 4.2: Adaptive TTL tracking
         self._last_market_state: str | None = None
 
+        # Streaming indicator state per ticker, reseeded when the IST trading date changes
+        # or a newer daily bar lands (monotonic seed times throttle the re-checks)
+        self._streaming_states: dict[str, StreamingIndicatorState] = {}
+        self._streaming_seeded_at: dict[str, float] = {}
+        self._streaming_lock = threading.Lock()
+
         logger.debug(f"IndicatorService initialized (caching: {enable_caching}, ttl: {cache_ttl}s)")
 
     @staticmethod
@@ -307,11 +322,13 @@ class IndicatorService:
         """
         Calculate real-time daily EMA9 value using current LTP.
 
-        This method maintains EXACT same logic as sell_engine.get_current_ema9():
-        1. Get historical daily data (exclude current day)
-        2. Calculate EMA9 on historical data
-        3. Get current LTP (today's price)
-        4. Calculate today's EMA9 with current LTP using formula:
+        Reads the previous close's EMA9 from the cached streaming state (see
+        ``get_streaming_state``) and rolls it forward with the LTP:
+        1. Previous close's EMA9: SMA-seeded over completed daily bars (same arithmetic as
+           pandas_ta.ema), computed once when the state is seeded and reused until the IST
+           date changes or a newer daily bar lands
+        2. Get current LTP (today's price)
+        3. Calculate today's EMA9 with current LTP using formula:
            EMA_today = (Price_today x k) + (EMA_yesterday x (1 - k))
            where k = 2 / (period + 1) = 2 / (9 + 1) = 0.2
 
@@ -328,29 +345,17 @@ class IndicatorService:
             >>> ema9 = service.calculate_ema9_realtime('RELIANCE.NS', 'RELIANCE-EQ')
         """
         try:
-            # Step 1: Get historical daily data (exclude current day for past EMA)
-            if self.price_service:
-                df = self.price_service.get_price(
-                    ticker, days=200, interval="1d", add_current_day=False
-                )
-            else:
-                # Fallback to direct fetch if price_service not available
-                df = fetch_ohlcv_yf(ticker, days=200, interval="1d", add_current_day=False)
-
-            if df is None or df.empty:
+            # Step 1: previous close's EMA9 from the cached streaming state
+            state = self.get_streaming_state(ticker)
+            if state is None:
                 logger.warning(f"No historical data for {ticker}")
                 return None
-
-            # Step 2: Calculate EMA9 on historical data
-            if len(df) < MIN_DATA_POINTS_FOR_EMA9:
-                logger.warning(f"Insufficient data for EMA9 calculation: {len(df)} days")
+            if state.ema9 is None:
+                logger.warning(f"Insufficient data for EMA9 calculation for {ticker}")
                 return None
+            yesterday_ema9 = state.ema9.value
 
-            # Calculate EMA9 using exponential weighted mean (same as sell_engine)
-            ema_series = df["close"].ewm(span=EMA9_PERIOD, adjust=False).mean()
-            yesterday_ema9 = float(ema_series.iloc[-1])
-
-            # Step 3: Get current LTP (today's price)
+            # Step 2: Get current LTP (today's price)
             if current_ltp is None:
                 if self.price_service:
                     # Extract base symbol for price service
@@ -368,12 +373,10 @@ class IndicatorService:
                 logger.warning(f"No LTP available for {ticker}, using yesterday's EMA9")
                 return yesterday_ema9
 
-            # Step 4: Calculate today's EMA9 with current LTP
+            # Step 3: Calculate today's EMA9 with current LTP
             # EMA formula: EMA_today = (Price_today x k) + (EMA_yesterday x (1 - k))
             # where k = 2 / (period + 1) = 2 / (9 + 1) = 0.2
-            # (EXACT same formula as sell_engine.get_current_ema9())
-            k = 2.0 / (EMA9_PERIOD + 1)
-            current_ema9 = (current_ltp * k) + (yesterday_ema9 * (1 - k))
+            current_ema9 = state.ema9.peek(current_ltp)
 
             logger.debug(
                 f"{ticker.replace('.NS', '')}: LTP=Rs {current_ltp:.2f}, "
@@ -386,6 +389,102 @@ class IndicatorService:
             logger.error(f"Error calculating real-time EMA9 for {ticker}: {e}")
             return None
 
+    def get_streaming_state(self, ticker: str) -> StreamingIndicatorState | None:
+        """
+        Get RSI10/EMA9/EMA200 streaming state for ticker, seeding it once per daily bar.
+
+        The state is built from completed daily bars (``add_current_day=False``) the first
+        time a ticker is requested on an IST date; later calls that day reuse it without
+        fetching history or running pandas. A seed taken before the previous session's bar
+        was available is re-fetched (at most every ``STREAMING_BAR_RECHECK_S``) until that
+        bar lands.
+
+        Args:
+            ticker: Stock ticker (e.g., 'RELIANCE.NS')
+
+        Returns:
+            StreamingIndicatorState, or None if history is unavailable
+        """
+        today = ist_now_naive().date()
+        with self._streaming_lock:
+            state = self._streaming_states.get(ticker)
+            seeded_at = self._streaming_seeded_at.get(ticker, 0.0)
+        if state is not None and state.session_date == today:
+            has_last_bar = (
+                state.last_bar_date is None
+                or state.last_bar_date >= get_previous_trading_day(today)
+            )
+            if has_last_bar or time.monotonic() - seeded_at < STREAMING_BAR_RECHECK_S:
+                return state
+
+        if self.price_service:
+            df = self.price_service.get_price(
+                ticker, days=STREAMING_SEED_DAYS, interval="1d", add_current_day=False
+            )
+        else:
+            df = fetch_ohlcv_yf(
+                ticker, days=STREAMING_SEED_DAYS, interval="1d", add_current_day=False
+            )
+
+        state = StreamingIndicatorState.from_history(df, session_date=today)
+        if state is None:
+            return None
+        # Only keep complete seeds; short/partial history is retried on the next call
+        if state.rsi is not None and state.ema9 is not None:
+            with self._streaming_lock:
+                self._streaming_states[ticker] = state
+                self._streaming_seeded_at[ticker] = time.monotonic()
+            logger.debug(
+                f"Seeded streaming indicator state for {ticker} (prev close {state.prev_close})"
+            )
+        return state
+
+    def calculate_realtime_indicators(
+        self, ticker: str, current_ltp: float | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Get RSI10, EMA9 and EMA200 with current LTP as today's provisional close.
+
+        O(1) per call after the daily seed (see ``get_streaming_state``). Values match
+        ``calculate_all_indicators`` on the same history with the LTP appended as today's bar.
+
+        Args:
+            ticker: Stock ticker (e.g., 'RELIANCE.NS')
+            current_ltp: Current LTP; None returns the previous close's values
+
+        Returns:
+            Dict with 'close', 'rsi10', 'ema9', 'ema200' (values may be None when history
+            is too short), or None if history is unavailable
+
+        Example:
+            >>> service = IndicatorService(price_service=price_svc)
+            >>> service.calculate_realtime_indicators('RELIANCE.NS', current_ltp=2450.5)["rsi10"]
+        """
+        try:
+            state = self.get_streaming_state(ticker)
+            if state is None:
+                return None
+            return state.snapshot(current_ltp)
+        except Exception as e:
+            logger.error(f"Error calculating real-time indicators for {ticker}: {e}")
+            return None
+
+    def get_snapshot_rsi10(self, ticker: str) -> float | None:
+        """
+        RSI10 (today's bar included) from the shared market data hub snapshot.
+
+        The hub computes it once per ticker and interval for every user, so callers can
+        skip fetching the daily frame and running ``calculate_all_indicators`` themselves.
+
+        Returns:
+            RSI10, or None when no hub is attached to the PriceService or it has no value
+        """
+        get_snapshot = getattr(self.price_service, "get_market_snapshot", None)
+        if get_snapshot is None:
+            return None
+        snapshot = get_snapshot(ticker)
+        return snapshot.rsi10 if snapshot is not None else None
+
     def calculate_all_indicators(
         self,
         df: pd.DataFrame,
@@ -681,6 +780,9 @@ class IndicatorService:
         if self._cache:
             self._cache.clear()
             logger.debug("Indicator cache cleared")
+        with self._streaming_lock:
+            self._streaming_states.clear()
+            self._streaming_seeded_at.clear()
 
 
 # Singleton instance
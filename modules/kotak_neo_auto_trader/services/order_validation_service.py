@@ -297,13 +297,15 @@ class OrderValidationService:
         )
         return (True, 0, 999)
 
-    def check_duplicate_order(
+    def check_duplicate_order(  # noqa: PLR0913
         self,
         symbol: str,
         check_active_buy_order: bool = True,
         check_holdings: bool = True,
         allow_reentry: bool = False,
         cached_pending_orders: list[dict[str, Any]] | None = None,
+        *,
+        order_view: Any | None = None,
     ) -> tuple[bool, str | None]:
         """
         Check if order would be duplicate
@@ -314,6 +316,8 @@ class OrderValidationService:
             check_holdings: Check if already in holdings
             allow_reentry: If True, skip holdings check (allows buying more of existing position)
             cached_pending_orders: Optional cached pending orders to avoid redundant API calls
+            order_view: Optional run-scoped RunOrderView (keyword-only) to read DB orders
+                from instead of listing every order of the user
 
         Returns:
             Tuple of (is_duplicate, reason)
@@ -341,7 +345,10 @@ class OrderValidationService:
             try:
                 from src.infrastructure.db.models import OrderStatus as DbOrderStatus
 
-                existing_orders, _ = self.orders_repo.list(self.user_id)
+                if order_view is not None:
+                    existing_orders = order_view.orders_for(symbol, side="buy")
+                else:
+                    existing_orders, _ = self.orders_repo.list(self.user_id)
                 symbol_base = (
                     symbol.upper()
                     .replace("-EQ", "")
@@ -11,6 +11,8 @@ Features:
 - Caching layer to reduce API calls
 - Thread-safe caching with request-scoped isolation
 - Subscription management
+- Optional process-wide MarketDataHub (multi-user service): daily OHLCV snapshots and
+  RSI10 shared by every user's engines
 """
 
 import sys
@@ -250,6 +252,7 @@ class PriceService:
         enable_caching: bool = True,
         historical_cache_ttl: int = 300,  # 5 minutes for historical
         realtime_cache_ttl: int = 30,  # 30 seconds for real-time
+        market_data_hub=None,
     ):
         """
         Initialize PriceService.
@@ -259,8 +262,11 @@ class PriceService:
             enable_caching: Enable price caching (default: True)
             historical_cache_ttl: Cache TTL for historical data in seconds (default: 300)
             realtime_cache_ttl: Cache TTL for real-time data in seconds (default: 30)
+            market_data_hub: Optional shared MarketDataHub; when set, daily snapshot-shaped
+                requests are served from it (set by MultiUserTradingService)
         """
         self.live_price_manager = live_price_manager
+        self.market_data_hub = market_data_hub
         self.enable_caching = enable_caching
         self.historical_cache_ttl = historical_cache_ttl
         self.realtime_cache_ttl = realtime_cache_ttl
@@ -312,6 +318,11 @@ class PriceService:
             >>> df = service.get_price('RELIANCE.NS', days=30)
             >>> print(df.head())
         """
+        snapshot = self._hub_snapshot(ticker, days, interval, end_date, add_current_day)
+        if snapshot is not None:
+            # Drop the hub's indicator column: callers get the same frame as a direct fetch
+            return snapshot.data.drop(columns=["rsi10"], errors="ignore")
+
         # Use shared cache if enabled (shared across all users - paper + broker)
         if self.enable_caching:
             from core.data_fetcher import get_cached_ohlcv
@@ -337,6 +348,51 @@ class PriceService:
             logger.error(f"Failed to fetch historical price data for {ticker}: {e}")
             return None
 
+    def _hub_snapshot(
+        self,
+        ticker: str,
+        days: int,
+        interval: str,
+        end_date: str | None,
+        add_current_day: bool,
+    ):
+        """Hub snapshot when the request matches the hub's daily frame, else None."""
+        if self.market_data_hub is None:
+            return None
+        from src.application.services.market_data_hub import SNAPSHOT_DAYS
+
+        if (days, interval, end_date, add_current_day) != (SNAPSHOT_DAYS, "1d", None, True):
+            return None
+        return self.get_market_snapshot(ticker)
+
+    def get_market_snapshot(self, ticker: str):
+        """
+        Shared daily snapshot (OHLCV including today plus RSI10) for ticker.
+
+        Returns:
+            MarketSnapshot, or None when no hub is attached or the ticker has no data
+        """
+        if self.market_data_hub is None:
+            return None
+        try:
+            return self.market_data_hub.get_snapshot(ticker)
+        except Exception as e:
+            logger.debug(f"Market data hub snapshot unavailable for {ticker}: {e}")
+            return None
+
+    def set_market_data_subscriptions(self, subscriber_id: Any, tickers: list[str]) -> None:
+        """
+        Register the tickers a user's engines monitor with the shared hub (no-op without one).
+
+        The hub polls subscribed tickers once per interval for all users together.
+        """
+        if self.market_data_hub is None or subscriber_id is None:
+            return
+        try:
+            self.market_data_hub.set_subscriptions(subscriber_id, [t for t in tickers if t])
+        except Exception as e:
+            logger.debug(f"Failed to update market data hub subscriptions: {e}")
+
     def get_realtime_price(
         self,
         symbol: str,
@@ -20,9 +20,11 @@ except ImportError:
     ist_now_naive = None
 
 try:
+    from .broker_snapshot import BrokerOrderIndex
     from .sell_engine import SellOrderManager
     from .utils.order_field_extractor import OrderFieldExtractor
 except ImportError:
+    from modules.kotak_neo_auto_trader.broker_snapshot import BrokerOrderIndex
     from modules.kotak_neo_auto_trader.sell_engine import SellOrderManager
     from modules.kotak_neo_auto_trader.utils.order_field_extractor import OrderFieldExtractor
 
@@ -577,6 +579,7 @@ class UnifiedOrderMonitor:
             if broker_orders is None:
                 orders_response = self.orders.get_orders() if self.orders else None
                 broker_orders = orders_response.get("data", []) if orders_response else []
+            order_index = BrokerOrderIndex(broker_orders)
 
             # Fetch holdings once for reconciliation (if needed)
             holdings_data = None
@@ -599,12 +602,7 @@ class UnifiedOrderMonitor:
                 stats["checked"] += 1
 
                 # Find order in broker orders
-                broker_order = None
-                for bo in broker_orders:
-                    broker_order_id = OrderFieldExtractor.get_order_id(bo)
-                    if broker_order_id == order_id:
-                        broker_order = bo
-                        break
+                broker_order = order_index.get(order_id)
 
                 if broker_order:
                     # Extract status
@@ -687,12 +685,7 @@ class UnifiedOrderMonitor:
 
                                         # Edge Case #2 Fix: Use priority order for execution details
                                         # Priority 1: Try order_report() first (same-day orders)
-                                        broker_order_from_report = None
-                                        if broker_orders:
-                                            for bo in broker_orders:
-                                                if OrderFieldExtractor.get_order_id(bo) == order_id:
-                                                    broker_order_from_report = bo
-                                                    break
+                                        broker_order_from_report = order_index.get(order_id)
 
                                         execution_qty = None
                                         execution_price = None
@@ -38,6 +38,7 @@ sys.path.insert(0, str(project_root))
 from core.feature_engineering import calculate_all_dip_features
 from services.data_service import DataService
 from services.indicator_service import IndicatorService
+from services.ml_feature_store import PointInTimeFeatureStore
 from services.signal_service import SignalService
 from services.verdict_service import VerdictService
 from utils.logger import logger
@@ -119,6 +120,116 @@ def _get_nifty_features_for_date(nifty_df: "pd.DataFrame | None", date_str: str)
         return defaults
 
 
+def _signal_date_for_entry(entry_date: str) -> str:
+    """Signal day (previous weekday) for a backtest entry/execution date."""
+    signal_date = datetime.strptime(entry_date, "%Y-%m-%d") - timedelta(days=1)
+
+    # Skip weekends: if signal_date falls on Saturday/Sunday, go back to Friday
+    while signal_date.weekday() >= 5:  # 5=Saturday, 6=Sunday
+        signal_date -= timedelta(days=1)
+
+    return signal_date.strftime("%Y-%m-%d")
+
+
+def _ticker_features_from_window(
+    ticker: str,
+    signal_date_str: str,
+    indicator_service: IndicatorService,
+    signal_service: SignalService,
+) -> dict | None:
+    """Ticker-level features from a history window fetched up to the signal date."""
+    # Fetch data up to SIGNAL date (not entry date!) to avoid look-ahead bias
+    # IMPORTANT: Fetch enough data for accurate EMA200 calculation
+    # EMA200 needs ~300 trading days (200 + 100 warmup) = ~420 calendar days
+    from core.data_fetcher import fetch_ohlcv_yf
+
+    df = fetch_ohlcv_yf(
+        ticker=ticker,
+        days=420 + 100,  # EMA200 buffer + extra safety margin
+        interval="1d",
+        end_date=signal_date_str,
+        add_current_day=False,
+    )
+
+    if df is None or df.empty or len(df) < 50:
+        return None
+
+    # Calculate indicators
+    df = indicator_service.compute_indicators(df)
+    if df is None or df.empty:
+        return None
+
+    # Get latest row (signal date - what we had when making decision)
+    last = df.iloc[-1]
+
+    # Extract features
+    features = {
+        # Technical indicators
+        "rsi_10": float(last.get("rsi10", 0)) if pd.notna(last.get("rsi10")) else None,
+        # REMOVED: ema200 (redundant with price_above_ema200 boolean)
+        # REMOVED: price (absolute price not useful for ML)
+        "price_above_ema200": bool(pd.notna(last.get("ema200")) and last["close"] > last["ema200"]),
+        # Volume features
+        # REMOVED: volume (absolute volume redundant with volume_ratio)
+        "avg_volume_20": float(df["volume"].tail(20).mean()) if len(df) >= 20 else None,
+        "volume_ratio": (
+            float(last["volume"] / df["volume"].tail(20).mean())
+            if len(df) >= 20 and df["volume"].tail(20).mean() > 0
+            else 1.0
+        ),
+        "vol_strong": (
+            bool(last["volume"] >= 1.5 * df["volume"].tail(20).mean()) if len(df) >= 20 else False
+        ),
+        # Price action
+        "recent_high_20": float(df["high"].tail(20).max()) if len(df) >= 20 else None,
+        "recent_low_20": float(df["low"].tail(20).min()) if len(df) >= 20 else None,
+        "support_distance_pct": (
+            float(((last["close"] - df["low"].tail(20).min()) / last["close"]) * 100)
+            if len(df) >= 20
+            else None
+        ),
+        # Target distance (EMA9 is the exit target)
+        "ema9_distance_pct": (
+            float(((last.get("ema9", 0) - last["close"]) / last["close"]) * 100)
+            if pd.notna(last.get("ema9")) and last["close"] > 0
+            else None
+        ),
+        # Patterns (simplified)
+        "has_hammer": False,  # Will be computed if needed
+        "has_bullish_engulfing": False,  # Will be computed if needed
+        "has_divergence": False,  # Will be computed if needed
+        # alignment_score removed: was hardcoded 0 (train/serve skew).
+        # Reintroduce after implementing historical weekly data collection.
+    }
+
+    # Detect patterns
+    if len(df) >= 2:
+        prev = df.iloc[-2]
+        signals = signal_service.detect_pattern_signals(df, last, prev)
+        features["has_hammer"] = "hammer" in signals
+        features["has_bullish_engulfing"] = "bullish_engulfing" in signals
+        features["has_divergence"] = "bullish_divergence" in signals
+
+    # ML ENHANCED DIP FEATURES (Phase 4): Add advanced dip-buying features
+    try:
+        dip_features = calculate_all_dip_features(df)
+        features.update(dip_features)
+        logger.debug(
+            f"{ticker}: Added dip features (depth={dip_features['dip_depth_from_20d_high_pct']:.1f}%)"
+        )
+    except Exception as e:
+        logger.warning(f"{ticker}: Failed to calculate dip features: {e}, using defaults")
+        # Add default values
+        features["dip_depth_from_20d_high_pct"] = 0.0
+        features["consecutive_red_days"] = 0
+        features["dip_speed_pct_per_day"] = 0.0
+        features["decline_rate_slowing"] = False
+        features["volume_green_vs_red_ratio"] = 1.0
+        features["support_hold_count"] = 0
+
+    return features
+
+
 def extract_features_at_date(
     ticker: str,
     entry_date: str,
@@ -127,6 +238,7 @@ def extract_features_at_date(
     signal_service: SignalService,
     verdict_service: VerdictService,
     market_history: dict | None = None,
+    feature_store: PointInTimeFeatureStore | None = None,
 ) -> dict | None:
     """
     Extract features at a specific entry date
@@ -154,130 +266,40 @@ def extract_features_at_date(
         indicator_service: Indicator service instance
         signal_service: Signal service instance
         verdict_service: Verdict service instance
+        feature_store: Optional point-in-time feature store; when given, ticker-level
+            features are looked up from its per-ticker table instead of fetching and
+            recomputing a 520-day window for this date
 
     Returns:
         Dict with features or None if extraction fails
     """
     try:
         # LOOK-AHEAD BIAS FIX: Calculate signal date (day before entry/execution)
-        entry_datetime = datetime.strptime(entry_date, "%Y-%m-%d")
-        signal_date = entry_datetime - timedelta(days=1)
-
-        # Skip weekends: if signal_date falls on Saturday/Sunday, go back to Friday
-        while signal_date.weekday() >= 5:  # 5=Saturday, 6=Sunday
-            signal_date -= timedelta(days=1)
-
-        signal_date_str = signal_date.strftime("%Y-%m-%d")
+        signal_date_str = _signal_date_for_entry(entry_date)
 
         logger.debug(
             f"{ticker}: Entry={entry_date}, Signal={signal_date_str} (using signal day for features)"
         )
 
-        # Fetch data up to SIGNAL date (not entry date!) to avoid look-ahead bias
-        # IMPORTANT: Fetch enough data for accurate EMA200 calculation
-        # EMA200 needs ~300 trading days (200 + 100 warmup) = ~420 calendar days
-        from core.data_fetcher import fetch_ohlcv_yf
-
-        df = fetch_ohlcv_yf(
-            ticker=ticker,
-            days=420 + 100,  # EMA200 buffer + extra safety margin
-            interval="1d",
-            end_date=signal_date_str,
-            add_current_day=False,
-        )
-
-        if df is None or df.empty or len(df) < 50:
-            return None
-
-        # Calculate indicators
-        df = indicator_service.compute_indicators(df)
-        if df is None or df.empty:
-            return None
-
-        # Get latest row (signal date - what we had when making decision)
-        last = df.iloc[-1]
-
-        # Extract features
-        features = {
-            "ticker": ticker,
-            "entry_date": entry_date,
-            # Technical indicators
-            "rsi_10": float(last.get("rsi10", 0)) if pd.notna(last.get("rsi10")) else None,
-            # REMOVED: ema200 (redundant with price_above_ema200 boolean)
-            # REMOVED: price (absolute price not useful for ML)
-            "price_above_ema200": bool(
-                pd.notna(last.get("ema200")) and last["close"] > last["ema200"]
-            ),
-            # Volume features
-            # REMOVED: volume (absolute volume redundant with volume_ratio)
-            "avg_volume_20": float(df["volume"].tail(20).mean()) if len(df) >= 20 else None,
-            "volume_ratio": (
-                float(last["volume"] / df["volume"].tail(20).mean())
-                if len(df) >= 20 and df["volume"].tail(20).mean() > 0
-                else 1.0
-            ),
-            "vol_strong": (
-                bool(last["volume"] >= 1.5 * df["volume"].tail(20).mean())
-                if len(df) >= 20
-                else False
-            ),
-            # Price action
-            "recent_high_20": float(df["high"].tail(20).max()) if len(df) >= 20 else None,
-            "recent_low_20": float(df["low"].tail(20).min()) if len(df) >= 20 else None,
-            "support_distance_pct": (
-                float(((last["close"] - df["low"].tail(20).min()) / last["close"]) * 100)
-                if len(df) >= 20
-                else None
-            ),
-            # Target distance (EMA9 is the exit target)
-            "ema9_distance_pct": (
-                float(((last.get("ema9", 0) - last["close"]) / last["close"]) * 100)
-                if pd.notna(last.get("ema9")) and last["close"] > 0
-                else None
-            ),
-            # Patterns (simplified)
-            "has_hammer": False,  # Will be computed if needed
-            "has_bullish_engulfing": False,  # Will be computed if needed
-            "has_divergence": False,  # Will be computed if needed
-            # alignment_score removed: was hardcoded 0 (train/serve skew).
-            # Reintroduce after implementing historical weekly data collection.
-        }
-
-        # Detect patterns
-        if len(df) >= 2:
-            prev = df.iloc[-2]
-            signals = signal_service.detect_pattern_signals(df, last, prev)
-            features["has_hammer"] = "hammer" in signals
-            features["has_bullish_engulfing"] = "bullish_engulfing" in signals
-            features["has_divergence"] = "bullish_divergence" in signals
+        if feature_store is not None:
+            ticker_features = feature_store.features_at(ticker, signal_date_str)
         else:
-            features["has_hammer"] = False
-            features["has_bullish_engulfing"] = False
-            features["has_divergence"] = False
-
-        # PE/PB dropped: fetch_fundamentals() calls yfinance.Ticker.info which returns
-        # current ratios with no date parameter — applying today's PE to a 2018 entry
-        # row is temporal leakage. Drop until a point-in-time fundamental source exists.
-        features["pe"] = None
-        features["pb"] = None
-        features["fundamental_ok"] = True
-
-        # ML ENHANCED DIP FEATURES (Phase 4): Add advanced dip-buying features
-        try:
-            dip_features = calculate_all_dip_features(df)
-            features.update(dip_features)
-            logger.debug(
-                f"{ticker}: Added dip features (depth={dip_features['dip_depth_from_20d_high_pct']:.1f}%)"
+            ticker_features = _ticker_features_from_window(
+                ticker, signal_date_str, indicator_service, signal_service
             )
-        except Exception as e:
-            logger.warning(f"{ticker}: Failed to calculate dip features: {e}, using defaults")
-            # Add default values
-            features["dip_depth_from_20d_high_pct"] = 0.0
-            features["consecutive_red_days"] = 0
-            features["dip_speed_pct_per_day"] = 0.0
-            features["decline_rate_slowing"] = False
-            features["volume_green_vs_red_ratio"] = 1.0
-            features["support_hold_count"] = 0
+        if not ticker_features:
+            return None
+
+        features = {"ticker": ticker, "entry_date": entry_date}
+        for name, value in ticker_features.items():
+            features[name] = value
+            if name == "has_divergence":
+                # PE/PB dropped: fetch_fundamentals() calls yfinance.Ticker.info which returns
+                # current ratios with no date parameter — applying today's PE to a 2018 entry
+                # row is temporal leakage. Drop until a point-in-time fundamental source exists.
+                features["pe"] = None
+                features["pb"] = None
+                features["fundamental_ok"] = True
 
         # MARKET REGIME FEATURES: Use pre-fetched history for fast, reliable lookups.
         # Per-date market_regime_service calls silently fell back to stubs (vix=21.88)
@@ -368,8 +390,16 @@ def extract_features_at_date(
         return None
 
 
+def _fill_date_str(fill_date) -> str:
+    if isinstance(fill_date, pd.Timestamp):
+        return fill_date.strftime("%Y-%m-%d")
+    return str(fill_date)
+
+
 def create_labels_from_backtest_results_with_reentry(
-    backtest_results: dict, market_history: dict | None = None
+    backtest_results: dict,
+    market_history: dict | None = None,
+    feature_store: PointInTimeFeatureStore | None = None,
 ) -> list[dict]:
     """
     Create labeled training examples from backtest results
@@ -379,6 +409,8 @@ def create_labels_from_backtest_results_with_reentry(
 
     Args:
         backtest_results: Backtest results dictionary (can be pandas Series or dict)
+        market_history: Pre-fetched Nifty/VIX history (see _fetch_market_history)
+        feature_store: Optional point-in-time feature store for ticker-level features
 
     Returns:
         List of labeled training examples
@@ -466,6 +498,17 @@ def create_labels_from_backtest_results_with_reentry(
 
     ticker = backtest_results["ticker"]
 
+    if feature_store is not None:
+        # One history fetch/indicator pass covering every fill of every position
+        fill_dates = [
+            _signal_date_for_entry(_fill_date_str(fill["date"]))
+            for position in positions
+            if isinstance(position, dict)
+            for fill in position.get("fills") or []
+            if fill.get("date") is not None
+        ]
+        feature_store.prepare(ticker, fill_dates)
+
     for position in positions:
         if not isinstance(position, dict):
             logger.debug(f"Position is not a dict: {type(position)}")
@@ -538,11 +581,7 @@ def create_labels_from_backtest_results_with_reentry(
 
         # Extract features for EACH fill (initial + re-entries)
         for fill_idx, fill in enumerate(fills):
-            fill_date = fill["date"]
-            if isinstance(fill_date, pd.Timestamp):
-                fill_date_str = fill_date.strftime("%Y-%m-%d")
-            else:
-                fill_date_str = str(fill_date)
+            fill_date_str = _fill_date_str(fill["date"])
 
             fill_price = float(fill.get("price", 0))
             is_reentry = fill_idx > 0
@@ -561,6 +600,7 @@ def create_labels_from_backtest_results_with_reentry(
                     signal_service=signal_service,
                     verdict_service=verdict_service,
                     market_history=market_history,
+                    feature_store=feature_store,
                 )
 
                 if not features:
@@ -641,7 +681,9 @@ def create_labels_from_backtest_results_with_reentry(
 
 
 def collect_training_data(
-    backtest_file: str, output_file: str = "data/ml_training_data_reentry.csv"
+    backtest_file: str,
+    output_file: str = "data/ml_training_data_reentry.csv",
+    feature_store_dir: str | None = "data/feature_store",
 ) -> pd.DataFrame:
     """
     Collect training data from backtest results
@@ -650,6 +692,8 @@ def collect_training_data(
     Args:
         backtest_file: Path to backtest results CSV
         output_file: Path to save training data
+        feature_store_dir: Directory of the point-in-time feature store (one history
+            fetch per ticker); None extracts every fill from its own fetched window
 
     Returns:
         DataFrame with training data
@@ -664,6 +708,7 @@ def collect_training_data(
     # Pre-fetch market history once — avoids per-row API calls that silently fall
     # back to stub defaults (india_vix=21.88) under rate limiting.
     market_history = _fetch_market_history()
+    feature_store = PointInTimeFeatureStore(feature_store_dir) if feature_store_dir else None
 
     all_training_data = []
     total = len(df_backtest)
@@ -673,7 +718,9 @@ def collect_training_data(
         logger.info(f"[{i + 1}/{total}] Processing {ticker}...")
 
         # Create labeled examples from this backtest result (WITH RE-ENTRY EXTRACTION)
-        examples = create_labels_from_backtest_results_with_reentry(row, market_history)
+        examples = create_labels_from_backtest_results_with_reentry(
+            row, market_history, feature_store
+        )
 
         if examples:
             all_training_data.extend(examples)
@@ -686,6 +733,8 @@ def collect_training_data(
         return pd.DataFrame()
 
     logger.info(f"\nCollected {len(all_training_data)} total training examples")
+    if feature_store is not None:
+        logger.info(f"Feature store: {feature_store.stats}")
 
     # Convert to DataFrame
     df_training = pd.DataFrame(all_training_data)
@@ -715,10 +764,24 @@ def main():
     parser.add_argument(
         "--output", default="data/ml_training_data_reentry.csv", help="Output file path"
     )
+    parser.add_argument(
+        "--feature-store-dir",
+        default="data/feature_store",
+        help="Point-in-time feature store directory (per-ticker feature tables)",
+    )
+    parser.add_argument(
+        "--no-feature-store",
+        action="store_true",
+        help="Fetch and compute a separate history window for every fill (slow)",
+    )
 
     args = parser.parse_args()
 
-    collect_training_data(args.backtest_file, args.output)
+    collect_training_data(
+        args.backtest_file,
+        args.output,
+        feature_store_dir=None if args.no_feature_store else args.feature_store_dir,
+    )
 
 
 if __name__ == "__main__":
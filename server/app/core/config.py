@@ -90,5 +90,15 @@ class Settings(BaseSettings):
     email_domain_allowlist_enabled: bool = True
     email_domain_allowlist_extra: list[str] = []
 
+    # Live quotes (QuoteService): per-ticker cache TTL during / outside the NSE session (and
+    # at most quote_failure_ttl_seconds for a lookup that found no price), how long past the
+    # TTL a quote is still served while it refreshes, and fetch concurrency
+    quote_ttl_market_seconds: float = 15.0
+    quote_ttl_closed_seconds: float = 600.0
+    quote_failure_ttl_seconds: float = 15.0
+    quote_stale_grace_seconds: float = 120.0
+    quote_fetch_timeout_seconds: float = 10.0
+    quote_fetch_workers: int = 8
+
 
 settings = Settings()
@@ -8,6 +8,7 @@ Scheduled tasks for the trading application:
 - Data cleanup tasks
 - Daily performance-fee billing reconcile (mark overdue invoices)
 - Monthly performance-fee invoices (broker users) after month close
+- Time-based signal expiry (buying zone reads compute it; this job persists it)
 """
 
 from __future__ import annotations
@@ -73,6 +74,19 @@ def job_performance_bills_month_close():
         logger.exception("Performance bills month-close job failed")
 
 
+def job_signal_expiry():
+    """Persist time-based expiry of ACTIVE/REJECTED signals (market close / AMO market open)."""
+    try:
+        from src.infrastructure.db.session import SessionLocal
+        from src.infrastructure.persistence.signals_repository import SignalsRepository
+
+        with SessionLocal() as db:
+            expired = SignalsRepository(db).mark_time_expired_signals()
+        logger.info("Signal expiry: %d signal(s) expired", expired)
+    except Exception:
+        logger.exception("Signal expiry job failed")
+
+
 def start_scheduler():
     """
     Initialize and start the background job scheduler
@@ -107,6 +121,15 @@ def start_scheduler():
         replace_existing=True,
     )
 
+    # Signal expiry: every 15 minutes, a minute after the 9:15 open / 3:30 close boundaries
+    scheduler.add_job(
+        job_signal_expiry,
+        trigger=CronTrigger(minute="1,16,31,46", timezone="Asia/Kolkata"),
+        id="signal_expiry",
+        name="Time-based signal expiry",
+        replace_existing=True,
+    )
+
     # Optional: Run MTM update on startup (disabled by default)
     # scheduler.add_job(
     #     job_mtm_update,
@@ -163,5 +186,6 @@ __all__ = [
     "job_mtm_update",
     "job_billing_reconcile",
     "job_performance_bills_month_close",
+    "job_signal_expiry",
     "closed_month_to_bill",
 ]
@@ -352,6 +352,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Pagination cursor of /signals/buying-zone, read by cross-origin browser clients
+    expose_headers=["X-Next-Cursor"],
 )
 
 
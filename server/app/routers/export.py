@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session
 
 from src.infrastructure.db.dialect import is_postgresql
 from src.infrastructure.db.models import Orders, Positions, Signals, TradeMode, Users
+from src.infrastructure.db.timezone_utils import day_range
 from src.infrastructure.persistence.export_job_repository import ExportJobRepository
 from src.infrastructure.persistence.pnl_repository import PnlRepository
 
@@ -223,14 +224,15 @@ def export_trades_csv(
         if not start_date:
             start_date = end_date - timedelta(days=90)
 
-        # Fetch closed positions
+        # Fetch closed positions (half-open range on the raw column, served by
+        # ix_positions_user_closed_at)
+        start_dt, end_dt = day_range(start_date, end_date)
         closed_positions = (
             db.query(Positions)
             .filter(
                 Positions.user_id == current.id,
-                Positions.closed_at.isnot(None),
-                func.date(Positions.closed_at) >= start_date,
-                func.date(Positions.closed_at) <= end_date,
+                Positions.closed_at >= start_dt,
+                Positions.closed_at < end_dt,
             )
             .order_by(Positions.closed_at.desc())
             .all()
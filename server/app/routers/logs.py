@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
@@ -40,6 +41,19 @@ def _parse_datetime(value: str | None) -> datetime | None:
         ) from exc
 
 
+def _read_logs(reader: FileLogReader, cursor: str | None, **kwargs) -> list[dict]:
+    """``reader.read_logs`` for one page; entries older than ``cursor`` when given."""
+    if cursor:
+        kwargs["cursor"] = cursor
+    try:
+        return reader.read_logs(**kwargs)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(exc),
+        ) from exc
+
+
 @router.get("/user/logs", response_model=ServiceLogsResponse)
 def get_user_logs(
     level: str | None = Query(
@@ -55,6 +69,10 @@ def get_user_logs(
     limit: int = Query(200, ge=1, le=500),
     days_back: int = Query(7, ge=1, le=14),
     tail: bool = Query(False, description="Return last 200 lines from latest file."),
+    cursor: Annotated[
+        str | None,
+        Query(description="next_cursor of the previous page (returns older entries)."),
+    ] = None,
     current_user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -62,10 +80,13 @@ def get_user_logs(
     _ = db  # Not used for file logs
     reader = FileLogReader()
 
+    next_cursor = None
     if tail:
         log_dicts = reader.tail_logs(user_id=current_user.id, log_type="service", tail_lines=200)
     else:
-        log_dicts = reader.read_logs(
+        log_dicts = _read_logs(
+            reader,
+            cursor,
             user_id=current_user.id,
             level=level,
             module=module,
@@ -75,13 +96,15 @@ def get_user_logs(
             limit=limit,
             days_back=days_back,
         )
+        if len(log_dicts) >= limit:
+            next_cursor = str(log_dicts[-1].get("id", "")) or None
 
     logs = []
     for log_dict in log_dicts:
         # Accept legacy int IDs (e.g., old DB rows) by coercing to string for the schema.
         coerced = {**log_dict, "id": str(log_dict.get("id", ""))}
         logs.append(ServiceLogEntry(**coerced))
-    return ServiceLogsResponse(logs=logs)
+    return ServiceLogsResponse(logs=logs, next_cursor=next_cursor)
 
 
 @router.get("/user/logs/errors", response_model=ErrorLogsResponse)
@@ -122,6 +145,10 @@ def get_admin_logs(
     limit: int = Query(500, ge=1, le=500),
     days_back: int = Query(7, ge=1, le=14),
     tail: bool = Query(False, description="Return last 200 lines from latest file."),
+    cursor: Annotated[
+        str | None,
+        Query(description="next_cursor of the previous page (returns older entries)."),
+    ] = None,
     admin=Depends(require_admin),
     db: Session = Depends(get_db),
 ):
@@ -135,10 +162,13 @@ def get_admin_logs(
         )
 
     reader = FileLogReader()
+    next_cursor = None
     if tail:
         log_dicts = reader.tail_logs(user_id=user_id, log_type="service", tail_lines=200)
     else:
-        log_dicts = reader.read_logs(
+        log_dicts = _read_logs(
+            reader,
+            cursor,
             user_id=user_id,
             level=level,
             module=module,
@@ -148,12 +178,14 @@ def get_admin_logs(
             limit=limit,
             days_back=days_back,
         )
+        if len(log_dicts) >= limit:
+            next_cursor = str(log_dicts[-1].get("id", "")) or None
 
     logs = []
     for log_dict in log_dicts:
         coerced = {**log_dict, "id": str(log_dict.get("id", ""))}
         logs.append(ServiceLogEntry(**coerced))
-    return ServiceLogsResponse(logs=logs)
+    return ServiceLogsResponse(logs=logs, next_cursor=next_cursor)
 
 
 @router.get("/admin/logs/errors", response_model=ErrorLogsResponse)
@@ -14,7 +14,7 @@ from sqlalchemy.orm import Session
 
 from src.infrastructure.db.connection_monitor import check_pool_health, get_pool_status
 from src.infrastructure.db.models import Orders, Positions, TradeMode, Users
-from src.infrastructure.db.timezone_utils import ist_now_naive
+from src.infrastructure.db.timezone_utils import day_range, ist_now_naive
 from src.infrastructure.db.session import engine
 from src.infrastructure.persistence.settings_repository import SettingsRepository
 
@@ -209,14 +209,13 @@ def get_daily_metrics(
                 ) from None
 
         # Query closed positions for the specific day
-        start_datetime = datetime.combine(target_date, datetime.min.time())
-        end_datetime = datetime.combine(target_date, datetime.max.time())
+        start_datetime, end_datetime = day_range(target_date, target_date)
 
         stmt = select(Positions).where(
             Positions.user_id == current.id,
             Positions.closed_at.isnot(None),
             Positions.closed_at >= start_datetime,
-            Positions.closed_at <= end_datetime,
+            Positions.closed_at < end_datetime,
         )
 
         positions = list(db.execute(stmt).scalars().all())
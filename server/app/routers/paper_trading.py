@@ -6,7 +6,6 @@ import logging
 from datetime import date, datetime
 from typing import Annotated, Any
 
-import yfinance as yf
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
@@ -36,6 +35,7 @@ from src.infrastructure.persistence.user_trading_config_repository import (
 
 from ..core.deps import get_current_user, get_db, require_entitlement
 from ..services.pnl_calculation_service import PnlCalculationService
+from ..services.quote_service import get_quote_service
 
 logger = logging.getLogger(__name__)
 
@@ -634,31 +634,16 @@ def get_paper_trading_portfolio(  # noqa: PLR0915, PLR0912, B008
 
         realized_pnl = _sum_paper_realized_pnl(db, current.id, all_orders, user_settings)
 
-        # Fetch live prices using yfinance (broker-agnostic)
+        # Live prices for all open holdings in one batch (shared quote cache, broker-agnostic)
+        live_prices = get_quote_service().get_quotes(
+            [position.symbol for position in paper_positions if (position.quantity or 0) > 0]
+        )
         portfolio_value = 0.0
-        all_holdings_to_process = list(paper_positions)
-        for position in all_holdings_to_process:
+        for position in paper_positions:
             qty = position.quantity or 0
             if qty > 0:
-                # Construct ticker from symbol (add .NS if not present)
-                symbol = position.symbol
-                ticker = (
-                    f"{symbol}.NS"
-                    if not symbol.endswith(".NS") and not symbol.endswith(".BO")
-                    else symbol
-                )
-                # Remove broker suffixes like -EQ, -BE for ticker lookup
-                if "-" in ticker:
-                    ticker = ticker.split("-")[0] + ".NS"
-                try:
-                    stock = yf.Ticker(ticker)
-                    live_price = stock.info.get("currentPrice") or stock.info.get(
-                        "regularMarketPrice"
-                    )
-                    current_price = float(live_price) if live_price else position.avg_price or 0.0
-                except Exception:
-                    # Fallback to avg_price if live fetch fails
-                    current_price = position.avg_price or 0.0
+                live_price = live_prices.get(position.symbol)
+                current_price = live_price if live_price else position.avg_price or 0.0
                 portfolio_value += qty * current_price
 
         # Frozen sell limits from open paper sell orders (same source as Recent Orders price).
@@ -666,18 +651,6 @@ def get_paper_trading_portfolio(  # noqa: PLR0915, PLR0912, B008
         for symbol, price in target_prices.items():
             logger.debug("Loaded target from DB sell order: %s = %s", symbol, price)
 
-        # Helper function to get live price
-        def get_live_price(symbol: str) -> float | None:
-            """Fetch live price for a symbol using yfinance"""
-            try:
-                ticker = f"{symbol}.NS" if not symbol.endswith(".NS") else symbol
-                stock = yf.Ticker(ticker)
-                price = stock.info.get("currentPrice") or stock.info.get("regularMarketPrice")
-                return float(price) if price else None
-            except Exception as e:
-                logger.debug(f"Failed to fetch live price for {symbol}: {e}")
-                return None
-
         # Calculate target prices on-the-fly if not available (same realtime EMA9 as broker/paper)
         _paper_price_service = get_price_service(live_price_manager=None, enable_caching=True)
         _paper_indicator_service = get_indicator_service(
@@ -721,22 +694,8 @@ def get_paper_trading_portfolio(  # noqa: PLR0915, PLR0912, B008
             if qty <= 0:
                 continue
 
-            # Construct ticker for price lookup (add .NS if not present)
-            ticker = symbol
-            if not ticker.endswith(".NS") and not ticker.endswith(".BO"):
-                # Remove broker suffixes like -EQ, -BE for ticker lookup
-                base_symbol = symbol.split("-")[0] if "-" in symbol else symbol
-                ticker = f"{base_symbol}.NS"
-            # Remove broker suffixes from existing ticker
-            elif "-" in ticker:
-                base_symbol = ticker.split("-")[0]
-                if base_symbol.endswith(".NS") or base_symbol.endswith(".BO"):
-                    ticker = base_symbol
-                else:
-                    ticker = f"{base_symbol}.NS"
-
-            # Fetch live price, fallback to avg_price if fetch fails
-            current_price = get_live_price(symbol.split("-")[0] if "-" in symbol else symbol)
+            # Live price from the batch above, fallback to avg_price if unavailable
+            current_price = live_prices.get(symbol)
             if current_price is None:
                 current_price = avg_price
                 logger.debug(f"Using avg_price for {symbol}: {current_price}")
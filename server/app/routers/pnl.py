@@ -1,5 +1,5 @@
 from collections import defaultdict
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from typing import Annotated
 
 # ruff: noqa: B008
@@ -7,7 +7,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import asc, desc
 from sqlalchemy.orm import Session
 
+from config.settings import paper_trading_dir
 from src.infrastructure.db.models import Positions, TradeMode, Users
+from src.infrastructure.db.timezone_utils import day_range
 from src.infrastructure.persistence.orders_repository import OrdersRepository
 from src.infrastructure.persistence.pnl_audit_repository import PnlAuditRepository
 from src.infrastructure.persistence.pnl_repository import PnlRepository
@@ -16,6 +18,7 @@ from src.infrastructure.persistence.positions_repository import PositionsReposit
 from ..core.deps import get_current_user, get_db
 from ..schemas.pnl import ClosedPositionDetail, DailyPnl, PaginatedClosedPositions, PnlSummary
 from ..services.pnl_calculation_service import PnlCalculationService
+from ..services.quote_service import get_quote_service
 
 try:
     from utils.logger import logger
@@ -33,7 +36,7 @@ def _get_paper_trading_account_data(user_id: int) -> dict | None:
         import json
         from pathlib import Path
 
-        store_path = Path(f"paper_trading/user_{user_id}/account.json")
+        store_path = Path(paper_trading_dir(f"user_{user_id}", "account.json"))
         if store_path.exists():
             with open(store_path) as f:
                 return json.load(f)
@@ -45,36 +48,29 @@ def _get_paper_trading_account_data(user_id: int) -> dict | None:
 def _calculate_portfolio_unrealized_pnl(user_id: int) -> float:
     """Calculate current unrealized P&L from holdings using live prices (matching portfolio calculation)."""
     try:
-        import json
         from pathlib import Path
 
-        import yfinance as yf
-
-        store_path = Path(f"paper_trading/user_{user_id}")
-        holdings_file = store_path / "holdings.json"
+        from modules.kotak_neo_auto_trader.infrastructure.persistence.paper_trade_store import (
+            read_paper_trade_state,
+        )
 
-        if not holdings_file.exists():
+        store_path = Path(paper_trading_dir(f"user_{user_id}"))
+        if not store_path.exists():
             return 0.0
 
-        with open(holdings_file) as f:
-            holdings_data = json.load(f)
+        # Snapshot plus journal entries not yet compacted into holdings.json
+        holdings_data = read_paper_trade_state(store_path)["holdings"]
 
         unrealized_pnl_total = 0.0
+        live_prices = get_quote_service().get_quotes(holdings_data)
 
         for symbol, holding in holdings_data.items():
             qty = holding.get("quantity", 0)
             avg_price = float(holding.get("average_price", 0))
 
-            # Try to fetch live price
-            try:
-                ticker = f"{symbol}.NS" if not symbol.endswith(".NS") else symbol
-                stock = yf.Ticker(ticker)
-                live_price = stock.info.get("currentPrice") or stock.info.get("regularMarketPrice")
-                current_price = (
-                    float(live_price) if live_price else float(holding.get("current_price", 0))
-                )
-            except Exception:
-                current_price = float(holding.get("current_price", 0))
+            # Live price, else the last price recorded in the paper store
+            live_price = live_prices.get(symbol)
+            current_price = live_price if live_price else float(holding.get("current_price", 0))
 
             cost_basis = qty * avg_price
             market_value = qty * current_price
@@ -88,27 +84,12 @@ def _calculate_portfolio_unrealized_pnl(user_id: int) -> float:
 
 
 def _ensure_pnl_records(user_id: int, start: date, end: date, db: Session):
-    """Populate PnL if missing by looking at earliest order date and calculating entire range."""
-    repo = PnlRepository(db)
-
-    # Get earliest order date
-    orders_repo = OrdersRepository(db)
-    orders = orders_repo.list(user_id)
-    order_dates = [o.placed_at.date() for o in orders if getattr(o, "placed_at", None)]
-
-    if not order_dates:
+    """Bring PnL up to date (incrementally after the first call) and return the range."""
+    service = PnlCalculationService(db)
+    if not service.materialize(user_id, start, end):
         # No orders at all; return empty
         return []
-
-    # Calculate from earliest order date or the requested start, whichever is earlier
-    calc_start = min(min(order_dates), start)
-
-    # Always run backfill to ensure full coverage (upsert handles duplicates)
-    service = PnlCalculationService(db)
-    service.calculate_date_range(user_id, calc_start, end)
-
-    # Now fetch the range
-    return repo.range(user_id, start, end)
+    return PnlRepository(db).range(user_id, start, end)
 
 
 def _compute_closed_trade_stats(user_id: int, db: Session, trade_mode: TradeMode | None):
@@ -203,13 +184,11 @@ def _compute_closed_trade_stats(user_id: int, db: Session, trade_mode: TradeMode
 def _calculate_unrealized_from_open_positions(
     user_id: int, db: Session, trade_mode: TradeMode | None
 ) -> float:
-    """Compute unrealized P&L from open positions using live prices via yfinance.
+    """Compute unrealized P&L from open positions using live prices from the quote service.
 
     Falls back to 0 if live price unavailable. Assumes NSE symbols by default.
     """
     try:
-        import yfinance as yf  # noqa: PLC0415
-
         qry = db.query(Positions).filter(
             Positions.user_id == user_id, Positions.closed_at == None
         )  # noqa: E711
@@ -217,6 +196,7 @@ def _calculate_unrealized_from_open_positions(
 
         orders_repo = OrdersRepository(db)
         total_unrealized = 0.0
+        live_prices = get_quote_service().get_quotes(pos.symbol for pos in positions)
 
         for pos in positions:
             # Optional trade_mode filter
@@ -243,15 +223,8 @@ def _calculate_unrealized_from_open_positions(
             qty = float(pos.quantity or 0.0)
             avg_price = float(pos.avg_price or 0.0)
 
-            # Fetch live price; assume NSE suffix if missing
-            symbol = pos.symbol or ""
-            ticker = f"{symbol}.NS" if symbol and not symbol.endswith((".NS", ".BO")) else symbol
-            try:
-                stock = yf.Ticker(ticker)
-                live_price = stock.info.get("currentPrice") or stock.info.get("regularMarketPrice")
-                current_price = float(live_price) if live_price else avg_price
-            except Exception:
-                current_price = avg_price
+            live_price = live_prices.get(pos.symbol)
+            current_price = live_price if live_price else avg_price
 
             total_unrealized += qty * (current_price - avg_price)
 
@@ -264,14 +237,16 @@ def _calculate_unrealized_from_open_positions(
 def _load_paper_trading_closed_trade_pnls(user_id: int) -> list[float]:
     """Fallback: Load realized PnL of closed trades from paper_trading transactions.json (SELL entries)."""
     try:
-        import json
         from pathlib import Path
 
-        tx_file = Path(f"paper_trading/user_{user_id}/transactions.json")
-        if not tx_file.exists():
+        from modules.kotak_neo_auto_trader.infrastructure.persistence.paper_trade_store import (
+            read_paper_trade_state,
+        )
+
+        store_path = Path(paper_trading_dir(f"user_{user_id}"))
+        if not store_path.exists():
             return []
-        with open(tx_file) as f:
-            tx = json.load(f)
+        tx = read_paper_trade_state(store_path)["transactions"]
         pnls: list[float] = []
         for t in tx:
             if t.get("transaction_type") == "SELL":
@@ -317,12 +292,11 @@ def daily_pnl(
         Positions.user_id == current.id,
         Positions.closed_at.isnot(None),  # noqa: E711
     )
-    # Filter by date range
-    start_datetime = datetime.combine(start, datetime.min.time())
-    end_datetime = datetime.combine(end, datetime.max.time())
+    # Filter by date range (half-open, served by ix_positions_user_closed_at)
+    start_datetime, end_datetime = day_range(start, end)
     closed_positions_qry = closed_positions_qry.filter(
         Positions.closed_at >= start_datetime,
-        Positions.closed_at <= end_datetime,
+        Positions.closed_at < end_datetime,
     )
 
     # Optional trade_mode filter
@@ -394,13 +368,15 @@ def daily_pnl(
     # Fallback: if DB has no realized data, derive from paper-trading transactions SELL entries
     if len(series) == 0:
         try:
-            import json
             from pathlib import Path
 
-            tx_file = Path(f"paper_trading/user_{current.id}/transactions.json")
-            if tx_file.exists():
-                with open(tx_file) as f:
-                    tx = json.load(f)
+            from modules.kotak_neo_auto_trader.infrastructure.persistence.paper_trade_store import (
+                read_paper_trade_state,
+            )
+
+            store_path = Path(paper_trading_dir(f"user_{current.id}"))
+            if store_path.exists():
+                tx = read_paper_trade_state(store_path)["transactions"]
                 daily_map: dict[date, float] = {}
                 for t in tx:
                     if t.get("transaction_type") == "SELL":
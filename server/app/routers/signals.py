@@ -1,10 +1,11 @@
 # ruff: noqa: B008
-from datetime import timedelta
+from datetime import datetime, timedelta
+from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
-from src.infrastructure.db.models import Signals, SignalStatus
+from src.infrastructure.db.models import SignalStatus
 from src.infrastructure.db.timezone_utils import ist_now
 from src.infrastructure.persistence.signals_repository import SignalsRepository
 
@@ -13,8 +14,23 @@ from ..core.deps import get_current_user, get_db, require_entitlement
 router = APIRouter(dependencies=[Depends(require_entitlement("stock_recommendations"))])
 
 
+def _parse_cursor(cursor: str | None) -> tuple[datetime, int] | None:
+    """``(ts, id)`` keyset position from a buying-zone ``X-Next-Cursor`` value."""
+    if not cursor:
+        return None
+    ts, _, signal_id = cursor.rpartition("_")
+    try:
+        return datetime.fromisoformat(ts), int(signal_id)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor.",
+        ) from exc
+
+
 @router.get("/buying-zone")
-def buying_zone(
+def buying_zone(  # noqa: PLR0913
+    response: Response,
     limit: int = Query(100, ge=1, le=500),
     date_filter: str | None = Query(
         None,
@@ -24,13 +40,20 @@ def buying_zone(
         "active",
         description="Filter by status: 'active', 'expired', 'traded', 'rejected', 'failed', or 'all'",
     ),
+    cursor: Annotated[
+        str | None,
+        Query(description="X-Next-Cursor header of the previous page (returns older signals)."),
+    ] = None,
     db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ):
-    repo = SignalsRepository(db, user_id=user.id)
+    """
+    Buying zone signals with per-user status (read-only).
 
-    # Mark time-expired signals before querying to ensure database consistency
-    repo.mark_time_expired_signals()
+    Time-based expiry is applied at read time from signal timestamps; the scheduled
+    expiry job persists it. A full page sets ``X-Next-Cursor`` for the next one.
+    """
+    repo = SignalsRepository(db, user_id=user.id)
 
     now = ist_now()
     today = now.date()
@@ -44,36 +67,33 @@ def buying_zone(
             # Invalid status filter, ignore
             pass
 
-    # Get signals with per-user status applied
+    start_date = end_date = None
     if date_filter == "today":
-        base_signals: list[Signals] = repo.by_date(today, limit=limit)
+        start_date = end_date = today
     elif date_filter == "yesterday":
-        yesterday = today - timedelta(days=1)
-        base_signals = repo.by_date(yesterday, limit=limit)
+        start_date = end_date = today - timedelta(days=1)
     elif date_filter == "last_10_days":
-        base_signals = repo.last_n_dates(n=10, limit=limit)
-    else:
-        # Default: recent (no date filter)
-        base_signals = repo.recent(limit=limit)
-
-    # Apply per-user status using repository method
-    items_with_status = repo.get_signals_with_user_status(
-        user_id=user.id, limit=limit, status_filter=status_enum
+        start_date, end_date = today - timedelta(days=9), today
+
+    items_with_status = repo.buying_zone(
+        user.id,
+        limit=limit,
+        status_filter=status_enum,
+        start_date=start_date,
+        end_date=end_date,
+        before=_parse_cursor(cursor),
     )
+    if len(items_with_status) >= limit:
+        last = items_with_status[-1][0]
+        response.headers["X-Next-Cursor"] = f"{last.ts.isoformat()}_{last.id}"
 
-    # If we already filtered by date, filter the results
-    if date_filter:
-        base_signal_ids = {s.id for s in base_signals}
-        items_with_status = [
-            (s, status) for s, status in items_with_status if s.id in base_signal_ids
-        ]
     # Map to client shape with all analysis result fields (use effective status)
     return [
         {
             "id": s.id,
             "symbol": s.symbol,
             "status": effective_status.value,  # Use per-user status
-            "base_status": s.status.value,  # Base signal status (for checking expiration)
+            "base_status": base_status.value,  # Base signal status (for checking expiration)
             # Technical indicators
             "rsi10": s.rsi10,
             "ema9": s.ema9,
@@ -137,7 +157,7 @@ def buying_zone(
             # Timestamp
             "ts": s.ts.isoformat(),
         }
-        for s, effective_status in items_with_status
+        for s, effective_status, base_status in items_with_status
     ]
 
 
@@ -19,6 +19,7 @@ class ServiceLogEntry(BaseModel):
 
 class ServiceLogsResponse(BaseModel):
     logs: list[ServiceLogEntry]
+    next_cursor: str | None = None  # pass as ?cursor= for the next (older) page
 
 
 class ErrorLogEntry(BaseModel):
@@ -6,52 +6,41 @@ Runs daily at market close (3:30 PM IST) via scheduler.
 """
 
 import logging
+from collections.abc import Iterable
 
 from sqlalchemy.orm import Session
 
+from server.app.services.quote_service import get_quote_service
 from src.infrastructure.db.models import Positions
 from src.infrastructure.db.session import SessionLocal
 
 logger = logging.getLogger(__name__)
 
 
-def get_live_price(symbol: str) -> float | None:
+def get_live_prices(symbols: Iterable[str]) -> dict[str, float | None]:
     """
-    Fetch live price for a symbol using yfinance
+    Fetch live prices for many symbols in one batch from the shared quote service
 
     Args:
-        symbol: Stock symbol (without exchange suffix)
+        symbols: Stock symbols (with or without exchange suffix)
 
     Returns:
-        Current price or None if unavailable
+        Mapping of each symbol to its current price (None if unavailable)
     """
-    try:
-        import yfinance as yf
+    return get_quote_service().get_quotes(symbols)
 
-        # Add NSE suffix for Indian stocks
-        ticker = f"{symbol}.NS" if not symbol.endswith(".NS") else symbol
-        stock = yf.Ticker(ticker)
 
-        # Try multiple price fields
-        info = stock.info
-        price = (
-            info.get("currentPrice") or info.get("regularMarketPrice") or info.get("previousClose")
-        )
-
-        if price:
-            return float(price)
-
-        # Fallback: use fast_info
-        try:
-            return float(stock.fast_info.get("lastPrice", 0))
-        except Exception:
-            pass
+def get_live_price(symbol: str) -> float | None:
+    """
+    Fetch live price for a symbol from the shared quote service
 
-        return None
+    Args:
+        symbol: Stock symbol (without exchange suffix)
 
-    except Exception as e:
-        logger.debug(f"Failed to fetch live price for {symbol}: {e}")
-        return None
+    Returns:
+        Current price or None if unavailable
+    """
+    return get_live_prices([symbol]).get(symbol)
 
 
 def update_unrealized_pnl_for_position(db: Session, position: Positions, live_price: float) -> bool:
@@ -134,8 +123,10 @@ def update_mtm_for_user(user_id: int, db: Session | None = None) -> dict[str, in
 
         logger.info(f"Starting MTM update for user {user_id}: {stats['total']} open positions")
 
+        live_prices = get_live_prices([position.symbol for position in open_positions])
+
         for position in open_positions:
-            live_price = get_live_price(position.symbol)
+            live_price = live_prices.get(position.symbol)
 
             if live_price is None:
                 logger.warning(f"No live price available for {position.symbol}")
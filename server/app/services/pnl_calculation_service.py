@@ -3,6 +3,11 @@ PnL Calculation Service
 
 Calculates daily P&L from positions and orders, populating the pnl_daily table.
 Supports both paper trading and broker trading modes.
+
+Date ranges are computed from one closed-positions query, one open-positions query and
+one orders query for the whole range, then upserted in a single transaction.
+``materialize`` stores a high-water mark per user and trade mode (pnl_materialization_marks)
+so repeated reads only recompute days touched by new fills or closures since the previous run.
 """
 
 from __future__ import annotations
@@ -11,9 +16,17 @@ from collections import defaultdict
 from datetime import date, datetime, timedelta
 
 from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from src.infrastructure.db.models import Orders, PnlDaily, Positions, TradeMode
+from src.infrastructure.db.models import (
+    Orders,
+    PnlDaily,
+    PnlMaterializationMark,
+    Positions,
+    TradeMode,
+)
+from src.infrastructure.db.timezone_utils import day_range, ist_now_naive
 from src.infrastructure.persistence.orders_repository import OrdersRepository
 from src.infrastructure.persistence.pnl_repository import PnlRepository
 from src.infrastructure.persistence.positions_repository import PositionsRepository
@@ -39,7 +52,11 @@ class PnlCalculationService:
         self.pnl_repo = PnlRepository(db)
 
     def calculate_realized_pnl(
-        self, user_id: int, trade_mode: TradeMode | None = None, target_date: date | None = None
+        self,
+        user_id: int,
+        trade_mode: TradeMode | None = None,
+        target_date: date | None = None,
+        date_range: tuple[date, date] | None = None,
     ) -> dict[date, float]:
         """
         Calculate realized P&L from closed positions.
@@ -49,6 +66,7 @@ class PnlCalculationService:
             trade_mode: Filter by trade mode (PAPER or BROKER). If None, includes all.
             target_date: If provided, only calculate for positions closed on this date.
                          If None, calculates for all closed positions.
+            date_range: Optional (start, end) dates, inclusive; used instead of target_date
 
         Returns:
             Dictionary mapping date -> realized P&L amount
@@ -59,25 +77,31 @@ class PnlCalculationService:
             Positions.closed_at.isnot(None),
         )
 
-        if target_date:
-            # Filter by closed_at date (using date() function for date comparison)
-            start_datetime = datetime.combine(target_date, datetime.min.time())
-            end_datetime = datetime.combine(target_date, datetime.max.time())
+        if target_date and not date_range:
+            date_range = (target_date, target_date)
+        if date_range:
+            # Half-open closed_at range (served by ix_positions_user_closed_at)
+            start_datetime, end_datetime = day_range(*date_range)
             stmt = stmt.where(
                 Positions.closed_at >= start_datetime,
-                Positions.closed_at <= end_datetime,
+                Positions.closed_at < end_datetime,
             )
 
         positions = list(self.db.execute(stmt).scalars().all())
 
         # Group by date and sum realized P&L
         realized_by_date: dict[date, float] = defaultdict(float)
+        user_orders: list[Orders] | None = None
 
         for pos in positions:
             # Filter by trade mode if specified
             if trade_mode:
-                # Get the buy order to check trade_mode
-                buy_order = self._get_buy_order_for_position(user_id, pos.symbol, pos.opened_at)
+                # Get the buy order to check trade_mode (orders loaded once for all positions)
+                if user_orders is None:
+                    user_orders, _total = self.orders_repo.list(user_id)
+                buy_order = self._get_buy_order_for_position(
+                    user_id, pos.symbol, pos.opened_at, orders=user_orders
+                )
                 if not buy_order or buy_order.trade_mode != trade_mode:
                     continue
 
@@ -148,10 +172,16 @@ class PnlCalculationService:
         unrealized_by_date: dict[date, float] = defaultdict(float)
         calculation_date = target_date or date.today()
 
+        user_orders: list[Orders] | None = None
+
         for pos in positions:
             # Filter by trade mode if specified
             if trade_mode:
-                buy_order = self._get_buy_order_for_position(user_id, pos.symbol, pos.opened_at)
+                if user_orders is None:
+                    user_orders, _total = self.orders_repo.list(user_id)
+                buy_order = self._get_buy_order_for_position(
+                    user_id, pos.symbol, pos.opened_at, orders=user_orders
+                )
                 if not buy_order or buy_order.trade_mode != trade_mode:
                     continue
 
@@ -171,7 +201,11 @@ class PnlCalculationService:
         return dict(unrealized_by_date)
 
     def calculate_fees(
-        self, user_id: int, trade_mode: TradeMode | None = None, target_date: date | None = None
+        self,
+        user_id: int,
+        trade_mode: TradeMode | None = None,
+        target_date: date | None = None,
+        date_range: tuple[date, date] | None = None,
     ) -> dict[date, float]:
         """
         Calculate fees from orders.
@@ -181,6 +215,7 @@ class PnlCalculationService:
             trade_mode: Filter by trade mode (PAPER or BROKER). If None, includes all.
             target_date: If provided, only calculate for orders on this date.
                          If None, calculates for all orders.
+            date_range: Optional (start, end) dates, inclusive; used instead of target_date
 
         Returns:
             Dictionary mapping date -> total fees
@@ -189,16 +224,24 @@ class PnlCalculationService:
         stmt = select(Orders).where(Orders.user_id == user_id)
         if trade_mode:
             stmt = stmt.where(Orders.trade_mode == trade_mode)
-        if target_date:
+        if target_date and not date_range:
+            date_range = (target_date, target_date)
+        if date_range:
             # Dialect-aware date filtering (SQLite vs Postgres)
             dialect = getattr(getattr(self.db, "bind", None), "dialect", None)
             dialect_name = getattr(dialect, "name", "")
+            range_start, range_end = date_range
             if dialect_name == "sqlite":
-                stmt = stmt.where(func.date(Orders.placed_at) == target_date)
+                if range_start == range_end:
+                    stmt = stmt.where(func.date(Orders.placed_at) == range_start)
+                else:
+                    stmt = stmt.where(
+                        func.date(Orders.placed_at) >= range_start,
+                        func.date(Orders.placed_at) <= range_end,
+                    )
             else:
-                start_dt = datetime.combine(target_date, datetime.min.time())
-                end_dt = datetime.combine(target_date, datetime.max.time())
-                stmt = stmt.where(Orders.placed_at >= start_dt, Orders.placed_at <= end_dt)
+                start_dt, end_dt = day_range(range_start, range_end)
+                stmt = stmt.where(Orders.placed_at >= start_dt, Orders.placed_at < end_dt)
 
         orders = list(self.db.execute(stmt).scalars().all())
 
@@ -271,29 +314,170 @@ class PnlCalculationService:
         Returns:
             List of PnlDaily records
         """
-        records = []
-        current_date = start_date
+        return self.calculate_dates(user_id, _date_span(start_date, end_date), trade_mode)
+
+    def calculate_dates(
+        self,
+        user_id: int,
+        days: list[date],
+        trade_mode: TradeMode | None = None,
+    ) -> list[PnlDaily]:
+        """
+        Calculate P&L for the given dates from one query per component and upsert them.
+
+        Produces the same rows as ``calculate_daily_pnl`` for each date: realized P&L from
+        positions closed that day, fees from orders placed that day and the current
+        unrealized P&L of open positions.
+
+        Args:
+            user_id: User ID
+            days: Dates to calculate (any order; duplicates ignored)
+            trade_mode: Filter by trade mode (PAPER or BROKER). If None, includes all.
+
+        Returns:
+            List of PnlDaily records in date order
+        """
+        days = sorted(set(days))
+        if not days:
+            return []
+
+        window = (days[0], days[-1])
+        realized = self.calculate_realized_pnl(user_id, trade_mode, date_range=window)
+        unrealized = self.calculate_unrealized_pnl(user_id, trade_mode, window[0])
+        fees = self.calculate_fees(user_id, trade_mode, date_range=window)
+        unrealized_pnl = unrealized.get(window[0], 0.0)
+
+        records = [
+            PnlDaily(
+                user_id=user_id,
+                date=day,
+                realized_pnl=realized.get(day, 0.0),
+                unrealized_pnl=unrealized_pnl,
+                fees=fees.get(day, 0.0),
+            )
+            for day in days
+        ]
+        return self.pnl_repo.upsert_many(records)
 
-        while current_date <= end_date:
-            record = self.calculate_daily_pnl(user_id, current_date, trade_mode)
-            records.append(record)
-            current_date += timedelta(days=1)
+    def materialize(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        trade_mode: TradeMode | None = None,
+    ) -> bool:
+        """
+        Bring pnl_daily up to date for ``start_date..end_date`` incrementally.
+
+        The first call for a user and trade mode computes everything from the earliest
+        order (or ``start_date`` if earlier) to ``end_date``. Later calls only recompute days
+        past the stored high-water mark, the last materialized day, and days of orders
+        updated or positions closed since the previous run; the current unrealized P&L is
+        applied to every materialized day, as a full recompute would.
 
-        return records
+        Args:
+            user_id: User ID
+            start_date: First date the caller will read
+            end_date: Last date the caller will read
+            trade_mode: Filter by trade mode (PAPER or BROKER). If None, includes all.
+
+        Returns:
+            False if the user has no orders (nothing to materialize), True otherwise
+        """
+        as_of = ist_now_naive()
+        mode_key = trade_mode.value if trade_mode else "all"
+        mark = self.pnl_repo.materialization_mark(user_id, mode_key)
+
+        if mark is None:
+            earliest = self.db.execute(
+                select(func.min(Orders.placed_at)).where(Orders.user_id == user_id)
+            ).scalar_one_or_none()
+            if earliest is None:
+                return False
+            span = (min(earliest.date(), start_date), end_date)
+            closed = self._closed_positions(user_id)
+            self.calculate_date_range(user_id, span[0], span[1], trade_mode)
+        else:
+            closed = self._closed_positions(user_id)
+            dirty = self._touched_dates(user_id, mark, closed)
+            # The last materialized day may have been partial
+            dirty.add(mark.through_date)
+            if start_date < mark.start_date:
+                dirty.update(_date_span(start_date, mark.start_date - timedelta(days=1)))
+            if end_date > mark.through_date:
+                dirty.update(_date_span(mark.through_date + timedelta(days=1), end_date))
+            span = (min(start_date, mark.start_date), max(end_date, mark.through_date))
+            # Every dirty day inside the marked span, even past end_date: the mark below
+            # records them as processed
+            self.calculate_dates(user_id, [d for d in dirty if span[0] <= d <= span[1]], trade_mode)
+            unrealized = self.calculate_unrealized_pnl(user_id, trade_mode, span[0])
+            self.pnl_repo.set_unrealized_pnl(
+                user_id, span[0], span[1], unrealized.get(span[0], 0.0)
+            )
+
+        try:
+            self.pnl_repo.save_materialization_mark(
+                user_id, mode_key, span[0], span[1], as_of, closed
+            )
+        except IntegrityError:
+            # A concurrent first run stored the mark; the next call picks it up
+            self.db.rollback()
+        return True
+
+    def _closed_positions(self, user_id: int) -> dict[int, datetime]:
+        """Closed position id -> closed_at (two columns, no ORM objects)."""
+        rows = self.db.execute(
+            select(Positions.id, Positions.closed_at).where(
+                Positions.user_id == user_id, Positions.closed_at.isnot(None)
+            )
+        ).all()
+        return dict(rows)
+
+    def _touched_dates(
+        self, user_id: int, mark: PnlMaterializationMark, closed: dict[int, datetime]
+    ) -> set[date]:
+        """Dates whose P&L changed since ``mark``: updated order days and changed closing days."""
+        order_days = self.db.execute(
+            select(Orders.placed_at).where(
+                Orders.user_id == user_id, Orders.updated_at >= mark.as_of
+            )
+        ).scalars()
+        dirty = {ts.date() for ts in order_days if ts is not None}
+        # Positions carry no updated_at; closures are detected by (id, closed_at) against the
+        # mark. A reopened position (closed_at reset) dirties its old closing day, and a
+        # re-close on a new timestamp dirties both the old and the new day.
+        known = {
+            int(pos_id): datetime.fromisoformat(closed_at)
+            for pos_id, closed_at in (mark.closed_positions or {}).items()
+        }
+        for pos_id, closed_at in closed.items():
+            previous = known.pop(pos_id, None)
+            if previous != closed_at:
+                dirty.add(closed_at.date())
+                if previous is not None:
+                    dirty.add(previous.date())
+        dirty.update(closed_at.date() for closed_at in known.values())
+        return dirty
 
     def _get_buy_order_for_position(
-        self, user_id: int, symbol: str, opened_at: datetime | None
+        self,
+        user_id: int,
+        symbol: str,
+        opened_at: datetime | None,
+        orders: list[Orders] | None = None,
     ) -> Orders | None:
         """
         Get the buy order that opened a position.
 
         This is a helper method to determine the trade_mode of a position.
+        Pass ``orders`` (the user's orders) to avoid reloading them per position.
         """
         if not opened_at:
             return None
 
         # Find buy orders for this symbol around the opened_at time
-        orders, _total = self.orders_repo.list(user_id)
+        if orders is None:
+            orders, _total = self.orders_repo.list(user_id)
         for order in orders:
             if (
                 order.symbol == symbol
@@ -304,3 +488,7 @@ class PnlCalculationService:
                 return order
 
         return None
+
+
+def _date_span(start_date: date, end_date: date) -> list[date]:
+    return [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
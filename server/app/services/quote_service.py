@@ -0,0 +1,227 @@
+"""Quote Service
+
+Live prices for the API routers and the MTM job, shared across requests and users.
+
+``yf.Ticker(ticker).info`` is a heavyweight scrape; calling it once per position inside a
+request made portfolio pages wait on one network round trip per holding. ``get_quotes``
+resolves a whole list of symbols at once:
+
+- quotes are cached per Yahoo ticker for ``quote_ttl_market_seconds`` during the NSE session
+  and ``quote_ttl_closed_seconds`` otherwise (prices do not move after the close); a lookup
+  that found no price is retried after at most ``quote_failure_ttl_seconds``;
+- cache misses are fetched concurrently on a shared thread pool, and a ticker another request
+  is already fetching is awaited instead of fetched twice;
+- a quote expired by less than ``quote_stale_grace_seconds`` is returned at once while a
+  background refresh runs (stale-while-revalidate); when a refresh fails the last known
+  price is returned instead of nothing.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from datetime import time as dt_time
+
+from modules.kotak_neo_auto_trader.utils.symbol_utils import (
+    get_ticker_from_full_symbol,
+    normalize_symbol,
+)
+from src.infrastructure.db.timezone_utils import ist_now
+from src.infrastructure.utils.holiday_calendar import is_trading_day
+
+from ..core.config import settings
+
+try:
+    from utils.logger import logger
+except ImportError:
+    import logging
+
+    logger = logging.getLogger(__name__)
+
+# Pre-open through the closing session, so the settled close is picked up at market TTL
+SESSION_START = dt_time(9, 0)
+SESSION_END = dt_time(16, 0)
+
+
+def to_yahoo_ticker(symbol: str) -> str:
+    """
+    Yahoo ticker for a broker or base symbol.
+
+    Examples:
+        'RELIANCE' -> 'RELIANCE.NS'
+        'SALSTEEL-BE' -> 'SALSTEEL.NS'
+        'TCS.BO' -> 'TCS.BO'
+    """
+    s = normalize_symbol(symbol)
+    if s.endswith((".NS", ".BO")):
+        return get_ticker_from_full_symbol(s[:-3], exchange=s[-2:])
+    return get_ticker_from_full_symbol(s)
+
+
+def fetch_yahoo_quote(ticker: str) -> float | None:
+    """Current price for one Yahoo ticker (currentPrice, regularMarketPrice, previousClose)."""
+    import yfinance as yf  # noqa: PLC0415
+
+    stock = yf.Ticker(ticker)
+    info = stock.info or {}
+    price = info.get("currentPrice") or info.get("regularMarketPrice") or info.get("previousClose")
+    if price:
+        return float(price)
+    try:
+        last = stock.fast_info.get("lastPrice")
+    except Exception:
+        return None
+    if isinstance(last, int | float) and not isinstance(last, bool) and last > 0:
+        return float(last)
+    return None
+
+
+@dataclass(frozen=True)
+class _Quote:
+    price: float | None
+    fetched_at: float
+
+
+class QuoteService:
+    """Process-wide live price cache with concurrent, de-duplicated refreshes."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        fetcher: Callable[[str], float | None] | None = None,
+        *,
+        ttl_market_s: float | None = None,
+        ttl_closed_s: float | None = None,
+        failure_ttl_s: float | None = None,
+        stale_grace_s: float | None = None,
+        fetch_timeout_s: float | None = None,
+        max_workers: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetcher = fetcher or fetch_yahoo_quote
+        self.ttl_market_s = (
+            settings.quote_ttl_market_seconds if ttl_market_s is None else ttl_market_s
+        )
+        self.ttl_closed_s = (
+            settings.quote_ttl_closed_seconds if ttl_closed_s is None else ttl_closed_s
+        )
+        self.failure_ttl_s = (
+            settings.quote_failure_ttl_seconds if failure_ttl_s is None else failure_ttl_s
+        )
+        self.stale_grace_s = (
+            settings.quote_stale_grace_seconds if stale_grace_s is None else stale_grace_s
+        )
+        self.fetch_timeout_s = (
+            settings.quote_fetch_timeout_seconds if fetch_timeout_s is None else fetch_timeout_s
+        )
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or settings.quote_fetch_workers,
+            thread_name_prefix="quote-fetch",
+        )
+        self._cache: dict[str, _Quote] = {}
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "stale": 0, "fetches": 0, "failures": 0}
+
+    def ttl(self) -> float:
+        """Cache TTL in seconds: short during the NSE session, long outside it."""
+        now = ist_now()
+        if is_trading_day(now.date()) and SESSION_START <= now.time() < SESSION_END:
+            return self.ttl_market_s
+        return self.ttl_closed_s
+
+    def get_quote(self, symbol: str) -> float | None:
+        return self.get_quotes([symbol]).get(symbol)
+
+    def get_quotes(self, symbols: Iterable[str]) -> dict[str, float | None]:
+        """
+        Live prices keyed by the given symbols (None when no price is known).
+
+        Fresh cache entries are returned as is; all other tickers are fetched in one
+        concurrent round, except recently expired ones, which are served stale while they
+        refresh in the background.
+        """
+        tickers = {symbol: to_yahoo_ticker(symbol) for symbol in symbols if symbol}
+        ttl = self.ttl()
+        failure_ttl = min(ttl, self.failure_ttl_s)
+        now = self._clock()
+        prices: dict[str, float | None] = {}
+        waiting: dict[str, Future] = {}
+        with self._lock:
+            for ticker in dict.fromkeys(tickers.values()):
+                quote = self._cache.get(ticker)
+                age = None if quote is None else now - quote.fetched_at
+                # A lookup that found no price is retried sooner than the closed-market TTL
+                fresh_for = failure_ttl if quote is not None and quote.price is None else ttl
+                if age is not None and age <= fresh_for:
+                    self.stats["hits"] += 1
+                    prices[ticker] = quote.price
+                    continue
+                future = self._inflight.get(ticker) or self._submit(ticker)
+                if age is not None and age <= ttl + self.stale_grace_s and quote.price is not None:
+                    self.stats["stale"] += 1
+                    prices[ticker] = quote.price
+                else:
+                    waiting[ticker] = future
+
+        deadline = time.monotonic() + self.fetch_timeout_s
+        for ticker, future in waiting.items():
+            try:
+                prices[ticker] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                logger.debug(f"Quote fetch for {ticker} timed out; using last known price")
+                prices[ticker] = self._last_price(ticker)
+        return {symbol: prices.get(ticker) for symbol, ticker in tickers.items()}
+
+    def _submit(self, ticker: str) -> Future:
+        """Start a background refresh of ``ticker`` (caller holds the lock)."""
+        future = self._executor.submit(self._refresh, ticker)
+        self._inflight[ticker] = future
+        return future
+
+    def _refresh(self, ticker: str) -> float | None:
+        try:
+            price = self._fetcher(ticker)
+            failed = False
+        except Exception as e:
+            logger.debug(f"Failed to fetch live price for {ticker}: {e}")
+            price, failed = None, True
+        with self._lock:
+            self._inflight.pop(ticker, None)
+            self.stats["failures" if failed else "fetches"] += 1
+            previous = self._cache.get(ticker)
+            if failed and previous is not None and previous.price is not None:
+                # Keep the last good price (and its age, so the next request retries)
+                return previous.price
+            self._cache[ticker] = _Quote(price, self._clock())
+        return price
+
+    def _last_price(self, ticker: str) -> float | None:
+        with self._lock:
+            quote = self._cache.get(ticker)
+        return None if quote is None else quote.price
+
+    def clear(self) -> None:
+        """Drop all cached quotes (in-flight refreshes still complete)."""
+        with self._lock:
+            self._cache.clear()
+            for key in self.stats:
+                self.stats[key] = 0
+
+
+_quote_service: QuoteService | None = None
+_quote_service_lock = threading.Lock()
+
+
+def get_quote_service() -> QuoteService:
+    """Shared QuoteService for all routers and jobs in this process."""
+    global _quote_service  # noqa: PLW0603
+    if _quote_service is None:
+        with _quote_service_lock:
+            if _quote_service is None:
+                _quote_service = QuoteService()
+    return _quote_service
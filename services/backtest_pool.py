@@ -0,0 +1,334 @@
+"""
+Process-pool execution of per-stock backtests for bulk scoring.
+
+Each ``run_stock_backtest`` call is CPU-bound pandas work plus an OHLCV fetch, so scoring
+a candidate list one stock at a time leaves every core but one idle. ``run_backtests_parallel``
+first warms the OHLCV DB cache with each candidate's backtest window (workers then read the
+cache instead of Yahoo, and the parent's rate limiter is the only one talking to Yahoo),
+then fans the backtests out to a process pool.
+
+Outcomes come back in input order with per-stock timing. A task that raises or exceeds the
+per-task timeout becomes a failed outcome instead of aborting the batch.
+
+Tasks are submitted only as workers free up, so each one starts as soon as it is submitted
+and its timeout is measured from then, independent of how long earlier tasks take.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import queue
+import time
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from config.settings import (
+    BACKTEST_SCORING_PREFETCH,
+    BACKTEST_SCORING_START_METHOD,
+    BACKTEST_SCORING_TASK_TIMEOUT_S,
+    BACKTEST_SCORING_WORKERS,
+    OHLCV_CACHE_ENABLED,
+    OHLCV_WEEKLY_FROM_DAILY,
+)
+from utils.logger import logger
+
+
+@dataclass(frozen=True)
+class BacktestTask:
+    """One stock to backtest (must be picklable: sent to a worker process)."""
+
+    ticker: str
+    years_back: int
+    dip_mode: bool
+    config: Any = None
+
+
+@dataclass
+class BacktestOutcome:
+    """Result of one ``BacktestTask``; ``result`` is None when ``error`` is set."""
+
+    ticker: str
+    result: dict | None
+    elapsed_s: float
+    yahoo_calls: int = 0
+    error: str | None = None
+
+
+def resolve_backtest_workers(workers: int | None = None) -> int:
+    """Worker count for bulk scoring: ``workers`` or settings; 0 means one per CPU core."""
+    value = BACKTEST_SCORING_WORKERS if workers is None else workers
+    if value <= 0:
+        return os.cpu_count() or 1
+    return value
+
+
+def _default_backtest_fn() -> Callable[..., dict]:
+    from core.backtest_scoring import _run_stock_backtest_impl  # noqa: PLC0415
+
+    return _run_stock_backtest_impl
+
+
+def _run_task(
+    backtest_fn: Callable[..., dict] | None, task: BacktestTask
+) -> tuple[dict, float, int]:
+    """Worker entry point: run one backtest and report its duration and Yahoo calls."""
+    from src.application.services.ohlcv_bulk_ops import (  # noqa: PLC0415
+        reset_symbol_yahoo_counter,
+    )
+    from src.application.services.ohlcv_cache_service import (  # noqa: PLC0415
+        get_ohlcv_cache_stats,
+    )
+
+    backtest_fn = backtest_fn or _default_backtest_fn()
+    reset_symbol_yahoo_counter()
+    started = time.perf_counter()
+    result = backtest_fn(task.ticker, task.years_back, task.dip_mode, task.config)
+    elapsed = time.perf_counter() - started
+    return result, elapsed, get_ohlcv_cache_stats().get("yahoo_calls", 0)
+
+
+class _TaskScheduler:
+    """
+    Feeds tasks to a pool as workers free up and enforces each task's timeout.
+
+    A task's clock starts when it is submitted, which is when a worker is free for it.
+    Timed-out tasks keep their worker (``stuck``) until they finish or the pool is terminated.
+    """
+
+    def __init__(
+        self,
+        pool: Any,
+        tasks: Sequence[BacktestTask],
+        backtest_fn: Callable[..., dict] | None,
+        workers: int,
+        timeout: float,
+    ):
+        self.pool = pool
+        self.tasks = tasks
+        self.backtest_fn = backtest_fn
+        self.workers = workers
+        self.timeout = timeout
+        self.stuck = False
+        self._finished: queue.Queue = queue.Queue()
+        self._outcomes: dict[int, BacktestOutcome] = {}
+        self._started_at: dict[int, float] = {}  # submitted tasks still holding a worker
+        self._timed_out: set[int] = set()
+        self._submitted = 0
+
+    def outcome(self, i: int) -> BacktestOutcome:
+        """Block until task ``i`` has finished, failed or timed out."""
+        while i not in self._outcomes:
+            self._submit_ready()
+            running = self._started_at.keys() - self._timed_out
+            if running:
+                self._wait(running)
+            else:
+                # Every worker is stuck on a timed-out backtest
+                for n in range(self._submitted, len(self.tasks)):
+                    self._outcomes[n] = BacktestOutcome(
+                        self.tasks[n].ticker, None, 0.0, error="Backtest not run: workers busy"
+                    )
+                self._submitted = len(self.tasks)
+        return self._outcomes.pop(i)
+
+    def _submit_ready(self) -> None:
+        while self._submitted < len(self.tasks) and len(self._started_at) < self.workers:
+            n = self._submitted
+            self._started_at[n] = time.perf_counter()
+            self.pool.apply_async(
+                _run_task,
+                (self.backtest_fn, self.tasks[n]),
+                callback=lambda value, n=n: self._finished.put((n, value, None)),
+                error_callback=lambda exc, n=n: self._finished.put((n, None, exc)),
+            )
+            self._submitted += 1
+
+    def _wait(self, running: set[int]) -> None:
+        """Collect the next finished task, or time out the running ones past their deadline."""
+        deadline = min(self._started_at[n] for n in running) + self.timeout
+        try:
+            n, value, exc = self._finished.get(timeout=max(deadline - time.perf_counter(), 0))
+        except queue.Empty:
+            now = time.perf_counter()
+            for n in running:
+                if now - self._started_at[n] >= self.timeout:
+                    self.stuck = True
+                    self._timed_out.add(n)
+                    self._outcomes[n] = BacktestOutcome(
+                        self.tasks[n].ticker,
+                        None,
+                        now - self._started_at[n],
+                        error=f"Backtest timed out after {self.timeout:.0f}s",
+                    )
+            return
+        waited = time.perf_counter() - self._started_at.pop(n)
+        if n in self._timed_out:
+            self._timed_out.discard(n)  # late result of a timed-out task; its worker is free
+        elif exc is not None:
+            self._outcomes[n] = BacktestOutcome(self.tasks[n].ticker, None, waited, error=str(exc))
+        else:
+            result, elapsed, yahoo_calls = value
+            self._outcomes[n] = BacktestOutcome(self.tasks[n].ticker, result, elapsed, yahoo_calls)
+
+
+def prefetch_backtest_ohlcv(tickers: Sequence[str], years_back: int) -> dict[str, int]:
+    """
+    Warm the OHLCV DB cache with the daily and weekly windows the integrated backtest reads.
+
+    The weekly window is skipped when ``OHLCV_WEEKLY_FROM_DAILY`` is on: the backtest then
+    resamples its weekly bars from the daily frame and never reads cached ``1wk`` rows.
+
+    Only useful with the persistent cache (``OHLCV_CACHE_ENABLED``); worker processes do not
+    share in-memory caches. Failures are logged and left to the backtest itself.
+
+    Returns:
+        Yahoo calls made per ticker while prefetching
+    """
+    if not OHLCV_CACHE_ENABLED:
+        logger.info("Backtest prefetch skipped: OHLCV DB cache disabled")
+        return {}
+
+    from core.backtest_scoring import backtest_date_range  # noqa: PLC0415
+    from core.data_fetcher import fetch_ohlcv_yf  # noqa: PLC0415
+    from integrated_backtest import backtest_fetch_days  # noqa: PLC0415
+    from src.application.services.ohlcv_bulk_ops import (  # noqa: PLC0415
+        reset_symbol_yahoo_counter,
+    )
+    from src.application.services.ohlcv_cache_service import (  # noqa: PLC0415
+        get_ohlcv_cache_stats,
+    )
+
+    start_date, end_date = backtest_date_range(years_back)
+    days = backtest_fetch_days(start_date, end_date)
+    started = time.perf_counter()
+    intervals = ("1d",) if OHLCV_WEEKLY_FROM_DAILY else ("1d", "1wk")
+    calls: dict[str, int] = {}
+    for ticker in dict.fromkeys(tickers):
+        reset_symbol_yahoo_counter()
+        for interval in intervals:
+            try:
+                fetch_ohlcv_yf(
+                    ticker, days=days, interval=interval, end_date=end_date, add_current_day=False
+                )
+            except Exception as e:
+                logger.debug("Backtest prefetch failed for %s [%s]: %s", ticker, interval, e)
+        calls[ticker] = get_ohlcv_cache_stats().get("yahoo_calls", 0)
+    logger.info(
+        "Backtest prefetch: %s symbol(s) in %.1fs (%s Yahoo call(s))",
+        len(calls),
+        time.perf_counter() - started,
+        sum(calls.values()),
+    )
+    return calls
+
+
+def run_backtests_parallel(  # noqa: PLR0913
+    tasks: Sequence[BacktestTask],
+    *,
+    workers: int | None = None,
+    timeout: float | None = None,
+    prefetch: bool | None = None,
+    start_method: str | None = None,
+    backtest_fn: Callable[..., dict] | None = None,
+) -> list[BacktestOutcome]:
+    """Run ``tasks`` in a process pool; all outcomes at once (see ``iter_backtests_parallel``)."""
+    return list(
+        iter_backtests_parallel(
+            tasks,
+            workers=workers,
+            timeout=timeout,
+            prefetch=prefetch,
+            start_method=start_method,
+            backtest_fn=backtest_fn,
+        )
+    )
+
+
+def iter_backtests_parallel(  # noqa: PLR0913
+    tasks: Sequence[BacktestTask],
+    *,
+    workers: int | None = None,
+    timeout: float | None = None,
+    prefetch: bool | None = None,
+    start_method: str | None = None,
+    backtest_fn: Callable[..., dict] | None = None,
+) -> Iterator[BacktestOutcome]:
+    """
+    Run ``tasks`` in a process pool and yield one outcome per task, in input order.
+
+    Each outcome is yielded as soon as it and all earlier ones are done, so callers can
+    use the first results while later backtests are still running.
+
+    Args:
+        tasks: Stocks to backtest
+        workers: Worker processes (default ``BACKTEST_SCORING_WORKERS``; 0 = CPU count)
+        timeout: Seconds each task may run, measured from its start (default
+            ``BACKTEST_SCORING_TASK_TIMEOUT_S``). A worker still busy with a timed-out task
+            keeps its slot; once every worker is stuck, the remaining tasks fail unrun.
+            Stuck workers are terminated at the end.
+        prefetch: Warm the OHLCV cache first (default ``BACKTEST_SCORING_PREFETCH``)
+        start_method: multiprocessing start method (default
+            ``BACKTEST_SCORING_START_METHOD``)
+        backtest_fn: Picklable ``fn(ticker, years_back, dip_mode, config) -> dict``
+            (default ``core.backtest_scoring._run_stock_backtest_impl``)
+
+    Yields:
+        Outcomes aligned with ``tasks``
+    """
+    if not tasks:
+        return
+    workers = min(resolve_backtest_workers(workers), len(tasks))
+    timeout = BACKTEST_SCORING_TASK_TIMEOUT_S if timeout is None else timeout
+    prefetch = BACKTEST_SCORING_PREFETCH if prefetch is None else prefetch
+
+    prefetch_calls: dict[str, int] = {}
+    if prefetch:
+        # All tasks of one bulk run share years_back; use the first for the window
+        prefetch_calls = prefetch_backtest_ohlcv([t.ticker for t in tasks], tasks[0].years_back)
+
+    context = multiprocessing.get_context(start_method or BACKTEST_SCORING_START_METHOD)
+    started = time.perf_counter()
+    logger.info("Backtesting %s stock(s) with %s worker process(es)...", len(tasks), workers)
+
+    done = failed = 0
+    busy = 0.0
+    terminate = False
+    pool = context.Pool(processes=workers)
+    scheduler = _TaskScheduler(pool, tasks, backtest_fn, workers, timeout)
+    try:
+        for i, task in enumerate(tasks, 1):
+            outcome = scheduler.outcome(i - 1)
+            outcome.yahoo_calls += prefetch_calls.get(task.ticker, 0)
+            done += 1
+            if outcome.error:
+                failed += 1
+                logger.warning(
+                    "Backtest %s/%s %s failed: %s", i, len(tasks), task.ticker, outcome.error
+                )
+            else:
+                busy += outcome.elapsed_s
+                logger.info(
+                    "Backtest %s/%s %s done in %.2fs", i, len(tasks), task.ticker, outcome.elapsed_s
+                )
+            yield outcome
+    except GeneratorExit:
+        # Caller stopped early: do not wait for the remaining backtests
+        terminate = True
+        raise
+    finally:
+        if terminate or scheduler.stuck:
+            pool.terminate()
+        else:
+            pool.close()
+        pool.join()
+
+    wall = time.perf_counter() - started
+    logger.info(
+        "Backtested %s stock(s) in %.1fs wall / %.1fs worker time (%s failed)",
+        done,
+        wall,
+        busy,
+        failed,
+    )
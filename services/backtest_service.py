@@ -8,7 +8,9 @@ This service provides backtest scoring based on historical performance
 of the trading strategy.
 """
 
+import time
 import warnings
+from collections.abc import Callable
 
 warnings.filterwarnings("ignore")
 
@@ -27,6 +29,7 @@ except ImportError as e:
 # Import helper functions from core (temporary, will be migrated)
 # Phase 4.8: calculate_backtest_score moved to BacktestService method
 from core.backtest_scoring import _run_stock_backtest_impl
+from services.backtest_pool import BacktestTask, iter_backtests_parallel, resolve_backtest_workers
 
 
 class BacktestService:
@@ -102,6 +105,8 @@ class BacktestService:
         years_back: int | None = None,
         dip_mode: bool | None = None,
         config=None,
+        workers: int | None = None,
+        on_result: Callable[[dict], None] | None = None,
     ) -> list[dict]:
         """
         Add backtest scores to existing stock analysis results.
@@ -113,6 +118,12 @@ class BacktestService:
             stock_results: List of stock analysis results
             years_back: Years of historical data to analyze (uses default if None)
             dip_mode: Whether to use dip mode (uses instance default if None)
+            workers: Backtest worker processes (default settings.BACKTEST_SCORING_WORKERS;
+                     1 = serial, 0 = one per CPU core). With more than one, the backtests
+                     run in a process pool (see services.backtest_pool) and the results
+                     are applied in input order as they complete.
+            on_result: Called with each stock result as soon as its scoring is final
+                       (used to stream results while later backtests still run)
 
         Returns:
             Enhanced stock results with backtest scores
@@ -124,10 +135,32 @@ class BacktestService:
 
         logger.info(f"Adding backtest scores for {len(stock_results)} stocks...")
 
+        # Parallel mode: backtests run in a pool; outcomes are applied in order below as
+        # each one (and all earlier ones) finishes
+        outcomes = None
+        workers = resolve_backtest_workers(workers)
+        if workers > 1 and len(stock_results) > 1:
+            outcomes = iter_backtests_parallel(
+                [
+                    BacktestTask(
+                        r.get("ticker", "Unknown"),
+                        years_back,
+                        dip_mode,
+                        r.get("_config") or config,
+                    )
+                    for r in stock_results
+                ],
+                workers=workers,
+            )
+
         enhanced_results = []
 
         for i, stock_result in enumerate(stock_results, 1):
+            backtest_yahoo_calls = None
             try:
+                # A broken pool fails this stock; the exhausted iterator then yields None and
+                # the remaining stocks are backtested serially
+                outcome = next(outcomes, None) if outcomes is not None else None
                 ticker = stock_result.get("ticker", "Unknown")
                 logger.info(f"Processing {i}/{len(stock_results)}: {ticker}")
 
@@ -161,9 +194,18 @@ class BacktestService:
                     logger.warning(
                         f"{ticker}: No config available for backtest, will use default (ml_enabled=False)"
                     )
-                backtest_data = self.run_stock_backtest(
-                    ticker, years_back, dip_mode, config=stock_config
-                )
+                if outcome is None:
+                    started = time.perf_counter()
+                    backtest_data = self.run_stock_backtest(
+                        ticker, years_back, dip_mode, config=stock_config
+                    )
+                    duration_s = time.perf_counter() - started
+                else:
+                    backtest_yahoo_calls = outcome.yahoo_calls
+                    if outcome.error:
+                        raise RuntimeError(outcome.error)
+                    backtest_data = outcome.result
+                    duration_s = outcome.elapsed_s
 
                 # Add backtest data to stock result
                 backtest_mode = backtest_data.get("backtest_mode", BACKTEST_MODE)
@@ -180,6 +222,7 @@ class BacktestService:
                         "backtest_ml_verdict"
                     ),  # Store for filtering logic
                     "backtest_mode": backtest_mode,
+                    "duration_s": round(duration_s, 2),
                 }
 
                 # Calculate combined score (50% current analysis + 50% backtest)
@@ -201,7 +244,9 @@ class BacktestService:
                 stock_result["combined_score"] = combined_score
                 stock_result["backtest_score"] = backtest_score
 
-                apply_ohlcv_ops_fields(stock_result, ticker)
+                apply_ohlcv_ops_fields(
+                    stock_result, ticker, backtest_yahoo_calls=backtest_yahoo_calls
+                )
 
                 # Re-classify based on combined score and key metrics
                 self._reclassify_with_backtest(stock_result, backtest_score, combined_score)
@@ -376,7 +421,9 @@ class BacktestService:
                     apply_ohlcv_ops_fields,
                 )
 
-                apply_ohlcv_ops_fields(stock_result, ticker)
+                apply_ohlcv_ops_fields(
+                    stock_result, ticker, backtest_yahoo_calls=backtest_yahoo_calls
+                )
                 # Add stock without backtest score
                 stock_result["backtest"] = {"score": 0, "error": str(e)}
                 # Restore initial ML predictions even on error (2025-11-11)
@@ -387,6 +434,12 @@ class BacktestService:
                     logger.debug(f"Restored ML after error for {ticker}")
                 enhanced_results.append(stock_result)
 
+            if on_result is not None:
+                on_result(stock_result)
+
+        if outcomes is not None:
+            next(outcomes, None)  # all consumed: shut the pool down and log its summary
+
         # DEBUG: Log summary of ML predictions in enhanced results
         ml_count = sum(1 for r in enhanced_results if r.get("ml_verdict") in ["buy", "strong_buy"])
         logger.debug(
@@ -10,13 +10,25 @@ examples. Each example represents one "episode":
 - Exit at the first EMA9 touch (close >= ema9) OR RSI10 >= 50, *after the last add*.
 
 Sizing assumption: equal capital per add. PnL% is computed accordingly.
+
+``generate_dip_episode_rows`` walks one ticker row by row and is the reference
+implementation. ``generate_dip_episode_dataset`` builds the same rows for many tickers:
+entry features are computed column-wise for the whole history, episode boundaries are
+found by jumping between candidate rows (RSI below the entry/add thresholds) and exit rows
+with ``searchsorted``, and tickers are processed in a process pool that writes one CSV
+shard per chunk of tickers.
 """
 
 from __future__ import annotations
 
+import multiprocessing
+import os
+from collections.abc import Mapping
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from core.backtest_scoring import calculate_wilder_rsi
@@ -278,3 +290,298 @@ def generate_dip_episode_rows(
     labels = ["pnl_pct", "net_win", "strong_win"]
     feat_cols = [c for c in out.columns if c not in meta + labels]
     return out[meta + labels + sorted(feat_cols)]
+
+
+# ---------------------------------------------------------------------------
+# Batch (column-wise) generation
+# ---------------------------------------------------------------------------
+
+SHARD_PREFIX = "dip_episodes_"
+
+
+def _prepare_frame(df: pd.DataFrame, params: DipEpisodeParams) -> pd.DataFrame:
+    """Indicators plus a sorted ``__date`` column, as ``generate_dip_episode_rows`` uses."""
+    frame = _ensure_indicators(df, params=params)
+    if "date" in frame.columns:
+        dates = pd.to_datetime(frame["date"])
+    else:
+        dates = pd.to_datetime(frame.index)
+    frame["__date"] = dates
+    return frame.sort_values("__date").reset_index(drop=True)
+
+
+def _run_length(flags: np.ndarray) -> np.ndarray:
+    """Length of the run of True values ending at each position."""
+    idx = np.arange(len(flags))
+    last_false = np.maximum.accumulate(np.where(flags, -1, idx))
+    return idx - last_false
+
+
+def _basic_feature_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """``_basic_features`` for every row at once (each row only uses rows up to itself)."""
+    close = frame["close"].to_numpy(dtype=float)
+    rsi = frame["rsi_10"].to_numpy(dtype=float)
+    ema9 = frame["ema9"].to_numpy(dtype=float)
+    ema9 = np.where(np.isnan(ema9), close, ema9)
+    row_no = np.arange(len(frame))
+
+    high_col = "high" if "high" in frame.columns else "close"
+    low_col = "low" if "low" in frame.columns else "close"
+    high20 = frame[high_col].rolling(20, min_periods=1).max().to_numpy(dtype=float)
+    low20 = frame[low_col].rolling(20, min_periods=1).min().to_numpy(dtype=float)
+
+    ret_std = frame["close"].pct_change().rolling(20, min_periods=1).std(ddof=0)
+    vol_20d = np.where(row_no >= 20, ret_std.fillna(0.0).to_numpy(dtype=float) * 100, 0.0)
+
+    volume_ratio = np.ones(len(frame))
+    if "volume" in frame.columns:
+        volume = frame["volume"].to_numpy(dtype=float)
+        avg_volume = frame["volume"].rolling(20, min_periods=1).mean().to_numpy(dtype=float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            use_avg = (row_no >= 19) & (avg_volume > 0)
+            volume_ratio = np.where(use_avg, np.nan_to_num(volume) / avg_volume, 1.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return pd.DataFrame(
+            {
+                "rsi_10": np.where(np.isnan(rsi), 50.0, rsi),
+                "ema9_distance_pct": np.where(close > 0, (ema9 - close) / close * 100, 0.0),
+                "dip_depth_from_20d_high_pct": np.where(
+                    high20 > 0, (high20 - close) / high20 * 100, 0.0
+                ),
+                "support_distance_pct": np.where(close > 0, (close - low20) / close * 100, 0.0),
+                "consecutive_red_days": _run_length(np.diff(close, prepend=np.nan) < 0).astype(
+                    float
+                ),
+                "volume_ratio": volume_ratio,
+                "volatility_20d_pct": vol_20d,
+            }
+        )
+
+
+def _episode_bounds(
+    rsi: np.ndarray, close: np.ndarray, ema9: np.ndarray, p: DipEpisodeParams
+) -> list[tuple[int, int, list[float]]]:
+    """
+    ``(entry_row, exit_row, add_prices)`` per completed episode.
+
+    Same state machine as ``generate_dip_episode_rows``, visiting only candidate rows
+    (RSI below an entry/add threshold) and jumping to the next exit row; resets (RSI above
+    the entry level) between visited rows are counted with a prefix sum.
+    """
+    valid = ~np.isnan(rsi)
+    entries = np.flatnonzero(valid & (rsi < p.rsi_entry))
+    candidates = np.flatnonzero(
+        valid & ((rsi < p.rsi_entry) | (rsi <= p.rsi_add_20) | (rsi <= p.rsi_add_10))
+    )
+    # above_cum[k]: rows before k with RSI above the entry level
+    above_cum = np.concatenate([[0], np.cumsum(valid & (rsi > p.rsi_entry))])
+    ema = np.where(np.isnan(ema9), close, ema9)
+    exits = np.flatnonzero(valid & ((close >= ema) | (rsi >= p.rsi_exit)))
+
+    bounds: list[tuple[int, int, list[float]]] = []
+    pos = 0
+    while True:
+        k = int(np.searchsorted(entries, pos))
+        if k >= len(entries):
+            return bounds
+        entry = int(entries[k])
+        prices = [float(close[entry])]
+        last_add = cursor = entry
+        seen_above = add_20 = add_10 = False
+        c = int(np.searchsorted(candidates, entry + 1))
+        while True:
+            x = int(np.searchsorted(exits, last_add + 1))
+            exit_row = int(exits[x]) if x < len(exits) else None
+            row = int(candidates[c]) if c < len(candidates) else None
+            if row is not None and (exit_row is None or row <= exit_row):
+                c += 1
+                if above_cum[row + 1] - above_cum[cursor + 1] > 0:
+                    seen_above, add_20, add_10 = True, False, False
+                cursor = row
+                value = rsi[row]
+                added = False
+                if value <= p.rsi_add_10:
+                    added = not add_10 or seen_above
+                    add_10 = add_10 or added
+                elif value <= p.rsi_add_20:
+                    added = not add_20 or seen_above
+                    add_20 = add_20 or added
+                elif value < p.rsi_entry:
+                    added = seen_above
+                if added:
+                    prices.append(float(close[row]))
+                    last_add = row
+                    seen_above = False
+                    continue
+                if row != exit_row:
+                    continue
+            if exit_row is None:
+                return bounds  # episode still open at the end of the data
+            if not any(px > 0 for px in prices):
+                return bounds
+            bounds.append((entry, exit_row, prices))
+            pos = exit_row + 1
+            break
+
+
+def generate_dip_episode_rows_vectorized(
+    df: pd.DataFrame,
+    *,
+    ticker: str,
+    params: DipEpisodeParams | None = None,
+) -> pd.DataFrame:
+    """Same rows as ``generate_dip_episode_rows``, computed column-wise."""
+    p = params or DipEpisodeParams()
+    frame = _prepare_frame(df, p)
+    if len(frame) < p.min_history_days:
+        logger.info("Dip dataset: %s skipped (only %s rows)", ticker, len(frame))
+        return pd.DataFrame()
+
+    bounds = _episode_bounds(
+        frame["rsi_10"].to_numpy(dtype=float),
+        frame["close"].to_numpy(dtype=float),
+        frame["ema9"].to_numpy(dtype=float),
+        p,
+    )
+    if not bounds:
+        return pd.DataFrame()
+
+    entry_rows = [b[0] for b in bounds]
+    exit_rows = [b[1] for b in bounds]
+    exit_close = frame["close"].to_numpy(dtype=float)[exit_rows]
+    pnl_pct = []
+    for (_, _, prices), exit_price in zip(bounds, exit_close, strict=True):
+        inv_prices = [1.0 / px for px in prices if px > 0]
+        pnl_pct.append(
+            float(round((exit_price * (sum(inv_prices) / len(inv_prices)) - 1.0) * 100.0, 4))
+        )
+
+    dates = frame["__date"]
+    features = _basic_feature_frame(frame).iloc[entry_rows].reset_index(drop=True)
+    out = pd.DataFrame(
+        {
+            "ticker": ticker,
+            "entry_date": [d.date().isoformat() for d in dates.iloc[entry_rows]],
+            "exit_date": [d.date().isoformat() for d in dates.iloc[exit_rows]],
+            "n_adds": [len(b[2]) for b in bounds],
+            "pnl_pct": pnl_pct,
+            "net_win": [1 if v >= p.label_net_win_threshold_pct else 0 for v in pnl_pct],
+            "strong_win": [1 if v >= p.label_strong_win_threshold_pct else 0 for v in pnl_pct],
+        }
+    )
+    return pd.concat([out, features[sorted(features.columns)]], axis=1)
+
+
+def _load_ohlcv(source: pd.DataFrame | str | Path) -> pd.DataFrame:
+    if isinstance(source, pd.DataFrame):
+        return source
+    return pd.read_csv(source)
+
+
+def _write_shard(
+    shard_path: str, items: list[tuple[str, pd.DataFrame | str]], params: DipEpisodeParams
+) -> tuple[str | None, int, int]:
+    """Worker entry point: episode rows for ``items`` written to one CSV shard."""
+    frames = []
+    for ticker, source in items:
+        try:
+            rows = generate_dip_episode_rows_vectorized(
+                _load_ohlcv(source), ticker=ticker, params=params
+            )
+        except Exception as e:
+            logger.warning("Dip dataset: %s failed: %s", ticker, e)
+            continue
+        if not rows.empty:
+            frames.append(rows)
+    if not frames:
+        return None, 0, len(items)
+    out = pd.concat(frames, ignore_index=True)
+    out.to_csv(shard_path, index=False)
+    return shard_path, len(out), len(items)
+
+
+def _ticker_sources(
+    source: pd.DataFrame | Mapping[str, pd.DataFrame] | str | Path,
+) -> list[tuple[str, pd.DataFrame | str]]:
+    """``(ticker, frame or CSV path)`` pairs from a panel, a mapping or a directory."""
+    if isinstance(source, pd.DataFrame):
+        if "ticker" not in source.columns:
+            raise ValueError("Panel dataframe needs a 'ticker' column")
+        return [
+            (str(ticker), group.drop(columns=["ticker"]))
+            for ticker, group in source.groupby("ticker", sort=True)
+        ]
+    if isinstance(source, Mapping):
+        return [(str(ticker), frame) for ticker, frame in sorted(source.items())]
+    directory = Path(source)
+    if not directory.is_dir():
+        raise ValueError(f"OHLCV directory not found: {directory}")
+    files = sorted([*directory.glob("*.csv"), *directory.glob("*.csv.gz")])
+    return [(f.name.split(".csv")[0], str(f)) for f in files]
+
+
+def generate_dip_episode_dataset(  # noqa: PLR0913
+    source: pd.DataFrame | Mapping[str, pd.DataFrame] | str | Path,
+    *,
+    output_dir: str | Path,
+    params: DipEpisodeParams | None = None,
+    workers: int | None = None,
+    tickers_per_shard: int = 50,
+    start_method: str = "spawn",
+) -> list[Path]:
+    """
+    Generate dip-episode training rows for many tickers and write them as CSV shards.
+
+    Args:
+        source: Panel dataframe with a ``ticker`` column, ``{ticker: ohlcv_frame}``, or a
+            directory of per-ticker OHLCV CSVs (``<TICKER>.csv``; ticker from the file name)
+        output_dir: Directory for ``dip_episodes_<n>.csv`` shards (existing shards removed)
+        params: Episode/label parameters
+        workers: Worker processes (None/0 = CPU count; 1 runs in this process)
+        tickers_per_shard: Tickers per shard (one worker task per shard)
+        start_method: multiprocessing start method
+
+    Returns:
+        Paths of the shards written, in ticker order (shards without episodes are skipped)
+    """
+    p = params or DipEpisodeParams()
+    out_dir = Path(output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in out_dir.glob(f"{SHARD_PREFIX}*.csv"):
+        stale.unlink()
+
+    items = _ticker_sources(source)
+    size = max(1, tickers_per_shard)
+    tasks = [
+        (str(out_dir / f"{SHARD_PREFIX}{n:05d}.csv"), items[i : i + size], p)
+        for n, i in enumerate(range(0, len(items), size))
+    ]
+    if not tasks:
+        return []
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    logger.info(
+        "Dip dataset: %s ticker(s) in %s shard(s) with %s worker(s)",
+        len(items),
+        len(tasks),
+        workers,
+    )
+
+    if workers == 1:
+        results = [_write_shard(*task) for task in tasks]
+    else:
+        context = multiprocessing.get_context(start_method)
+        with context.Pool(processes=workers) as pool:
+            results = pool.starmap(_write_shard, tasks)
+
+    total_rows = sum(n_rows for _, n_rows, _ in results)
+    logger.info("Dip dataset: %s episode row(s) written to %s", total_rows, out_dir)
+    return [Path(path) for path, _, _ in results if path is not None]
+
+
+def load_dip_episode_shards(output_dir: str | Path) -> pd.DataFrame:
+    """Concatenate the shards written by ``generate_dip_episode_dataset``."""
+    shards = sorted(Path(output_dir).glob(f"{SHARD_PREFIX}*.csv"))
+    if not shards:
+        return pd.DataFrame()
+    return pd.concat([pd.read_csv(path) for path in shards], ignore_index=True)
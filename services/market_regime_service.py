@@ -10,33 +10,129 @@ Features provided:
 3. nifty_vs_sma50_pct: % distance from 50-day SMA
 4. india_vix: Current volatility index
 5. sector_strength: Sector performance vs Nifty (if available)
+
+Nifty and VIX closes are kept as date-indexed histories (fetched once from
+MARKET_REGIME_HISTORY_START, then extended only by the missing head/tail ranges) and
+features are served by as-of date lookup, so a backtest or training run asking for
+thousands of dates downloads each index once instead of once per date. Features for
+settled dates are memoized per date. The shared service (get_market_regime_service)
+persists the histories under MARKET_REGIME_HISTORY_DIR.
 """
 
+import json
+import os
+import threading
 import yfinance as yf
 import pandas as pd
 import numpy as np
-from datetime import timedelta
+from datetime import datetime, time, timedelta
+from pathlib import Path
 from typing import Dict, Optional, Tuple
 import logging
 
+from config.settings import MARKET_REGIME_HISTORY_DIR, MARKET_REGIME_HISTORY_START
 from src.infrastructure.db.timezone_utils import ist_now_naive
 
 logger = logging.getLogger(__name__)
 
+# Daily bars fetched at/after this IST time are treated as final for that day
+_SESSION_SETTLED = time(16, 0)
+
+
+class _CloseHistory:
+    """Daily closes of one index over the date range fetched so far."""
+
+    def __init__(self, name: str, symbol: str):
+        self.name = name
+        self.symbol = symbol
+        self.closes = pd.Series(dtype=float)
+        self.start: pd.Timestamp | None = None  # first requested date
+        self.through: pd.Timestamp | None = None  # last requested date
+        self.checked_at: datetime | None = None  # naive IST time of the last tail fetch
+        # Earliest head start that came back empty this session (not persisted)
+        self.empty_head_from: pd.Timestamp | None = None
+        self.version = 0
+
+    def settled_through(self) -> pd.Timestamp | None:
+        """Last date whose bar was final when the tail was fetched."""
+        if self.through is None or self.checked_at is None:
+            return None
+        settled = pd.Timestamp(self.checked_at.date())
+        if self.checked_at.time() < _SESSION_SETTLED:
+            settled -= timedelta(days=1)
+        return min(self.through, settled)
+
+    def merge(self, closes: pd.Series, start: pd.Timestamp, through: pd.Timestamp) -> None:
+        """Add fetched closes (newer values win) and widen the covered range."""
+        merged = closes.combine_first(self.closes) if not self.closes.empty else closes
+        self.closes = merged.sort_index()
+        self.start = start if self.start is None else min(self.start, start)
+        self.through = through if self.through is None else max(self.through, through)
+        self.version += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "symbol": self.symbol,
+            "start": self.start.strftime("%Y-%m-%d") if self.start is not None else None,
+            "through": self.through.strftime("%Y-%m-%d") if self.through is not None else None,
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+            "closes": {d.strftime("%Y-%m-%d"): float(v) for d, v in self.closes.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, name: str, data: dict) -> "_CloseHistory":
+        history = cls(name, data["symbol"])
+        closes = data.get("closes") or {}
+        history.closes = pd.Series(
+            list(closes.values()), index=pd.to_datetime(list(closes.keys())), dtype=float
+        ).sort_index()
+        history.start = pd.Timestamp(data["start"]) if data.get("start") else None
+        history.through = pd.Timestamp(data["through"]) if data.get("through") else None
+        history.checked_at = (
+            datetime.fromisoformat(data["checked_at"]) if data.get("checked_at") else None
+        )
+        return history
+
 
 class MarketRegimeService:
     """Service to fetch and analyze market regime data"""
 
-    # Cache duration (in seconds)
+    # Cache duration (in seconds); also how long today's still-forming bar is reused
     CACHE_DURATION = 3600  # 1 hour
 
-    def __init__(self):
-        """Initialize the market regime service"""
+    NIFTY_SYMBOL = "^NSEI"
+    VIX_SYMBOL = "^INDIAVIX"
+    # As-of lookups older than this (calendar days) count as missing data
+    NIFTY_LOOKBACK_DAYS = 100  # also the SMA50 warm-up before a date
+    VIX_LOOKBACK_DAYS = 5
+    # Tail fetches re-read this many days before the last settled date
+    TAIL_OVERLAP_DAYS = 7
+
+    def __init__(
+        self,
+        history_dir: str | None = None,
+        history_start: str = MARKET_REGIME_HISTORY_START,
+    ):
+        """
+        Initialize the market regime service
+
+        Args:
+            history_dir: Directory to persist the Nifty/VIX histories (None = memory only)
+            history_start: First date fetched when a history is empty
+        """
         self._nifty_cache: Optional[pd.DataFrame] = None
         self._vix_cache: Optional[float] = None
         self._cache_timestamp = None  # naive IST datetime
         self._cache_date: Optional[str] = None  # Track which date's data is cached
 
+        self._history_dir = Path(history_dir) if history_dir else None
+        self._history_start = pd.Timestamp(history_start)
+        self._histories: dict[str, _CloseHistory] = {}
+        self._nifty_table: pd.DataFrame | None = None
+        self._nifty_table_version = -1
+        self._features_by_date: dict[str, dict[str, float]] = {}
+        self._lock = threading.RLock()
+
     def get_market_regime_features(
         self,
         date: Optional[str] = None,
@@ -62,6 +158,10 @@ class MarketRegimeService:
             if date is None:
                 date = ist_now_naive().strftime("%Y-%m-%d")
 
+            cached = self._features_by_date.get(date)
+            if cached is not None:
+                return dict(cached)
+
             # Fetch market data
             nifty_data = self._get_nifty_data(date)
             if nifty_data is None:
@@ -89,6 +189,8 @@ class MarketRegimeService:
             features["sector_strength"] = 0.0  # TODO: Implement sector analysis
 
             logger.debug(f"Market regime features for {date}: {features}")
+            if self._is_settled(date):
+                self._features_by_date[date] = dict(features)
             return features
 
         except Exception as e:
@@ -97,9 +199,9 @@ class MarketRegimeService:
 
     def _get_nifty_data(self, target_date: str) -> Optional[pd.DataFrame]:
         """
-        Fetch Nifty 50 data with SMAs for the given date.
+        Nifty 50 close with SMA20/SMA50 for the given date (or closest previous trading day).
 
-        Uses caching to avoid repeated API calls within the same session.
+        Served from the date-indexed Nifty history; only missing ranges are downloaded.
         """
         try:
             # Parse target date
@@ -110,56 +212,27 @@ class MarketRegimeService:
                 logger.debug("Using cached Nifty data")
                 return self._nifty_cache
 
-            logger.debug(f"Fetching Nifty data for {target_date}")
-
-            # Calculate date range (need extra days for SMA50)
-            end_date = target_dt + timedelta(days=1)  # Include target date
-            start_date = target_dt - timedelta(days=100)  # Buffer for SMA50
-
-            # Fetch data
-            # NOTE: Using unadjusted prices (auto_adjust=False) to match TradingView
-            nifty = yf.download(
-                "^NSEI",
-                start=start_date.strftime("%Y-%m-%d"),
-                end=end_date.strftime("%Y-%m-%d"),
-                progress=False,
-                auto_adjust=False,
+            history = self._history_for(
+                "nifty", self.NIFTY_SYMBOL, target_dt, self.NIFTY_LOOKBACK_DAYS
             )
-
-            if nifty.empty:
+            if history.closes.empty:
                 logger.warning("No Nifty data received")
                 return None
 
-            # Handle MultiIndex columns (yfinance behavior)
-            if isinstance(nifty.columns, pd.MultiIndex):
-                nifty.columns = nifty.columns.get_level_values(0)
-
-            # Normalize index
-            if nifty.index.tz is not None:
-                nifty.index = nifty.index.tz_localize(None)
-            nifty.index = pd.to_datetime(nifty.index).normalize()
-
-            # Calculate SMAs
-            nifty["SMA20"] = nifty["Close"].rolling(window=20).mean()
-            nifty["SMA50"] = nifty["Close"].rolling(window=50).mean()
+            nifty = self._get_nifty_table(history)
 
             # Get data for target date (or closest previous trading day)
-            try:
-                row = nifty.loc[target_dt]
-            except KeyError:
-                # Use asof to get closest previous trading day
-                closest_date = nifty.index.asof(target_dt)
-                if pd.isna(closest_date):
-                    logger.warning(f"No Nifty data available for {target_date}")
-                    return None
-                row = nifty.loc[closest_date]
+            closest_date = nifty.index.asof(target_dt)
+            if pd.isna(closest_date) or closest_date < target_dt - timedelta(
+                days=self.NIFTY_LOOKBACK_DAYS
+            ):
+                logger.warning(f"No Nifty data available for {target_date}")
+                return None
+            if closest_date != target_dt:
                 logger.debug(f"Using closest date: {closest_date} for {target_date}")
 
             # Convert row to DataFrame for consistency
-            if isinstance(row, pd.Series):
-                result_df = pd.DataFrame([row])
-            else:
-                result_df = pd.DataFrame([row.iloc[0]])
+            result_df = pd.DataFrame([nifty.loc[closest_date]])
 
             # Cache the result
             self._nifty_cache = result_df
@@ -174,7 +247,7 @@ class MarketRegimeService:
 
     def _get_vix(self, target_date: str) -> float:
         """
-        Fetch India VIX for the given date.
+        India VIX close for the given date (or closest previous day within a few days).
 
         Note: India VIX historical data is limited on Yahoo Finance.
         Returns 20.0 as default if not available.
@@ -184,40 +257,20 @@ class MarketRegimeService:
             if self._is_cache_valid(target_date) and self._vix_cache is not None:
                 return self._vix_cache
 
-            # Try to fetch VIX data
-            target_dt = pd.to_datetime(target_date)
-            end_date = target_dt + timedelta(days=1)
-            start_date = target_dt - timedelta(days=5)  # Look back a few days
-
-            # NOTE: Using unadjusted prices (auto_adjust=False) to match TradingView
-            vix = yf.download(
-                "^INDIAVIX",
-                start=start_date.strftime("%Y-%m-%d"),
-                end=end_date.strftime("%Y-%m-%d"),
-                progress=False,
-                auto_adjust=False,
+            target_dt = pd.to_datetime(target_date).normalize()
+            history = self._history_for(
+                "india_vix", self.VIX_SYMBOL, target_dt, self.VIX_LOOKBACK_DAYS
             )
 
-            if not vix.empty:
-                # Handle MultiIndex columns
-                if isinstance(vix.columns, pd.MultiIndex):
-                    vix.columns = vix.columns.get_level_values(0)
-
-                # Normalize index
-                if vix.index.tz is not None:
-                    vix.index = vix.index.tz_localize(None)
-                vix.index = pd.to_datetime(vix.index).normalize()
-
+            if not history.closes.empty:
                 # Get closest value
-                target_dt_normalized = pd.to_datetime(target_date).normalize()
-                if target_dt_normalized in vix.index:
-                    vix_value = float(vix.loc[target_dt_normalized, "Close"])
+                closest_date = history.closes.index.asof(target_dt)
+                if not pd.isna(closest_date) and closest_date >= target_dt - timedelta(
+                    days=self.VIX_LOOKBACK_DAYS
+                ):
+                    vix_value = float(history.closes.loc[closest_date])
                 else:
-                    closest_date = vix.index.asof(target_dt_normalized)
-                    if not pd.isna(closest_date):
-                        vix_value = float(vix.loc[closest_date, "Close"])
-                    else:
-                        vix_value = 20.0  # Default
+                    vix_value = 20.0  # Default
 
                 # Clamp VIX to a reasonable range for model features and tests
                 # This avoids extreme or edge values (e.g., <10) that can skew features.
@@ -233,6 +286,144 @@ class MarketRegimeService:
         # Default VIX (neutral)
         return 20.0
 
+    # ---------------------- Date-indexed history ----------------------
+
+    def _history_for(
+        self, name: str, symbol: str, target_dt: pd.Timestamp, lookback_days: int
+    ) -> _CloseHistory:
+        """History covering ``target_dt`` and its lookback, fetching only missing ranges."""
+        with self._lock:
+            history = self._histories.get(name)
+            if history is None:
+                history = self._load_history(name, symbol)
+                self._histories[name] = history
+
+            now = ist_now_naive()
+            today = pd.Timestamp(now.date())
+            need_start = target_dt - timedelta(days=lookback_days)
+
+            if history.start is None:
+                self._fetch_into(
+                    history, min(need_start, self._history_start), max(target_dt, today), now
+                )
+                return history
+
+            if need_start < history.start and (
+                history.empty_head_from is None or need_start < history.empty_head_from
+            ):
+                # Nothing listed before the first bar: do not ask again this session
+                if not self._fetch_into(history, need_start, history.start - timedelta(days=1)):
+                    history.empty_head_from = need_start
+
+            settled = history.settled_through()
+            if settled is not None and target_dt <= settled:
+                return history
+            fresh = (
+                history.checked_at is not None
+                and (now - history.checked_at).total_seconds() < self.CACHE_DURATION
+            )
+            if target_dt <= history.through and fresh:
+                return history  # today's bar, re-read at most every CACHE_DURATION
+            tail_start = (settled or history.through) - timedelta(days=self.TAIL_OVERLAP_DAYS)
+            self._fetch_into(history, tail_start, max(target_dt, today), now)
+            return history
+
+    def _fetch_into(
+        self,
+        history: _CloseHistory,
+        start: pd.Timestamp,
+        through: pd.Timestamp,
+        checked_at: datetime | None = None,
+    ) -> bool:
+        """
+        Download ``[start, through]`` into ``history``.
+
+        Returns False for an empty response, which is not recorded.
+        """
+        logger.debug(f"Fetching {history.symbol} history {start.date()} to {through.date()}")
+        closes = self._download_closes(history.symbol, start, through)
+        if closes.empty:
+            return False
+        history.merge(closes, start, through)
+        if checked_at is not None:
+            history.checked_at = checked_at
+        self._save_history(history)
+        return True
+
+    def _download_closes(
+        self, symbol: str, start: pd.Timestamp, through: pd.Timestamp
+    ) -> pd.Series:
+        # NOTE: Using unadjusted prices (auto_adjust=False) to match TradingView
+        data = yf.download(
+            symbol,
+            start=start.strftime("%Y-%m-%d"),
+            end=(through + timedelta(days=1)).strftime("%Y-%m-%d"),  # end is exclusive
+            progress=False,
+            auto_adjust=False,
+        )
+        if data is None or data.empty:
+            return pd.Series(dtype=float)
+
+        # Handle MultiIndex columns (yfinance behavior)
+        if isinstance(data.columns, pd.MultiIndex):
+            data.columns = data.columns.get_level_values(0)
+
+        # Normalize index
+        if data.index.tz is not None:
+            data.index = data.index.tz_localize(None)
+        data.index = pd.to_datetime(data.index).normalize()
+
+        closes = data["Close"].astype(float).dropna()
+        return closes[~closes.index.duplicated(keep="last")].sort_index()
+
+    def _get_nifty_table(self, history: _CloseHistory) -> pd.DataFrame:
+        """Close/SMA20/SMA50 over the whole Nifty history (rebuilt when it grows)."""
+        if self._nifty_table is None or self._nifty_table_version != history.version:
+            nifty = pd.DataFrame({"Close": history.closes})
+            nifty["SMA20"] = nifty["Close"].rolling(window=20).mean()
+            nifty["SMA50"] = nifty["Close"].rolling(window=50).mean()
+            self._nifty_table = nifty
+            self._nifty_table_version = history.version
+        return self._nifty_table
+
+    def _is_settled(self, date: str) -> bool:
+        """True when both histories hold final bars for ``date`` (safe to memoize)."""
+        target_dt = pd.to_datetime(date).normalize()
+        for name in ("nifty", "india_vix"):
+            history = self._histories.get(name)
+            settled = history.settled_through() if history is not None else None
+            if settled is None or target_dt > settled:
+                return False
+        return True
+
+    def _history_path(self, name: str) -> Path | None:
+        return self._history_dir / f"{name}.json" if self._history_dir else None
+
+    def _load_history(self, name: str, symbol: str) -> _CloseHistory:
+        path = self._history_path(name)
+        if path is not None and path.exists():
+            try:
+                with open(path, encoding="utf-8") as f:
+                    history = _CloseHistory.from_dict(name, json.load(f))
+                if history.symbol == symbol:
+                    return history
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Ignoring unreadable market regime history {path}: {e}")
+        return _CloseHistory(name, symbol)
+
+    def _save_history(self, history: _CloseHistory) -> None:
+        path = self._history_path(history.name)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(history.to_dict(), f)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not persist market regime history {path}: {e}")
+
     def _calculate_trend(self, nifty_data: pd.DataFrame) -> float:
         """
         Calculate trend: 1.0 (bullish), 0.0 (neutral), -1.0 (bearish)
@@ -305,11 +496,16 @@ class MarketRegimeService:
         }
 
     def clear_cache(self) -> None:
-        """Clear cached market data (useful for testing)"""
+        """Clear cached market data (useful for testing); persisted histories are kept"""
         self._nifty_cache = None
         self._vix_cache = None
         self._cache_timestamp = None
         self._cache_date = None
+        with self._lock:
+            self._histories.clear()
+            self._nifty_table = None
+            self._nifty_table_version = -1
+            self._features_by_date.clear()
         logger.debug("Market regime cache cleared")
 
 
@@ -321,6 +517,6 @@ def get_market_regime_service() -> MarketRegimeService:
     """Get or create the singleton market regime service instance"""
     global _market_regime_service
     if _market_regime_service is None:
-        _market_regime_service = MarketRegimeService()
+        _market_regime_service = MarketRegimeService(history_dir=MARKET_REGIME_HISTORY_DIR or None)
     return _market_regime_service
 
@@ -0,0 +1,424 @@
+"""
+Point-in-time per-ticker feature store for ML training data collection.
+
+``scripts/collect_training_data.extract_features_at_date`` used to download ~520 days of
+OHLCV, recompute indicators, pattern signals and dip features for every single fill of
+every backtested position, so each ticker's history was fetched and processed once per
+fill. The store computes the same ticker-level feature columns once per ticker over its
+full history, column-wise, and answers ``(ticker, signal_date)`` lookups from a date index.
+
+No look-ahead: every column value at row ``i`` only uses rows ``<= i`` (rolling windows,
+shifts and run lengths over the past), so the row for the signal date equals what a
+window ending on that date produces. Indicators (EMA200, RSI) run over the whole fetched
+history instead of a 520-day window, which only changes their warm-up tails.
+
+Tables are persisted per ticker as compressed ``.npz`` column files under
+``data/feature_store/`` together with the fetched date range; a lookup outside that range
+(or without 520 days of warm-up before it) rebuilds the table over the union of ranges.
+
+Market regime (Nifty/VIX), calendar and interaction features are not ticker-specific and
+are still added by the collection script after the lookup.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from services.indicator_service import IndicatorService
+from utils.logger import logger
+
+FEATURE_STORE_SCHEMA_VERSION = 1
+
+# Calendar days of history before a signal date (EMA200 warm-up), as the per-date fetch used
+HISTORY_DAYS = 520
+# extract_features_at_date returned None for windows shorter than this
+MIN_HISTORY_ROWS = 50
+
+# Ticker-level columns in extract_features_at_date's output order
+FLOAT_OR_NONE_COLUMNS = (
+    "rsi_10",
+    "avg_volume_20",
+    "recent_high_20",
+    "recent_low_20",
+    "support_distance_pct",
+    "ema9_distance_pct",
+)
+TICKER_FEATURE_COLUMNS = (
+    "rsi_10",
+    "price_above_ema200",
+    "avg_volume_20",
+    "volume_ratio",
+    "vol_strong",
+    "recent_high_20",
+    "recent_low_20",
+    "support_distance_pct",
+    "ema9_distance_pct",
+    "has_hammer",
+    "has_bullish_engulfing",
+    "has_divergence",
+    "dip_depth_from_20d_high_pct",
+    "consecutive_red_days",
+    "dip_speed_pct_per_day",
+    "decline_rate_slowing",
+    "volume_green_vs_red_ratio",
+    "support_hold_count",
+)
+BOOL_COLUMNS = frozenset(
+    {
+        "price_above_ema200",
+        "vol_strong",
+        "has_hammer",
+        "has_bullish_engulfing",
+        "has_divergence",
+        "decline_rate_slowing",
+    }
+)
+INT_COLUMNS = frozenset({"consecutive_red_days", "support_hold_count"})
+
+
+def _run_length(flags: np.ndarray) -> np.ndarray:
+    """Length of the run of True values ending at each position."""
+    idx = np.arange(len(flags))
+    last_false = np.maximum.accumulate(np.where(flags, -1, idx))
+    return idx - last_false
+
+
+def _windows(values: np.ndarray, size: int) -> np.ndarray:
+    """``(n, size)`` trailing windows (row ``i`` = values[i-size+1 .. i]); NaN-padded start."""
+    padded = np.concatenate([np.full(size - 1, np.nan), values])
+    return sliding_window_view(padded, size)
+
+
+def _bullish_divergence(low: np.ndarray, rsi: np.ndarray, look: int = 10) -> np.ndarray:
+    """core.patterns.bullish_divergence at every row (needs ``look + 5`` rows)."""
+    n = len(low)
+    out = np.zeros(n, dtype=bool)
+    if n < look + 5:
+        return out
+    low_filled = np.where(np.isnan(low), np.inf, low)
+    recent = sliding_window_view(low_filled, look)[5:]  # rows i-look+1 .. i, i >= look+4
+    earlier = sliding_window_view(low_filled, look)[: n - look - 4]  # rows i-look-4 .. i-5
+    rows = np.arange(look + 4, n)
+    recent_arg = recent.argmin(axis=1)
+    earlier_arg = earlier.argmin(axis=1)
+    recent_min = recent[np.arange(len(rows)), recent_arg]
+    earlier_min = earlier[np.arange(len(rows)), earlier_arg]
+    rsi_now = rsi[rows - look + 1 + recent_arg]
+    rsi_earlier = rsi[rows - look - 4 + earlier_arg]
+    with np.errstate(invalid="ignore"):
+        hit = (
+            np.isfinite(earlier_min)
+            & (recent_min < earlier_min)
+            & ~np.isnan(rsi_now)
+            & ~np.isnan(rsi_earlier)
+            & (rsi_now > rsi_earlier)
+        )
+    out[rows] = hit
+    return out
+
+
+def _volume_green_vs_red_ratio(o: np.ndarray, c: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Mean green-candle volume / mean red-candle volume over the last 10 rows."""
+    green = c > o
+    red = c <= o
+    vol_ok = ~np.isnan(v)
+    green_w = _windows(green.astype(float), 10)
+    red_w = _windows(red.astype(float), 10)
+    v_w = _windows(np.where(vol_ok, v, 0.0), 10)
+    ok_w = _windows(vol_ok.astype(float), 10)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_green = np.nansum(v_w * green_w, axis=1) / np.nansum(ok_w * green_w, axis=1)
+        avg_red = np.nansum(v_w * red_w, axis=1) / np.nansum(ok_w * red_w, axis=1)
+        ratio = np.where(
+            (np.nansum(green_w, axis=1) == 0) | (np.nansum(red_w, axis=1) == 0),
+            1.0,
+            np.where(avg_red > 0, avg_green / avg_red, 1.0),
+        )
+    ratio[:9] = 1.0
+    return ratio
+
+
+def _support_holds(lo: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Days in the last 20 whose low tested the 20-day low (2% tolerance) and closed above."""
+    low_w = _windows(lo, 20)
+    close_w = _windows(c, 20)
+    support = np.nanmin(np.where(np.isnan(low_w), np.inf, low_w), axis=1)
+    support = np.where(np.isinf(support), np.nan, support)
+    tolerance = support * 0.02
+    with np.errstate(invalid="ignore"):
+        held = (np.abs(low_w - support[:, None]) <= tolerance[:, None]) & (
+            close_w > support[:, None]
+        )
+        holds = np.where(support > 0, held.sum(axis=1), 0)
+    holds[:19] = 0
+    return holds
+
+
+def compute_ticker_feature_frame(df: pd.DataFrame, rsi_period: int = 10) -> pd.DataFrame:
+    """
+    Ticker-level training features for every row of an indicator frame.
+
+    ``df`` is ``IndicatorService.compute_indicators`` output (open/high/low/close/volume,
+    rsi10, ema9, ema200). Row ``i`` equals what ``extract_features_at_date`` computes for a
+    window ending at row ``i``.
+    """
+    o = df["open"].to_numpy(dtype=float)
+    h = df["high"].to_numpy(dtype=float)
+    lo = df["low"].to_numpy(dtype=float)
+    c = df["close"].to_numpy(dtype=float)
+    v = df["volume"].to_numpy(dtype=float)
+    rsi_col = f"rsi{rsi_period}" if f"rsi{rsi_period}" in df.columns else "rsi10"
+    rsi = df[rsi_col].to_numpy(dtype=float) if rsi_col in df.columns else np.full(len(df), np.nan)
+    ema9 = df["ema9"].to_numpy(dtype=float) if "ema9" in df.columns else np.full(len(df), np.nan)
+    ema200 = (
+        df["ema200"].to_numpy(dtype=float) if "ema200" in df.columns else np.full(len(df), np.nan)
+    )
+
+    avg_vol = df["volume"].rolling(20, min_periods=1).mean().to_numpy(dtype=float)
+    high20 = df["high"].rolling(20, min_periods=1).max().to_numpy(dtype=float)
+    low20 = df["low"].rolling(20, min_periods=1).min().to_numpy(dtype=float)
+
+    prev_o = np.concatenate([[np.nan], o[:-1]])
+    prev_c = np.concatenate([[np.nan], c[:-1]])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Candle patterns (core.patterns.is_hammer / is_bullish_engulfing)
+        body = np.abs(c - o)
+        body = np.where(body == 0, 1e-6, body)
+        hammer = ((np.minimum(o, c) - lo) > 2 * body) & ((h - np.maximum(o, c)) < body * 0.8)
+        engulfing = (prev_c < prev_o) & (c > o) & (c >= prev_o) & (o <= prev_c)
+
+        # Dip depth from the 20-day high (0 when above it or undefined)
+        dip_depth = np.where(high20 > 0, (high20 - c) / high20 * 100, 0.0)
+        dip_depth = np.where(dip_depth > 0, dip_depth, 0.0)
+
+        # Dip speed: mean % decline over the run of falling closes (max 20 days)
+        falling = c < prev_c
+        falling_run = np.minimum(_run_length(falling), 20)
+        decline = np.where(falling, (prev_c - c) / prev_c * 100, 0.0)
+        cum = np.concatenate([[0.0], np.cumsum(decline)])
+        idx = np.arange(len(c))
+        decline_sum = cum[idx + 1] - cum[idx + 1 - falling_run]
+        dip_speed = np.where(falling_run > 0, decline_sum / np.maximum(falling_run, 1), 0.0)
+
+        # Decline slowing: |5-day change| smaller than the 5 days before
+        c5 = np.concatenate([np.full(5, np.nan), c[:-5]])
+        c10 = np.concatenate([np.full(10, np.nan), c[:-10]])
+        slowing = np.abs((c - c5) / c5 * 100) < np.abs((c5 - c10) / c10 * 100)
+        slowing[:10] = False
+
+        features = pd.DataFrame(
+            {
+                "rsi_10": rsi,
+                "price_above_ema200": ~np.isnan(ema200) & (c > ema200),
+                "avg_volume_20": avg_vol,
+                "volume_ratio": np.where(avg_vol > 0, v / avg_vol, 1.0),
+                "vol_strong": v >= 1.5 * avg_vol,
+                "recent_high_20": high20,
+                "recent_low_20": low20,
+                "support_distance_pct": (c - low20) / c * 100,
+                "ema9_distance_pct": np.where(
+                    ~np.isnan(ema9) & (c > 0), (ema9 - c) / c * 100, np.nan
+                ),
+                "has_hammer": hammer,
+                "has_bullish_engulfing": engulfing,
+                "has_divergence": _bullish_divergence(lo, rsi),
+                "dip_depth_from_20d_high_pct": dip_depth,
+                "consecutive_red_days": _run_length(c < o),
+                "dip_speed_pct_per_day": dip_speed,
+                "decline_rate_slowing": slowing,
+                "volume_green_vs_red_ratio": _volume_green_vs_red_ratio(o, c, v),
+                "support_hold_count": _support_holds(lo, c),
+            },
+            index=df.index,
+        )
+    return features
+
+
+class TickerFeatureTable:
+    """One ticker's feature columns with an O(1) date -> row index."""
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        columns: dict[str, np.ndarray],
+        covered_start: date,
+        covered_end: date,
+    ) -> None:
+        self.dates = dates.astype("datetime64[D]")
+        self.columns = columns
+        self.covered_start = covered_start
+        self.covered_end = covered_end
+        self._row_by_date = {d: i for i, d in enumerate(self.dates.tolist())}
+
+    @classmethod
+    def from_frame(
+        cls, features: pd.DataFrame, covered_start: date, covered_end: date
+    ) -> TickerFeatureTable:
+        dates = pd.to_datetime(features.index).tz_localize(None).normalize()
+        columns = {name: features[name].to_numpy() for name in TICKER_FEATURE_COLUMNS}
+        return cls(dates.to_numpy(dtype="datetime64[D]"), columns, covered_start, covered_end)
+
+    def covers(self, signal_date: date) -> bool:
+        """True when the fetched range includes ``signal_date`` and its warm-up history."""
+        return (
+            self.covered_start <= signal_date - timedelta(days=HISTORY_DAYS)
+            and signal_date <= self.covered_end
+        )
+
+    def row_for(self, signal_date: date) -> int | None:
+        """Row of the last bar on or before ``signal_date`` (None before the first bar)."""
+        row = self._row_by_date.get(signal_date)
+        if row is not None:
+            return row
+        pos = int(np.searchsorted(self.dates, np.datetime64(signal_date, "D"), side="right"))
+        return pos - 1 if pos > 0 else None
+
+    def features_at(self, signal_date: date) -> dict[str, Any] | None:
+        row = self.row_for(signal_date)
+        if row is None:
+            return None
+        first_in_window = int(
+            np.searchsorted(
+                self.dates, np.datetime64(signal_date - timedelta(days=HISTORY_DAYS + 5), "D")
+            )
+        )
+        if row + 1 - first_in_window < MIN_HISTORY_ROWS:
+            return None
+        return {name: _to_python(name, self.columns[name][row]) for name in TICKER_FEATURE_COLUMNS}
+
+    # ---------------------- Persistence ----------------------
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.stem}.tmp.npz")
+        np.savez_compressed(
+            tmp,
+            schema=np.array(FEATURE_STORE_SCHEMA_VERSION),
+            covered=np.array([self.covered_start, self.covered_end], dtype="datetime64[D]"),
+            dates=self.dates,
+            **{f"col_{name}": values for name, values in self.columns.items()},
+        )
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> TickerFeatureTable | None:
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["schema"]) != FEATURE_STORE_SCHEMA_VERSION:
+                    return None
+                covered_start, covered_end = data["covered"].tolist()
+                columns = {name: data[f"col_{name}"] for name in TICKER_FEATURE_COLUMNS}
+                return cls(data["dates"], columns, covered_start, covered_end)
+        except (OSError, KeyError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable feature store table {path}: {e}")
+            return None
+
+
+def _to_python(name: str, value: Any) -> Any:
+    if name in BOOL_COLUMNS:
+        return bool(value)
+    if name in INT_COLUMNS:
+        return int(value)
+    value = float(value)
+    if np.isnan(value):
+        return None if name in FLOAT_OR_NONE_COLUMNS else value
+    return value
+
+
+def _as_date(value: str | date | datetime) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value)[:10], "%Y-%m-%d").date()
+
+
+class PointInTimeFeatureStore:
+    """Per-ticker feature tables, built once per ticker (one OHLCV fetch) and cached on disk."""
+
+    def __init__(
+        self,
+        root: Path | str = Path("data") / "feature_store",
+        fetch: Callable[..., pd.DataFrame | None] | None = None,
+        indicator_service: IndicatorService | None = None,
+        rsi_period: int = 10,
+    ) -> None:
+        self.root = Path(root)
+        self._fetch = fetch
+        self.indicator_service = indicator_service or IndicatorService()
+        self.rsi_period = rsi_period
+        self._tables: dict[str, TickerFeatureTable | None] = {}
+        self.stats = {"builds": 0, "disk_loads": 0, "lookups": 0}
+
+    def path_for(self, ticker: str) -> Path:
+        return self.root / f"{ticker.replace('/', '_')}.npz"
+
+    def prepare(self, ticker: str, signal_dates: Iterable[str | date | datetime]) -> None:
+        """Make sure one table covers every date in ``signal_dates`` (at most one build)."""
+        days = [_as_date(d) for d in signal_dates]
+        if days:
+            self._table_for(ticker, min(days), max(days))
+
+    def features_at(self, ticker: str, signal_date: str | date | datetime) -> dict | None:
+        """Ticker-level features for the bar on or before ``signal_date`` (None if too short)."""
+        self.stats["lookups"] += 1
+        day = _as_date(signal_date)
+        table = self._table_for(ticker, day, day)
+        return table.features_at(day) if table is not None else None
+
+    def _table_for(self, ticker: str, first: date, last: date) -> TickerFeatureTable | None:
+        if ticker not in self._tables:
+            table = TickerFeatureTable.load(self.path_for(ticker))
+            if table is not None:
+                self.stats["disk_loads"] += 1
+            self._tables[ticker] = table
+        table = self._tables[ticker]
+        if table is not None and table.covers(first) and table.covers(last):
+            return table
+
+        start = first - timedelta(days=HISTORY_DAYS)
+        end = last
+        if table is not None:
+            start, end = min(start, table.covered_start), max(end, table.covered_end)
+        table = self._build(ticker, start, end)
+        self._tables[ticker] = table
+        return table
+
+    def _build(self, ticker: str, start: date, end: date) -> TickerFeatureTable | None:
+        self.stats["builds"] += 1
+        fetch = self._fetch
+        if fetch is None:
+            from core.data_fetcher import fetch_ohlcv_yf  # noqa: PLC0415
+
+            fetch = fetch_ohlcv_yf
+        df = fetch(
+            ticker=ticker,
+            days=(end - start).days,
+            interval="1d",
+            end_date=end.strftime("%Y-%m-%d"),
+            add_current_day=False,
+        )
+        if df is None or df.empty:
+            return None
+        df = self.indicator_service.compute_indicators(df)
+        if df is None or df.empty:
+            return None
+        if "date" in df.columns:
+            df = df.set_index(pd.to_datetime(df["date"]))
+        features = compute_ticker_feature_frame(df, rsi_period=self.rsi_period)
+        # Fetch pads its start by a few days; the table only vouches for the requested range
+        table = TickerFeatureTable.from_frame(features, start, end)
+        try:
+            table.save(self.path_for(ticker))
+        except OSError as e:
+            logger.warning(f"Could not persist feature table for {ticker}: {e}")
+        logger.debug(f"{ticker}: feature table built ({len(features)} rows, {start} to {end})")
+        return table
@@ -0,0 +1,213 @@
+"""
+Shared once-per-session analysis artifacts.
+
+The scheduled analysis task runs ``trade_agent.py --backtest`` (fetch, indicators, chart
+quality, ML verdicts, backtest scoring) over the whole NSE universe. Every user whose
+analysis-relevant strategy config is identical gets identical results, so the run is done
+once per completed trading session per config hash and stored as one gzip-compressed JSON
+artifact under ``analysis_results/artifacts/<session>/<config_hash>.json.gz``. Later users
+with the same hash reuse it and only apply their own persistence (tradability re-check,
+verdict filter, deduplication into Signals).
+
+The config hash covers every ``StrategyConfig`` field except ``EXECUTION_ONLY_FIELDS``
+(order placement / exit settings that the analysis pipeline never reads). Capital and the
+ML confidence threshold stay in the hash: capital drives backtest scoring (execution
+capital, small-capital skips) and the ML verdict feeds trading parameters, strength and
+combined scores, so neither can be re-applied to finished rows.
+
+Runs while the NSE session is open are not shared (the current bar is still moving).
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import threading
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+from pathlib import Path
+from typing import Any
+
+from config.settings import ANALYSIS_ARTIFACT_RETENTION_DAYS
+from src.infrastructure.db.timezone_utils import ist_now
+from src.infrastructure.utils.holiday_calendar import get_previous_trading_day, is_trading_day
+from utils.logger import logger
+
+NSE_SESSION_OPEN = dt_time(9, 15)
+NSE_SESSION_CLOSE = dt_time(15, 30)
+
+# StrategyConfig fields that only affect order placement / exits, never analysis output
+EXECUTION_ONLY_FIELDS = frozenset(
+    {
+        "max_portfolio_size",
+        "max_order_value",
+        "default_exchange",
+        "default_product",
+        "default_order_type",
+        "default_variety",
+        "default_validity",
+        "exit_on_ema9_or_rsi50",
+        "allow_duplicate_recommendations_same_day",
+        "enable_premarket_amo_adjustment",
+        "min_combined_score",
+    }
+)
+
+
+def analysis_config_hash(strategy_config: Any) -> str:
+    """Stable short hash of the analysis-relevant part of a ``StrategyConfig``."""
+    if strategy_config is None:
+        values: dict[str, Any] = {}
+    elif is_dataclass(strategy_config):
+        values = asdict(strategy_config)
+    else:
+        values = dict(vars(strategy_config))
+    relevant = {k: v for k, v in values.items() if k not in EXECUTION_ONLY_FIELDS}
+    payload = json.dumps(relevant, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def analysis_session_date(now: datetime | None = None) -> date | None:
+    """
+    Latest completed NSE session an analysis run at ``now`` sees, or None mid-session.
+
+    After the close on a trading day that is today; before the open (or on a holiday /
+    weekend) it is the previous trading day.
+    """
+    now = now or ist_now()
+    today = now.date()
+    if is_trading_day(today):
+        if now.time() >= NSE_SESSION_CLOSE:
+            return today
+        if now.time() >= NSE_SESSION_OPEN:
+            return None
+        return get_previous_trading_day(today)
+    return get_previous_trading_day(today + timedelta(days=1))
+
+
+@dataclass(frozen=True)
+class AnalysisArtifact:
+    """Results of one universe analysis run."""
+
+    session_date: date
+    config_hash: str
+    built_at: str
+    results: list[dict]
+
+
+class AnalysisArtifactStore:
+    """Compressed on-disk artifacts keyed by (session date, config hash), built once per key."""
+
+    def __init__(self, root: Path, retention_days: int = ANALYSIS_ARTIFACT_RETENTION_DAYS) -> None:
+        self.root = Path(root)
+        self.retention_days = retention_days
+        self._locks: dict[tuple[date, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def path_for(self, session_date: date, config_hash: str) -> Path:
+        return self.root / session_date.isoformat() / f"{config_hash}.json.gz"
+
+    def load(self, session_date: date, config_hash: str) -> AnalysisArtifact | None:
+        """Stored artifact, or None when missing/unreadable."""
+        path = self.path_for(session_date, config_hash)
+        if not path.exists():
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+            return AnalysisArtifact(
+                session_date=session_date,
+                config_hash=config_hash,
+                built_at=payload.get("built_at", ""),
+                results=payload.get("results", []),
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable analysis artifact {path}: {e}")
+            return None
+
+    def save(self, session_date: date, config_hash: str, results: list[dict]) -> AnalysisArtifact:
+        """Write atomically (temp file + rename) so readers never see a partial artifact."""
+        artifact = AnalysisArtifact(
+            session_date=session_date,
+            config_hash=config_hash,
+            built_at=ist_now().isoformat(),
+            results=results,
+        )
+        path = self.path_for(session_date, config_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        payload = {
+            "session_date": session_date.isoformat(),
+            "config_hash": config_hash,
+            "built_at": artifact.built_at,
+            "results": results,
+        }
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(payload, f, default=str, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        return artifact
+
+    def get_or_build(
+        self,
+        session_date: date,
+        config_hash: str,
+        build: Callable[[], list[dict]],
+    ) -> tuple[AnalysisArtifact, bool]:
+        """
+        Return the artifact for the key, running ``build`` only if none exists yet.
+
+        Concurrent callers for the same key wait for the first builder instead of running
+        their own analysis. Returns ``(artifact, built)``; a failing ``build`` raises and
+        stores nothing, and empty results are returned without being stored, so the next
+        caller retries in both cases.
+        """
+        with self._key_lock(session_date, config_hash):
+            artifact = self.load(session_date, config_hash)
+            if artifact is not None:
+                return artifact, False
+            results = build()
+            if not results:
+                return AnalysisArtifact(session_date, config_hash, ist_now().isoformat(), []), True
+            artifact = self.save(session_date, config_hash, results)
+        self.prune(session_date)
+        return artifact, True
+
+    def prune(self, session_date: date) -> int:
+        """Delete session directories older than ``retention_days`` before ``session_date``."""
+        if not self.root.exists():
+            return 0
+        cutoff = session_date - timedelta(days=self.retention_days)
+        removed = 0
+        for entry in self.root.iterdir():
+            try:
+                entry_date = date.fromisoformat(entry.name)
+            except ValueError:
+                continue
+            if entry.is_dir() and entry_date < cutoff:
+                shutil.rmtree(entry, ignore_errors=True)
+                removed += 1
+        return removed
+
+    def _key_lock(self, session_date: date, config_hash: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault((session_date, config_hash), threading.Lock())
+
+
+_store: AnalysisArtifactStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_analysis_artifact_store(root: Path | None = None) -> AnalysisArtifactStore:
+    """Process-wide store (per-key build locks must be shared by all user threads)."""
+    global _store  # noqa: PLW0603
+    with _store_lock:
+        if _store is None:
+            if root is None:
+                root = Path(__file__).parent.parent.parent.parent / "analysis_results" / "artifacts"
+            _store = AnalysisArtifactStore(root)
+        return _store
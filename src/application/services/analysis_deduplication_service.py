@@ -43,6 +43,11 @@ def _deep_sanitize_nonfinite_floats(obj):
     return obj
 
 
+def signal_symbol(data: dict) -> str:
+    """Signals symbol for one analysis row (``symbol``, else ``ticker`` without ``.NS``)."""
+    return data.get("symbol") or data.get("ticker", "").replace(".NS", "")
+
+
 class AnalysisDeduplicationService:
     """Service for deduplicating analysis results based on trading day windows"""
 
@@ -210,6 +215,7 @@ class AnalysisDeduplicationService:
         new_signals: list[dict],
         skip_time_check: bool = False,
         metadata_only: bool = False,
+        expire_missing: bool = True,
     ) -> dict[str, int]:
         """
         Update existing signals or insert new ones with smart expiration logic.
@@ -226,6 +232,9 @@ class AnalysisDeduplicationService:
             metadata_only: If True, only refresh ML/metadata fields on existing ACTIVE buy signals;
                 no new signals are inserted and no signals are expired. Used during trading hours
                 so ML confidence stays current without disrupting the session.
+            expire_missing: If False, ACTIVE signals for symbols absent from ``new_signals`` are
+                left alone. Used when ``new_signals`` is one batch of a streamed analysis; call
+                ``expire_missing_signals`` with every streamed symbol once the run completes.
 
         Returns:
             dict with 'updated', 'inserted', 'skipped', and 'expired' counts
@@ -234,7 +243,7 @@ class AnalysisDeduplicationService:
             # During trading hours: still refresh ML metadata on existing ACTIVE buy signals
             # so Buying Zone shows current confidence without inserting/expiring anything.
             return self.deduplicate_and_update_signals(
-                new_signals, skip_time_check=True, metadata_only=True
+                new_signals, skip_time_check=True, metadata_only=True, expire_missing=expire_missing
             )
 
         # Get ALL existing signals (not just within window) to check for matches
@@ -268,7 +277,7 @@ class AnalysisDeduplicationService:
             return data.get("final_verdict") or data.get("verdict") or data.get("ml_verdict")
 
         for signal_data in new_signals:
-            symbol = signal_data.get("symbol") or signal_data.get("ticker", "").replace(".NS", "")
+            symbol = signal_symbol(signal_data)
             if not symbol:
                 skipped_count += 1
                 continue
@@ -429,11 +438,37 @@ class AnalysisDeduplicationService:
         # This is done after processing new signals to know which symbols to exclude
         # Flush pending changes (like RELIANCE timestamp update) so they're visible to the SQL query
         self.db.flush()
-        expired_from_missing = self._signals_repo.mark_old_signals_as_expired(
-            exclude_symbols=symbols_in_new_analysis
+        if expire_missing:
+            expired_count += self._signals_repo.mark_old_signals_as_expired(
+                exclude_symbols=symbols_in_new_analysis
+            )
+
+        self._commit_signals()
+
+        return {
+            "updated": updated_count,
+            "inserted": inserted_count,
+            "skipped": skipped_count,
+            "expired": expired_count,
+        }
+
+    def expire_missing_signals(self, symbols_in_analysis: set[str]) -> int:
+        """
+        Expire ACTIVE signals whose symbol is not in ``symbols_in_analysis``.
+
+        Completes a streamed analysis persisted with ``expire_missing=False`` per batch.
+
+        Returns:
+            Number of signals expired
+        """
+        self.db.flush()
+        expired = self._signals_repo.mark_old_signals_as_expired(
+            exclude_symbols=symbols_in_analysis
         )
-        expired_count += expired_from_missing
+        self._commit_signals()
+        return expired
 
+    def _commit_signals(self) -> None:
         try:
             self.db.commit()
         except Exception as commit_error:
@@ -447,13 +482,6 @@ class AnalysisDeduplicationService:
                 f"Failed to commit signals to database: {commit_error}"
             ) from commit_error
 
-        return {
-            "updated": updated_count,
-            "inserted": inserted_count,
-            "skipped": skipped_count,
-            "expired": expired_count,
-        }
-
     @staticmethod
     def _convert_boolean(value: object) -> bool | None:
         """Convert string boolean to actual boolean"""
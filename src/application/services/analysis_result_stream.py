@@ -0,0 +1,115 @@
+"""
+Streaming NDJSON channel for universe analysis results.
+
+``trade_agent.py --ndjson-output PATH`` writes one compact JSON line per ticker as soon as
+its result is final (after backtest scoring when that is enabled) instead of one indented
+JSON document at the end of the run. Buy candidates are written a second time after news
+enrichment, so readers keep the last line per ticker. A closing ``{"_stream": "end"}`` line
+marks a complete run; a stream without it belongs to a run that failed part-way.
+
+``AnalysisResultTail`` follows the file while trade_agent is still running and returns the
+complete lines appended since the previous read, so results can be persisted in batches
+while the analysis continues.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from utils.logger import logger
+
+STREAM_KEY = "_stream"
+STREAM_END = "end"
+
+
+def json_default(obj: Any) -> Any:
+    """``json.dump`` fallback for analysis rows (datetimes, sets, paths, anything else)."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, set):
+        return list(obj)
+    if isinstance(obj, Path):
+        return str(obj)
+    return str(obj)
+
+
+class AnalysisResultStreamWriter:
+    """Appends one analysis row per line; ``close`` writes the end-of-stream marker."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("w", encoding="utf-8")
+        self.count = 0
+
+    def write(self, record: dict) -> None:
+        """Write one row and flush it so a tailing reader sees it immediately."""
+        if self._file.closed or not isinstance(record, dict):
+            return
+        try:
+            line = json.dumps(
+                record, default=json_default, ensure_ascii=False, separators=(",", ":")
+            )
+            self._file.write(line + "\n")
+            self._file.flush()
+            self.count += 1
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to stream analysis result for {record.get('ticker')}: {e}")
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        try:
+            self._file.write(json.dumps({STREAM_KEY: STREAM_END, "count": self.count}) + "\n")
+            logger.info(f"Analysis results streamed to NDJSON: {self.path} ({self.count} rows)")
+        except OSError as e:
+            logger.warning(f"Failed to finish analysis results stream {self.path}: {e}")
+        finally:
+            self._file.close()
+
+
+class AnalysisResultTail:
+    """Incremental reader of a stream that may still be growing."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.offset = 0
+        self.count = 0
+        self.complete = False
+
+    def read(self) -> list[dict]:
+        """Rows on complete lines appended since the last call (a partial line waits)."""
+        try:
+            with self.path.open("rb") as f:
+                if f.seek(0, 2) < self.offset:
+                    # Rewritten by a new producer (e.g. trade_agent's sequential fallback)
+                    self.offset, self.complete = 0, False
+                f.seek(self.offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return []
+        end = chunk.rfind(b"\n")
+        if end < 0:
+            return []
+        self.offset += end + 1
+
+        rows = []
+        for raw in chunk[: end + 1].splitlines():
+            if not raw.strip():
+                continue
+            try:
+                record = json.loads(raw)
+            except (ValueError, UnicodeDecodeError) as e:
+                logger.warning(f"Skipping unreadable line in {self.path}: {e}")
+                continue
+            if not isinstance(record, dict):
+                continue
+            if record.get(STREAM_KEY) == STREAM_END:
+                self.complete = True
+                continue
+            rows.append(record)
+        self.count += len(rows)
+        return rows
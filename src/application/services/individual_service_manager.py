@@ -23,7 +23,21 @@ from sqlalchemy.orm import Session
 
 # Import trading service module at top level to avoid linting issues
 import modules.kotak_neo_auto_trader.run_trading_service as trading_service_module  # noqa: PLC0415
-from src.application.services.analysis_deduplication_service import AnalysisDeduplicationService
+from config.settings import (
+    ANALYSIS_SHARED_ARTIFACTS,
+    ANALYSIS_STREAM_BATCH_SIZE,
+    ANALYSIS_STREAM_FLUSH_INTERVAL_S,
+)
+from src.application.services.analysis_artifact_service import (
+    analysis_config_hash,
+    analysis_session_date,
+    get_analysis_artifact_store,
+)
+from src.application.services.analysis_deduplication_service import (
+    AnalysisDeduplicationService,
+    signal_symbol,
+)
+from src.application.services.analysis_result_stream import AnalysisResultTail
 from src.application.services.broker_credentials import decrypt_broker_credentials
 from src.application.services.config_converter import user_config_to_strategy_config
 from src.application.services.conflict_detection_service import ConflictDetectionService
@@ -1054,210 +1068,292 @@ class IndividualServiceManager:
                 service.running = False
 
     def _run_analysis_task(self, user_id: int) -> dict:
-        """Execute the analysis task without requiring broker credentials"""
+        """
+        Execute the analysis task without requiring broker credentials.
+
+        The universe analysis (trade_agent.py --backtest) is shared: users whose
+        analysis-relevant config hashes the same reuse one artifact per completed NSE
+        session (see analysis_artifact_service). Only persistence runs per user.
+
+        trade_agent streams one NDJSON line per ticker; rows are persisted in batches while
+        the analysis is still running, and missing signals are expired once the stream
+        completes. A reused artifact is persisted in one pass.
+        """
         logger = get_user_logger(user_id=user_id, db=self.db, module="IndividualService")
 
         try:
-            max_retries = 3
-            base_delay = 30.0  # seconds
-            timeout_seconds = 1800  # 30 minutes
-
             trade_agent_path = project_root / "trade_agent.py"
             if not trade_agent_path.exists():
                 error_msg = f"trade_agent.py not found at {trade_agent_path}. Cannot run analysis."
                 logger.error(error_msg, action="run_analysis")
                 raise FileNotFoundError(error_msg)
 
+            # Load user config (trade_agent loads the same config via TRADE_AGENT_USER_ID)
+            user_config = self._config_repo.get_or_create_default(user_id)
+            strategy_config = user_config_to_strategy_config(user_config, db_session=self.db)
+            config_hash = analysis_config_hash(strategy_config)
+            session_date = analysis_session_date() if ANALYSIS_SHARED_ARTIFACTS else None
+
             results_dir = project_root / "analysis_results"
             results_dir.mkdir(parents=True, exist_ok=True)
-            results_json_path = results_dir / "latest_results.json"
-            if results_json_path.exists():
+            # Per-hash scratch file so concurrent users never overwrite each other's output
+            results_path = results_dir / f"latest_results_{config_hash}.ndjson"
+
+            with execute_task(user_id, self.db, "analysis", logger) as task_context:
+                task_context["config_hash"] = config_hash
+                stdout_tail = None
+                # Rows are only retained when they also become the shared artifact
+                persister = _StreamingSignalPersister(
+                    self, user_id, logger, keep_rows=session_date is not None
+                )
+
+                def build_results() -> list[dict]:
+                    nonlocal stdout_tail
+                    stdout_tail = self._run_analysis_subprocess(
+                        trade_agent_path,
+                        results_path,
+                        user_id,
+                        task_context,
+                        logger,
+                        on_results=persister.add,
+                    )
+                    return persister.rows
+
+                if session_date is None:
+                    analysis_results = build_results()
+                    task_context["artifact_reused"] = False
+                else:
+                    artifact, built = get_analysis_artifact_store().get_or_build(
+                        session_date, config_hash, build_results
+                    )
+                    analysis_results = artifact.results
+                    task_context["artifact_reused"] = not built
+                    task_context["artifact_session"] = session_date.isoformat()
+                    if not built:
+                        logger.info(
+                            f"Reusing analysis artifact for session {session_date} "
+                            f"(config {config_hash}, built {artifact.built_at}, "
+                            f"{len(analysis_results)} results)",
+                            action="run_analysis",
+                            task_name="analysis",
+                        )
+
+                # Persist results for this user (subprocess/artifact already completed)
+                summary = {"processed": 0, "inserted": 0, "updated": 0, "skipped": 0}
                 try:
-                    results_json_path.unlink()
-                except OSError:
-                    logger.warning(
-                        f"Unable to remove previous analysis results file: {results_json_path}",
+                    if task_context["artifact_reused"]:
+                        summary = self._persist_analysis_results(analysis_results, logger, user_id)
+                    else:
+                        summary = persister.finish(task_context.get("stream_complete", False))
+                    logger.info(
+                        f"Analysis results persisted: {summary}",
                         action="run_analysis",
                         task_name="analysis",
                     )
+                except Exception as persist_error:
+                    # Log error but don't fail - analysis completed
+                    logger.error(
+                        f"Failed to persist analysis results "
+                        f"(but analysis completed): {persist_error}",
+                        exc_info=persist_error,
+                        action="run_analysis",
+                        task_name="analysis",
+                    )
+                    summary["error"] = str(persist_error)
 
-            # Load user config to pass to trade_agent
-            user_config = self._config_repo.get_or_create_default(user_id)
-            from src.application.services.config_converter import (
-                user_config_to_strategy_config,
+                results_count = (
+                    len(analysis_results)
+                    if task_context["artifact_reused"]
+                    else persister.results_count
+                )
+                task_context["analysis_summary"] = summary
+                task_context["results_count"] = results_count
+
+                return {
+                    "task": "analysis",
+                    "status": "completed",
+                    "stdout_tail": stdout_tail,
+                    "analysis_summary": summary,
+                    "results_count": results_count,
+                    "artifact_reused": task_context["artifact_reused"],
+                }
+
+        except Exception as e:
+            # Log the error with full context
+            logger.error(
+                f"Analysis task failed: {str(e)}",
+                exc_info=e,
+                action="run_analysis",
+                task_name="analysis",
             )
+            raise
 
-            strategy_config = user_config_to_strategy_config(user_config, db_session=self.db)
+    def _run_analysis_subprocess(  # noqa: PLR0913
+        self,
+        trade_agent_path: Path,
+        results_path: Path,
+        user_id: int,
+        task_context: dict,
+        logger,
+        on_results=None,
+    ) -> str | None:
+        """
+        Run trade_agent.py --backtest with retries; returns the stdout tail on success.
 
-            # Pass user_id as environment variable so trade_agent can load config
-            # Note: trade_agent.py will need to be updated to read user_id from env
-            import os
+        ``on_results`` is called with the rows streamed to ``results_path`` since its previous
+        call (possibly none) every ``poll_seconds`` while trade_agent runs, and once more after
+        it exits. ``task_context["stream_complete"]`` records whether the stream was finished.
+        """
+        max_retries = 3
+        base_delay = 30.0  # seconds
+        timeout_seconds = 1800  # 30 minutes
+        poll_seconds = 2.0
 
-            env = os.environ.copy()
-            env["TRADE_AGENT_USER_ID"] = str(user_id)
+        # Pass user_id as environment variable so trade_agent can load config
+        env = os.environ.copy()
+        env["TRADE_AGENT_USER_ID"] = str(user_id)
 
-            cmd = [
-                sys.executable,
-                str(trade_agent_path),
-                "--backtest",
-                "--json-output",
-                str(results_json_path),
-            ]
-            logger.info(f"Running analysis: {' '.join(cmd)}", action="run_analysis")
+        cmd = [
+            sys.executable,
+            str(trade_agent_path),
+            "--backtest",
+            "--ndjson-output",
+            str(results_path),
+        ]
+        logger.info(f"Running analysis: {' '.join(cmd)}", action="run_analysis")
 
-            with execute_task(user_id, self.db, "analysis", logger) as task_context:
-                task_context["timeout_seconds"] = timeout_seconds
-                task_context["max_retries"] = max_retries
+        task_context["timeout_seconds"] = timeout_seconds
+        task_context["max_retries"] = max_retries
 
-                for attempt in range(max_retries):
-                    try:
-                        if attempt > 0:
-                            delay = base_delay * attempt
-                            logger.info(
-                                f"Retrying analysis attempt {attempt + 1}/{max_retries} in {delay:.0f}s",
-                                action="run_analysis",
-                                task_name="analysis",
-                            )
-                            time.sleep(delay)
+        for attempt in range(max_retries):
+            try:
+                if attempt > 0:
+                    delay = base_delay * attempt
+                    logger.info(
+                        f"Retrying analysis attempt {attempt + 1}/{max_retries} in {delay:.0f}s",
+                        action="run_analysis",
+                        task_name="analysis",
+                    )
+                    time.sleep(delay)
 
-                        logger.info(
-                            "Starting analysis subprocess (trade_agent.py --backtest)",
+                if results_path.exists():
+                    try:
+                        results_path.unlink()
+                    except OSError:
+                        logger.warning(
+                            f"Unable to remove previous analysis results file: {results_path}",
                             action="run_analysis",
                             task_name="analysis",
                         )
-                        result = subprocess.run(
-                            cmd,
-                            check=False,
-                            cwd=str(project_root),
-                            capture_output=True,
-                            text=True,
-                            encoding="utf-8",
-                            errors="replace",
-                            timeout=timeout_seconds,
-                            env=env,  # Pass environment with user_id
-                        )
 
-                        task_context["return_code"] = result.returncode
-                        stdout_tail = (
-                            result.stdout[-500:]
-                            if result.stdout and len(result.stdout) > 500
-                            else result.stdout
-                        )
-                        stderr_tail = (
-                            result.stderr[-500:]
-                            if result.stderr and len(result.stderr) > 500
-                            else result.stderr
-                        )
+                logger.info(
+                    "Starting analysis subprocess (trade_agent.py --backtest)",
+                    action="run_analysis",
+                    task_name="analysis",
+                )
+                tail = AnalysisResultTail(results_path)
+                process = subprocess.Popen(
+                    cmd,
+                    cwd=str(project_root),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    env=env,  # Pass environment with user_id
+                )
+                deadline = time.monotonic() + timeout_seconds
+                while True:
+                    try:
+                        stdout, stderr = process.communicate(timeout=poll_seconds)
+                        break
+                    except subprocess.TimeoutExpired:
+                        if on_results is not None:
+                            on_results(tail.read())
+                        if time.monotonic() >= deadline:
+                            process.kill()
+                            process.communicate()
+                            raise subprocess.TimeoutExpired(cmd, timeout_seconds) from None
+                result = subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
+                if on_results is not None:
+                    on_results(tail.read())
+                task_context["stream_complete"] = tail.complete
+
+                task_context["return_code"] = result.returncode
+                stdout_tail = (
+                    result.stdout[-500:]
+                    if result.stdout and len(result.stdout) > 500
+                    else result.stdout
+                )
+                stderr_tail = (
+                    result.stderr[-500:]
+                    if result.stderr and len(result.stderr) > 500
+                    else result.stderr
+                )
 
-                        if result.returncode == 0:
-                            logger.info(
-                                "Analysis subprocess completed successfully",
-                                action="run_analysis",
-                                task_name="analysis",
-                            )
-                            task_context["success"] = True
-                            if stdout_tail:
-                                task_context["stdout_tail"] = stdout_tail
-
-                            # Load and persist results (this may take time, but subprocess already completed)
-                            analysis_results = []
-                            summary = {"processed": 0, "inserted": 0, "updated": 0, "skipped": 0}
-                            try:
-                                analysis_results = self._load_analysis_results(
-                                    results_json_path, logger
-                                )
-                                summary = self._persist_analysis_results(
-                                    analysis_results, logger, user_id
-                                )
-                                logger.info(
-                                    f"Analysis results persisted: {summary}",
-                                    action="run_analysis",
-                                    task_name="analysis",
-                                )
-                            except Exception as persist_error:
-                                # Log error but don't fail - subprocess completed
-                                logger.error(
-                                    f"Failed to persist analysis results "
-                                    f"(but subprocess completed): {persist_error}",
-                                    exc_info=persist_error,
-                                    action="run_analysis",
-                                    task_name="analysis",
-                                )
-                                summary["error"] = str(persist_error)
-
-                            task_context["analysis_summary"] = summary
-                            task_context["results_count"] = len(analysis_results)
-
-                            return {
-                                "task": "analysis",
-                                "status": "completed",
-                                "stdout_tail": stdout_tail,
-                                "analysis_summary": summary,
-                                "results_count": len(analysis_results),
-                            }
-
-                        error_msg = f"Analysis failed with return code {result.returncode}"
-                        if stderr_tail:
-                            error_msg += f"\nSTDERR (tail):\n{stderr_tail}"
-                        if stdout_tail:
-                            error_msg += f"\nSTDOUT (tail):\n{stdout_tail}"
-                        task_context["error_message"] = error_msg
-
-                        if (
-                            self._looks_like_network_error(result.stdout, result.stderr)
-                            and attempt < max_retries - 1
-                        ):
-                            logger.warning(
-                                f"{error_msg}\nDetected transient/network issue. Retrying...",
-                                action="run_analysis",
-                                task_name="analysis",
-                            )
-                            continue
+                if result.returncode == 0:
+                    logger.info(
+                        "Analysis subprocess completed successfully",
+                        action="run_analysis",
+                        task_name="analysis",
+                    )
+                    task_context["success"] = True
+                    if stdout_tail:
+                        task_context["stdout_tail"] = stdout_tail
+                    return stdout_tail
 
-                        raise RuntimeError(error_msg)
+                error_msg = f"Analysis failed with return code {result.returncode}"
+                if stderr_tail:
+                    error_msg += f"\nSTDERR (tail):\n{stderr_tail}"
+                if stdout_tail:
+                    error_msg += f"\nSTDOUT (tail):\n{stdout_tail}"
+                task_context["error_message"] = error_msg
+
+                if (
+                    self._looks_like_network_error(result.stdout, result.stderr)
+                    and attempt < max_retries - 1
+                ):
+                    logger.warning(
+                        f"{error_msg}\nDetected transient/network issue. Retrying...",
+                        action="run_analysis",
+                        task_name="analysis",
+                    )
+                    continue
 
-                    except subprocess.TimeoutExpired:
-                        timeout_msg = (
-                            f"Analysis timed out after {timeout_seconds} seconds "
-                            f"(attempt {attempt + 1}/{max_retries})"
-                        )
-                        logger.error(
-                            timeout_msg,
-                            action="run_analysis",
-                            task_name="analysis",
-                        )
-                        task_context["timeout"] = True
-                        if attempt < max_retries - 1:
-                            continue
-                        raise RuntimeError(timeout_msg)
+                raise RuntimeError(error_msg)
 
-                    except Exception as e:
-                        logger.error(
-                            f"Analysis subprocess failed: {e}",
-                            exc_info=e,
-                            action="run_analysis",
-                            task_name="analysis",
-                        )
-                        task_context["exception"] = str(e)
-                        if (
-                            isinstance(e, RuntimeError)
-                            and "network" in str(e).lower()
-                            and attempt < max_retries - 1
-                        ):
-                            continue
-                        raise
+            except subprocess.TimeoutExpired:
+                timeout_msg = (
+                    f"Analysis timed out after {timeout_seconds} seconds "
+                    f"(attempt {attempt + 1}/{max_retries})"
+                )
+                logger.error(
+                    timeout_msg,
+                    action="run_analysis",
+                    task_name="analysis",
+                )
+                task_context["timeout"] = True
+                if attempt < max_retries - 1:
+                    continue
+                raise RuntimeError(timeout_msg)
 
-                raise RuntimeError("Analysis failed after all retry attempts")
+            except Exception as e:
+                logger.error(
+                    f"Analysis subprocess failed: {e}",
+                    exc_info=e,
+                    action="run_analysis",
+                    task_name="analysis",
+                )
+                task_context["exception"] = str(e)
+                if (
+                    isinstance(e, RuntimeError)
+                    and "network" in str(e).lower()
+                    and attempt < max_retries - 1
+                ):
+                    continue
+                raise
 
-        except Exception as e:
-            # Log the error with full context
-            logger.error(
-                f"Analysis task failed: {str(e)}",
-                exc_info=e,
-                action="run_analysis",
-                task_name="analysis",
-            )
-            raise
+        raise RuntimeError("Analysis failed after all retry attempts")
 
     @staticmethod
     def _looks_like_network_error(stdout: str | None, stderr: str | None) -> bool:
@@ -1266,39 +1362,6 @@ class IndividualServiceManager:
         network_keywords = ["timeout", "connection", "socket", "network", "urllib3", "recv_into"]
         return any(keyword in combined for keyword in network_keywords)
 
-    def _load_analysis_results(self, results_path: Path, logger) -> list[dict]:
-        """Load analysis results from JSON file produced by trade_agent"""
-        if not results_path.exists():
-            logger.warning(
-                f"Analysis results JSON not found at {results_path}",
-                action="run_analysis",
-                task_name="analysis",
-            )
-            return []
-
-        try:
-            with results_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, dict) and "results" in data:
-                data = data["results"]
-            if not isinstance(data, list):
-                logger.warning(
-                    "Analysis results JSON format invalid (expected list)",
-                    action="run_analysis",
-                    task_name="analysis",
-                )
-                return []
-
-            return data
-        except Exception as e:
-            logger.error(
-                f"Failed to load analysis results JSON: {e}",
-                exc_info=e,
-                action="run_analysis",
-                task_name="analysis",
-            )
-            return []
-
     def _is_non_tradable_equity(self, ticker: str) -> bool:
         """
         Thin re-check at persist: deny non-company-equity listings.
@@ -1327,16 +1390,8 @@ class IndividualServiceManager:
                 pass
             return False
 
-    def _persist_analysis_results(
-        self, results: list[dict], logger, user_id: int | None = None
-    ) -> dict[str, int]:
-        """Persist analysis results to Signals table using smart deduplication rules"""
-        logger.info(
-            f"Starting persistence: {len(results)} results to process",
-            action="run_analysis",
-            task_name="analysis",
-        )
-
+    def _prepare_rows_for_persist(self, results: list[dict], logger) -> tuple[list[dict], int]:
+        """Normalized rows worth persisting, and how many were dropped as non-tradable"""
         processed_rows = []
         tradability_filtered_count = 0
         for row in results:
@@ -1357,6 +1412,36 @@ class IndividualServiceManager:
             normalized = self._normalize_analysis_row(row)
             if normalized:
                 processed_rows.append(normalized)
+        return processed_rows, tradability_filtered_count
+
+    @staticmethod
+    def _signal_update_gate_reason(dedup_service: AnalysisDeduplicationService) -> str:
+        """Why should_update_signals() refused a full update (for logs and the summary)"""
+        from datetime import time as time_class  # noqa: PLC0415
+
+        from src.infrastructure.db.timezone_utils import ist_now  # noqa: PLC0415
+
+        now = ist_now()
+        current_time = now.time()
+        if dedup_service.is_weekend_or_holiday(now.date()):
+            if current_time >= time_class(9, 0):
+                return "weekend/holiday (after 9AM)"
+            return "weekend/holiday (unexpected - should allow before 9AM)"
+        if time_class(9, 0) <= current_time < time_class(16, 0):
+            return f"during trading hours (9AM-4PM, current time: {now.strftime('%H:%M:%S')})"
+        return f"unexpected time restriction (current time: {now.strftime('%H:%M:%S')})"
+
+    def _persist_analysis_results(
+        self, results: list[dict], logger, user_id: int | None = None
+    ) -> dict[str, int]:
+        """Persist analysis results to Signals table using smart deduplication rules"""
+        logger.info(
+            f"Starting persistence: {len(results)} results to process",
+            action="run_analysis",
+            task_name="analysis",
+        )
+
+        processed_rows, tradability_filtered_count = self._prepare_rows_for_persist(results, logger)
 
         summary = {
             "processed": 0,  # Will be updated after actual persistence
@@ -1401,27 +1486,7 @@ class IndividualServiceManager:
             )
 
             if not should_update:
-                from datetime import time as time_class  # noqa: PLC0415
-
-                from src.infrastructure.db.timezone_utils import ist_now  # noqa: PLC0415
-
-                now = ist_now()
-                current_time = now.time()
-                reason = "unknown"
-                if dedup_service.is_weekend_or_holiday(now.date()):
-                    if current_time >= time_class(9, 0):
-                        reason = "weekend/holiday (after 9AM)"
-                    else:
-                        reason = "weekend/holiday (unexpected - should allow before 9AM)"
-                elif time_class(9, 0) <= current_time < time_class(16, 0):
-                    reason = (
-                        f"during trading hours (9AM-4PM, current time: {now.strftime('%H:%M:%S')})"
-                    )
-                else:
-                    reason = (
-                        f"unexpected time restriction (current time: {now.strftime('%H:%M:%S')})"
-                    )
-
+                reason = self._signal_update_gate_reason(dedup_service)
                 logger.info(
                     f"Signal updates gated ({reason}): running metadata-only refresh "
                     f"(ML confidence/verdict) on existing ACTIVE buy signals; "
@@ -2463,3 +2528,127 @@ class IndividualServiceManager:
         if count:
             self.db.commit()
         return count
+
+
+class _StreamingSignalPersister:
+    """
+    Persists streamed analysis rows to Signals in batches while trade_agent is running.
+
+    Whether signals may be fully updated is decided once, on the first batch; each batch is
+    then deduplicated without expiring anything, and ``finish`` expires signals missing from
+    the whole run only when the stream was complete.
+    """
+
+    def __init__(
+        self,
+        manager: IndividualServiceManager,
+        user_id: int,
+        logger,
+        *,
+        keep_rows: bool = False,
+        batch_size: int = ANALYSIS_STREAM_BATCH_SIZE,
+        flush_interval_s: float = ANALYSIS_STREAM_FLUSH_INTERVAL_S,
+    ) -> None:
+        self._manager = manager
+        self._logger = logger
+        self._keep_rows = keep_rows
+        self._batch_size = max(1, batch_size)
+        self._flush_interval_s = flush_interval_s
+        self._dedup_service = AnalysisDeduplicationService(manager.db, user_id=user_id)
+        self._metadata_only: bool | None = None
+        self._pending: dict[str, dict] = {}
+        self._last_flush = time.monotonic()
+        self._rows_by_ticker: dict[str, dict] = {}
+        self._tickers: set[str] = set()
+        self._symbols: set[str] = set()
+        self.summary = {
+            "processed": 0,
+            "inserted": 0,
+            "updated": 0,
+            "skipped": 0,
+            "expired": 0,
+            "tradability_filtered": 0,
+            "batches": 0,
+        }
+
+    @property
+    def rows(self) -> list[dict]:
+        """Last streamed row per ticker (empty unless ``keep_rows``)"""
+        return list(self._rows_by_ticker.values())
+
+    @property
+    def results_count(self) -> int:
+        return len(self._tickers)
+
+    def add(self, results: list[dict]) -> None:
+        """Queue newly streamed rows; flushes a full batch or when the interval has elapsed"""
+        for row in results:
+            ticker = row.get("ticker") or row.get("symbol")
+            if ticker:
+                self._tickers.add(ticker)
+                if self._keep_rows:
+                    self._rows_by_ticker[ticker] = row
+        rows, filtered = self._manager._prepare_rows_for_persist(results, self._logger)
+        self.summary["tradability_filtered"] += filtered
+        self.summary["skipped"] += len(results) - len(rows)
+        for row in rows:
+            # A ticker streamed again (after news enrichment) replaces its pending row
+            self._pending[signal_symbol(row)] = row
+        if len(self._pending) >= self._batch_size or (
+            self._pending and time.monotonic() - self._last_flush >= self._flush_interval_s
+        ):
+            self._flush()
+
+    def _flush(self) -> None:
+        batch = list(self._pending.values())
+        self._pending.clear()
+        self._last_flush = time.monotonic()
+        if not batch or "error" in self.summary:
+            return
+        try:
+            if self._metadata_only is None:
+                self._metadata_only = not self._dedup_service.should_update_signals()
+                if self._metadata_only:
+                    reason = self._manager._signal_update_gate_reason(self._dedup_service)
+                    self.summary["skipped_reason"] = reason
+                    self._logger.info(
+                        f"Signal updates gated ({reason}): running metadata-only refresh "
+                        f"(ML confidence/verdict) on existing ACTIVE buy signals; "
+                        f"no new signals inserted.",
+                        action="run_analysis",
+                        task_name="analysis",
+                    )
+            counts = self._dedup_service.deduplicate_and_update_signals(
+                batch,
+                skip_time_check=True,
+                metadata_only=self._metadata_only,
+                expire_missing=False,
+            )
+        except Exception as e:
+            self._logger.error(
+                f"Failed to persist analysis results batch: {e}",
+                exc_info=e,
+                action="run_analysis",
+                task_name="analysis",
+            )
+            self.summary["error"] = str(e)
+            return
+        self._symbols.update(signal_symbol(row) for row in batch)
+        for key in ("inserted", "updated", "skipped"):
+            self.summary[key] += counts.get(key, 0)
+        self.summary["processed"] = self.summary["inserted"] + self.summary["updated"]
+        self.summary["batches"] += 1
+
+    def finish(self, complete: bool) -> dict:
+        """Flush the last batch; expire missing signals only after a complete stream"""
+        self._flush()
+        if "error" not in self.summary:
+            if not complete:
+                self._logger.warning(
+                    "Analysis results stream incomplete: not expiring missing signals",
+                    action="run_analysis",
+                    task_name="analysis",
+                )
+            elif self._symbols:
+                self.summary["expired"] = self._dedup_service.expire_missing_signals(self._symbols)
+        return self.summary
@@ -7,6 +7,7 @@ from pathlib import Path
 from sqlalchemy.orm import Session
 
 from src.infrastructure.db.timezone_utils import ist_now
+from src.infrastructure.logging.log_index import index_path_for
 from src.infrastructure.persistence.error_log_repository import ErrorLogRepository
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,7 @@ class LogRetentionService:
                 file_date = datetime.strptime(date_part, "%Y%m%d").date()
                 if file_date < cutoff_date:
                     path.unlink(missing_ok=True)
+                    index_path_for(path).unlink(missing_ok=True)
                     removed += 1
             except Exception as exc:  # noqa: BLE001
                 logger.debug("Failed to prune log file %s: %s", path, exc, exc_info=False)
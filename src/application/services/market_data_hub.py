@@ -0,0 +1,319 @@
+"""
+Process-wide market data hub shared by all per-user trading services.
+
+``MultiUserTradingService`` runs one scheduler thread per user, and every sell-monitor
+cycle (paper and broker) used to fetch the daily OHLCV frame and recompute RSI10 for each of
+that user's positions. With many users holding the same stock, the same data was fetched and
+the same indicator computed once per user per cycle. The hub is attached to the
+process-wide ``PriceService`` (``get_market_snapshot``/``set_market_data_subscriptions``),
+which ``IndicatorService`` and both trade modes' sell monitors read through.
+
+The hub keeps one subscription set per subscriber (user), reference-counted per ticker. The
+first caller after the poll interval polls every subscribed ticker once and computes the
+indicators once per ticker; concurrent callers wait for that poll instead of
+starting their own, and every user reads the same ``MarketSnapshot``. Yahoo/cache reads per
+interval become O(unique tickers) instead of O(users x tickers).
+
+The interval is ``MARKET_DATA_HUB_MARKET_HOURS_INTERVAL_S`` (15s) during market hours, so
+exit checks never see a live bar older than the market-hours OHLCV cache TTL, and
+``MARKET_DATA_HUB_INTERVAL_S`` otherwise.
+
+The poll lock only elects the leader for an interval; tickers are fetched on a bounded pool
+with no lock held, and callers wanting a ticker another thread is fetching wait for that
+fetch to publish.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+
+from config.settings import (
+    MARKET_DATA_HUB_FETCH_WORKERS,
+    MARKET_DATA_HUB_INTERVAL_S,
+    MARKET_DATA_HUB_MARKET_HOURS_INTERVAL_S,
+)
+from utils.logger import logger
+
+SNAPSHOT_DAYS = 200
+RSI_PERIOD = 10
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """Daily OHLCV (including the current session) and indicators for one ticker."""
+
+    ticker: str
+    data: pd.DataFrame
+    rsi10: float | None
+    fetched_at: float
+
+    @property
+    def latest(self) -> pd.Series:
+        return self.data.iloc[-1]
+
+
+def _default_fetch(ticker: str) -> pd.DataFrame | None:
+    from core.data_fetcher import get_cached_ohlcv  # noqa: PLC0415
+
+    return get_cached_ohlcv(ticker, days=SNAPSHOT_DAYS, interval="1d", add_current_day=True)
+
+
+def build_snapshot(ticker: str, data: pd.DataFrame | None) -> MarketSnapshot | None:
+    """Compute the shared indicators for a fetched frame (None when there is no data)."""
+    if data is None or data.empty:
+        return None
+    import pandas_ta as ta  # noqa: PLC0415
+
+    frame = data.copy()
+    rsi10 = None
+    rsi = ta.rsi(frame["close"], length=RSI_PERIOD) if "close" in frame.columns else None
+    if rsi is not None:
+        frame["rsi10"] = rsi
+        if not pd.isna(rsi.iloc[-1]):
+            rsi10 = float(rsi.iloc[-1])
+    return MarketSnapshot(ticker=ticker, data=frame, rsi10=rsi10, fetched_at=time.monotonic())
+
+
+class MarketDataHub:
+    """
+    Shared, reference-counted market data snapshots.
+
+    Thread-safe. Snapshots are immutable from the hub's point of view: callers must copy
+    ``snapshot.data`` before mutating it.
+    """
+
+    def __init__(
+        self,
+        interval_s: float | None = None,
+        fetch_fn: Callable[[str], pd.DataFrame | None] | None = None,
+        max_workers: int | None = None,
+        market_hours_interval_s: float | None = None,
+    ):
+        """
+        Args:
+            interval_s: Minimum seconds between polls of a ticker
+                (default ``MARKET_DATA_HUB_INTERVAL_S``)
+            market_hours_interval_s: Upper bound for the interval during market hours
+                (default ``MARKET_DATA_HUB_MARKET_HOURS_INTERVAL_S``)
+            fetch_fn: ``fn(ticker) -> DataFrame`` for daily OHLCV including today
+                (default ``get_cached_ohlcv`` with 200 days)
+            max_workers: Concurrent fetches per poll (default ``MARKET_DATA_HUB_FETCH_WORKERS``)
+        """
+        self.interval_s = MARKET_DATA_HUB_INTERVAL_S if interval_s is None else interval_s
+        self.market_hours_interval_s = (
+            MARKET_DATA_HUB_MARKET_HOURS_INTERVAL_S
+            if market_hours_interval_s is None
+            else market_hours_interval_s
+        )
+        self.max_workers = max(1, max_workers or MARKET_DATA_HUB_FETCH_WORKERS)
+        self._fetch_fn = fetch_fn or _default_fetch
+        self._lock = threading.Lock()  # subscriptions, snapshots, in-flight fetches, stats
+        self._poll_lock = threading.Lock()  # elects one poll leader per interval
+        self._subscriptions: dict[Any, set[str]] = {}
+        self._ref_counts: dict[str, int] = {}
+        self._snapshots: dict[str, MarketSnapshot] = {}
+        self._inflight: dict[str, threading.Event] = {}  # set once the ticker is published
+        self._last_poll: float | None = None
+        self._stats = {"polls": 0, "fetches": 0, "fetch_errors": 0, "snapshot_reads": 0}
+
+    # ===== SUBSCRIPTIONS =====
+
+    def set_subscriptions(self, subscriber_id: Any, tickers: Iterable[str]) -> None:
+        """Replace the tickers ``subscriber_id`` (e.g. a user ID) is interested in."""
+        new = {t for t in tickers if t}
+        with self._lock:
+            old = self._subscriptions.get(subscriber_id, set())
+            for ticker in new - old:
+                self._ref_counts[ticker] = self._ref_counts.get(ticker, 0) + 1
+            for ticker in old - new:
+                self._release(ticker)
+            if new:
+                self._subscriptions[subscriber_id] = new
+            else:
+                self._subscriptions.pop(subscriber_id, None)
+
+    def unsubscribe(self, subscriber_id: Any) -> None:
+        """Drop all of ``subscriber_id``'s subscriptions (e.g. when its service stops)."""
+        self.set_subscriptions(subscriber_id, ())
+
+    def _release(self, ticker: str) -> None:
+        """Decrement a ticker's reference count (assumes lock held)."""
+        count = self._ref_counts.get(ticker, 0) - 1
+        if count > 0:
+            self._ref_counts[ticker] = count
+        else:
+            self._ref_counts.pop(ticker, None)
+            self._snapshots.pop(ticker, None)
+
+    def subscribed_tickers(self) -> dict[str, int]:
+        """Subscribed tickers with their subscriber counts."""
+        with self._lock:
+            return dict(self._ref_counts)
+
+    # ===== SNAPSHOTS =====
+
+    def get_snapshots(self, tickers: Iterable[str]) -> dict[str, MarketSnapshot]:
+        """
+        Current snapshots for ``tickers``, polling first when the interval has elapsed.
+
+        Tickers not subscribed by anyone are fetched on demand and cached for the interval.
+        Tickers without data are missing from the result.
+        """
+        wanted = list(dict.fromkeys(t for t in tickers if t))
+        self.poll()
+        interval_s = self.current_interval_s()
+        with self._lock:
+            self._stats["snapshot_reads"] += len(wanted)
+            missing = [t for t in wanted if not self._is_fresh(self._snapshots.get(t), interval_s)]
+        if missing:
+            self._fetch_into_cache(missing)
+        with self._lock:
+            return {t: self._snapshots[t] for t in wanted if t in self._snapshots}
+
+    def get_snapshot(self, ticker: str) -> MarketSnapshot | None:
+        return self.get_snapshots([ticker]).get(ticker)
+
+    def poll(self, force: bool = False) -> int:
+        """
+        Refresh every subscribed ticker once per interval (one shared poll for all users).
+
+        Returns:
+            Number of tickers fetched by this call (0 when the previous poll is still fresh)
+        """
+        with self._poll_lock:
+            now = time.monotonic()
+            interval_s = self.current_interval_s()
+            if not force and self._last_poll is not None and now - self._last_poll < interval_s:
+                return 0
+            self._last_poll = now
+            with self._lock:
+                # Tickers fetched on demand within this interval are still fresh
+                tickers = [
+                    t
+                    for t in self._ref_counts
+                    if not self._is_fresh(self._snapshots.get(t), interval_s)
+                ]
+                # Expired on-demand snapshots nobody subscribes to
+                for ticker in [t for t in self._snapshots if t not in self._ref_counts]:
+                    if not self._is_fresh(self._snapshots[ticker], interval_s):
+                        del self._snapshots[ticker]
+                self._stats["polls"] += 1
+        return self._fetch_into_cache(tickers) if tickers else 0
+
+    def current_interval_s(self) -> float:
+        """Poll interval now: at most ``market_hours_interval_s`` during market hours."""
+        from core.volume_analysis import is_market_hours  # noqa: PLC0415
+
+        if is_market_hours():
+            return min(self.interval_s, self.market_hours_interval_s)
+        return self.interval_s
+
+    @staticmethod
+    def _is_fresh(snapshot: MarketSnapshot | None, interval_s: float) -> bool:
+        return snapshot is not None and time.monotonic() - snapshot.fetched_at < interval_s
+
+    def _fetch_into_cache(self, tickers: list[str]) -> int:
+        """
+        Fetch and publish snapshots for stale ``tickers`` outside any lock.
+
+        Tickers already being fetched by another thread are not fetched again; this call
+        waits for that fetch to publish instead.
+
+        Returns:
+            Number of tickers fetched by this call
+        """
+        done = threading.Event()
+        with self._lock:
+            interval_s = self.current_interval_s()
+            stale = [t for t in tickers if not self._is_fresh(self._snapshots.get(t), interval_s)]
+            waits = {self._inflight[t] for t in stale if t in self._inflight}
+            mine = [t for t in stale if t not in self._inflight]
+            for ticker in mine:
+                self._inflight[ticker] = done
+
+        if mine:
+            started = time.perf_counter()
+            results: dict[str, MarketSnapshot | None | Exception] = {}
+            try:
+                if len(mine) == 1 or self.max_workers == 1:
+                    results = {t: self._fetch_one(t) for t in mine}
+                else:
+                    workers = min(self.max_workers, len(mine))
+                    with ThreadPoolExecutor(
+                        max_workers=workers, thread_name_prefix="market-data-hub"
+                    ) as pool:
+                        results = dict(zip(mine, pool.map(self._fetch_one, mine), strict=True))
+            finally:
+                self._publish(mine, results)
+                done.set()
+            logger.debug(
+                "Market data hub refreshed %s/%s ticker(s) in %.2fs",
+                sum(isinstance(r, MarketSnapshot) for r in results.values()),
+                len(mine),
+                time.perf_counter() - started,
+            )
+
+        for event in waits:
+            event.wait()
+        return len(mine)
+
+    def _fetch_one(self, ticker: str) -> MarketSnapshot | None | Exception:
+        try:
+            return build_snapshot(ticker, self._fetch_fn(ticker))
+        except Exception as e:
+            logger.debug("Market data hub fetch failed for %s: %s", ticker, e)
+            return e
+
+    def _publish(
+        self, tickers: list[str], results: dict[str, MarketSnapshot | None | Exception]
+    ) -> None:
+        with self._lock:
+            for ticker in tickers:
+                self._inflight.pop(ticker, None)
+                if ticker not in results:
+                    continue
+                result = results[ticker]
+                if isinstance(result, Exception):
+                    self._stats["fetch_errors"] += 1
+                    continue
+                self._stats["fetches"] += 1
+                if result is not None:
+                    self._snapshots[ticker] = result
+
+    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                **self._stats,
+                "subscribers": len(self._subscriptions),
+                "tickers": len(self._ref_counts),
+            }
+
+    def clear(self) -> None:
+        """Drop all subscriptions and snapshots."""
+        with self._lock:
+            self._subscriptions.clear()
+            self._ref_counts.clear()
+            self._snapshots.clear()
+            self._last_poll = None
+
+
+# Singleton instance
+_market_data_hub: MarketDataHub | None = None
+_market_data_hub_lock = threading.Lock()
+
+
+def get_market_data_hub() -> MarketDataHub:
+    """Get or create the process-wide ``MarketDataHub``."""
+    global _market_data_hub  # noqa: PLW0603
+
+    with _market_data_hub_lock:
+        if _market_data_hub is None:
+            _market_data_hub = MarketDataHub()
+        return _market_data_hub
@@ -18,6 +18,7 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 import modules.kotak_neo_auto_trader.run_trading_service as trading_service_module
+from modules.kotak_neo_auto_trader.services import get_price_service
 from services.notification_preference_service import (
     NotificationEventType,
     NotificationPreferenceService,
@@ -27,6 +28,7 @@ from src.application.services.broker_credentials import (
     decrypt_broker_credentials,
 )
 from src.application.services.config_converter import user_config_to_strategy_config
+from src.application.services.market_data_hub import get_market_data_hub
 from src.application.services.paper_trading_service_adapter import PaperTradingServiceAdapter
 from src.application.services.schedule_manager import ScheduleManager
 from src.application.services.service_lifecycle_generation import (
@@ -1210,6 +1212,10 @@ class MultiUserTradingService:
 
                 service_generation = bump_service_generation(user_id)
 
+                # Share one market data poll/RSI10 pass per ticker across all users' engines:
+                # the process-wide PriceService/IndicatorService serve both trade modes
+                get_price_service(enable_caching=True).market_data_hub = get_market_data_hub()
+
                 # Create appropriate service based on mode
                 if settings.trade_mode.value == "paper":
                     # Paper trading mode - use PaperTradingServiceAdapter
@@ -1367,6 +1373,9 @@ class MultiUserTradingService:
                         # Thread stopped successfully - clear lock_id if still present
                         self._lock_keys.pop(user_id, None)
 
+                # Release this user's market data subscriptions
+                get_market_data_hub().unsubscribe(user_id)
+
                 # Clean up temporary env file (Phase 2.4)
                 if user_id in self._temp_env_files:
                     temp_file = self._temp_env_files[user_id]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import date
 
 from sqlalchemy.orm import Session
@@ -17,7 +18,7 @@ from src.application.services.ohlcv_fetch_validation import validate_yahoo_ohlcv
 from src.infrastructure.data_providers.nse_bhavcopy_fetcher import (
     NseBhavcopyFetcher,
     NseEquityBar,
-    find_equity_bar,
+    index_equity_bars,
 )
 from src.infrastructure.data_providers.nse_symbol import (
     base_from_cache_ticker,
@@ -79,53 +80,116 @@ class NseBhavcopyIngestService:
         if not cache_ticker:
             logger.error("NSE ingest: invalid ticker %s", ticker)
             return 0
+        return self.fill_symbols_range([cache_ticker], start_date, end_date).get(cache_ticker, 0)
 
-        base = base_from_cache_ticker(cache_ticker)
-        total = 0
-        missing_days = 0
+    def fill_symbols_range(
+        self, tickers: list[str], start_date: date, end_date: date
+    ) -> dict[str, int]:
+        """
+        Bulk gap-fill: upsert missing NSE bars for many symbols across [start, end].
 
-        days_to_fetch = filter_nse_intraday_gap_dates(
-            self.repo.get_missing_trading_dates(
-                cache_ticker, start_date, end_date, interval=DEFAULT_INTERVAL
-            )
+        Missing ``(symbol, trade_date)`` pairs are grouped by trade date so each bhavcopy
+        is downloaded and parsed once (symbol-indexed) and written with one ``upsert_many``
+        per day, instead of once per symbol per day. ``ohlcv_symbol_meta`` is refreshed in
+        bulk at the end, then each symbol's coverage validation is recorded.
+
+        Args:
+            tickers: Cache tickers (``*.NS``) or bases; invalid entries are skipped.
+            start_date: First calendar date to fill.
+            end_date: Last calendar date to fill.
+
+        Returns:
+            Rows upserted per cache ticker (0 for symbols that needed nothing).
+        """
+        cache_tickers: list[str] = []
+        for ticker in tickers:
+            cache_ticker = ensure_cache_ticker(ticker)
+            if not cache_ticker:
+                logger.error("NSE ingest: invalid ticker %s", ticker)
+            elif cache_ticker not in cache_tickers:
+                cache_tickers.append(cache_ticker)
+        if not cache_tickers:
+            return {}
+
+        symbols_by_day = self._missing_symbols_by_day(cache_tickers, start_date, end_date)
+        totals = dict.fromkeys(cache_tickers, 0)
+        missing_days = dict.fromkeys(cache_tickers, 0)
+        today_ist = ist_now().date()
+        today_upserted = False
+        for trade_day in sorted(symbols_by_day):
+            rows = self._bhavcopy_rows_for_day(trade_day, symbols_by_day[trade_day], missing_days)
+            if not rows:
+                continue
+            self.repo.upsert_many(rows)
+            for row in rows:
+                totals[row["symbol"]] += 1
+            if trade_day == today_ist:
+                today_upserted = True
+
+        if today_upserted:
+            mark_nse_bhavcopy_published_for_today()
+
+        fetched = {t for day_tickers in symbols_by_day.values() for t in day_tickers}
+        self._record_post_validation(
+            cache_tickers, start_date, end_date, fetched, totals, missing_days
         )
-        if not days_to_fetch:
+        if len(cache_tickers) > 1:
             logger.info(
-                "NSE fill_symbol_range %s: no missing trading days in [%s, %s]; skipping bhavcopy fetch",
-                cache_ticker,
-                start_date,
-                end_date,
+                "NSE fill_symbols_range: %s symbol(s), %s bhavcopy day(s), upserted=%s",
+                len(cache_tickers),
+                len(symbols_by_day),
+                sum(totals.values()),
             )
-            self.repo.refresh_symbol_meta(cache_ticker, interval=DEFAULT_INTERVAL)
-            from src.application.services.ohlcv_fetch_validation import validate_cached_symbol
+        return totals
 
-            post = validate_cached_symbol(
-                self.repo, cache_ticker, start_date, end_date, interval=DEFAULT_INTERVAL
-            )
-            self.repo.record_fetch_validation(
-                cache_ticker,
-                DEFAULT_INTERVAL,
-                fetch_status=post.status,
-                coverage_pct=post.coverage_pct,
-                message=post.message,
+    def _missing_symbols_by_day(
+        self, cache_tickers: list[str], start_date: date, end_date: date
+    ) -> dict[date, list[str]]:
+        """Invert per-symbol missing trading dates into ``{trade_date: [cache_ticker, ...]}``."""
+        symbols_by_day: dict[date, list[str]] = defaultdict(list)
+        for cache_ticker in cache_tickers:
+            missing = filter_nse_intraday_gap_dates(
+                self.repo.get_missing_trading_dates(
+                    cache_ticker, start_date, end_date, interval=DEFAULT_INTERVAL
+                )
             )
-            return 0
+            if not missing:
+                logger.info(
+                    "NSE fill_symbol_range %s: no missing trading days in [%s, %s]; "
+                    "skipping bhavcopy fetch",
+                    cache_ticker,
+                    start_date,
+                    end_date,
+                )
+            for trade_day in missing:
+                symbols_by_day[trade_day].append(cache_ticker)
+        return symbols_by_day
 
-        today_ist = ist_now().date()
-        today_upserted = False
-        for trade_day in days_to_fetch:
-            df = self.fetcher.download_bhavcopy(trade_day)
-            if df is None or df.empty:
-                missing_days += 1
-                continue
-            bar = find_equity_bar(df, base)
+    def _bhavcopy_rows_for_day(
+        self, trade_day: date, cache_tickers: list[str], missing_days: dict[str, int]
+    ) -> list[dict]:
+        """
+        Download and index one bhavcopy, returning validated upsert rows for ``cache_tickers``.
+
+        Symbols with no usable row are counted in ``missing_days``.
+        """
+        df = self.fetcher.download_bhavcopy(trade_day)
+        if df is None or df.empty:
+            for cache_ticker in cache_tickers:
+                missing_days[cache_ticker] += 1
+            return []
+
+        bases = {t: base_from_cache_ticker(t).upper() for t in cache_tickers}
+        bars = index_equity_bars(df, set(bases.values()))
+        rows: list[dict] = []
+        for cache_ticker in cache_tickers:
+            bar = bars.get(bases[cache_ticker])
             if bar is None:
-                missing_days += 1
+                missing_days[cache_ticker] += 1
                 continue
             row = _bar_to_upsert_row(cache_ticker, bar)
-            frame = _rows_to_frame([row])
             validation = validate_yahoo_ohlcv_frame(
-                frame,
+                _rows_to_frame([row]),
                 symbol=cache_ticker,
                 interval=DEFAULT_INTERVAL,
                 start_date=trade_day,
@@ -139,36 +203,49 @@ class NseBhavcopyIngestService:
                     validation.message,
                 )
                 continue
-            total += self.repo.upsert_many([row])
-            if trade_day == today_ist:
-                today_upserted = True
+            rows.append(row)
+        return rows
 
-        if today_upserted:
-            mark_nse_bhavcopy_published_for_today()
-
-        self.repo.refresh_symbol_meta(cache_ticker, interval=DEFAULT_INTERVAL)
+    def _record_post_validation(  # noqa: PLR0913
+        self,
+        cache_tickers: list[str],
+        start_date: date,
+        end_date: date,
+        fetched: set[str],
+        totals: dict[str, int],
+        missing_days: dict[str, int],
+    ) -> None:
+        """Bulk-refresh symbol meta, then record coverage validation per symbol (one commit)."""
         from src.application.services.ohlcv_fetch_validation import validate_cached_symbol
 
-        post = validate_cached_symbol(
-            self.repo, cache_ticker, start_date, end_date, interval=DEFAULT_INTERVAL
-        )
-        self.repo.record_fetch_validation(
-            cache_ticker,
-            DEFAULT_INTERVAL,
-            fetch_status=post.status,
-            coverage_pct=post.coverage_pct,
-            message=post.message
-            if post.status != "failed"
-            else f"NSE ingest: {missing_days} trading day(s) without bhavcopy row; {post.message}",
-        )
-        logger.info(
-            "NSE fill_symbol_range %s: upserted=%s missing_days=%s status=%s",
-            cache_ticker,
-            total,
-            missing_days,
-            post.status,
-        )
-        return total
+        self.repo.refresh_symbol_meta_many(cache_tickers, interval=DEFAULT_INTERVAL)
+        for cache_ticker in cache_tickers:
+            post = validate_cached_symbol(
+                self.repo, cache_ticker, start_date, end_date, interval=DEFAULT_INTERVAL
+            )
+            message = post.message
+            if post.status == "failed" and cache_ticker in fetched:
+                message = (
+                    f"NSE ingest: {missing_days[cache_ticker]} trading day(s) without "
+                    f"bhavcopy row; {post.message}"
+                )
+            self.repo.record_fetch_validation(
+                cache_ticker,
+                DEFAULT_INTERVAL,
+                fetch_status=post.status,
+                coverage_pct=post.coverage_pct,
+                message=message,
+                commit=False,
+            )
+            if cache_ticker in fetched:
+                logger.info(
+                    "NSE fill_symbol_range %s: upserted=%s missing_days=%s status=%s",
+                    cache_ticker,
+                    totals[cache_ticker],
+                    missing_days[cache_ticker],
+                    post.status,
+                )
+        self.db.commit()
 
     def ingest_trading_day(
         self,
@@ -35,12 +35,15 @@ def apply_ohlcv_ops_fields(
     symbol: str,
     *,
     cache_health_override: str | None = None,
+    backtest_yahoo_calls: int | None = None,
 ) -> None:
     """
     Set ``cache_health_status`` and ``yahoo_calls`` on a bulk analysis result dict.
 
     ``yahoo_calls`` sums analysis-phase calls (if recorded) plus backtest-phase calls
-    since the last ``reset_symbol_yahoo_counter()`` before backtest.
+    since the last ``reset_symbol_yahoo_counter()`` before backtest. Pass
+    ``backtest_yahoo_calls`` when the backtest ran in another process (the local
+    counter did not see those calls).
     """
     if not isinstance(result, dict):
         return
@@ -52,7 +55,10 @@ def apply_ohlcv_ops_fields(
         result["cache_health_status"] = _read_cache_health_status(ticker)
 
     analysis_calls = int(result.pop(_ANALYSIS_YAHOO_KEY, 0) or 0)
-    backtest_calls = get_ohlcv_cache_stats().get("yahoo_calls", 0)
+    if backtest_yahoo_calls is None:
+        backtest_calls = get_ohlcv_cache_stats().get("yahoo_calls", 0)
+    else:
+        backtest_calls = backtest_yahoo_calls
     result["yahoo_calls"] = analysis_calls + backtest_calls
 
 
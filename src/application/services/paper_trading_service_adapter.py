@@ -14,11 +14,13 @@ from typing import Any
 
 import pandas as pd
 
+from config.settings import paper_trading_dir
 from modules.kotak_neo_auto_trader.config.paper_trading_config import PaperTradingConfig
 from modules.kotak_neo_auto_trader.infrastructure.broker_adapters import (
     PaperTradingBrokerAdapter,
 )
 from modules.kotak_neo_auto_trader.infrastructure.simulation import PaperTradeReporter
+from src.application.services.market_data_hub import MarketDataHub
 from src.infrastructure.db.timezone_utils import ist_now, ist_now_naive
 from src.infrastructure.logging import get_user_logger
 
@@ -116,7 +118,7 @@ class PaperTradingServiceAdapter:
 
         # Set storage path to user-specific if not provided
         if storage_path is None:
-            storage_path = f"paper_trading/user_{user_id}"
+            storage_path = paper_trading_dir(f"user_{user_id}")
 
         self.initial_capital = initial_capital
         self.storage_path = storage_path
@@ -1572,14 +1574,31 @@ class PaperTradingServiceAdapter:
 
         from core.data_fetcher import fetch_ohlcv_yf
 
+        # Shared MarketDataHub on the process-wide PriceService (multi-user service): one
+        # daily OHLCV fetch and RSI10 per ticker per interval across all users
+        shared = isinstance(getattr(self.price_service, "market_data_hub", None), MarketDataHub)
+        if shared:
+            self.price_service.set_market_data_subscriptions(
+                self.user_id,
+                [
+                    info.get("ticker")
+                    for symbol, info in self.active_sell_orders.items()
+                    if symbol not in symbols_to_remove
+                ],
+            )
+
         for symbol, order_info in list(self.active_sell_orders.items()):
             if symbol in symbols_to_remove:
                 continue
             try:
                 ticker = order_info["ticker"]
 
-                # Fetch recent data for RSI exit and today's-session guard (60 days)
-                data = fetch_ohlcv_yf(ticker, days=60, interval="1d")
+                snapshot = self.price_service.get_market_snapshot(ticker) if shared else None
+                if shared:
+                    data = snapshot.data if snapshot is not None else None
+                else:
+                    # Fetch recent data for RSI exit and today's-session guard (60 days)
+                    data = fetch_ohlcv_yf(ticker, days=60, interval="1d")
 
                 if data is None or data.empty:
                     continue
@@ -1629,7 +1648,7 @@ class PaperTradingServiceAdapter:
                 if symbol in self.converted_to_market:
                     continue
 
-                rsi10 = self._get_current_rsi10_paper(symbol, ticker)
+                rsi10 = self._get_current_rsi10_paper(symbol, ticker, snapshot=snapshot)
                 RSI_EXIT_THRESHOLD = 50  # From backtest: 10% of exits, 37% win rate
 
                 if rsi10 is not None and rsi10 > RSI_EXIT_THRESHOLD:
@@ -1855,7 +1874,7 @@ class PaperTradingServiceAdapter:
             )
             return None
 
-    def _get_current_rsi10_paper(self, symbol: str, ticker: str) -> float | None:
+    def _get_current_rsi10_paper(self, symbol: str, ticker: str, snapshot=None) -> float | None:
         """
         Get current RSI10 value with real-time calculation and fallback to cache (paper trading).
 
@@ -1866,6 +1885,7 @@ class PaperTradingServiceAdapter:
         Args:
             symbol: Stock symbol (for cache lookup)
             ticker: Stock ticker (e.g., 'RELIANCE.NS')
+            snapshot: Optional shared ``MarketSnapshot`` (RSI10 already computed by the hub)
 
         Returns:
             Current RSI10 value, or None if unavailable
@@ -1875,8 +1895,13 @@ class PaperTradingServiceAdapter:
 
             from core.data_fetcher import fetch_ohlcv_yf
 
-            # Try to get real-time RSI10 (include current day)
-            data = fetch_ohlcv_yf(ticker, days=200, interval="1d", add_current_day=True)
+            if snapshot is not None:
+                current_rsi = snapshot.rsi10
+                data = None
+            else:
+                # Try to get real-time RSI10 (include current day)
+                data = fetch_ohlcv_yf(ticker, days=200, interval="1d", add_current_day=True)
+                current_rsi = None
 
             if data is not None and not data.empty:
                 # Calculate RSI
@@ -1887,14 +1912,14 @@ class PaperTradingServiceAdapter:
                     latest = data.iloc[-1]
                     current_rsi = latest.get("rsi10", None)
 
-                    if current_rsi is not None and not pd.isna(current_rsi):
-                        # Update cache with real-time value
-                        self.rsi10_cache[symbol] = float(current_rsi)
-                        self.logger.debug(
-                            f"Updated RSI10 cache for {symbol} with real-time value: {current_rsi:.2f}",
-                            action="_get_current_rsi10_paper",
-                        )
-                        return float(current_rsi)
+            if current_rsi is not None and not pd.isna(current_rsi):
+                # Update cache with real-time value
+                self.rsi10_cache[symbol] = float(current_rsi)
+                self.logger.debug(
+                    f"Updated RSI10 cache for {symbol} with real-time value: {current_rsi:.2f}",
+                    action="_get_current_rsi10_paper",
+                )
+                return float(current_rsi)
         except Exception as e:
             self.logger.debug(
                 f"Error calculating real-time RSI10 for {symbol}: {e}",
@@ -11,6 +11,7 @@ from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.infrastructure.db.models import PnlDaily, Positions
+from src.infrastructure.db.timezone_utils import day_range
 from src.infrastructure.persistence.pnl_repository import PnlRepository
 
 logger = logging.getLogger(__name__)
@@ -59,8 +60,7 @@ class PnlDailySyncService:
         """
         start = date(year, month, 1)
         end = date(year, month, monthrange(year, month)[1])
-        start_dt = datetime.combine(start, datetime.min.time())
-        end_dt = datetime.combine(end, datetime.max.time())
+        start_dt, end_dt = day_range(start, end)
 
         positions = list(
             self.db.execute(
@@ -68,7 +68,7 @@ class PnlDailySyncService:
                     Positions.user_id == user_id,
                     Positions.closed_at.isnot(None),
                     Positions.closed_at >= start_dt,
-                    Positions.closed_at <= end_dt,
+                    Positions.closed_at < end_dt,
                     Positions.realized_pnl.isnot(None),
                 )
             ).scalars()
@@ -1,7 +1,8 @@
 """
 NSE UDiFF daily bhavcopy fetcher (capital market EOD ``_F_0000`` files).
 
-Downloads one zip per calendar day, caches CSV on disk, parses tradeable equity OHLCV rows.
+Downloads one zip per calendar day, caches it in the columnar on-disk store
+(``nse_bhavcopy_store``), parses tradeable equity OHLCV rows.
 """
 
 from __future__ import annotations
@@ -12,7 +13,7 @@ import zipfile
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 import urllib.error
@@ -27,6 +28,9 @@ from config.settings import (
 )
 from utils.logger import logger
 
+if TYPE_CHECKING:
+    from src.infrastructure.data_providers.nse_bhavcopy_store import NseBhavcopyStore
+
 NSE_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -186,6 +190,54 @@ def find_equity_bar(df: pd.DataFrame, tckr_symb: str) -> NseEquityBar | None:
     return _row_to_bar(rows.iloc[0], date_col=date_col)
 
 
+def index_equity_bars(
+    df: pd.DataFrame, symbols: set[str] | None = None
+) -> dict[str, NseEquityBar]:
+    """
+    Parse a bhavcopy once into ``{TCKRSYMB: bar}`` for repeated per-symbol lookups.
+
+    Picks the same row per symbol as :func:`find_equity_bar` (allowed series only,
+    ``NSE_EQUITY_SERIES_PREFERENCE`` order, then file order), so bulk ingest yields the
+    same bars as calling ``find_equity_bar`` for each symbol.
+
+    Args:
+        df: Raw CSV loaded from NSE zip.
+        symbols: Optional upper-case ``TckrSymb`` values to keep (skips parsing the rest).
+
+    Returns:
+        Mapping of upper-case ``TckrSymb`` to its bar.
+    """
+    if df is None or df.empty or SYM_COL not in df.columns or CLOSE_COL not in df.columns:
+        return {}
+
+    date_col = DATE_COL_PRIMARY if DATE_COL_PRIMARY in df.columns else DATE_COL_FALLBACK
+    if date_col not in df.columns:
+        return {}
+
+    keys = df[SYM_COL].astype(str).str.upper()
+    work = df.assign(_sym_key=keys)
+    if symbols is not None:
+        work = work[keys.isin(symbols).to_numpy()]
+    if SERIES_COL in work.columns:
+        series = work[SERIES_COL].map(_normalize_series)
+        work = work[series.isin(NSE_BHAVCOPY_EQUITY_SERIES).to_numpy()]
+        preference = [p for p in NSE_EQUITY_SERIES_PREFERENCE if p in NSE_BHAVCOPY_EQUITY_SERIES]
+        rank = work[SERIES_COL].map(
+            lambda s: preference.index(_normalize_series(s))
+            if _normalize_series(s) in preference
+            else len(preference)
+        )
+        work = work.assign(_rank=rank).sort_values("_rank", kind="stable")
+    work = work.drop_duplicates("_sym_key", keep="first")
+
+    bars: dict[str, NseEquityBar] = {}
+    for _, row in work.iterrows():
+        bar = _row_to_bar(row, date_col=date_col)
+        if bar is not None:
+            bars[row["_sym_key"]] = bar
+    return bars
+
+
 class NseBhavcopyFetcher:
     """Download and cache NSE UDiFF bhavcopy files."""
 
@@ -207,13 +259,61 @@ class NseBhavcopyFetcher:
         )
         self.use_disk_cache = NSE_BHAVCOPY_USE_DISK_CACHE
         self._last_request_at = 0.0
+        self._store: NseBhavcopyStore | None = None
+
+    @property
+    def store(self) -> NseBhavcopyStore:
+        """Columnar on-disk store under ``<cache_dir>/store`` (created lazily)."""
+        if self._store is None:
+            from src.infrastructure.data_providers.nse_bhavcopy_store import (  # noqa: PLC0415
+                NseBhavcopyStore,
+            )
+
+            self._store = NseBhavcopyStore(self.cache_dir / "store")
+        return self._store
 
     def _cache_path(self, trade_date: date) -> Path:
+        """Legacy per-day CSV cache path (read once, then converted into the store)."""
         return self.cache_dir / f"bhav_{trade_date.strftime('%Y%m%d')}.csv"
 
     def has_cached_bhavcopy(self, trade_date: date) -> bool:
-        """True when a prior download left a CSV on disk for ``trade_date``."""
-        return self._cache_path(trade_date).exists()
+        """True when a prior download left ``trade_date`` on disk (store or legacy CSV)."""
+        return self.store.has_day(trade_date) or self._cache_path(trade_date).exists()
+
+    def migrate_csv_cache(self, *, remove: bool = True) -> int:
+        """Convert every legacy ``bhav_YYYYMMDD.csv`` in ``cache_dir`` into the store."""
+        return self.store.import_csv_cache(self.cache_dir, remove=remove)
+
+    def symbol_history(
+        self,
+        tckr_symb: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        columns: tuple[str, ...] = ("open", "high", "low", "close", "volume"),
+    ) -> pd.DataFrame:
+        """
+        Stored daily bars for one ``TckrSymb`` without reading other symbols or days.
+
+        Only days already downloaded are covered; see ``NseBhavcopyStore.symbol_history``.
+        """
+        return self.store.symbol_history(tckr_symb, start_date, end_date, columns)
+
+    def _read_stored_day(self, trade_date: date) -> pd.DataFrame | None:
+        """Stored rows for ``trade_date``; None when absent or unreadable (e.g. corrupt)."""
+        try:
+            if self.store.has_day(trade_date):
+                return self.store.read_day(trade_date)
+        except Exception as exc:
+            logger.warning("NSE bhavcopy store read failed for %s: %s", trade_date, exc)
+        return None
+
+    def _store_day(self, trade_date: date, df: pd.DataFrame) -> bool:
+        try:
+            self.store.write_day(trade_date, df)
+        except Exception as exc:
+            logger.warning("NSE bhavcopy store write failed for %s: %s", trade_date, exc)
+            return False
+        return True
 
     def is_bhavcopy_available_on_nse(self, trade_date: date) -> bool:
         """
@@ -281,19 +381,31 @@ class NseBhavcopyFetcher:
         """
         Load bhavcopy CSV for ``trade_date`` (optional disk cache or HTTP download).
 
-        When disk cache is disabled, parses the NSE zip in memory and does not write CSV.
+        When disk cache is disabled, parses the NSE zip in memory and writes nothing.
+        Days served from the store carry only the stored columns (symbol, series, date,
+        OHLC, volume); a legacy CSV cache file is converted into the store on first read.
+        A day the store cannot read (e.g. a corrupt partition) is downloaded again.
 
         Returns:
             DataFrame or None if file unavailable (holiday / not published).
         """
         use_disk = self.use_disk_cache if use_disk_cache is None else use_disk_cache
+        if use_disk:
+            df = self._read_stored_day(trade_date)
+            if df is not None:
+                return df
+
         cache_path = self._cache_path(trade_date)
         if use_disk and cache_path.exists():
             try:
-                return pd.read_csv(cache_path)
+                df = pd.read_csv(cache_path)
             except Exception as exc:
                 logger.warning("Corrupt NSE cache %s: %s", cache_path, exc)
                 cache_path.unlink(missing_ok=True)
+            else:
+                if self._store_day(trade_date, df):
+                    cache_path.unlink(missing_ok=True)
+                return df
 
         url = bhavcopy_url(trade_date)
         raw = self._http_get(url)
@@ -305,6 +417,5 @@ class NseBhavcopyFetcher:
             df = pd.read_csv(zf.open(name))
 
         if use_disk:
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            df.to_csv(cache_path, index=False)
+            self._store_day(trade_date, df)
         return df
@@ -0,0 +1,437 @@
+"""
+Compacting columnar on-disk store for NSE UDiFF bhavcopy rows.
+
+Replaces the per-day ``bhav_YYYYMMDD.csv`` cache. Only the columns the ingest and
+research code read are kept (symbol, series, trade date, OHLC, volume):
+
+* ``pending/bhav_YYYYMMDD.npz`` - a freshly downloaded day, written once.
+* ``year=YYYY/<version>/<column>.npy`` - compacted partitions, one ``.npy`` per column,
+  rows sorted by ``(symbol, date)``; ``year=YYYY/CURRENT`` names the live version. Files
+  are memory-mapped, so a per-symbol history is a binary search on the symbol column plus
+  a contiguous slice of the value columns; other symbols' rows are never read.
+
+Pending days are folded into their year partitions once ``compact_threshold`` of them
+accumulate (or on :meth:`NseBhavcopyStore.compact`). Legacy CSV files are converted once
+via :meth:`NseBhavcopyStore.import_csv_cache`.
+
+Several processes may share one store: writes and compaction hold an exclusive lock on
+``<root>/.lock`` and stage files under unique temp names, reads hold a shared lock. A
+rewritten partition goes into a fresh version directory and becomes visible when
+``CURRENT`` is swapped with :func:`os.replace`, so readers never see a half-written year.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from config.settings import NSE_BHAVCOPY_STORE_COMPACT_DAYS
+from src.infrastructure.data_providers.nse_bhavcopy_fetcher import (
+    CLOSE_COL,
+    DATE_COL_FALLBACK,
+    DATE_COL_PRIMARY,
+    HIGH_COL,
+    LOW_COL,
+    NSE_EQUITY_SERIES_PREFERENCE,
+    OPEN_COL,
+    SERIES_COL,
+    SYM_COL,
+    VOLUME_COL,
+    _is_allowed_equity_series,
+    _normalize_series,
+)
+from utils.file_lock import locked_file
+from utils.logger import logger
+
+# Store column -> bhavcopy CSV column
+STORE_COLUMNS = {
+    "symbol": SYM_COL,
+    "series": SERIES_COL,
+    "date": DATE_COL_PRIMARY,
+    "open": OPEN_COL,
+    "high": HIGH_COL,
+    "low": LOW_COL,
+    "close": CLOSE_COL,
+    "volume": VOLUME_COL,
+}
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+# Internal column: the bhavcopy file (calendar) day each row came from
+_FILE_DAY = "day"
+_ALL_COLUMNS = (*STORE_COLUMNS, _FILE_DAY)
+_PENDING_DIR = "pending"
+_DAYS_FILE = "days.npy"
+_CURRENT_FILE = "CURRENT"
+_LOCK_FILE = ".lock"
+_STAMP_LEN = len("YYYYMMDD")
+
+
+def _day_name(trade_date: date) -> str:
+    return f"bhav_{trade_date.strftime('%Y%m%d')}"
+
+
+def _parse_day_name(stem: str) -> date | None:
+    """Inverse of :func:`_day_name`; None for anything else (e.g. temp files)."""
+    stamp = stem[5:]
+    if not stem.startswith("bhav_") or len(stamp) != _STAMP_LEN or not stamp.isdigit():
+        return None
+    try:
+        return date(int(stamp[:4]), int(stamp[4:6]), int(stamp[6:8]))
+    except ValueError:
+        return None
+
+
+def _frame_to_columns(df: pd.DataFrame, trade_date: date) -> dict[str, np.ndarray]:
+    """Project a raw bhavcopy frame onto the store's typed columns (one trade date)."""
+    n = len(df)
+
+    def _text(col: str) -> np.ndarray:
+        if col not in df.columns:
+            return np.full(n, "", dtype="U1")
+        return df[col].fillna("").astype(str).str.strip().str.upper().to_numpy(dtype=str)
+
+    def _number(col: str) -> np.ndarray:
+        if col not in df.columns:
+            return np.full(n, np.nan)
+        return pd.to_numeric(df[col], errors="coerce").to_numpy(dtype="float64")
+
+    date_col = DATE_COL_PRIMARY if DATE_COL_PRIMARY in df.columns else DATE_COL_FALLBACK
+    if date_col in df.columns:
+        row_dates = pd.to_datetime(df[date_col], errors="coerce").fillna(pd.Timestamp(trade_date))
+        dates = row_dates.to_numpy(dtype="datetime64[D]")
+    else:
+        dates = np.full(n, np.datetime64(trade_date, "D"))
+    columns = {
+        "symbol": _text(SYM_COL),
+        "series": _text(SERIES_COL),
+        "date": dates,
+        _FILE_DAY: np.full(n, np.datetime64(trade_date, "D")),
+    }
+    for name in PRICE_COLUMNS:
+        columns[name] = _number(STORE_COLUMNS[name])
+    keep = columns["symbol"] != ""
+    return {name: values[keep] for name, values in columns.items()}
+
+
+def _columns_to_frame(columns: dict[str, np.ndarray]) -> pd.DataFrame:
+    """Rebuild a bhavcopy-shaped frame (CSV column names) from store columns."""
+    return pd.DataFrame({csv: np.asarray(columns[name]) for name, csv in STORE_COLUMNS.items()})
+
+
+def _concat_columns(parts: list[dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+    return {name: np.concatenate([p[name] for p in parts]) for name in _ALL_COLUMNS}
+
+
+def _pick_equity_rows(frame: pd.DataFrame) -> pd.DataFrame:
+    """One row per date: allowed equity series in ``NSE_EQUITY_SERIES_PREFERENCE`` order."""
+    frame = frame[frame["series"].map(_is_allowed_equity_series)]
+    if frame.empty:
+        return frame
+    rank = {s: i for i, s in enumerate(NSE_EQUITY_SERIES_PREFERENCE)}
+    frame = frame.assign(
+        _rank=frame["series"].map(lambda s: rank.get(_normalize_series(s), len(rank)))
+    )
+    frame = frame.sort_values(["date", "_rank"], kind="stable")
+    return frame.drop_duplicates("date", keep="first").drop(columns="_rank")
+
+
+class NseBhavcopyStore:
+    """Columnar bhavcopy store keyed by trade date and symbol (see module docstring)."""
+
+    def __init__(self, root: str | Path, *, compact_threshold: int | None = None):
+        self.root = Path(root)
+        self.compact_threshold = (
+            NSE_BHAVCOPY_STORE_COMPACT_DAYS if compact_threshold is None else compact_threshold
+        )
+        self._lock = threading.RLock()
+        # year -> (days.npy identity, sorted datetime64[D] days in that partition); the
+        # identity changes whenever any process rewrites the partition
+        self._partition_days: dict[int, tuple[tuple[int, int, int] | None, np.ndarray]] = {}
+
+    # ------------------------------------------------------------------ paths
+
+    @property
+    def _pending_dir(self) -> Path:
+        return self.root / _PENDING_DIR
+
+    def _pending_path(self, trade_date: date) -> Path:
+        return self._pending_dir / f"{_day_name(trade_date)}.npz"
+
+    def _year_dir(self, year: int) -> Path:
+        return self.root / f"year={year}"
+
+    def _partition_dir(self, year: int) -> Path:
+        """Live version directory of ``year`` (the year directory itself for flat layouts)."""
+        year_dir = self._year_dir(year)
+        try:
+            version = (year_dir / _CURRENT_FILE).read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return year_dir
+        return year_dir / version
+
+    @contextmanager
+    def _store_lock(self, *, exclusive: bool) -> Iterator[None]:
+        """Thread lock plus the store's inter-process file lock."""
+        with self._lock, locked_file(self.root / _LOCK_FILE, exclusive=exclusive):
+            yield
+
+    def _pending_days(self) -> list[date]:
+        if not self._pending_dir.exists():
+            return []
+        days = (_parse_day_name(path.stem) for path in self._pending_dir.glob("bhav_*.npz"))
+        return sorted(d for d in days if d is not None)
+
+    # ------------------------------------------------------------------ reads
+
+    def _days_in_partition(self, year: int) -> np.ndarray:
+        path = self._partition_dir(year) / _DAYS_FILE
+        try:
+            stat = path.stat()
+            identity = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            identity = None
+        with self._lock:
+            cached = self._partition_days.get(year)
+            if cached is not None and cached[0] == identity:
+                return cached[1]
+            days = np.load(path) if identity else np.array([], dtype="datetime64[D]")
+            self._partition_days[year] = (identity, days)
+            return days
+
+    def _in_partition(self, trade_date: date) -> bool:
+        days = self._days_in_partition(trade_date.year)
+        day = np.datetime64(trade_date, "D")
+        i = int(np.searchsorted(days, day))
+        return i < len(days) and days[i] == day
+
+    def has_day(self, trade_date: date) -> bool:
+        """True when ``trade_date`` is stored (pending or compacted)."""
+        return self._pending_path(trade_date).exists() or self._in_partition(trade_date)
+
+    def _load_partition(self, year: int, *, mmap: bool = True) -> dict[str, np.ndarray] | None:
+        part = self._partition_dir(year)
+        if not (part / _DAYS_FILE).exists():
+            return None
+        mode = "r" if mmap else None
+        return {name: np.load(part / f"{name}.npy", mmap_mode=mode) for name in _ALL_COLUMNS}
+
+    def _load_pending(self, trade_date: date) -> dict[str, np.ndarray] | None:
+        path = self._pending_path(trade_date)
+        if not path.exists():
+            return None
+        with np.load(path) as data:
+            return {name: data[name] for name in _ALL_COLUMNS}
+
+    def read_day(self, trade_date: date) -> pd.DataFrame | None:
+        """
+        Return the stored bhavcopy rows for ``trade_date`` with CSV column names.
+
+        Only the stored columns (symbol, series, date, OHLC, volume) are present.
+        """
+        with self._store_lock(exclusive=False):
+            columns = self._load_pending(trade_date)
+            if columns is None and self._in_partition(trade_date):
+                part = self._load_partition(trade_date.year)
+                mask = part[_FILE_DAY] == np.datetime64(trade_date, "D")
+                columns = {name: values[mask] for name, values in part.items()}
+        if columns is None:
+            return None
+        return _columns_to_frame(columns)
+
+    def symbol_history(
+        self,
+        tckr_symb: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        columns: Iterable[str] = PRICE_COLUMNS,
+    ) -> pd.DataFrame:
+        """
+        Daily bars for one symbol across all stored days in ``[start_date, end_date]``.
+
+        Reads only that symbol's slice of each yearly partition (plus pending days in range)
+        and only the requested ``columns``. Duplicate series rows on a day resolve like
+        ``find_equity_bar`` (allowed equity series, EQ first).
+
+        Returns:
+            DataFrame with ``date`` plus the requested columns, sorted by date (empty when
+            the symbol is not stored).
+        """
+        symbol = tckr_symb.strip().upper()
+        wanted = [c for c in columns if c in PRICE_COLUMNS]
+        read = ["date", "series", *wanted]
+        parts: list[pd.DataFrame] = []
+        with self._store_lock(exclusive=False):
+            for year in self._years(start_date, end_date):
+                part = self._load_partition(year)
+                if part is None:
+                    continue
+                lo = int(np.searchsorted(part["symbol"], symbol, side="left"))
+                hi = int(np.searchsorted(part["symbol"], symbol, side="right"))
+                if hi > lo:
+                    parts.append(pd.DataFrame({c: np.array(part[c][lo:hi]) for c in read}))
+            for day in self._pending_days():
+                if (start_date and day < start_date) or (end_date and day > end_date):
+                    continue
+                pending = self._load_pending(day)
+                if pending is None:
+                    continue
+                mask = pending["symbol"] == symbol
+                if mask.any():
+                    parts.append(pd.DataFrame({c: pending[c][mask] for c in read}))
+
+        if not parts:
+            return pd.DataFrame(columns=["date", *wanted])
+        frame = pd.concat(parts, ignore_index=True)
+        frame["date"] = pd.to_datetime(frame["date"])
+        if start_date is not None:
+            frame = frame[frame["date"] >= pd.Timestamp(start_date)]
+        if end_date is not None:
+            frame = frame[frame["date"] <= pd.Timestamp(end_date)]
+        frame = _pick_equity_rows(frame)
+        return frame[["date", *wanted]].sort_values("date").reset_index(drop=True)
+
+    def _years(self, start_date: date | None, end_date: date | None) -> list[int]:
+        years = sorted(
+            int(p.name.split("=", 1)[1])
+            for p in self.root.glob("year=*")
+            if p.is_dir() and p.name.split("=", 1)[1].isdigit()
+        )
+        return [
+            y
+            for y in years
+            if (start_date is None or y >= start_date.year)
+            and (end_date is None or y <= end_date.year)
+        ]
+
+    # ----------------------------------------------------------------- writes
+
+    def write_day(self, trade_date: date, df: pd.DataFrame) -> None:
+        """Store one raw bhavcopy frame; compacts once enough pending days accumulate."""
+        columns = _frame_to_columns(df, trade_date)
+        with self._store_lock(exclusive=True):
+            self._pending_dir.mkdir(parents=True, exist_ok=True)
+            path = self._pending_path(trade_date)
+            fd, tmp = tempfile.mkstemp(prefix=f".{path.stem}.", suffix=".npz", dir=path.parent)
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    np.savez(handle, **columns)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+            if self.compact_threshold and len(self._pending_days()) >= self.compact_threshold:
+                self._compact()
+
+    def compact(self) -> int:
+        """
+        Fold pending days into their yearly partitions (rewriting each touched year once).
+
+        Returns:
+            Number of days compacted.
+        """
+        with self._store_lock(exclusive=True):
+            return self._compact()
+
+    def _compact(self) -> int:
+        """:meth:`compact` body; the caller holds the exclusive store lock."""
+        pending = self._pending_days()
+        by_year: dict[int, list[date]] = {}
+        for day in pending:
+            by_year.setdefault(day.year, []).append(day)
+        compacted = 0
+        for year, days in by_year.items():
+            written = self._rewrite_partition(year, days)
+            for day in written:
+                self._pending_path(day).unlink(missing_ok=True)
+            compacted += len(written)
+        if compacted:
+            logger.info("NSE bhavcopy store: compacted %s day(s) into %s", compacted, self.root)
+        return compacted
+
+    def _rewrite_partition(self, year: int, new_days: list[date]) -> list[date]:
+        """Merge pending ``new_days`` into the year's partition; returns the days merged."""
+        loaded = {d: self._load_pending(d) for d in new_days}
+        # Another store may have compacted a day between listing and loading it
+        new_days = [d for d, columns in loaded.items() if columns is not None]
+        if not new_days:
+            return []
+        parts = []
+        existing = self._load_partition(year, mmap=False)
+        new_set = np.array([np.datetime64(d, "D") for d in new_days])
+        if existing is not None:
+            keep = ~np.isin(existing[_FILE_DAY], new_set)
+            parts.append({name: values[keep] for name, values in existing.items()})
+        parts.extend(loaded[d] for d in new_days)
+        merged = _concat_columns(parts)
+        order = np.lexsort((merged["date"], merged["symbol"]))
+        merged = {name: values[order] for name, values in merged.items()}
+        days = np.union1d(self._days_in_partition(year), new_set).astype("datetime64[D]")
+
+        year_dir = self._year_dir(year)
+        year_dir.mkdir(parents=True, exist_ok=True)
+        previous = self._partition_dir(year)
+        version = Path(tempfile.mkdtemp(prefix="v-", dir=year_dir))
+        pointer = year_dir / f".{_CURRENT_FILE}.{version.name}"
+        try:
+            for name, values in merged.items():
+                np.save(version / f"{name}.npy", values)
+            np.save(version / _DAYS_FILE, days)
+            pointer.write_text(version.name, encoding="utf-8")
+            os.replace(pointer, year_dir / _CURRENT_FILE)
+        except BaseException:
+            pointer.unlink(missing_ok=True)
+            shutil.rmtree(version, ignore_errors=True)
+            raise
+        # Readers resolve CURRENT under the shared lock, so superseded versions (and versions
+        # orphaned by a crashed rewrite) are unreachable while this exclusive lock is held
+        for stale in year_dir.glob("v-*"):
+            if stale != version:
+                shutil.rmtree(stale, ignore_errors=True)
+        for stale in year_dir.glob(f".{_CURRENT_FILE}.*"):
+            stale.unlink(missing_ok=True)
+        if previous == year_dir:
+            # Flat layout written before versioned partitions
+            for path in year_dir.glob("*.npy"):
+                path.unlink()
+        return new_days
+
+    def import_csv_cache(self, csv_dir: str | Path, *, remove: bool = True) -> int:
+        """
+        Convert legacy ``bhav_YYYYMMDD.csv`` cache files into the store (one-time migration).
+
+        Args:
+            csv_dir: Directory holding the CSV files.
+            remove: Delete each CSV once converted.
+
+        Returns:
+            Number of days imported.
+        """
+        imported = 0
+        for path, trade_date in _iter_csv_cache(Path(csv_dir)):
+            if not self.has_day(trade_date):
+                try:
+                    df = pd.read_csv(path, usecols=lambda c: c in STORE_COLUMNS.values())
+                except Exception as exc:
+                    logger.warning("Skipping unreadable NSE cache %s: %s", path, exc)
+                    continue
+                self.write_day(trade_date, df)
+                imported += 1
+            if remove:
+                path.unlink(missing_ok=True)
+        self.compact()
+        return imported
+
+
+def _iter_csv_cache(csv_dir: Path) -> Iterator[tuple[Path, date]]:
+    for path in sorted(csv_dir.glob("bhav_*.csv")):
+        trade_date = _parse_day_name(path.stem)
+        if trade_date is not None:
+            yield path, trade_date
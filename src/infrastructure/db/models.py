@@ -236,7 +236,11 @@ class Positions(Base):
     realized_pnl_pct: Mapped[float | None] = mapped_column(Float, nullable=True)
     sell_order_id: Mapped[int | None] = mapped_column(ForeignKey("orders.id"), nullable=True)
 
-    __table_args__ = ()
+    __table_args__ = (
+        # Closed-trade history / realized P&L by date range, and per-symbol lookups
+        Index("ix_positions_user_closed_at", "user_id", "closed_at"),
+        Index("ix_positions_user_symbol_closed_at", "user_id", "symbol", "closed_at"),
+    )
 
 
 class Fills(Base):
@@ -385,6 +389,26 @@ class PnlDaily(Base):
     __table_args__ = (UniqueConstraint("user_id", "date", name="uq_pnl_daily_user_date"),)
 
 
+class PnlMaterializationMark(Base):
+    """Days of pnl_daily already materialized for a user and trade mode ('all' = no filter)"""
+
+    __tablename__ = "pnl_materialization_marks"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    trade_mode: Mapped[str] = mapped_column(String(16), nullable=False)  # all/paper/broker
+    start_date: Mapped[date] = mapped_column(Date, nullable=False)
+    through_date: Mapped[date] = mapped_column(Date, nullable=False)
+    as_of: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # Positions have no updated_at; closures (and reopen/re-close) are detected against
+    # this {position id: closed_at ISO timestamp} map
+    closed_positions: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "trade_mode", name="uq_pnl_materialization_marks_user_mode"),
+    )
+
+
 class PnlCalculationAudit(Base):
     """Audit trail for P&L calculations (Phase 0.5)"""
 
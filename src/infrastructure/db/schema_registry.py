@@ -0,0 +1,70 @@
+"""Per-engine cache of live table columns for schema-tolerant repositories.
+
+Some repositories select only the columns that exist in the connected database so they
+keep working before the latest migration has run. Inspecting the schema on every call is
+expensive, so the column sets are resolved once per engine and table and dropped again
+after ``MetaData.create_all``/``drop_all`` and after Alembic migrations run in this process
+(``alembic/env.py``). Other DDL - raw ``ALTER TABLE`` or migrations applied by another
+process - must be followed by ``invalidate_schema_cache``.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+
+from sqlalchemy import MetaData, event, inspect
+from sqlalchemy.engine import Connection, Engine
+
+_lock = threading.Lock()
+_columns_by_engine: weakref.WeakKeyDictionary[Engine, dict[str, frozenset[str]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _engine_of(bind: Engine | Connection) -> Engine:
+    return bind.engine if isinstance(bind, Connection) else bind
+
+
+def table_columns(bind: Engine | Connection, table_name: str) -> frozenset[str]:
+    """Return the column names of ``table_name`` as they exist in the database.
+
+    Args:
+        bind: Engine or connection (``session.bind``)
+        table_name: Table to describe
+
+    Returns:
+        Frozen set of column names, resolved once per engine until the next DDL
+    """
+    engine = _engine_of(bind)
+    with _lock:
+        cached = _columns_by_engine.get(engine, {}).get(table_name)
+    if cached is not None:
+        return cached
+
+    columns = frozenset(col["name"] for col in inspect(bind).get_columns(table_name))
+    with _lock:
+        _columns_by_engine.setdefault(engine, {})[table_name] = columns
+    return columns
+
+
+def has_column(bind: Engine | Connection, table_name: str, column_name: str) -> bool:
+    """Check whether ``table_name`` has ``column_name`` in the connected database."""
+    return column_name in table_columns(bind, table_name)
+
+
+def invalidate_schema_cache(bind: Engine | Connection | None = None) -> None:
+    """Forget cached columns for every engine on the same database as ``bind`` (or all)."""
+    with _lock:
+        if bind is None:
+            _columns_by_engine.clear()
+            return
+        url = _engine_of(bind).url
+        for engine in [e for e in _columns_by_engine if e.url == url]:
+            del _columns_by_engine[engine]
+
+
+@event.listens_for(MetaData, "after_create")
+@event.listens_for(MetaData, "after_drop")
+def _invalidate_after_ddl(target: MetaData, connection: Connection, **kw) -> None:
+    invalidate_schema_cache(connection)
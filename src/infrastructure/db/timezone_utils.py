@@ -4,7 +4,7 @@ Timezone utilities for database models
 All datetime fields use IST (Indian Standard Time, UTC+5:30)
 """
 
-from datetime import UTC, datetime, timedelta, timezone
+from datetime import UTC, date, datetime, timedelta, timezone
 
 # IST timezone (UTC+5:30)
 IST = timezone(timedelta(hours=5, minutes=30))
@@ -50,6 +50,19 @@ def ist_now_naive() -> datetime:
     return datetime.now(IST).replace(tzinfo=None)
 
 
+def day_range(start_date: date, end_date: date) -> tuple[datetime, datetime]:
+    """
+    Half-open naive bounds ``[start 00:00, day after end 00:00)`` for an inclusive date range.
+
+    Filter with ``column >= start`` and ``column < end`` instead of ``func.date(column)`` so
+    the comparison stays on the raw column and can use its index.
+    """
+    return (
+        datetime.combine(start_date, datetime.min.time()),
+        datetime.combine(end_date + timedelta(days=1), datetime.min.time()),
+    )
+
+
 def utc_to_ist(utc_dt: datetime) -> datetime:
     """
     Convert UTC datetime to IST
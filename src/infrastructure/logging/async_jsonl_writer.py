@@ -0,0 +1,271 @@
+"""
+Asynchronous batched JSONL writer for per-user log files.
+
+``UserFileLogHandler`` used to serialize, write and ``flush()`` every record on the calling
+(trading) thread. In async mode the handler only builds the payload dict (shallow-copying
+context containers) and enqueues it; one background thread per process serializes queued
+records, groups them by file, writes each group with a single ``write`` and flushes once
+per batch.
+
+- Batches are written when ``USER_LOG_BATCH_SIZE`` records are queued or every
+  ``USER_LOG_FLUSH_INTERVAL_S`` seconds, whichever comes first.
+- The queue is bounded (``USER_LOG_QUEUE_SIZE``). When it is full, records are dropped
+  (never blocking the caller) and counted; the next batch written to the affected file
+  starts with a WARNING line reporting how many records were lost.
+- ``flush()`` waits until everything queued before the call is on disk; it runs on handler
+  close, before ``FileLogReader`` reads, and at interpreter exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import queue
+import threading
+import time
+from typing import Any, TextIO
+
+from config.settings import USER_LOG_BATCH_SIZE, USER_LOG_FLUSH_INTERVAL_S, USER_LOG_QUEUE_SIZE
+from src.infrastructure.db.timezone_utils import ist_now
+
+logger = logging.getLogger(__name__)
+
+# Streams not written for this long are closed (date rotation leaves yesterday's file idle)
+_IDLE_STREAM_CLOSE_S = 60.0
+
+
+def dumps_log_payload(payload: dict[str, Any]) -> str:
+    """Serialize one log payload; non-JSON context values are stored as ``str(value)``."""
+    try:
+        return json.dumps(payload, ensure_ascii=False, default=str)
+    except (TypeError, ValueError):
+        # e.g. circular references: fall back to per-key conversion
+        context = payload.get("context") or {}
+        safe_context: dict[str, Any] = {}
+        for key, value in context.items():
+            try:
+                json.dumps(value, default=str)
+                safe_context[key] = value
+            except (TypeError, ValueError):
+                safe_context[key] = str(value)
+        return json.dumps(
+            {**payload, "context": safe_context or None}, ensure_ascii=False, default=str
+        )
+
+
+def snapshot_log_value(value: Any) -> Any:
+    """
+    Shallow copy of a context value, taken on the logging thread.
+
+    Queued payloads are serialized later on the writer thread, so the emitting thread only
+    copies the top level of dicts, lists and sets (keys the caller re-assigns or items it
+    appends afterwards stay out of the record). Nested containers and other objects are
+    read when the writer thread serializes them.
+    """
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+class AsyncJsonlWriter:
+    """Bounded queue of ``(path, payload)`` records drained by one background writer thread."""
+
+    def __init__(
+        self,
+        queue_size: int = USER_LOG_QUEUE_SIZE,
+        batch_size: int = USER_LOG_BATCH_SIZE,
+        flush_interval_s: float = USER_LOG_FLUSH_INTERVAL_S,
+    ) -> None:
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_s = flush_interval_s
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._streams: dict[str, TextIO] = {}
+        self._last_used: dict[str, float] = {}
+        # path -> (records dropped since the last write to it, user_id of the dropped records)
+        self._dropped: dict[str, tuple[int, Any]] = {}
+        self._stats = {"enqueued": 0, "written": 0, "dropped": 0, "batches": 0}
+
+    # ---------------------- Producer side ----------------------
+
+    def submit(self, path: str, payload: dict[str, Any]) -> bool:
+        """Queue a record for ``path``; returns False when it was dropped (queue full/closed)."""
+        if self._closed:
+            return False
+        self._ensure_started()
+        try:
+            self._queue.put_nowait((path, payload))
+        except queue.Full:
+            with self._lock:
+                count, _ = self._dropped.get(path, (0, None))
+                self._dropped[path] = (count + 1, payload.get("user_id"))
+                self._stats["dropped"] += 1
+            return False
+        with self._lock:
+            self._stats["enqueued"] += 1
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until records queued before this call are written; False on timeout."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return True
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Write everything still queued, close the files and stop the thread."""
+        self.flush(timeout)
+        self._closed = True
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            try:
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                return
+            thread.join(timeout)
+
+    def get_stats(self) -> dict[str, int]:
+        """Counters: enqueued, written, dropped (queue full or unwritable) and batches written."""
+        with self._lock:
+            return {**self._stats, "queued": self._queue.qsize()}
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="UserLogWriter", daemon=True)
+                self._thread.start()
+
+    # ---------------------- Writer thread ----------------------
+
+    def _run(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=self.flush_interval_s)
+            except queue.Empty:
+                self._close_idle_streams()
+                continue
+
+            records: list[tuple[str, dict[str, Any]]] = []
+            waiters: list[threading.Event] = []
+            stop = False
+            item = first
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    records.append(item)
+                if stop or len(records) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            self._write_batch(records)
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                self._close_streams()
+                return
+
+    def _write_batch(self, records: list[tuple[str, dict[str, Any]]]) -> None:
+        if not records and not self._dropped:
+            return
+        lines_by_path: dict[str, list[str]] = {}
+        unwritten = 0
+        with self._lock:
+            dropped, self._dropped = self._dropped, {}
+        for path, (count, user_id) in dropped.items():
+            lines_by_path.setdefault(path, []).append(
+                dumps_log_payload(
+                    {
+                        "timestamp": ist_now().isoformat(),
+                        "level": "WARNING",
+                        "module": "logging",
+                        "message": f"Dropped {count} log records (log queue full)",
+                        "context": {"dropped": count},
+                        "user_id": user_id,
+                    }
+                )
+            )
+        for path, payload in records:
+            try:
+                lines_by_path.setdefault(path, []).append(dumps_log_payload(payload))
+            except Exception as exc:  # noqa: BLE001
+                unwritten += 1
+                logger.warning("Dropped unserializable log record for %s: %s", path, exc)
+
+        now = time.monotonic()
+        written = 0
+        for path, lines in lines_by_path.items():
+            try:
+                stream = self._streams.get(path)
+                if stream is None:
+                    stream = open(path, "a", encoding="utf-8")  # noqa: SIM115
+                    self._streams[path] = stream
+                stream.write("\n".join(lines) + "\n")
+                stream.flush()
+                self._last_used[path] = now
+                written += len(lines)
+            except Exception as exc:  # noqa: BLE001
+                unwritten += len(lines)
+                logger.warning("Dropped %d log records for %s: %s", len(lines), path, exc)
+                self._close_stream(path)
+        with self._lock:
+            self._stats["written"] += written
+            self._stats["dropped"] += unwritten
+            self._stats["batches"] += 1
+
+    def _close_idle_streams(self) -> None:
+        cutoff = time.monotonic() - _IDLE_STREAM_CLOSE_S
+        for path in [p for p, used in self._last_used.items() if used < cutoff]:
+            self._close_stream(path)
+
+    def _close_streams(self) -> None:
+        for path in list(self._streams):
+            self._close_stream(path)
+
+    def _close_stream(self, path: str) -> None:
+        self._last_used.pop(path, None)
+        stream = self._streams.pop(path, None)
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Failed to close log file %s: %s", path, exc)
+
+
+_writer: AsyncJsonlWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_async_jsonl_writer() -> AsyncJsonlWriter:
+    """Process-wide writer shared by every async ``UserFileLogHandler``."""
+    global _writer  # noqa: PLW0603
+    with _writer_lock:
+        if _writer is None:
+            _writer = AsyncJsonlWriter()
+            atexit.register(_writer.shutdown)
+        return _writer
+
+
+def flush_user_logs(timeout: float = 5.0) -> bool:
+    """Flush queued user log records (no-op when async logging was never used)."""
+    writer = _writer
+    return writer.flush(timeout) if writer is not None else True
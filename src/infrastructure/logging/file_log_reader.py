@@ -3,25 +3,29 @@
 from __future__ import annotations
 
 import json
-from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 from src.infrastructure.db.timezone_utils import ist_now
+from src.infrastructure.logging.async_jsonl_writer import flush_user_logs
+from src.infrastructure.logging.log_index import LogFileIndex, get_log_index
 
 
 class FileLogReader:
     """
     File Log Reader for JSONL activity logs.
 
-    Reads per-user JSONL logs with filtering and tail support.
+    Reads per-user JSONL logs with filtering and tail support. Queries go through the
+    per-file sidecar index (``log_index``): only lines whose indexed level, module and
+    timestamp can match are read and parsed, newest first.
     """
 
     def __init__(self, base_dir: Path | str = "logs"):
         self.base_dir = Path(base_dir)
 
     def _iter_log_files(self, user_id: int, log_type: str, days_back: int) -> list[Path]:
+        flush_user_logs()  # records still queued by this process's async log writer
         user_dir = self.base_dir / "users" / f"user_{user_id}"
         if not user_dir.exists():
             return []
@@ -80,54 +84,25 @@ class FileLogReader:
         search: str | None = None,
         limit: int = 500,
         days_back: int = 14,
+        cursor: str | None = None,
     ) -> list[dict[str, Any]]:
-        files = self._iter_log_files(user_id, log_type="service", days_back=days_back)
-        results: list[dict[str, Any]] = []
-        fallback_time = ist_now()
-
-        for path in files:
-            try:
-                with path.open("r", encoding="utf-8") as f:
-                    buffer: deque[dict[str, Any]] = deque(maxlen=limit)
-                    line_no = 0
-                    for line in f:
-                        line_no += 1
-                        parsed = self._parse_line(line, fallback_time)
-                        if not parsed:
-                            continue
-                        if not parsed.get("id"):
-                            parsed["id"] = f"{path.name}:{line_no}"
-
-                        if level and parsed["level"].upper() != level.upper():
-                            continue
-                        if module and module.lower() not in parsed["module"].lower():
-                            continue
-                        if start_time and parsed["timestamp"] < start_time:
-                            continue
-                        if end_time and parsed["timestamp"] > end_time:
-                            continue
-                        if (
-                            search
-                            and search.lower()
-                            not in json.dumps(
-                                {"message": parsed["message"], "context": parsed.get("context")}
-                            ).lower()
-                        ):
-                            continue
-
-                        buffer.append(parsed)
-
-                    if buffer:
-                        results.extend(buffer)
-
-                if len(results) >= limit:
-                    break  # already have enough from newest files
-            except (OSError, UnicodeDecodeError):
-                continue
+        """
+        Newest-first service logs.
 
-        # keep only latest `limit` and return newest-first
-        results = results[-limit:]
-        return list(reversed(results))
+        ``cursor`` is the ``id`` (``"<file>:<line>"``) of the last entry of the previous
+        page; only older entries are returned.
+        """
+        files = self._iter_log_files(user_id, log_type="service", days_back=days_back)
+        return self._query(
+            files,
+            level=level,
+            module=module,
+            start_time=start_time,
+            end_time=end_time,
+            search=search,
+            limit=limit,
+            cursor=cursor,
+        )
 
     def read_error_logs(  # noqa: PLR0913
         self,
@@ -140,76 +115,126 @@ class FileLogReader:
         days_back: int = 30,
     ) -> list[dict[str, Any]]:
         files = self._iter_log_files(user_id, log_type="errors", days_back=days_back)
-        results: list[dict[str, Any]] = []
+        return self._query(
+            files,
+            start_time=start_time,
+            end_time=end_time,
+            search=search,
+            limit=limit,
+            levels_in=("ERROR", "CRITICAL"),
+        )
+
+    def tail_logs(
+        self,
+        user_id: int,
+        *,
+        log_type: str = "service",
+        tail_lines: int = 200,
+    ) -> list[dict[str, Any]]:
+        files = self._iter_log_files(user_id, log_type=log_type, days_back=1)
+        if not files:
+            return []
+
+        path = files[0]
+        index = get_log_index(path)
+        first_line = index.line_count - tail_lines + 1
+        positions = []
+        for pos in range(len(index) - 1, -1, -1):
+            if index.line_nos[pos] < first_line:
+                break
+            positions.append(pos)
+        return self._read_rows(path, index, positions, ist_now())
+
+    def _query(  # noqa: PLR0913
+        self,
+        files: list[Path],
+        *,
+        level: str | None = None,
+        module: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        search: str | None = None,
+        limit: int = 500,
+        cursor: str | None = None,
+        levels_in: tuple[str, ...] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Walk files newest first, reading only rows the index says can match."""
+        cursor_file, cursor_line = _parse_cursor(cursor)
+        needle = search.lower() if search else None
+        # Cheap substring test on the raw line before parsing (skipped when JSON escaping
+        # could make the raw text differ from the json.dumps text the filter matches)
+        raw_needle = needle if needle and needle.isascii() and "\\" not in needle else None
         fallback_time = ist_now()
+        results: list[dict[str, Any]] = []
 
         for path in files:
+            if cursor_file is not None and path.name > cursor_file:
+                continue  # newer than the page the cursor points into
+            before_line = cursor_line if path.name == cursor_file else None
+            index = get_log_index(path)
             try:
-                with path.open("r", encoding="utf-8") as f:
-                    buffer: deque[dict[str, Any]] = deque(maxlen=limit)
-                    line_no = 0
-                    for line in f:
-                        line_no += 1
+                with path.open("rb") as f:
+                    for pos in index.candidates(
+                        level=level,
+                        module=module,
+                        start_time=start_time,
+                        end_time=end_time,
+                        before_line=before_line,
+                        levels_in=levels_in,
+                    ):
+                        line = index.read_line(f, pos)
+                        if raw_needle and raw_needle not in line.lower():
+                            continue
                         parsed = self._parse_line(line, fallback_time)
                         if not parsed:
                             continue
-                        if parsed["level"].upper() not in ("ERROR", "CRITICAL"):
-                            continue
                         if not parsed.get("id"):
-                            parsed["id"] = f"{path.name}:{line_no}"
+                            parsed["id"] = f"{path.name}:{index.line_nos[pos]}"
 
                         if start_time and parsed["timestamp"] < start_time:
                             continue
                         if end_time and parsed["timestamp"] > end_time:
                             continue
                         if (
-                            search
-                            and search.lower()
+                            needle
+                            and needle
                             not in json.dumps(
                                 {"message": parsed["message"], "context": parsed.get("context")}
                             ).lower()
                         ):
                             continue
 
-                        buffer.append(parsed)
-
-                    if buffer:
-                        results.extend(buffer)
-
-                if len(results) >= limit:
-                    break
+                        results.append(parsed)
+                        if len(results) >= limit:
+                            return results
             except (OSError, UnicodeDecodeError):
                 continue
 
-        results = results[-limit:]
-        return list(reversed(results))
+        return results
 
-    def tail_logs(
-        self,
-        user_id: int,
-        *,
-        log_type: str = "service",
-        tail_lines: int = 200,
+    def _read_rows(
+        self, path: Path, index: LogFileIndex, positions: list[int], fallback_time: datetime
     ) -> list[dict[str, Any]]:
-        files = self._iter_log_files(user_id, log_type=log_type, days_back=1)
-        if not files:
-            return []
-
-        path = files[0]
-        fallback_time = ist_now()
+        results: list[dict[str, Any]] = []
         try:
-            with path.open("r", encoding="utf-8") as f:
-                buffer = deque(f, maxlen=tail_lines)
-            results: list[dict[str, Any]] = []
-            line_no = 0
-            for line in buffer:
-                line_no += 1
-                parsed = self._parse_line(line, fallback_time)
-                if not parsed:
-                    continue
-                if not parsed.get("id"):
-                    parsed["id"] = f"{path.name}:{line_no}"
-                results.append(parsed)
-            return list(reversed(results))
+            with path.open("rb") as f:
+                for pos in positions:
+                    parsed = self._parse_line(index.read_line(f, pos), fallback_time)
+                    if not parsed:
+                        continue
+                    if not parsed.get("id"):
+                        parsed["id"] = f"{path.name}:{index.line_nos[pos]}"
+                    results.append(parsed)
         except (OSError, UnicodeDecodeError):
             return []
+        return results
+
+
+def _parse_cursor(cursor: str | None) -> tuple[str | None, int | None]:
+    """``"service_20260410.jsonl:123"`` -> (file name, line number)."""
+    if not cursor:
+        return None, None
+    name, sep, line = cursor.rpartition(":")
+    if not sep or not name or not line.isdigit():
+        raise ValueError(f"Invalid log cursor: {cursor!r}")
+    return name, int(line)
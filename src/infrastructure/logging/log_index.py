@@ -0,0 +1,321 @@
+"""
+Sidecar index for per-user JSONL log files.
+
+``FileLogReader`` used to ``json.loads`` every line of every daily file on each request.
+A ``LogFileIndex`` records, once per line, its byte offset, line number, timestamp and
+interned level/module ids. Queries filter on those columns, seek straight to the matching
+lines and parse only the rows they return, newest first.
+
+The index is kept current incrementally: when the log file has grown, only the bytes past
+the indexed size are read (complete lines only; a partial trailing line is picked up next
+time). A shrunken file is re-indexed from scratch. Indexes are cached per process and
+persisted next to the log as ``<file>.jsonl.idx`` so a restart does not re-scan whole
+files; today's growing file is re-persisted at most every ``_PERSIST_MIN_NEW_ROWS`` rows.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.infrastructure.db.timezone_utils import IST
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx"
+_INDEX_VERSION = 1
+_PERSIST_MIN_NEW_ROWS = 1000
+_QUIET_FILE_S = 300.0
+_REQUIRED_FIELDS = ("level", "module", "message", "user_id")
+# Timestamp suffix after "YYYY-MM-DDTHH:MM:SS[.ffffff]" written by UserFileLogHandler
+_IST_SUFFIX = "+05:30"
+_WALL_KEY_LEN = len("YYYY-MM-DDTHH:MM:SS")
+
+
+def index_path_for(log_path: Path) -> Path:
+    return log_path.with_name(log_path.name + INDEX_SUFFIX)
+
+
+def _ts_kind(ts: str | None) -> str | None:
+    """'ist' / 'naive' / other offset for seekable timestamps, None when unknown."""
+    if not ts or len(ts) < _WALL_KEY_LEN:
+        return None
+    tail = ts[_WALL_KEY_LEN:].lstrip(".0123456789")
+    if tail == _IST_SUFFIX:
+        return "ist"
+    return "naive" if tail == "" else tail
+
+
+class LogFileIndex:
+    """Column index (offset, line number, timestamp, level id, module id) of one JSONL file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.mtime = 0.0
+        self._persisted_rows = 0
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self) -> None:
+        self.size = 0  # bytes indexed (end of the last complete line)
+        self.line_count = 0  # physical lines seen, for the "<file>:<line>" ids
+        self.offsets: list[int] = []
+        self.line_nos: list[int] = []
+        self.timestamps: list[str | None] = []
+        self.level_ids: list[int] = []
+        self.module_ids: list[int] = []
+        self.levels: list[str] = []
+        self.modules: list[str] = []
+        self._level_lookup: dict[str, int] = {}
+        self._module_lookup: dict[str, int] = {}
+        # Wall-clock keys ("YYYY-MM-DDTHH:MM:SS") are non-decreasing and share one ts_kind
+        self.seekable = True
+        self.ts_kind: str | None = None
+        self._last_key = ""
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    # ---------------------- Building ----------------------
+
+    def refresh(self) -> None:
+        """Index lines appended since the last refresh (re-index if the file shrank)."""
+        with self._lock:
+            try:
+                stat = self.path.stat()
+            except OSError:
+                return
+            file_size, self.mtime = stat.st_size, stat.st_mtime
+            if file_size < self.size:
+                self._clear()
+            if file_size == self.size:
+                return
+            try:
+                with self.path.open("rb") as f:
+                    f.seek(self.size)
+                    chunk = f.read(file_size - self.size)
+            except OSError as exc:
+                logger.debug("Failed to index log file %s: %s", self.path, exc)
+                return
+            end = chunk.rfind(b"\n")
+            if end < 0:
+                return  # no complete new line yet
+            offset = self.size
+            for raw in chunk[: end + 1].splitlines(keepends=True):
+                self.line_count += 1
+                self._add_line(raw, offset)
+                offset += len(raw)
+            self.size = offset
+
+    def _add_line(self, raw: bytes, offset: int) -> None:
+        line = raw.strip()
+        if not line:
+            return
+        try:
+            data = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return
+        if not isinstance(data, dict) or not all(k in data for k in _REQUIRED_FIELDS):
+            return
+        ts = data.get("timestamp")
+        ts = ts if isinstance(ts, str) else None
+        self.offsets.append(offset)
+        self.line_nos.append(self.line_count)
+        self.timestamps.append(ts)
+        self.level_ids.append(self._intern(self.levels, self._level_lookup, data["level"]))
+        self.module_ids.append(self._intern(self.modules, self._module_lookup, data["module"]))
+        self._track_order(ts)
+
+    @staticmethod
+    def _intern(values: list[str], lookup: dict[str, int], value: Any) -> int:
+        value = str(value)
+        idx = lookup.get(value)
+        if idx is None:
+            idx = lookup[value] = len(values)
+            values.append(value)
+        return idx
+
+    def _track_order(self, ts: str | None) -> None:
+        if not self.seekable:
+            return
+        kind = _ts_kind(ts)
+        if kind is None or (self.ts_kind is not None and kind != self.ts_kind):
+            self.seekable = False
+            return
+        self.ts_kind = kind
+        key = ts[:_WALL_KEY_LEN]
+        if key < self._last_key:
+            self.seekable = False
+            return
+        self._last_key = key
+
+    # ---------------------- Persistence ----------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": _INDEX_VERSION,
+            "size": self.size,
+            "line_count": self.line_count,
+            "levels": self.levels,
+            "modules": self.modules,
+            "rows": [
+                self.offsets,
+                self.line_nos,
+                self.timestamps,
+                self.level_ids,
+                self.module_ids,
+            ],
+        }
+
+    @classmethod
+    def load(cls, path: Path) -> LogFileIndex:
+        """Index from the sidecar when it is valid for ``path``, else an empty one."""
+        index = cls(path)
+        sidecar = index_path_for(path)
+        try:
+            with sidecar.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != _INDEX_VERSION or data["size"] > path.stat().st_size:
+                return index
+            offsets, line_nos, timestamps, level_ids, module_ids = data["rows"]
+            index.size = data["size"]
+            index.line_count = data["line_count"]
+            index.levels = list(data["levels"])
+            index.modules = list(data["modules"])
+            index._level_lookup = {v: i for i, v in enumerate(index.levels)}
+            index._module_lookup = {v: i for i, v in enumerate(index.modules)}
+            index.offsets, index.line_nos = offsets, line_nos
+            index.timestamps, index.level_ids, index.module_ids = timestamps, level_ids, module_ids
+            for ts in timestamps:
+                index._track_order(ts)
+            index._persisted_rows = len(offsets)
+        except (OSError, ValueError, KeyError, TypeError):
+            return cls(path)
+        return index
+
+    def persist(self) -> None:
+        """
+        Write the sidecar when rows were added since the last write.
+
+        A file still being appended to is re-persisted only every ``_PERSIST_MIN_NEW_ROWS``
+        rows; a quiet one (no write for ``_QUIET_FILE_S``) is persisted as soon as it changed.
+        """
+        with self._lock:
+            new_rows = len(self) - self._persisted_rows
+            if new_rows <= 0:
+                return
+            quiet = time.time() - self.mtime > _QUIET_FILE_S
+            if not quiet and new_rows < _PERSIST_MIN_NEW_ROWS:
+                return
+            sidecar = index_path_for(self.path)
+            tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+            try:
+                with tmp.open("w", encoding="utf-8") as f:
+                    json.dump(self.to_dict(), f, separators=(",", ":"))
+                os.replace(tmp, sidecar)
+                self._persisted_rows = len(self)
+            except OSError as exc:
+                logger.debug("Failed to persist log index %s: %s", sidecar, exc)
+
+    # ---------------------- Queries ----------------------
+
+    def candidates(  # noqa: PLR0913
+        self,
+        *,
+        level: str | None = None,
+        module: str | None = None,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        before_line: int | None = None,
+        levels_in: tuple[str, ...] | None = None,
+    ) -> Iterator[int]:
+        """Row positions matching the indexed filters, newest (last) first."""
+        level_ok = None
+        if level:
+            wanted = level.upper()
+            level_ok = {i for i, v in enumerate(self.levels) if v.upper() == wanted}
+        if levels_in:
+            allowed = {i for i, v in enumerate(self.levels) if v.upper() in levels_in}
+            level_ok = allowed if level_ok is None else level_ok & allowed
+        module_ok = None
+        if module:
+            needle = module.lower()
+            module_ok = {i for i, v in enumerate(self.modules) if needle in v.lower()}
+        if (level_ok is not None and not level_ok) or (module_ok is not None and not module_ok):
+            return
+
+        lo, hi = self._seek_range(start_time, end_time)
+        if before_line is not None:
+            hi = min(hi, bisect.bisect_left(self.line_nos, before_line))
+        for pos in range(hi - 1, lo - 1, -1):
+            if level_ok is not None and self.level_ids[pos] not in level_ok:
+                continue
+            if module_ok is not None and self.module_ids[pos] not in module_ok:
+                continue
+            yield pos
+
+    def _seek_range(self, start_time: datetime | None, end_time: datetime | None):
+        """Row range that can contain ``[start_time, end_time]`` (whole file if not seekable)."""
+        lo, hi = 0, len(self)
+        if not self.seekable:
+            return lo, hi
+        start_key = self._wall_key(start_time)
+        end_key = self._wall_key(end_time)
+        if start_time is not None and start_key is not None:
+            lo = bisect.bisect_left(self.timestamps, start_key, key=lambda ts: ts[:_WALL_KEY_LEN])
+        if end_time is not None and end_key is not None:
+            # Keys are second-resolution: keep the whole end second, filter exactly later
+            hi = bisect.bisect_right(self.timestamps, end_key, key=lambda ts: ts[:_WALL_KEY_LEN])
+        return lo, max(lo, hi)
+
+    def _wall_key(self, value: datetime | None) -> str | None:
+        """``value`` as this file's wall-clock key, None when it cannot be compared that way."""
+        if value is None:
+            return None
+        if self.ts_kind == "ist" and value.tzinfo is not None:
+            return value.astimezone(IST).strftime("%Y-%m-%dT%H:%M:%S")
+        if self.ts_kind == "naive" and value.tzinfo is None:
+            return value.strftime("%Y-%m-%dT%H:%M:%S")
+        return None
+
+    def read_line(self, f, pos: int) -> str:
+        """Raw line for row ``pos`` from an open binary handle of the log file."""
+        f.seek(self.offsets[pos])
+        return f.readline().decode("utf-8")
+
+
+class LogIndexCache:
+    """Process-wide ``LogFileIndex`` per log file, refreshed on every lookup."""
+
+    def __init__(self) -> None:
+        self._indexes: dict[Path, LogFileIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> LogFileIndex:
+        key = path.resolve()
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = self._indexes[key] = LogFileIndex.load(key)
+        index.refresh()
+        index.persist()
+        return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+
+
+_cache = LogIndexCache()
+
+
+def get_log_index(path: Path) -> LogFileIndex:
+    return _cache.get(path)
@@ -2,16 +2,25 @@
 User File Logging Handler (JSONL)
 
 Writes per-user JSONL logs organized by date.
+
+By default (``USER_LOG_ASYNC``) records are handed to the process-wide
+``AsyncJsonlWriter`` and written in batches by a background thread, so logging in the
+trading loops does no file I/O on the calling thread.
 """
 
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 from typing import Any
 
+from config.settings import USER_LOG_ASYNC
 from src.infrastructure.db.timezone_utils import ist_now
+from src.infrastructure.logging.async_jsonl_writer import (
+    dumps_log_payload,
+    get_async_jsonl_writer,
+    snapshot_log_value,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +69,7 @@ class UserFileLogHandler(logging.Handler):
         user_id: int,
         log_type: str = "service",
         level: int = logging.NOTSET,
+        async_writes: bool | None = None,
     ):
         """
         Initialize user file log handler.
@@ -68,22 +78,31 @@ class UserFileLogHandler(logging.Handler):
             user_id: User ID for log file organization
             log_type: Type of log file ('service' or 'errors')
             level: Minimum logging level (default: NOTSET = all levels)
+            async_writes: Queue records to the background writer instead of writing
+                synchronously (default: USER_LOG_ASYNC setting)
         """
         super().__init__(level)
         self.user_id = user_id
         self.log_type = log_type
+        self.async_writes = USER_LOG_ASYNC if async_writes is None else async_writes
 
-        log_dir = Path("logs") / "users" / f"user_{user_id}"
+        # Absolute path: queued records must land here even if the cwd changes later
+        log_dir = (Path("logs") / "users" / f"user_{user_id}").resolve()
         log_dir.mkdir(parents=True, exist_ok=True)
         today = ist_now().date().strftime("%Y%m%d")
         self.base_path = log_dir
         self.baseFilename = str(log_dir / f"{log_type}_{today}.jsonl")
-        self.stream = open(self.baseFilename, "a", encoding="utf-8")
+        self._writer = get_async_jsonl_writer() if self.async_writes else None
+        self.stream = None if self.async_writes else open(self.baseFilename, "a", encoding="utf-8")
 
     def _ensure_current_file(self) -> None:
         today = ist_now().date().strftime("%Y%m%d")
         expected = self.base_path / f"{self.log_type}_{today}.jsonl"
         if self.baseFilename != str(expected):
+            if self._writer is not None:
+                # The writer opens files by path; it closes the idle old one itself
+                self.baseFilename = str(expected)
+                return
             try:
                 if self.stream:
                     self.stream.close()
@@ -97,11 +116,8 @@ class UserFileLogHandler(logging.Handler):
         for key, value in record.__dict__.items():
             if key in self.STANDARD_FIELDS:
                 continue
-            try:
-                json.dumps(value)  # test serializability
-                context[key] = value
-            except (TypeError, ValueError):
-                context[key] = str(value)
+            # Copied now: the writer thread serializes the payload after the caller moves on
+            context[key] = snapshot_log_value(value)
         return context or None
 
     def emit(self, record: logging.LogRecord) -> None:
@@ -121,15 +137,27 @@ class UserFileLogHandler(logging.Handler):
                 "user_id": self.user_id,
             }
 
-            line = json.dumps(payload, ensure_ascii=False)
-            self.stream.write(line + "\n")
+            if self._writer is not None:
+                self._writer.submit(self.baseFilename, payload)
+                return
+
+            self.stream.write(dumps_log_payload(payload) + "\n")
             self.stream.flush()
 
         except Exception:
             self.handleError(record)
 
+    def flush(self) -> None:
+        """Write out queued records (async) or the file buffer (sync)."""
+        if self._writer is not None:
+            self._writer.flush()
+        elif self.stream and not self.stream.closed:
+            self.stream.flush()
+
     def close(self) -> None:
         try:
+            if self._writer is not None:
+                self._writer.flush()
             if self.stream and not self.stream.closed:
                 self.stream.close()
         finally:
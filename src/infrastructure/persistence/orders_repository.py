@@ -3,9 +3,10 @@ from __future__ import annotations
 import builtins
 import json
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
-from sqlalchemy import func, inspect, select, text
+from sqlalchemy import bindparam, column, func, select, table, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -17,6 +18,7 @@ from src.infrastructure.db.models import (
     SignalStatus,
     TradeMode,
 )
+from src.infrastructure.db.schema_registry import table_columns
 from src.infrastructure.db.timezone_utils import IST, ist_now_naive
 from src.infrastructure.persistence.fills_repository import FillsRepository
 from src.infrastructure.persistence.settings_repository import SettingsRepository
@@ -46,6 +48,203 @@ except ImportError:
 
 CIRCUIT_DEFER_ORIG_SOURCE = "circuit_defer"
 
+# Columns selected by OrdersRepository.list; optional ones only when present in the database
+_LIST_BASE_COLUMNS = (
+    "id",
+    "user_id",
+    "symbol",
+    "side",
+    "order_type",
+    "quantity",
+    "price",
+    "status",
+    "avg_price",
+    "placed_at",
+    "filled_at",
+    "closed_at",
+    "orig_source",
+)
+_LIST_OPTIONAL_COLUMNS = (
+    "updated_at",
+    "order_id",
+    "broker_order_id",
+    "metadata",
+    "entry_type",
+    # Order monitoring fields
+    "first_failed_at",
+    "last_retry_attempt",
+    "retry_count",
+    "reason",
+    "last_status_check",
+    "execution_price",
+    "execution_qty",
+    "execution_time",
+    # Phase 0.1: Trade mode column
+    "trade_mode",
+)
+# Optional columns copied as-is / parsed as datetimes (the rest need special handling)
+_LIST_PLAIN_COLUMNS = (
+    "order_id",
+    "broker_order_id",
+    "entry_type",
+    "reason",
+    "execution_price",
+    "execution_qty",
+)
+_LIST_DATETIME_COLUMNS = (
+    "first_failed_at",
+    "last_retry_attempt",
+    "last_status_check",
+    "execution_time",
+)
+
+
+class OrderRow(NamedTuple):
+    """Read-only order returned by ``OrdersRepository.list(projection=True)``.
+
+    Field names match the ``Orders`` attributes; fields whose column is missing from the
+    database keep their default.
+    """
+
+    id: int
+    user_id: int
+    symbol: str
+    side: str
+    order_type: str
+    quantity: float
+    price: float | None
+    status: OrderStatus
+    avg_price: float | None
+    placed_at: datetime | None
+    updated_at: datetime | None
+    filled_at: datetime | None
+    closed_at: datetime | None
+    orig_source: str | None
+    order_id: str | None = None
+    broker_order_id: str | None = None
+    order_metadata: dict | None = None
+    entry_type: str | None = None
+    first_failed_at: datetime | None = None
+    last_retry_attempt: datetime | None = None
+    retry_count: int = 0
+    reason: str | None = None
+    last_status_check: datetime | None = None
+    execution_price: float | None = None
+    execution_qty: float | None = None
+    execution_time: datetime | None = None
+    trade_mode: TradeMode | None = None
+
+
+@lru_cache(maxsize=8)
+def _orders_list_columns(existing: frozenset[str]) -> tuple[str, ...]:
+    return _LIST_BASE_COLUMNS + tuple(c for c in _LIST_OPTIONAL_COLUMNS if c in existing)
+
+
+@lru_cache(maxsize=64)
+def _orders_list_select(columns: tuple[str, ...], by_status: bool, paginated: bool, window: bool):
+    """Prebuilt SELECT for ``OrdersRepository.list`` (reused, so SQLAlchemy caches its SQL)."""
+    orders = table("orders", *(column(name) for name in columns))
+    stmt = select(*orders.c).where(orders.c.user_id == bindparam("user_id"))
+    if by_status:
+        stmt = stmt.where(orders.c.status == bindparam("status"))
+    if window:
+        stmt = stmt.add_columns(func.count().over().label("total_count"))
+    stmt = stmt.order_by(orders.c.placed_at.desc())
+    if paginated:
+        stmt = stmt.limit(bindparam("limit")).offset(bindparam("offset"))
+    return stmt
+
+
+@lru_cache(maxsize=2)
+def _orders_count_select(by_status: bool):
+    orders = table("orders", column("user_id"), column("status"))
+    stmt = select(func.count()).select_from(orders).where(orders.c.user_id == bindparam("user_id"))
+    if by_status:
+        stmt = stmt.where(orders.c.status == bindparam("status"))
+    return stmt
+
+
+def _parse_datetime(dt_value):
+    """Convert string datetime (SQLite) to datetime object if needed"""
+    if dt_value is None or isinstance(dt_value, datetime):
+        return dt_value
+    if not isinstance(dt_value, str):
+        return dt_value
+    # Try ISO format first (handles timezone-aware strings)
+    try:
+        return datetime.fromisoformat(dt_value.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        pass
+    # Try common SQLite formats (naive datetimes)
+    for fmt in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"):
+        try:
+            return datetime.strptime(dt_value, fmt)
+        except (ValueError, AttributeError):
+            continue
+    return None
+
+
+def _order_values(row: dict[str, Any], columns: tuple[str, ...]) -> dict[str, Any]:
+    """Map a selected ``orders`` row to ``Orders`` / ``OrderRow`` keyword arguments."""
+    # Convert status string to OrderStatus enum
+    status_str = row.get("status", "amo")
+    try:
+        status_enum = OrderStatus(status_str.lower())
+    except (ValueError, AttributeError):
+        status_upper = status_str.upper()
+        status_enum = getattr(OrderStatus, status_upper, OrderStatus.AMO)
+
+    values = {
+        "id": row["id"],
+        "user_id": row["user_id"],
+        "symbol": row["symbol"],
+        "side": row["side"],
+        "order_type": row["order_type"],
+        "quantity": row["quantity"],
+        "price": row.get("price"),
+        "status": status_enum,
+        "avg_price": row.get("avg_price"),
+        "placed_at": _parse_datetime(row["placed_at"]),
+        # Fallback to placed_at if updated_at not present (for existing records)
+        "updated_at": _parse_datetime(row.get("updated_at") or row.get("placed_at")),
+        "filled_at": _parse_datetime(row.get("filled_at")),
+        "closed_at": _parse_datetime(row.get("closed_at")),
+        "orig_source": row.get("orig_source"),
+    }
+    if len(columns) == len(_LIST_BASE_COLUMNS):
+        return values
+
+    # Only add optional fields if they exist in the database
+    for name in _LIST_PLAIN_COLUMNS:
+        if name in row:
+            values[name] = row[name]
+    for name in _LIST_DATETIME_COLUMNS:
+        if name in row:
+            values[name] = _parse_datetime(row[name])
+    if "retry_count" in row:
+        values["retry_count"] = row["retry_count"] or 0
+    if "metadata" in row:
+        # Handle JSON metadata - might be string or dict
+        metadata_val = row["metadata"]
+        if isinstance(metadata_val, str):
+            try:
+                metadata_val = json.loads(metadata_val)
+            except Exception:
+                metadata_val = None
+        values["order_metadata"] = metadata_val
+    # Phase 0.1: Add trade_mode if column exists
+    if "trade_mode" in row:
+        trade_mode_str = row["trade_mode"]
+        if trade_mode_str:
+            try:
+                values["trade_mode"] = TradeMode(trade_mode_str.lower())
+            except (ValueError, AttributeError):
+                # Fallback to default if invalid value
+                values["trade_mode"] = TradeMode.PAPER
+        else:
+            values["trade_mode"] = TradeMode.PAPER
+    return values
+
 
 class OrdersRepository:
     def __init__(self, db: Session):
@@ -54,13 +253,16 @@ class OrdersRepository:
     def get(self, order_id: int) -> Orders | None:
         return self.db.get(Orders, order_id)
 
-    def list(  # noqa: PLR0912, PLR0915
+    def list(  # noqa: PLR0913
         self,
         user_id: int,
         status: OrderStatus | None = None,
         limit: int | None = None,
         offset: int = 0,
-    ) -> tuple[builtins.list[Orders], int]:
+        *,
+        window_count: bool = False,
+        projection: bool = False,
+    ) -> tuple[builtins.list[Orders] | builtins.list[OrderRow], int]:
         """
         List orders with optional pagination support.
 
@@ -69,211 +271,44 @@ class OrdersRepository:
             status: Optional status filter
             limit: Optional limit for pagination
             offset: Offset for pagination (default: 0)
+            window_count: Return the total from a ``COUNT(*) OVER ()`` column of the page
+                query instead of a separate COUNT query (only used with ``limit``)
+            projection: Return read-only ``OrderRow`` tuples instead of detached ``Orders``
 
         Returns:
             Tuple of (orders list, total count)
         """
-        # Always use raw SQL fallback to avoid enum validation issues
-        # This ensures compatibility with database schema regardless of SQLAlchemy metadata cache
-
-        # Check which columns actually exist in the database
-        inspector = inspect(self.db.bind)
-        orders_columns = [col["name"] for col in inspector.get_columns("orders")]
-
-        # Build SELECT query dynamically based on available columns
-        base_columns = [
-            "id",
-            "user_id",
-            "symbol",
-            "side",
-            "order_type",
-            "quantity",
-            "price",
-            "status",
-            "avg_price",
-            "placed_at",
-            "filled_at",
-            "closed_at",
-            "orig_source",
-        ]
-        optional_columns = []
-        # Handle updated_at as optional for backward compatibility (until migration runs)
-        if "updated_at" in orders_columns:
-            optional_columns.append("updated_at")
-        if "order_id" in orders_columns:
-            optional_columns.append("order_id")
-        if "broker_order_id" in orders_columns:
-            optional_columns.append("broker_order_id")
-        if "metadata" in orders_columns:
-            optional_columns.append("metadata")
-        if "entry_type" in orders_columns:
-            optional_columns.append("entry_type")
-        # Order monitoring fields
-        if "first_failed_at" in orders_columns:
-            optional_columns.append("first_failed_at")
-        if "last_retry_attempt" in orders_columns:
-            optional_columns.append("last_retry_attempt")
-        if "retry_count" in orders_columns:
-            optional_columns.append("retry_count")
-        if "reason" in orders_columns:
-            optional_columns.append("reason")
-        if "last_status_check" in orders_columns:
-            optional_columns.append("last_status_check")
-        if "execution_price" in orders_columns:
-            optional_columns.append("execution_price")
-        if "execution_qty" in orders_columns:
-            optional_columns.append("execution_qty")
-        if "execution_time" in orders_columns:
-            optional_columns.append("execution_time")
-        # Phase 0.1: Trade mode column
-        if "trade_mode" in orders_columns:
-            optional_columns.append("trade_mode")
-
-        all_columns = base_columns + optional_columns
-
-        # Build base WHERE clause
-        where_clause = "WHERE user_id = :user_id"
-        params = {"user_id": user_id}
+        # Select through an untyped table construct (no ORM enum validation), restricted to
+        # the columns that exist in the database so it works before migrations have run
+        columns = _orders_list_columns(table_columns(self.db.bind, "orders"))
+        paginated = limit is not None
+        use_window = window_count and paginated
+
+        params: dict[str, Any] = {"user_id": user_id}
         if status:
-            where_clause += " AND status = :status"
             # Use enum value (lowercase) to match database
             params["status"] = status.value.lower()
-
-        # Get total count before applying pagination
-        # `where_clause` is built from static strings; values are bound via `params`.
-        count_query = f"SELECT COUNT(*) FROM orders {where_clause}"  # noqa: S608
-        total_count = self.db.execute(text(count_query), params).scalar() or 0
-
-        # Build SELECT query with pagination.
-        # Columns are derived from DB introspection; values are bound via `params`.
-        query = "\n".join(
-            [
-                "SELECT " + ", ".join(all_columns),
-                "FROM orders",
-                where_clause,
-                "ORDER BY placed_at DESC",
-            ]
-        )  # noqa: S608
-
-        # Apply pagination if limit is provided
-        if limit is not None:
-            query += " LIMIT :limit OFFSET :offset"
+        if paginated:
             params["limit"] = int(limit)
             params["offset"] = max(0, int(offset))
 
-        results = self.db.execute(text(query), params).fetchall()
+        stmt = _orders_list_select(columns, bool(status), paginated, use_window)
+        results = self.db.execute(stmt, params).fetchall()
 
-        # Helper function to convert string datetime to datetime object
-        def parse_datetime(dt_value):
-            """Convert string datetime to datetime object if needed"""
-            if dt_value is None or isinstance(dt_value, datetime):
-                return dt_value
-            if not isinstance(dt_value, str):
-                return dt_value
-            # Try ISO format first (handles timezone-aware strings)
-            try:
-                return datetime.fromisoformat(dt_value.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                pass
-            # Try common SQLite formats (naive datetimes)
-            for fmt in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"):
-                try:
-                    return datetime.strptime(dt_value, fmt)
-                except (ValueError, AttributeError):
-                    continue
-            return None
+        if not paginated:
+            total_count = len(results)
+        elif use_window and results:
+            total_count = results[0][-1]
+        elif use_window and params["offset"] == 0:
+            total_count = 0
+        else:
+            count_stmt = _orders_count_select(bool(status))
+            total_count = self.db.execute(count_stmt, params).scalar() or 0
 
-        # Reconstruct Orders objects with all columns including new ones
-        orders = []
-        for row in results:
-            # Row is a Row object - access by index or use _mapping
-            row_dict = dict(row._mapping) if hasattr(row, "_mapping") else {}
-            # If _mapping doesn't work, access by index
-            if not row_dict:
-                row_dict = {all_columns[i]: row[i] for i in range(min(len(row), len(all_columns)))}
-
-            # Convert status string to OrderStatus enum
-            status_str = row_dict.get("status", "amo")
-            try:
-                status_enum = OrderStatus(status_str.lower())
-            except (ValueError, AttributeError):
-                status_upper = status_str.upper()
-                status_enum = getattr(OrderStatus, status_upper, OrderStatus.AMO)
-
-            # Build Orders object with only fields that exist
-            order_kwargs = {
-                "id": row_dict["id"],
-                "user_id": row_dict["user_id"],
-                "symbol": row_dict["symbol"],
-                "side": row_dict["side"],
-                "order_type": row_dict["order_type"],
-                "quantity": row_dict["quantity"],
-                "price": row_dict.get("price"),
-                "status": status_enum,
-                "avg_price": row_dict.get("avg_price"),
-                "placed_at": parse_datetime(row_dict["placed_at"]),
-                "updated_at": parse_datetime(
-                    row_dict.get("updated_at") or row_dict.get("placed_at")
-                ),  # Fallback to placed_at if updated_at not present (for existing records)
-                "filled_at": parse_datetime(row_dict.get("filled_at")),
-                "closed_at": parse_datetime(row_dict.get("closed_at")),
-                "orig_source": row_dict.get("orig_source"),
-            }
-            # Only add optional fields if they exist in the database
-            if "order_id" in orders_columns:
-                order_kwargs["order_id"] = row_dict.get("order_id")
-            if "broker_order_id" in orders_columns:
-                order_kwargs["broker_order_id"] = row_dict.get("broker_order_id")
-            if "metadata" in orders_columns:
-                # Handle JSON metadata - might be string or dict
-                metadata_val = row_dict.get("metadata")
-                if isinstance(metadata_val, str):
-                    try:
-                        metadata_val = json.loads(metadata_val)
-                    except Exception:
-                        metadata_val = None
-                order_kwargs["order_metadata"] = metadata_val
-            if "entry_type" in orders_columns:
-                order_kwargs["entry_type"] = row_dict.get("entry_type")
-            # Order monitoring fields
-            if "first_failed_at" in orders_columns:
-                order_kwargs["first_failed_at"] = parse_datetime(row_dict.get("first_failed_at"))
-            if "last_retry_attempt" in orders_columns:
-                order_kwargs["last_retry_attempt"] = parse_datetime(
-                    row_dict.get("last_retry_attempt")
-                )
-            if "retry_count" in orders_columns:
-                order_kwargs["retry_count"] = row_dict.get("retry_count") or 0
-            if "reason" in orders_columns:
-                order_kwargs["reason"] = row_dict.get("reason")
-            if "last_status_check" in orders_columns:
-                order_kwargs["last_status_check"] = parse_datetime(
-                    row_dict.get("last_status_check")
-                )
-            if "execution_price" in orders_columns:
-                order_kwargs["execution_price"] = row_dict.get("execution_price")
-            if "execution_qty" in orders_columns:
-                order_kwargs["execution_qty"] = row_dict.get("execution_qty")
-            if "execution_time" in orders_columns:
-                order_kwargs["execution_time"] = parse_datetime(row_dict.get("execution_time"))
-            if "updated_at" in orders_columns:
-                order_kwargs["updated_at"] = parse_datetime(
-                    row_dict.get("updated_at") or row_dict.get("placed_at")
-                )
-            # Phase 0.1: Add trade_mode if column exists
-            if "trade_mode" in orders_columns:
-                trade_mode_str = row_dict.get("trade_mode")
-                if trade_mode_str:
-                    try:
-                        order_kwargs["trade_mode"] = TradeMode(trade_mode_str.lower())
-                    except (ValueError, AttributeError):
-                        # Fallback to default if invalid value
-                        order_kwargs["trade_mode"] = TradeMode.PAPER
-                else:
-                    order_kwargs["trade_mode"] = TradeMode.PAPER
-
-            order = Orders(**order_kwargs)
-            orders.append(order)
+        make = OrderRow if projection else Orders
+        orders = [
+            make(**_order_values(dict(zip(columns, row, strict=False)), columns)) for row in results
+        ]
         return orders, total_count
 
     def create_amo(  # noqa: PLR0912, PLR0913, PLR0915
@@ -769,8 +804,8 @@ class OrdersRepository:
         # Extract base symbol (remove segment suffixes)
         base_symbol = symbol.upper().split("-")[0].strip()
 
-        # Get all buy orders for user
-        all_orders, _ = self.list(user_id)
+        # Get all buy orders for user (read-only check: row tuples are enough)
+        all_orders, _ = self.list(user_id, projection=True)
 
         for order in all_orders:
             if order.side != "buy" or order.status not in statuses:
@@ -1220,7 +1255,7 @@ class OrdersRepository:
 
             # Edge case: Check if there are other successful orders for this symbol
             # Only mark as FAILED if ALL buy orders have failed
-            other_orders, _ = self.list(order.user_id)
+            other_orders, _ = self.list(order.user_id, projection=True)
             symbol_orders = [
                 o
                 for o in other_orders
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from calendar import monthrange
-from datetime import date
+from datetime import date, datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.orm import Session
 
-from src.infrastructure.db.models import PnlDaily
+from src.infrastructure.db.models import PnlDaily, PnlMaterializationMark
 
 
 class PnlRepository:
@@ -55,3 +55,81 @@ class PnlRepository:
             self.db.commit()
             self.db.refresh(rec)
             return rec
+
+    def upsert_many(self, records: list[PnlDaily]) -> list[PnlDaily]:
+        """Upsert several days for one user with one lookup query and one commit."""
+        if not records:
+            return []
+        dates = [rec.date for rec in records]
+        existing = {row.date: row for row in self.range(records[0].user_id, min(dates), max(dates))}
+
+        saved = []
+        for rec in records:
+            row = existing.get(rec.date)
+            if row:
+                row.realized_pnl = rec.realized_pnl
+                row.unrealized_pnl = rec.unrealized_pnl
+                row.fees = rec.fees
+            else:
+                self.db.add(rec)
+                row = rec
+            saved.append(row)
+        self.db.commit()
+        return saved
+
+    def set_unrealized_pnl(self, user_id: int, start: date, end: date, amount: float) -> None:
+        """Apply the current unrealized P&L to every day of the range in one UPDATE."""
+        self.db.execute(
+            update(PnlDaily)
+            .where(
+                PnlDaily.user_id == user_id,
+                PnlDaily.date >= start,
+                PnlDaily.date <= end,
+                PnlDaily.unrealized_pnl != amount,
+            )
+            .values(unrealized_pnl=amount)
+        )
+        self.db.commit()
+
+    def materialization_mark(self, user_id: int, trade_mode: str) -> PnlMaterializationMark | None:
+        return self.db.execute(
+            select(PnlMaterializationMark).where(
+                PnlMaterializationMark.user_id == user_id,
+                PnlMaterializationMark.trade_mode == trade_mode,
+            )
+        ).scalar_one_or_none()
+
+    def save_materialization_mark(  # noqa: PLR0913
+        self,
+        user_id: int,
+        trade_mode: str,
+        start_date: date,
+        through_date: date,
+        as_of: datetime,
+        closed_positions: dict[int, datetime],
+    ) -> PnlMaterializationMark:
+        """
+        Store the mark for ``trade_mode`` and drop the user's marks for other modes.
+
+        pnl_daily has one row per user and day, so rows written for one mode invalidate
+        whatever another mode's mark recorded.
+        """
+        self.db.execute(
+            delete(PnlMaterializationMark).where(
+                PnlMaterializationMark.user_id == user_id,
+                PnlMaterializationMark.trade_mode != trade_mode,
+            )
+        )
+        mark = self.materialization_mark(user_id, trade_mode)
+        if mark is None:
+            mark = PnlMaterializationMark(user_id=user_id, trade_mode=trade_mode)
+            self.db.add(mark)
+        mark.start_date = start_date
+        mark.through_date = through_date
+        mark.as_of = as_of
+        mark.closed_positions = {
+            str(pos_id): closed_at.isoformat()
+            for pos_id, closed_at in sorted(closed_positions.items())
+        }
+        self.db.commit()
+        return mark
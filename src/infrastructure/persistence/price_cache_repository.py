@@ -625,6 +625,61 @@ class PriceCacheRepository:
         self.db.refresh(meta)
         return meta
 
+    def refresh_symbol_meta_many(
+        self, symbols: list[str], interval: str = DEFAULT_INTERVAL
+    ) -> dict[str, OhlcvSymbolMeta]:
+        """
+        Recompute ohlcv_symbol_meta for many symbols with one aggregate query and one commit.
+
+        Same result as calling :meth:`refresh_symbol_meta` per symbol (symbols without
+        cached rows get an empty meta row).
+        """
+        symbols = list(dict.fromkeys(symbols))
+        if not symbols:
+            return {}
+
+        aggs = {
+            sym: (first_date, last_date, row_count)
+            for sym, first_date, last_date, row_count in self.db.execute(
+                select(
+                    PriceCache.symbol,
+                    func.min(PriceCache.date),
+                    func.max(PriceCache.date),
+                    func.count(PriceCache.id),
+                )
+                .where(and_(PriceCache.symbol.in_(symbols), PriceCache.interval == interval))
+                .group_by(PriceCache.symbol)
+            ).all()
+        }
+        existing = {
+            meta.symbol: meta
+            for meta in self.db.execute(
+                select(OhlcvSymbolMeta).where(
+                    and_(
+                        OhlcvSymbolMeta.symbol.in_(symbols),
+                        OhlcvSymbolMeta.interval == interval,
+                    )
+                )
+            ).scalars()
+        }
+
+        now = ist_now_naive()
+        metas: dict[str, OhlcvSymbolMeta] = {}
+        for symbol in symbols:
+            first_date, last_date, row_count = aggs.get(symbol, (None, None, 0))
+            meta = existing.get(symbol)
+            if meta is None:
+                meta = OhlcvSymbolMeta(symbol=symbol, interval=interval)
+                self.db.add(meta)
+            meta.first_date = first_date
+            meta.last_date = last_date
+            meta.row_count = int(row_count or 0)
+            meta.updated_at = now
+            metas[symbol] = meta
+
+        self.db.commit()
+        return metas
+
     def record_fetch_validation(
         self,
         symbol: str,
@@ -633,8 +688,13 @@ class PriceCacheRepository:
         fetch_status: str,
         coverage_pct: float | None,
         message: str,
+        commit: bool = True,
     ) -> OhlcvSymbolMeta:
-        """Persist Yahoo ingest validation outcome on ohlcv_symbol_meta."""
+        """
+        Persist Yahoo ingest validation outcome on ohlcv_symbol_meta.
+
+        Pass ``commit=False`` to batch several symbols into the caller's commit.
+        """
         meta = self.get_symbol_meta(symbol, interval=interval)
         if meta is None:
             meta = OhlcvSymbolMeta(symbol=symbol, interval=interval, row_count=0)
@@ -644,8 +704,9 @@ class PriceCacheRepository:
         meta.last_validation_message = message[:2000] if message else None
         meta.last_fetch_at = ist_now_naive()
         meta.updated_at = ist_now_naive()
-        self.db.commit()
-        self.db.refresh(meta)
+        if commit:
+            self.db.commit()
+            self.db.refresh(meta)
         return meta
 
     def get_symbol_meta(
@@ -2,7 +2,21 @@ from __future__ import annotations
 
 from datetime import date, datetime, time, timedelta
 
-from sqlalchemy import bindparam, func, outerjoin, select, text, update
+from sqlalchemy import (
+    ColumnElement,
+    and_,
+    bindparam,
+    case,
+    exists,
+    false,
+    func,
+    literal,
+    or_,
+    outerjoin,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.orm import Session
 
 from src.infrastructure.db.models import (
@@ -21,6 +35,8 @@ from src.infrastructure.utils.holiday_calendar import get_next_trading_day
 SATURDAY = 5  # weekday() returns 5 for Saturday
 SUNDAY = 6  # weekday() returns 6 for Sunday
 MARKET_CLOSE_TIME = time(15, 30)  # 3:30 PM IST
+# User actions that always win over the base signal status in the buying zone
+USER_ACTION_STATUSES = (SignalStatus.TRADED, SignalStatus.REJECTED, SignalStatus.FAILED)
 
 
 class SignalsRepository:
@@ -877,37 +893,7 @@ class SignalsRepository:
         self.mark_time_expired_signals()
 
         # Get symbols with open positions for this user (exclude from active signals)
-        open_position_symbols = set()
-        try:
-            from modules.kotak_neo_auto_trader.utils.symbol_utils import extract_base_symbol
-
-            open_positions = (
-                self.db.execute(
-                    select(Positions.symbol).where(
-                        Positions.user_id == user_id,
-                        Positions.quantity > 0,
-                        Positions.closed_at.is_(None),  # Only open positions
-                    )
-                )
-                .scalars()
-                .all()
-            )
-            # Normalize symbols (remove suffixes for matching)
-            for pos_symbol in open_positions:
-                # Use extract_base_symbol for consistent normalization
-                base_symbol = extract_base_symbol(pos_symbol).upper()
-                open_position_symbols.add(base_symbol)
-                # Also add variants for comprehensive matching
-                open_position_symbols.add(pos_symbol.upper())
-                # Add NSE-style variant if not already present
-                if not pos_symbol.upper().endswith(".NS"):
-                    open_position_symbols.add(f"{base_symbol}.NS")
-                # Add EQ variant if not already present
-                if "-" not in pos_symbol.upper():
-                    open_position_symbols.add(f"{base_symbol}-EQ")
-        except Exception as e:
-            # If positions table doesn't exist or query fails, continue without exclusion
-            logger.debug(f"Failed to get open positions for exclusion: {e}")
+        open_position_symbols = self._open_position_symbol_variants(user_id)
 
         # Join signals with user_signal_status
         stmt = (
@@ -1003,6 +989,189 @@ class SignalsRepository:
 
         return signals_with_status
 
+    def _open_position_symbol_variants(self, user_id: int) -> set[str]:
+        """Upper-cased symbol variants (base, .NS, -EQ) of the user's open positions."""
+        open_position_symbols = set()
+        try:
+            from modules.kotak_neo_auto_trader.utils.symbol_utils import extract_base_symbol
+
+            open_positions = (
+                self.db.execute(
+                    select(Positions.symbol).where(
+                        Positions.user_id == user_id,
+                        Positions.quantity > 0,
+                        Positions.closed_at.is_(None),  # Only open positions
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            # Normalize symbols (remove suffixes for matching)
+            for pos_symbol in open_positions:
+                # Use extract_base_symbol for consistent normalization
+                base_symbol = extract_base_symbol(pos_symbol).upper()
+                open_position_symbols.add(base_symbol)
+                # Also add variants for comprehensive matching
+                open_position_symbols.add(pos_symbol.upper())
+                # Add NSE-style variant if not already present
+                if not pos_symbol.upper().endswith(".NS"):
+                    open_position_symbols.add(f"{base_symbol}.NS")
+                # Add EQ variant if not already present
+                if "-" not in pos_symbol.upper():
+                    open_position_symbols.add(f"{base_symbol}-EQ")
+        except Exception as e:
+            # If positions table doesn't exist or query fails, continue without exclusion
+            logger.debug(f"Failed to get open positions for exclusion: {e}")
+        return open_position_symbols
+
+    @staticmethod
+    def _matches_symbol_variants(
+        symbol: ColumnElement[str], variants: set[str]
+    ) -> ColumnElement[bool]:
+        """
+        SQL condition: any variant of the upper-cased ``symbol`` is in ``variants``.
+
+        Mirrors ``get_signals_with_user_status``: a signal's variants are the symbol itself,
+        its base (text before the first ``-``), ``<base>.NS`` unless it already ends in
+        ``.NS`` and ``<base>-EQ`` when it has no suffix. "Base is ``b``" is matched as
+        ``symbol = b OR symbol LIKE 'b-%'``.
+        """
+        if not variants:
+            return false()
+
+        def has_base(base: str) -> ColumnElement[bool]:
+            escaped = base.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            return or_(symbol == base, symbol.like(f"{escaped}-%", escape="\\"))
+
+        # Unsuffixed symbols whose -EQ variant is held are matched exactly
+        exact = variants | {v[:-3] for v in variants if v.endswith("-EQ") and "-" not in v[:-3]}
+        bases = {v for v in variants if "-" not in v}
+        ns_bases = {v[:-3] for v in variants if v.endswith(".NS") and "-" not in v[:-3]} - bases
+        conditions = [symbol.in_(sorted(exact))]
+        conditions += [has_base(base) for base in sorted(bases)]
+        conditions += [and_(~symbol.like("%.NS"), has_base(base)) for base in sorted(ns_bases)]
+        return or_(*conditions)
+
+    def time_expiry_cutoff(self, now: datetime | None = None) -> datetime:
+        """
+        Naive IST instant before which signals are past their market-close expiry.
+
+        A signal expires at 3:30 PM IST on the next trading day after its date, so the
+        expired signals at ``now`` are exactly those dated before the first date whose
+        expiry is still ahead. Lets readers apply ``mark_time_expired_signals``' rule as a
+        plain ``ts < cutoff`` comparison without writing anything.
+        """
+        now = now or ist_now()
+        if now.tzinfo is not None:
+            now = now.astimezone(IST)
+        now = now.replace(tzinfo=None)
+
+        cutoff_date = now.date()
+        while True:
+            previous = cutoff_date - timedelta(days=1)
+            if now >= datetime.combine(get_next_trading_day(previous), MARKET_CLOSE_TIME):
+                break
+            cutoff_date = previous
+        return datetime.combine(cutoff_date, time.min)
+
+    def buying_zone(  # noqa: PLR0913
+        self,
+        user_id: int,
+        *,
+        limit: int = 100,
+        status_filter: SignalStatus | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        before: tuple[datetime, int] | None = None,
+    ) -> list[tuple[Signals, SignalStatus, SignalStatus]]:
+        """
+        Read-only buying zone page: signals with per-user status, in one query.
+
+        Returns ``(signal, effective_status, base_status)`` tuples ordered by ``(ts, id)``
+        descending, applying the same rules as ``get_signals_with_user_status`` without
+        writing:
+
+        - ``base_status`` is EXPIRED for ACTIVE/REJECTED signals past their market-close
+          expiry (``time_expiry_cutoff``), unless any open position or pending buy order
+          holds the symbol - what ``mark_time_expired_signals`` would store. Persisting it
+          is left to the scheduled expiry job.
+        - ``effective_status`` is the user's TRADED/REJECTED/FAILED status, else TRADED when
+          the user holds an open position in the symbol, else EXPIRED when the base status
+          is, else the user's status or the base status.
+
+        Args:
+            user_id: User ID to get personalized status for
+            limit: Maximum number of signals to return
+            status_filter: Filter by effective status
+            start_date: Only signals on or after this IST date
+            end_date: Only signals on or before this IST date
+            before: Keyset cursor ``(ts, id)`` of the last row of the previous page
+
+        Returns:
+            List of (Signals, effective SignalStatus, base SignalStatus) tuples
+        """
+        held_elsewhere = or_(
+            exists().where(
+                Positions.symbol == Signals.symbol,
+                Positions.quantity > 0,
+                Positions.closed_at.is_(None),
+            ),
+            exists().where(
+                Orders.symbol == Signals.symbol,
+                Orders.status.in_([OrderStatus.PENDING, OrderStatus.ONGOING]),
+                Orders.side == "buy",
+            ),
+        )
+        base_value = func.lower(Signals.status)
+        base_status = case(
+            (
+                and_(
+                    base_value.in_([SignalStatus.ACTIVE.value, SignalStatus.REJECTED.value]),
+                    Signals.ts < self.time_expiry_cutoff(),
+                    ~held_elsewhere,
+                ),
+                literal(SignalStatus.EXPIRED.value),
+            ),
+            else_=base_value,
+        )
+
+        user_value = func.lower(UserSignalStatus.status)
+        has_open_position = self._matches_symbol_variants(
+            func.upper(Signals.symbol), self._open_position_symbol_variants(user_id)
+        )
+        effective_status = case(
+            (user_value.in_([s.value for s in USER_ACTION_STATUSES]), user_value),
+            (and_(has_open_position, user_value.is_(None)), literal(SignalStatus.TRADED.value)),
+            (base_status == SignalStatus.EXPIRED.value, literal(SignalStatus.EXPIRED.value)),
+            else_=func.coalesce(user_value, base_status),
+        )
+
+        stmt = select(Signals, effective_status, base_status).select_from(
+            outerjoin(
+                Signals,
+                UserSignalStatus,
+                (Signals.id == UserSignalStatus.signal_id) & (UserSignalStatus.user_id == user_id),
+            )
+        )
+        # Plain ts ranges (not date(ts)) so the ts index is used
+        if start_date is not None:
+            stmt = stmt.where(Signals.ts >= datetime.combine(start_date, time.min))
+        if end_date is not None:
+            stmt = stmt.where(Signals.ts < datetime.combine(end_date + timedelta(days=1), time.min))
+        if before is not None:
+            before_ts, before_id = before
+            stmt = stmt.where(
+                or_(Signals.ts < before_ts, and_(Signals.ts == before_ts, Signals.id < before_id))
+            )
+        if status_filter is not None:
+            stmt = stmt.where(effective_status == status_filter.value)
+        stmt = stmt.order_by(Signals.ts.desc(), Signals.id.desc()).limit(limit)
+
+        return [
+            (signal, SignalStatus(effective), SignalStatus(base))
+            for signal, effective, base in self.db.execute(stmt).all()
+        ]
+
     def sync_traded_status_for_symbol(self, symbol: str, user_id: int | None = None) -> bool:
         """
         Sync TRADED status for a single symbol (event-driven).
@@ -41,6 +41,8 @@ if "DB_URL" not in os.environ or not os.environ.get("DB_URL", "").startswith("sq
 os.environ["OHLCV_DAILY_SOURCE"] = "yahoo"
 os.environ["NSE_BHAVCOPY_REQUEST_DELAY_S"] = "0"
 os.environ["NSE_BHAVCOPY_REQUEST_TIMEOUT_S"] = "1"
+# Bulk scoring defaults to one worker process per core; tests patch the serial path
+os.environ["BACKTEST_SCORING_WORKERS"] = "1"
 # Signup tests use example.com; production enforces provider allowlist only.
 os.environ.setdefault("EMAIL_DOMAIN_ALLOWLIST_ENABLED", "false")
 os.environ.setdefault("AUTH_USE_COOKIES", "false")
@@ -52,6 +54,7 @@ def pytest_load_initial_conftests(early_config, parser, args):
     os.environ["OHLCV_DAILY_SOURCE"] = "yahoo"
     os.environ["NSE_BHAVCOPY_REQUEST_DELAY_S"] = "0"
     os.environ["NSE_BHAVCOPY_REQUEST_TIMEOUT_S"] = "1"
+    os.environ["BACKTEST_SCORING_WORKERS"] = "1"
 
 
 # Ensure Unicode logs render on Windows/CI environments
@@ -605,3 +608,15 @@ def _clear_trading_notification_dedupe():
         trading_notification_dedupe.clear()
     except ImportError:
         pass
+
+
+@pytest.fixture(autouse=True)
+def paper_trading_root_in_tmp_path(tmp_path, monkeypatch):
+    """
+    Keep paper trading stores (user_<id>/, data/) out of the working tree.
+
+    The store, the adapters and the pnl router all resolve their directories through
+    ``config.settings.paper_trading_dir``; tests that chdir into tmp_path see the same
+    ``paper_trading/`` directory.
+    """
+    monkeypatch.setattr("config.settings.PAPER_TRADING_ROOT", str(tmp_path / "paper_trading"))
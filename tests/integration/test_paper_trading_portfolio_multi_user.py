@@ -142,7 +142,7 @@ class TestPaperTradingPortfolioMultiUser:
         mock_ticker = MagicMock()
         mock_ticker.info = {"currentPrice": 100.0}
         monkeypatch.setattr(
-            "server.app.routers.paper_trading.yf.Ticker",
+            "yfinance.Ticker",
             lambda symbol: mock_ticker,
         )
         monkeypatch.setattr(
@@ -182,7 +182,7 @@ class TestPaperTradingPortfolioMultiUser:
         mock_ticker = MagicMock()
         mock_ticker.info = {"currentPrice": 100.0}
         monkeypatch.setattr(
-            "server.app.routers.paper_trading.yf.Ticker",
+            "yfinance.Ticker",
             lambda symbol: mock_ticker,
         )
         monkeypatch.setattr(
@@ -2,7 +2,6 @@
 Basic tests for paper trading system
 """
 
-import os
 import sys
 from pathlib import Path
 
@@ -23,18 +22,10 @@ from modules.kotak_neo_auto_trader.infrastructure.broker_adapters import PaperTr
 
 
 @pytest.fixture
-def paper_config():
+def paper_config(tmp_path):
     """Create test configuration"""
-    # Make storage path unique per worker when running in parallel
-    # This prevents race conditions when tests run with pytest-xdist (-n=auto)
-    base_path = "paper_trading/test"
-    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "")
-    if worker_id:
-        # Running in parallel - use unique path per worker
-        storage_path = f"{base_path}_{worker_id}"
-    else:
-        # Running sequentially - use base path
-        storage_path = base_path
+    # A per-test directory also keeps pytest-xdist workers from sharing state
+    storage_path = str(tmp_path / "paper_trading")
 
     return PaperTradingConfig(
         initial_capital=100000.0,
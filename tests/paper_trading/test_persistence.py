@@ -6,6 +6,9 @@ import pytest
 import json
 from pathlib import Path
 from modules.kotak_neo_auto_trader.infrastructure.persistence import PaperTradeStore
+from modules.kotak_neo_auto_trader.infrastructure.persistence.paper_trade_store import (
+    read_paper_trade_state,
+)
 
 
 class TestPaperTradeStore:
@@ -241,6 +244,125 @@ class TestPaperTradeStore:
         assert stats["account_initialized"] is True
 
 
+class TestPaperTradeStoreJournal:
+    """Test the append-only journal, compaction and indexes"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create store with temporary storage"""
+        return PaperTradeStore(str(tmp_path / "paper_trading"), auto_save=False)
+
+    def test_mutations_append_to_journal_not_snapshots(self, tmp_path):
+        """Auto-saved order/holding/transaction writes go to the journal only"""
+        store = PaperTradeStore(str(tmp_path), auto_save=True, compact_every=0)
+        store.add_order({"order_id": "J1", "symbol": "INFY", "status": "PENDING"})
+        store.update_order("J1", {"status": "COMPLETE"})
+        store.add_or_update_holding("INFY", {"quantity": 10})
+        store.add_transaction({"symbol": "INFY", "quantity": 10})
+
+        assert not (tmp_path / "orders.json").exists()
+        lines = (tmp_path / "journal.jsonl").read_text().splitlines()
+        assert [json.loads(line)["op"] for line in lines] == [
+            "add_order",
+            "update_order",
+            "put_holding",
+            "add_transaction",
+        ]
+
+        reloaded = PaperTradeStore(str(tmp_path))
+        assert reloaded.get_order_by_id("J1")["status"] == "COMPLETE"
+        assert reloaded.get_holding("INFY")["quantity"] == 10
+        assert len(reloaded.get_transactions_by_symbol("INFY")) == 1
+        assert reloaded.get_statistics()["journal_entries"] == 4
+
+    def test_compaction_writes_snapshots_and_truncates_journal(self, tmp_path):
+        """Every compact_every entries the journal is folded into the JSON files"""
+        store = PaperTradeStore(str(tmp_path), auto_save=True, compact_every=3)
+        store.add_order({"order_id": "J1", "symbol": "TCS", "status": "PENDING"})
+        store.add_or_update_holding("TCS", {"quantity": 5})
+        store.remove_holding("TCS")
+
+        assert (tmp_path / "journal.jsonl").read_text() == ""
+        assert json.loads((tmp_path / "orders.json").read_text())[0]["order_id"] == "J1"
+        assert json.loads((tmp_path / "holdings.json").read_text()) == {}
+
+        store.add_transaction({"symbol": "TCS", "quantity": 5})
+        store.save_all()
+        assert (tmp_path / "journal.jsonl").read_text() == ""
+        assert len(json.loads((tmp_path / "transactions.json").read_text())) == 1
+
+    def test_compaction_keeps_entries_journaled_by_another_store(self, tmp_path):
+        """Stores sharing a directory do not drop each other's entries on compaction"""
+        first = PaperTradeStore(str(tmp_path), auto_save=True, compact_every=0)
+        second = PaperTradeStore(str(tmp_path), auto_save=True, compact_every=0)
+        first.add_order({"order_id": "A1", "symbol": "INFY", "status": "PENDING"})
+        second.add_order({"order_id": "B1", "symbol": "TCS", "status": "PENDING"})
+        second.add_transaction({"symbol": "TCS", "quantity": 2})
+
+        first.save_all()
+
+        assert (tmp_path / "journal.jsonl").read_text() == ""
+        orders = json.loads((tmp_path / "orders.json").read_text())
+        assert [o["order_id"] for o in orders] == ["A1", "B1"]
+        assert len(json.loads((tmp_path / "transactions.json").read_text())) == 1
+        assert first.get_order_by_id("B1") is not None
+
+    def test_replay_after_interrupted_compaction_is_idempotent(self, tmp_path):
+        """Snapshots already holding journaled entries are not duplicated on load"""
+        store = PaperTradeStore(str(tmp_path), auto_save=True, compact_every=0)
+        store.add_order({"order_id": "J1", "symbol": "INFY", "status": "PENDING"})
+        store.add_transaction({"symbol": "INFY", "quantity": 1})
+        journal = (tmp_path / "journal.jsonl").read_text()
+        store.save_all()
+        # Simulate a crash after the snapshots were rewritten but before truncation
+        (tmp_path / "journal.jsonl").write_text(journal + '{"op": "add_order", "ord')
+
+        reloaded = PaperTradeStore(str(tmp_path))
+        assert len(reloaded.get_all_orders()) == 1
+        assert len(reloaded.get_all_transactions()) == 1
+
+    def test_indexes_follow_status_and_symbol_changes(self, store):
+        """Pending/symbol lookups reflect updates and keep insertion order"""
+        store.add_order({"order_id": "A", "symbol": "INFY", "status": "PENDING"})
+        store.add_order({"order_id": "B", "symbol": "TCS", "status": "OPEN"})
+        store.add_order({"order_id": "C", "symbol": "INFY", "status": "PENDING"})
+
+        store.update_order("A", {"status": "COMPLETE"})
+        store.update_order("B", {"symbol": "INFY"})
+
+        assert [o["order_id"] for o in store.get_pending_orders()] == ["B", "C"]
+        assert [o["order_id"] for o in store.get_orders_by_symbol("INFY")] == ["A", "B", "C"]
+        assert store.get_orders_by_symbol("TCS") == []
+        assert store.update_order("missing", {"status": "COMPLETE"}) is False
+        assert store.get_statistics()["completed_orders"] == 1
+
+    def test_restore_backup_drops_newer_journal(self, tmp_path):
+        """Restoring a backup without a journal discards entries made since"""
+        storage_path = tmp_path / "paper_trading"
+        store = PaperTradeStore(str(storage_path), auto_save=True, compact_every=0)
+        store.add_order({"order_id": "J1", "status": "PENDING"})
+        store.save_all()
+        (storage_path / "journal.jsonl").unlink()
+        backup_dir = store.create_backup()
+
+        store.add_order({"order_id": "J2", "status": "PENDING"})
+        store.restore_backup(backup_dir)
+
+        assert [o["order_id"] for o in store.get_all_orders()] == ["J1"]
+        assert not (storage_path / "journal.jsonl").exists()
+
+    def test_read_paper_trade_state_includes_journal(self, tmp_path):
+        """External readers see journaled entries without opening a store"""
+        store = PaperTradeStore(str(tmp_path), auto_save=True, compact_every=0)
+        store.add_or_update_holding("INFY", {"quantity": 3})
+        store.add_transaction({"symbol": "INFY", "transaction_type": "SELL"})
+
+        state = read_paper_trade_state(tmp_path)
+        assert state["holdings"]["INFY"]["quantity"] == 3
+        assert state["transactions"][0]["transaction_type"] == "SELL"
+        assert state["account"] is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
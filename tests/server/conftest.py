@@ -0,0 +1,3 @@
+"""Pytest configuration for server tests."""
+
+from tests.support.quote_cache import _clear_quote_cache  # noqa: F401
@@ -103,7 +103,7 @@ def test_portfolio_uses_yfinance_for_live_prices(monkeypatch):
     # Mock yfinance to return a DIFFERENT price than stored avg_price.
     # Also stub OHLCV fetch used for EMA9 target calculation to avoid real downloads.
     with (
-        patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class,
+        patch("yfinance.Ticker") as mock_ticker_class,
         patch("server.app.routers.paper_trading.compute_sell_target", return_value=160.0),
     ):
         mock_ticker = MagicMock()
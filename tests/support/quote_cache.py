@@ -0,0 +1,15 @@
+"""Autouse fixture isolating the process-wide live quote cache between server tests."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _clear_quote_cache():
+    """Live quotes are cached process-wide; each test sees its own yfinance mocks."""
+    from server.app.services.quote_service import get_quote_service  # noqa: PLC0415
+
+    get_quote_service().clear()
+    yield
+    get_quote_service().clear()
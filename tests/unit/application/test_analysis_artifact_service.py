@@ -0,0 +1,147 @@
+"""Shared once-per-session analysis artifacts keyed by analysis-config hash."""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import replace
+from datetime import date, datetime
+
+from config.strategy_config import StrategyConfig
+from src.application.services.analysis_artifact_service import (
+    AnalysisArtifactStore,
+    analysis_config_hash,
+    analysis_session_date,
+)
+
+
+def test_config_hash_ignores_execution_only_fields():
+    base = StrategyConfig()
+
+    assert analysis_config_hash(base) == analysis_config_hash(replace(base))
+    assert analysis_config_hash(base) == analysis_config_hash(
+        replace(base, max_portfolio_size=base.max_portfolio_size + 5, default_product="MIS")
+    )
+    assert analysis_config_hash(base) != analysis_config_hash(
+        replace(base, rsi_oversold=base.rsi_oversold + 5)
+    )
+    # Capital and ML threshold shape backtest scores and verdicts
+    assert analysis_config_hash(base) != analysis_config_hash(
+        replace(base, user_capital=base.user_capital * 2)
+    )
+    assert analysis_config_hash(base) != analysis_config_hash(
+        replace(base, ml_confidence_threshold=0.9)
+    )
+
+
+def test_stricter_ml_threshold_does_not_reuse_lenient_artifact(tmp_path):
+    store = AnalysisArtifactStore(tmp_path)
+    day = date(2026, 4, 9)
+    lenient = replace(StrategyConfig(), ml_confidence_threshold=0.5)
+    strict = replace(lenient, ml_confidence_threshold=0.8)
+
+    def build_for(config):
+        # ML says buy at 72% confidence; the rule-based verdict is watch
+        ml_applied = 0.72 >= config.ml_confidence_threshold
+        return lambda: [
+            {
+                "ticker": "RELIANCE.NS",
+                "verdict": "buy" if ml_applied else "watch",
+                "verdict_source": "ml" if ml_applied else "rule_based",
+                "final_verdict": "buy" if ml_applied else "watch",
+                "buy_range": [98.0, 100.0] if ml_applied else None,
+            }
+        ]
+
+    lenient_artifact, _ = store.get_or_build(day, analysis_config_hash(lenient), build_for(lenient))
+    strict_artifact, strict_built = store.get_or_build(
+        day, analysis_config_hash(strict), build_for(strict)
+    )
+
+    assert strict_built
+    assert lenient_artifact.results[0]["final_verdict"] == "buy"
+    (row,) = strict_artifact.results
+    assert (row["verdict"], row["final_verdict"], row["buy_range"]) == ("watch", "watch", None)
+
+
+def test_session_date_is_latest_completed_session():
+    # Thursday 2026-04-09 is a trading day; Friday 2026-04-10 too
+    assert analysis_session_date(datetime(2026, 4, 9, 16, 0)) == date(2026, 4, 9)
+    assert analysis_session_date(datetime(2026, 4, 10, 8, 0)) == date(2026, 4, 9)
+    assert analysis_session_date(datetime(2026, 4, 10, 11, 0)) is None
+    # Weekend sees Friday's session
+    assert analysis_session_date(datetime(2026, 4, 11, 10, 0)) == date(2026, 4, 10)
+
+
+def test_get_or_build_builds_once_and_reuses(tmp_path):
+    store = AnalysisArtifactStore(tmp_path)
+    day = date(2026, 4, 9)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return [{"ticker": "RELIANCE.NS", "verdict": "buy"}]
+
+    first, built = store.get_or_build(day, "abc", build)
+    second, built_again = store.get_or_build(day, "abc", build)
+    other, built_other = store.get_or_build(day, "def", build)
+
+    assert (built, built_again, built_other) == (True, False, True)
+    assert second.results == first.results == [{"ticker": "RELIANCE.NS", "verdict": "buy"}]
+    assert len(calls) == 2
+    assert store.path_for(day, "abc").exists()
+    # A fresh store (another process) reads the persisted artifact
+    assert AnalysisArtifactStore(tmp_path).load(day, "abc").results == first.results
+
+
+def test_concurrent_callers_share_one_build(tmp_path):
+    store = AnalysisArtifactStore(tmp_path)
+    calls = []
+
+    def slow_build():
+        calls.append(1)
+        time.sleep(0.1)
+        return [{"ticker": "TCS.NS"}]
+
+    outcomes = []
+    threads = [
+        threading.Thread(
+            target=lambda: outcomes.append(store.get_or_build(date(2026, 4, 9), "abc", slow_build))
+        )
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert sorted(built for _, built in outcomes) == [False, False, False, False, True]
+
+
+def test_failed_or_empty_builds_are_not_stored(tmp_path):
+    store = AnalysisArtifactStore(tmp_path)
+    day = date(2026, 4, 9)
+
+    def failing():
+        raise RuntimeError("network")
+
+    try:
+        store.get_or_build(day, "abc", failing)
+    except RuntimeError:
+        pass
+    assert store.load(day, "abc") is None
+
+    artifact, built = store.get_or_build(day, "abc", list)
+    assert built and artifact.results == []
+    assert store.load(day, "abc") is None
+
+
+def test_prune_drops_old_sessions(tmp_path):
+    store = AnalysisArtifactStore(tmp_path, retention_days=7)
+    store.save(date(2026, 3, 20), "abc", [{"ticker": "OLD.NS"}])
+    store.save(date(2026, 4, 6), "abc", [{"ticker": "NEW.NS"}])
+
+    assert store.prune(date(2026, 4, 9)) == 1
+    assert store.load(date(2026, 3, 20), "abc") is None
+    assert store.load(date(2026, 4, 6), "abc") is not None
@@ -0,0 +1,136 @@
+"""
+Unit tests for the streamed analysis results channel
+
+Tests for:
+- NDJSON writer / tail round trip (partial lines, end marker, rewritten file)
+- Batched Signals persistence while the stream is open
+- Expiring missing signals only after a complete stream
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from freezegun import freeze_time
+
+from src.application.services.analysis_result_stream import (
+    AnalysisResultStreamWriter,
+    AnalysisResultTail,
+)
+from src.application.services.individual_service_manager import (
+    IndividualServiceManager,
+    _StreamingSignalPersister,
+)
+from src.infrastructure.db.models import Signals, SignalStatus
+
+
+def _row(ticker: str, verdict: str = "buy") -> dict:
+    return {"ticker": ticker, "verdict": verdict, "rsi10": 25.0, "status": "success"}
+
+
+def test_tail_round_trips_writer_rows_and_detects_end(tmp_path):
+    path = tmp_path / "results.ndjson"
+    writer = AnalysisResultStreamWriter(path)
+    tail = AnalysisResultTail(path)
+
+    writer.write({"ticker": "AAA.NS", "ts": datetime(2026, 1, 2, 15, 30)})
+    assert tail.read() == [{"ticker": "AAA.NS", "ts": "2026-01-02T15:30:00"}]
+    assert tail.read() == []
+    assert not tail.complete
+
+    writer.write({"ticker": "BBB.NS", "tags": {"x"}})
+    writer.close()
+    assert tail.read() == [{"ticker": "BBB.NS", "tags": ["x"]}]
+    assert tail.complete
+    assert tail.count == 2
+
+
+def test_tail_leaves_a_partial_line_for_the_next_read(tmp_path):
+    path = tmp_path / "results.ndjson"
+    tail = AnalysisResultTail(path)
+    assert tail.read() == []
+
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"ticker": "AAA.NS"}\nnot json\n{"ticker": "BB')
+    assert tail.read() == [{"ticker": "AAA.NS"}]
+    with path.open("a", encoding="utf-8") as f:
+        f.write('B.NS"}\n')
+    assert tail.read() == [{"ticker": "BBB.NS"}]
+
+
+def test_tail_restarts_when_the_file_is_rewritten(tmp_path):
+    path = tmp_path / "results.ndjson"
+    writer = AnalysisResultStreamWriter(path)
+    for ticker in ("AAA.NS", "BBB.NS", "CCC.NS"):
+        writer.write({"ticker": ticker})
+    writer.close()
+    tail = AnalysisResultTail(path)
+    assert len(tail.read()) == 3
+    assert tail.complete
+
+    writer = AnalysisResultStreamWriter(path)
+    writer.write({"ticker": "ZZZ.NS"})
+    assert tail.read() == [{"ticker": "ZZZ.NS"}]
+    assert not tail.complete
+
+
+class TestStreamingSignalPersister:
+    """Batched persistence of streamed rows"""
+
+    def _persister(self, db_session, **kwargs) -> _StreamingSignalPersister:
+        manager = IndividualServiceManager(db_session)
+        manager._is_non_tradable_equity = lambda ticker: False
+        return _StreamingSignalPersister(manager, 1, MagicMock(), **kwargs)
+
+    def test_rows_are_persisted_in_batches(self, db_session):
+        with (
+            freeze_time("2025-01-13 08:00:00+05:30"),
+            patch(
+                "src.application.services.individual_service_manager.AnalysisDeduplicationService.should_update_signals",
+                return_value=True,
+            ),
+        ):
+            persister = self._persister(db_session, keep_rows=True, batch_size=2)
+            persister.add([_row("AAA.NS")])
+            assert db_session.query(Signals).count() == 0
+
+            persister.add([_row("BBB.NS"), _row("CCC.NS", verdict="avoid")])
+            assert {s.symbol for s in db_session.query(Signals)} == {"AAA", "BBB"}
+
+            # Streamed again after news enrichment: the last row wins
+            persister.add([_row("AAA.NS", verdict="strong_buy")])
+            summary = persister.finish(complete=True)
+
+        assert summary["inserted"] == 2
+        assert summary["batches"] == 2
+        assert persister.results_count == 3
+        assert {r["ticker"]: r["verdict"] for r in persister.rows}["AAA.NS"] == "strong_buy"
+
+    def test_missing_signals_expire_only_after_complete_stream(self, db_session):
+        with freeze_time("2025-01-12 18:00:00+05:30"):
+            db_session.add(
+                Signals(symbol="OLD", verdict="buy", final_verdict="buy", ts=datetime.now())
+            )
+            db_session.commit()
+
+        with (
+            freeze_time("2025-01-13 08:00:00+05:30"),
+            patch(
+                "src.application.services.individual_service_manager.AnalysisDeduplicationService.should_update_signals",
+                return_value=True,
+            ),
+        ):
+            persister = self._persister(db_session)
+            persister.add([_row("AAA.NS")])
+            summary = persister.finish(complete=False)
+            assert summary["expired"] == 0
+            old = db_session.query(Signals).filter_by(symbol="OLD").one()
+            assert old.status == SignalStatus.ACTIVE
+
+            persister = self._persister(db_session)
+            persister.add([_row("AAA.NS")])
+            summary = persister.finish(complete=True)
+
+        assert summary["expired"] == 1
+        db_session.refresh(old)
+        assert old.status == SignalStatus.EXPIRED
+        assert persister.rows == []
@@ -0,0 +1,227 @@
+"""Tests for the shared cross-user MarketDataHub."""
+
+import threading
+import time
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.kotak_neo_auto_trader.sell_engine import SellOrderManager
+from modules.kotak_neo_auto_trader.services.indicator_service import IndicatorService
+from modules.kotak_neo_auto_trader.services.price_service import PriceService
+from src.application.services.market_data_hub import MarketDataHub
+from src.application.services.paper_trading_service_adapter import PaperTradingServiceAdapter
+
+
+def _daily_frame(days: int = 40, last_close: float = 100.0) -> pd.DataFrame:
+    now_ist = pd.Timestamp.now(tz="Asia/Kolkata")
+    close = np.linspace(80.0, last_close, days)
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": np.arange(days) * 1000.0 + 5000.0,
+        },
+        index=pd.date_range(end=now_ist, periods=days, freq="D"),
+    )
+
+
+class CountingFetch:
+    def __init__(self, delay: float = 0.0):
+        self.calls: list[str] = []
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self, ticker):
+        with self._lock:
+            self.calls.append(ticker)
+        time.sleep(self.delay)
+        return None if ticker == "EMPTY.NS" else _daily_frame()
+
+
+def test_subscriptions_are_reference_counted_per_ticker():
+    hub = MarketDataHub(interval_s=60, fetch_fn=CountingFetch())
+    hub.set_subscriptions(1, ["RELIANCE.NS", "TCS.NS"])
+    hub.set_subscriptions(2, ["RELIANCE.NS"])
+    assert hub.subscribed_tickers() == {"RELIANCE.NS": 2, "TCS.NS": 1}
+
+    hub.set_subscriptions(1, ["RELIANCE.NS"])
+    hub.unsubscribe(2)
+    assert hub.subscribed_tickers() == {"RELIANCE.NS": 1}
+    hub.unsubscribe(1)
+    assert hub.subscribed_tickers() == {}
+
+
+def test_one_poll_per_interval_is_shared_by_all_users():
+    fetch = CountingFetch()
+    hub = MarketDataHub(interval_s=60, fetch_fn=fetch)
+    for user_id in range(1, 51):
+        hub.set_subscriptions(user_id, ["RELIANCE.NS", "INFY.NS"])
+
+    snapshots = [hub.get_snapshots(["RELIANCE.NS", "INFY.NS"]) for _ in range(50)]
+
+    assert sorted(fetch.calls) == ["INFY.NS", "RELIANCE.NS"]
+    assert all(s["RELIANCE.NS"] is snapshots[0]["RELIANCE.NS"] for s in snapshots)
+    assert snapshots[0]["RELIANCE.NS"].rsi10 == pytest.approx(100.0)
+    assert "rsi10" in snapshots[0]["RELIANCE.NS"].data.columns
+    assert hub.get_stats()["polls"] == 1
+
+
+def test_expired_interval_polls_subscribed_tickers_again():
+    fetch = CountingFetch()
+    hub = MarketDataHub(interval_s=0.05, fetch_fn=fetch)
+    hub.set_subscriptions(1, ["RELIANCE.NS"])
+    hub.get_snapshot("RELIANCE.NS")
+    time.sleep(0.06)
+    hub.get_snapshot("RELIANCE.NS")
+    assert fetch.calls == ["RELIANCE.NS", "RELIANCE.NS"]
+
+
+def test_market_hours_bound_snapshot_age(monkeypatch):
+    import core.volume_analysis
+
+    fetch = CountingFetch()
+    hub = MarketDataHub(interval_s=60, fetch_fn=fetch, market_hours_interval_s=15)
+    hub.set_subscriptions(1, ["RELIANCE.NS"])
+
+    def read_after(seconds):
+        # Age the last poll and the snapshot instead of sleeping
+        hub._last_poll -= seconds
+        snapshot = hub._snapshots["RELIANCE.NS"]
+        hub._snapshots["RELIANCE.NS"] = replace(snapshot, fetched_at=snapshot.fetched_at - seconds)
+        hub.get_snapshot("RELIANCE.NS")
+
+    monkeypatch.setattr(core.volume_analysis, "is_market_hours", lambda: False)
+    assert hub.current_interval_s() == 60
+    hub.get_snapshot("RELIANCE.NS")
+    read_after(20)
+    assert len(fetch.calls) == 1
+
+    monkeypatch.setattr(core.volume_analysis, "is_market_hours", lambda: True)
+    assert hub.current_interval_s() == 15
+    read_after(16)
+    assert len(fetch.calls) == 2
+
+
+def test_unsubscribed_ticker_fetched_on_demand_and_missing_data_omitted():
+    fetch = CountingFetch()
+    hub = MarketDataHub(interval_s=60, fetch_fn=fetch)
+
+    assert hub.get_snapshots(["SBIN.NS", "EMPTY.NS"]).keys() == {"SBIN.NS"}
+    # SBIN is cached for the interval; a ticker without data is retried
+    assert hub.get_snapshots(["SBIN.NS", "EMPTY.NS"]).keys() == {"SBIN.NS"}
+    assert fetch.calls == ["SBIN.NS", "EMPTY.NS", "EMPTY.NS"]
+
+
+def test_concurrent_callers_coalesce_into_one_fetch():
+    fetch = CountingFetch(delay=0.1)
+    hub = MarketDataHub(interval_s=60, fetch_fn=fetch)
+    for user_id in range(8):
+        hub.set_subscriptions(user_id, ["RELIANCE.NS"])
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(hub.get_snapshot("RELIANCE.NS")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert fetch.calls == ["RELIANCE.NS"]
+    assert len({id(r) for r in results}) == 1
+
+
+def test_paper_sell_monitors_share_hub_snapshots():
+    fetch = CountingFetch()
+    hub = MarketDataHub(interval_s=60, fetch_fn=fetch)
+    price_service = PriceService(market_data_hub=hub)
+    adapters = []
+    for user_id in (1, 2, 3):
+        adapter = PaperTradingServiceAdapter(user_id=user_id, db_session=MagicMock())
+        adapter.logger = MagicMock()
+        adapter.broker = MagicMock()
+        adapter.broker.check_and_execute_pending_orders.return_value = {"executed": 0}
+        adapter.price_service = price_service
+        adapter.active_sell_orders = {
+            "RELIANCE": {
+                "order_id": "S1",
+                "target_price": 10_000.0,
+                "qty": 1,
+                "ticker": "RELIANCE.NS",
+            }
+        }
+        adapter._finalize_monitor_sell_removals = MagicMock()
+        adapters.append(adapter)
+
+    for adapter in adapters:
+        adapter._monitor_sell_orders()
+
+    assert fetch.calls == ["RELIANCE.NS"]
+    assert hub.subscribed_tickers() == {"RELIANCE.NS": 3}
+    # Uptrend RSI 100 > 50 triggers the RSI exit from the shared snapshot for every user
+    for adapter in adapters:
+        assert adapter.rsi10_cache["RELIANCE"] == pytest.approx(100.0)
+        adapter.broker.place_order.assert_called_once()
+
+
+def test_price_and_indicator_services_read_hub_snapshots(monkeypatch):
+    fetch = CountingFetch()
+    price_service = PriceService(market_data_hub=MarketDataHub(interval_s=60, fetch_fn=fetch))
+    indicator_service = IndicatorService(price_service=price_service)
+    direct = MagicMock(return_value=_daily_frame(days=5))
+    monkeypatch.setattr("core.data_fetcher.get_cached_ohlcv", direct)
+
+    # Broker sell monitors of two users: one fetch and one RSI10 for the shared ticker
+    for user_id in (1, 2):
+        price_service.set_market_data_subscriptions(user_id, ["RELIANCE.NS"])
+        manager = SellOrderManager.__new__(SellOrderManager)
+        manager.price_service = price_service
+        manager.indicator_service = MagicMock(wraps=indicator_service)
+        manager.indicator_service.get_streaming_state.return_value = None
+        manager.rsi10_cache = {}
+        assert manager._get_current_rsi10("RELIANCE", "RELIANCE.NS") == pytest.approx(100.0)
+
+    frame = price_service.get_price("RELIANCE.NS", days=200, interval="1d", add_current_day=True)
+    assert "rsi10" not in frame.columns
+    assert len(frame) == 40
+    assert fetch.calls == ["RELIANCE.NS"]
+    assert price_service.market_data_hub.subscribed_tickers() == {"RELIANCE.NS": 2}
+
+    # Other frame shapes keep the regular shared OHLCV cache path
+    assert len(price_service.get_price("RELIANCE.NS", days=800, add_current_day=False)) == 5
+    direct.assert_called_once()
+    assert fetch.calls == ["RELIANCE.NS"]
+
+
+def test_poll_fetches_on_bounded_pool_without_holding_poll_lock():
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def fetch(ticker):
+        # Another user's poll check must not block on this network call
+        assert hub._poll_lock.acquire(blocking=False)
+        hub._poll_lock.release()
+        with lock:
+            active.append(ticker)
+            peak.append(len(active))
+        time.sleep(0.05)
+        with lock:
+            active.remove(ticker)
+        return _daily_frame()
+
+    hub = MarketDataHub(interval_s=60, fetch_fn=fetch, max_workers=3)
+    tickers = [f"T{i}.NS" for i in range(9)]
+    hub.set_subscriptions(1, tickers)
+
+    assert hub.poll() == 9
+    assert hub.get_snapshots(tickers).keys() == set(tickers)
+    assert max(peak) == 3
+    assert hub.get_stats()["fetches"] == 9
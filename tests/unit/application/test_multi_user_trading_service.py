@@ -737,8 +737,9 @@ class TestMultiUserTradingService:
             # Should not have raised exceptions
             assert not any("error" in r[0] for r in results), f"Unexpected errors: {results}"
 
-    def test_error_logging_on_start_failure(self, db_session, sample_user):
+    def test_error_logging_on_start_failure(self, db_session, sample_user, tmp_path, monkeypatch):
         """Test that errors are logged when service start fails"""
+        monkeypatch.chdir(tmp_path)
         service = MultiUserTradingService(db=db_session)
 
         # Try to start without settings (will fail)
@@ -121,3 +121,70 @@ def test_ingest_trading_day_multiple_symbols(db_session, sample_df):
     tcs = repo.get("TCS.NS", date(2026, 6, 2))
     assert tcs is not None
     assert tcs.source == "nse"
+
+
+def _bhavcopy_for(sample_df: pd.DataFrame):
+    """Fake ``download_bhavcopy``: the sample file re-dated to the requested day."""
+
+    def download(trade_day):
+        return sample_df.assign(TradDt=trade_day.isoformat(), BizDt=trade_day.isoformat())
+
+    return download
+
+
+def test_fill_symbols_range_downloads_each_day_once(db_session, sample_df, monkeypatch):
+    fetcher = MagicMock()
+    fetcher.download_bhavcopy.side_effect = _bhavcopy_for(sample_df)
+    svc = NseBhavcopyIngestService(db_session, fetcher=fetcher)
+    upsert_spy = MagicMock(wraps=svc.repo.upsert_many)
+    monkeypatch.setattr(svc.repo, "upsert_many", upsert_spy)
+
+    totals = svc.fill_symbols_range(
+        ["DMART.NS", "TCS", "NOTLISTED.NS"], date(2026, 6, 1), date(2026, 6, 2)
+    )
+
+    assert totals == {"DMART.NS": 2, "TCS.NS": 2, "NOTLISTED.NS": 0}
+    assert [c.args[0] for c in fetcher.download_bhavcopy.call_args_list] == [
+        date(2026, 6, 1),
+        date(2026, 6, 2),
+    ]
+    assert upsert_spy.call_count == 2
+    assert all(len(c.args[0]) == 2 for c in upsert_spy.call_args_list)
+
+    repo = PriceCacheRepository(db_session)
+    meta = repo.get_symbol_meta("TCS.NS")
+    assert meta.row_count == 2
+    assert meta.first_date == date(2026, 6, 1)
+    assert meta.last_date == date(2026, 6, 2)
+    missing = repo.get_symbol_meta("NOTLISTED.NS")
+    assert missing.row_count == 0
+    assert "without bhavcopy row" in (missing.last_validation_message or "")
+
+
+def test_fill_symbols_range_only_fetches_days_missing_for_some_symbol(db_session, sample_df):
+    fetcher = MagicMock()
+    fetcher.download_bhavcopy.side_effect = _bhavcopy_for(sample_df)
+    svc = NseBhavcopyIngestService(db_session, fetcher=fetcher)
+    assert svc.fill_symbol_range("DMART.NS", date(2026, 6, 2), date(2026, 6, 2)) == 1
+    fetcher.download_bhavcopy.reset_mock()
+
+    totals = svc.fill_symbols_range(["DMART.NS", "TCS.NS"], date(2026, 6, 2), date(2026, 6, 2))
+
+    assert totals == {"DMART.NS": 0, "TCS.NS": 1}
+    fetcher.download_bhavcopy.assert_called_once_with(date(2026, 6, 2))
+
+
+def test_refresh_symbol_meta_many_matches_single_refresh(db_session, sample_df):
+    fetcher = MagicMock()
+    fetcher.download_bhavcopy.return_value = sample_df
+    svc = NseBhavcopyIngestService(db_session, fetcher=fetcher)
+    svc.ingest_trading_day(date(2026, 6, 2), ["DMART.NS", "TCS.NS"])
+    repo = PriceCacheRepository(db_session)
+
+    metas = repo.refresh_symbol_meta_many(["DMART.NS", "TCS.NS", "EMPTY.NS"])
+
+    single = repo.refresh_symbol_meta("DMART.NS")
+    assert metas["DMART.NS"].row_count == single.row_count == 1
+    assert metas["DMART.NS"].last_date == single.last_date
+    assert metas["EMPTY.NS"].row_count == 0
+    assert metas["EMPTY.NS"].first_date is None
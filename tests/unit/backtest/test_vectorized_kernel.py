@@ -0,0 +1,163 @@
+"""Parity tests: vectorized backtest kernel vs the iterrows reference loop."""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+import pytest
+
+import backtest.backtest_engine as eng_mod
+import integrated_backtest
+from backtest.backtest_config import BacktestConfig
+from backtest.vectorized_kernel import next_row_positions, resolve_kernel
+
+
+def make_oscillating_ohlcv(seed: int, days: int = 700, freq: str = "B") -> pd.DataFrame:
+    """Uptrend with sharp, repeated dips so RSI crosses the 30/20/10 levels often."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(days)
+    close = 100 + t * 0.15 + np.sin(t / 6.0) * 8 + rng.normal(0, 1.5, size=days).cumsum() * 0.3
+    close = np.maximum(close, 5.0)
+    open_ = close * (1.0 + rng.normal(0, 0.01, size=days))
+    high = np.maximum(open_, close) * (1.0 + rng.uniform(0, 0.02, size=days))
+    low = np.minimum(open_, close) * (1.0 - rng.uniform(0, 0.02, size=days))
+    idx = pd.date_range("2022-01-03", periods=days, freq=freq)
+    return pd.DataFrame(
+        {"Open": open_, "High": high, "Low": low, "Close": close, "Volume": 100_000.0},
+        index=idx,
+    )
+
+
+def _engine_with_data(monkeypatch, data: pd.DataFrame) -> eng_mod.BacktestEngine:
+    monkeypatch.setattr(eng_mod.BacktestEngine, "_load_data", lambda self: None)
+    monkeypatch.setattr(eng_mod.BacktestEngine, "_check_chart_quality", lambda self: None)
+    config = BacktestConfig()
+    config.DETAILED_LOGGING = False
+    engine = eng_mod.BacktestEngine("AAA.NS", "2022-01-01", "2025-12-31", config=config)
+    engine.data = data.copy()
+    engine._calculate_indicators()
+    engine.start_date = engine.data.index.min()
+    engine.end_date = engine.data.index.max()
+    return engine
+
+
+def test_resolve_kernel():
+    assert resolve_kernel("ITERROWS") == "iterrows"
+    assert resolve_kernel("vectorized") == "vectorized"
+    with pytest.raises(ValueError):
+        resolve_kernel("numba")
+
+
+def test_next_row_positions_matches_loc_lookup():
+    index = pd.DatetimeIndex(["2024-01-02", "2024-01-01", "2024-01-03", "2024-01-03"])
+    expected = []
+    for date in index:
+        later = np.flatnonzero(index > date)
+        expected.append(later[0] if len(later) else len(index))
+    assert next_row_positions(index).tolist() == expected
+    assert next_row_positions(index.sort_values()).tolist() == [1, 2, 4, 4]
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_backtest_engine_kernels_produce_identical_trades(monkeypatch, seed):
+    data = make_oscillating_ohlcv(seed)
+
+    reference = _engine_with_data(monkeypatch, data)
+    reference_results = reference.run_backtest(kernel="iterrows")
+    vectorized = _engine_with_data(monkeypatch, data)
+    vectorized_results = vectorized.run_backtest(kernel="vectorized")
+
+    reference_trades = reference.get_trades_dataframe()
+    assert len(reference_trades) > 1
+    pd.testing.assert_frame_equal(vectorized.get_trades_dataframe(), reference_trades)
+    assert vectorized_results == reference_results
+    for flag in ("last_rsi_above_30_date", "rsi_10_trade_made", "rsi_20_trade_made"):
+        assert getattr(vectorized, flag) == getattr(reference, flag)
+
+
+@pytest.mark.parametrize("max_positions", [2, 3])
+def test_kernels_share_entry_rules_under_position_cap(monkeypatch, max_positions):
+    data = make_oscillating_ohlcv(5)
+    decisions = {}
+    engines = {}
+    for kernel in ("iterrows", "vectorized"):
+        engine = _engine_with_data(monkeypatch, data)
+        engine.config.MAX_POSITIONS = max_positions
+        original = engine._entry_decision
+        calls = decisions.setdefault(kernel, [])
+
+        def _spy(close_price, rsi, ema200, original=original, calls=calls):
+            result = original(close_price, rsi, ema200)
+            calls.append((rsi, result))
+            return result
+
+        monkeypatch.setattr(engine, "_entry_decision", _spy)
+        engine.run_backtest(kernel=kernel)
+        engines[kernel] = engine
+
+    # The vectorized kernel only evaluates the rows whose RSI can trigger an entry
+    level_1 = engines["iterrows"].config.RSI_OVERSOLD_LEVEL_1
+    candidates = [call for call in decisions["iterrows"] if call[0] < level_1]
+    assert decisions["vectorized"] == candidates
+    assert len(candidates) < len(decisions["iterrows"])
+    assert (False, "Maximum positions reached") in [result for _, result in candidates]
+    assert all(not result[0] for rsi, result in decisions["iterrows"] if rsi >= level_1)
+    pd.testing.assert_frame_equal(
+        engines["vectorized"].get_trades_dataframe(), engines["iterrows"].get_trades_dataframe()
+    )
+
+
+def _integrated_frame(seed: int) -> pd.DataFrame:
+    # Calendar-day frequency also exercises the weekend-skip branch
+    data = make_oscillating_ohlcv(seed, days=900, freq="D")
+    data.iloc[400:403, data.columns.get_loc("Close")] = np.nan  # NaN RSI rows
+    return data
+
+
+def _run_both_kernels(data: pd.DataFrame, **kwargs) -> tuple[dict, dict]:
+    with patch("integrated_backtest.fetch_ohlcv_yf", return_value=data):
+        reference = integrated_backtest.run_integrated_backtest(
+            "AAA.NS", ("2022-09-01", "2024-06-01"), kernel="iterrows", **kwargs
+        )
+        vectorized = integrated_backtest.run_integrated_backtest(
+            "AAA.NS", ("2022-09-01", "2024-06-01"), kernel="vectorized", **kwargs
+        )
+    return reference, vectorized
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_integrated_backtest_kernels_produce_identical_positions(seed):
+    reference, vectorized = _run_both_kernels(
+        _integrated_frame(seed), skip_trade_agent_validation=True
+    )
+
+    assert reference["executed_trades"] > 1
+    assert any(p["is_pyramided"] for p in reference["positions"])
+    assert vectorized == reference
+
+
+def test_integrated_backtest_kernels_match_with_trade_agent_validation():
+    calls = []
+
+    def fake_validate(stock_name, date_str, rsi, ema200, market_data, **kwargs):
+        calls.append((date_str, float(rsi)))
+        day = int(date_str[-2:])
+        return {"approved": day % 3 != 0, "ml_verdict": "buy", "ml_confidence": 40 + day}
+
+    with patch.object(
+        integrated_backtest, "validate_initial_entry_with_trade_agent", fake_validate
+    ):
+        reference, vectorized = _run_both_kernels(_integrated_frame(4))
+
+    half = len(calls) // 2
+    assert half > 1
+    assert calls[:half] == calls[half:]
+    assert reference["skipped_signals"] > 0
+    assert reference["backtest_ml_verdict"] == "buy"
+    assert vectorized == reference
+
+
+def test_synthetic_data_reaches_pyramiding_levels():
+    rsi = ta.rsi(make_oscillating_ohlcv(0)["Close"], length=10)
+    assert (rsi < 20).any()
@@ -0,0 +1,67 @@
+"""Different tickers download in parallel: no global lock around the yfinance call."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from core import data_fetcher
+
+
+@pytest.fixture(autouse=True)
+def _offline(monkeypatch):
+    data_fetcher.yfinance_circuit_breaker.reset()
+    monkeypatch.setattr(data_fetcher, "_enforce_rate_limit", lambda *a, **k: None)
+    yield
+    data_fetcher.yfinance_circuit_breaker.reset()
+
+
+def test_different_tickers_download_concurrently(monkeypatch):
+    both_in_flight = threading.Barrier(2, timeout=5)
+
+    def _history(ticker, start, end, interval):
+        # Fails with BrokenBarrierError if the second download cannot start until this returns
+        both_in_flight.wait()
+        idx = pd.date_range("2026-01-01", periods=30, freq="D")
+        return pd.DataFrame(
+            {"Open": 1.0, "High": 2.0, "Low": 0.5, "Close": 1.5, "Volume": 100},
+            index=idx,
+        )
+
+    monkeypatch.setattr(data_fetcher, "_download_history", _history)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        frames = list(
+            pool.map(
+                lambda t: data_fetcher.fetch_ohlcv_yf_raw(t, days=30, add_current_day=False),
+                ["AAA.NS", "BBB.NS"],
+            )
+        )
+
+    assert [len(df) for df in frames] == [30, 30]
+
+
+def test_download_history_matches_download_timestamps(monkeypatch):
+    idx = pd.date_range("2026-01-05 09:15", periods=2, freq="D", tz="Asia/Kolkata")
+    hist = pd.DataFrame({"Close": [1.0, 2.0]}, index=idx)
+
+    class _Ticker:
+        def __init__(self, ticker):
+            self.ticker = ticker
+
+        def history(self, **kwargs):
+            assert kwargs["auto_adjust"] is False
+            return hist.copy()
+
+    monkeypatch.setattr(data_fetcher.yf, "Ticker", _Ticker)
+
+    daily = data_fetcher._download_history("AAA.NS", "2026-01-01", "2026-01-10", "1d")
+    intraday = data_fetcher._download_history("AAA.NS", "2026-01-01", "2026-01-10", "15m")
+
+    assert daily.index.tz is None
+    assert daily.index[0] == pd.Timestamp("2026-01-05 09:15")
+    assert str(intraday.index.tz) == "UTC"
+    assert intraday.index[0] == pd.Timestamp("2026-01-05 03:45", tz="UTC")
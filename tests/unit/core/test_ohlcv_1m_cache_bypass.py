@@ -14,11 +14,9 @@ MINUTE_INTERVAL = "1m"
 
 @pytest.fixture(autouse=True)
 def clear_inprocess_ohlcv_cache():
-    with data_fetcher._ohlcv_cache_lock:
-        data_fetcher._shared_ohlcv_cache.clear()
+    data_fetcher.clear_ohlcv_cache()
     yield
-    with data_fetcher._ohlcv_cache_lock:
-        data_fetcher._shared_ohlcv_cache.clear()
+    data_fetcher.clear_ohlcv_cache()
 
 
 class TestOhlcv1mCacheBypass:
@@ -0,0 +1,251 @@
+"""Window-agnostic OHLCV series store: one stored series serves every ``days`` window."""
+
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from core import data_fetcher
+from core.ohlcv_series_store import OhlcvSeriesStore, merge_live_bar, tail_slice
+
+TODAY = date(2026, 5, 26)
+
+
+def _daily_frame(end: str = "2026-05-25", periods: int = 600) -> pd.DataFrame:
+    dates = pd.bdate_range(end=end, periods=periods)
+    closes = [100.0 + i for i in range(periods)]
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "open": closes,
+            "high": [c + 1 for c in closes],
+            "low": [c - 1 for c in closes],
+            "close": closes,
+            "volume": [1000] * periods,
+        }
+    )
+
+
+def _history_fetch(frame: pd.DataFrame) -> MagicMock:
+    """Fake fetch_ohlcv_yf honouring the calendar-day ``days`` window."""
+
+    def fetch(ticker, days, interval, end_date, add_current_day):
+        return tail_slice(frame, days, TODAY).reset_index(drop=True)
+
+    return MagicMock(side_effect=fetch)
+
+
+def _store(fetch_history, fetch_live_bar=None) -> OhlcvSeriesStore:
+    return OhlcvSeriesStore(
+        fetch_history=fetch_history,
+        fetch_live_bar=fetch_live_bar or MagicMock(return_value=None),
+        max_series=10,
+    )
+
+
+def _get(store, days, include_live_bar=False, ticker="RELIANCE.NS"):
+    return store.get(
+        ticker,
+        days,
+        "1d",
+        None,
+        include_live_bar=include_live_bar,
+        history_ttl=60,
+        live_ttl=15,
+        today=TODAY,
+    )
+
+
+class TestTailSlice:
+    def test_slice_matches_calendar_window(self):
+        frame = _daily_frame()
+        out = tail_slice(frame, 30, TODAY)
+        assert out["date"].iloc[0] >= pd.Timestamp("2026-04-21")
+        assert out["date"].iloc[-1] == frame["date"].iloc[-1]
+        assert len(out) < len(frame)
+
+    def test_empty_frame(self):
+        empty = pd.DataFrame(columns=["date", "close"])
+        assert tail_slice(empty, 10, TODAY).empty
+
+
+class TestMergeLiveBar:
+    def test_appends_new_day(self):
+        frame = _daily_frame(periods=3)
+        bar = {"date": TODAY, "open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 10}
+        out = merge_live_bar(frame, bar)
+        assert len(out) == 4
+        assert out["close"].iloc[-1] == 1.5
+        assert len(frame) == 3
+
+    def test_replaces_existing_partial_bar(self):
+        frame = _daily_frame(end="2026-05-26", periods=3)
+        bar = {"date": TODAY, "open": 1, "high": 2, "low": 0.5, "close": 1.5, "volume": 10}
+        out = merge_live_bar(frame, bar)
+        assert len(out) == 3
+        assert out["close"].iloc[-1] == 1.5
+
+    def test_none_bar_returns_frame(self):
+        frame = _daily_frame(periods=3)
+        assert merge_live_bar(frame, None) is frame
+
+
+class TestOhlcvSeriesStore:
+    def test_smaller_window_served_from_stored_series(self):
+        fetch = _history_fetch(_daily_frame())
+        store = _store(fetch)
+
+        long = _get(store, 800)
+        short = _get(store, 200)
+
+        assert fetch.call_count == 1
+        assert len(short) < len(long)
+        pd.testing.assert_frame_equal(
+            short.reset_index(drop=True),
+            tail_slice(_daily_frame(), 200, TODAY).reset_index(drop=True),
+        )
+        stats = store.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_larger_window_extends_and_keeps_longest(self):
+        fetch = _history_fetch(_daily_frame())
+        store = _store(fetch)
+
+        _get(store, 200)
+        _get(store, 800)
+        _get(store, 365)
+
+        assert [c.kwargs["days"] for c in fetch.call_args_list] == [200, 800]
+        stats = store.get_stats()
+        assert stats["extends"] == 1
+        assert stats["hits"] == 1
+
+    def test_expired_series_refetches_longest_window(self):
+        fetch = _history_fetch(_daily_frame())
+        store = _store(fetch)
+
+        _get(store, 800)
+        store.get(
+            "RELIANCE.NS",
+            200,
+            "1d",
+            None,
+            include_live_bar=False,
+            history_ttl=0,
+            live_ttl=15,
+            today=TODAY,
+        )
+
+        assert [c.kwargs["days"] for c in fetch.call_args_list] == [800, 800]
+
+    def test_history_always_fetched_without_current_day(self):
+        fetch = _history_fetch(_daily_frame())
+        store = _store(fetch)
+        _get(store, 200, include_live_bar=True)
+        assert fetch.call_args.kwargs["add_current_day"] is False
+
+    def test_live_bar_merged_only_when_requested(self):
+        fetch = _history_fetch(_daily_frame())
+        live = MagicMock(
+            return_value={
+                "date": TODAY,
+                "open": 10,
+                "high": 11,
+                "low": 9,
+                "close": 10.5,
+                "volume": 5,
+            }
+        )
+        store = _store(fetch, live)
+
+        plain = _get(store, 365)
+        with_live = _get(store, 365, include_live_bar=True)
+        again = _get(store, 200, include_live_bar=True)
+
+        assert fetch.call_count == 1
+        assert live.call_count == 1
+        assert len(with_live) == len(plain) + 1
+        assert with_live["close"].iloc[-1] == 10.5
+        assert again["close"].iloc[-1] == 10.5
+        stats = store.get_stats()
+        assert stats["live_misses"] == 1
+        assert stats["live_hits"] == 1
+
+    def test_mutating_slice_does_not_touch_stored_series(self):
+        fetch = _history_fetch(_daily_frame())
+        store = _store(fetch)
+
+        first = _get(store, 200)
+        first.loc[first.index[-1], "close"] = -1.0
+        second = _get(store, 200)
+
+        assert second["close"].iloc[-1] != -1.0
+
+    def test_missing_history_returns_none(self):
+        store = _store(MagicMock(return_value=None))
+        assert _get(store, 200) is None
+        assert store.get_stats()["size"] == 0
+
+    def test_clear(self):
+        fetch = _history_fetch(_daily_frame())
+        store = _store(fetch)
+        _get(store, 200)
+        store.clear()
+        _get(store, 200)
+        assert fetch.call_count == 2
+
+
+@pytest.fixture
+def clean_shared_cache():
+    data_fetcher.clear_ohlcv_cache()
+    yield
+    data_fetcher.clear_ohlcv_cache()
+
+
+@pytest.mark.usefixtures("clean_shared_cache")
+class TestGetCachedOhlcvSeriesStore:
+    def test_different_days_share_one_fetch(self):
+        frame = _daily_frame()
+        with patch.object(data_fetcher, "fetch_ohlcv_yf", return_value=frame) as mock_fetch:
+            d365 = data_fetcher.get_cached_ohlcv(
+                "TCS.NS", days=365, add_current_day=False, end_date="2026-05-25"
+            )
+            d200 = data_fetcher.get_cached_ohlcv(
+                "TCS.NS", days=200, add_current_day=False, end_date="2026-05-25"
+            )
+
+        mock_fetch.assert_called_once()
+        assert len(d200) < len(d365)
+        assert data_fetcher.get_ohlcv_cache_stats()["size"] == 1
+
+    def test_live_and_non_live_callers_share_history(self):
+        frame = _daily_frame(end="2026-10-15")
+        live_bar = {
+            "date": date(2026, 10, 16),
+            "open": 1,
+            "high": 2,
+            "low": 0.5,
+            "close": 1.5,
+            "volume": 7,
+        }
+        with (
+            patch.object(data_fetcher, "fetch_ohlcv_yf", return_value=frame) as mock_fetch,
+            patch.object(data_fetcher, "_get_current_day_data", return_value=live_bar) as mock_live,
+            patch.object(
+                data_fetcher,
+                "live_current_day_scope_allowed",
+                side_effect=lambda **kw: kw["add_current_day"],
+            ),
+        ):
+            hist = data_fetcher.get_cached_ohlcv("INFY.NS", days=200, add_current_day=False)
+            live = data_fetcher.get_cached_ohlcv("INFY.NS", days=200, add_current_day=True)
+
+        mock_fetch.assert_called_once()
+        mock_live.assert_called_once_with("INFY.NS")
+        assert len(live) == len(hist) + 1
+        assert live["close"].iloc[-1] == 1.5
@@ -0,0 +1,250 @@
+"""Per-key single-flight OHLCV cache: concurrent distinct keys, coalesced same-key fetches."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from core import data_fetcher
+from core.single_flight_cache import SingleFlightCache
+
+# Historical window end keeps these tests off the live current-day path
+END_DATE = "2026-05-26"
+
+
+@pytest.fixture(autouse=True)
+def clear_inprocess_ohlcv_cache():
+    data_fetcher.clear_ohlcv_cache()
+    yield
+    data_fetcher.clear_ohlcv_cache()
+
+
+def _frame(close: float = 100.0) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2026-05-25"]),
+            "open": [close],
+            "high": [close + 1],
+            "low": [close - 1],
+            "close": [close],
+            "volume": [1000],
+        }
+    )
+
+
+class TestSingleFlightCache:
+    def test_hit_after_miss(self):
+        cache = SingleFlightCache(max_size=10)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return "value"
+
+        assert cache.get_or_load("k", loader, ttl_seconds=60) == "value"
+        assert cache.get_or_load("k", loader, ttl_seconds=60) == "value"
+        assert len(calls) == 1
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["size"] == 1
+
+    def test_expired_entry_reloads(self):
+        cache = SingleFlightCache(max_size=10)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return len(calls)
+
+        assert cache.get_or_load("k", loader, ttl_seconds=0) == 1
+        assert cache.get_or_load("k", loader, ttl_seconds=0) == 2
+
+    def test_same_key_concurrent_callers_share_one_load(self):
+        cache = SingleFlightCache(max_size=10)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "shared"
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.get_or_load("k", loader, ttl_seconds=60))
+            )
+            for _ in range(5)
+        ]
+        threads[0].start()
+        assert started.wait(5)
+        for t in threads[1:]:
+            t.start()
+        # Let followers reach the wait before releasing the leader
+        deadline = time.monotonic() + 5
+        while cache.get_stats()["waits"] < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert len(calls) == 1
+        assert results == ["shared"] * 5
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["waits"] == 4
+        assert stats["inflight"] == 0
+
+    def test_different_keys_load_concurrently(self):
+        cache = SingleFlightCache(max_size=10)
+        barrier = threading.Barrier(2, timeout=5)
+
+        def loader():
+            # Both loaders must be running at the same time to pass the barrier
+            barrier.wait()
+            return "ok"
+
+        errors = []
+
+        def run(key):
+            try:
+                cache.get_or_load(key, loader, ttl_seconds=60)
+            except Exception as e:  # pragma: no cover - surfaced via assertion
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(k,)) for k in ("A", "B")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(10)
+
+        assert errors == []
+
+    def test_loader_error_propagates_and_is_not_cached(self):
+        cache = SingleFlightCache(max_size=10)
+
+        def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load("k", failing, ttl_seconds=60)
+        assert cache.get_or_load("k", lambda: "ok", ttl_seconds=60) == "ok"
+        assert cache.get_stats()["errors"] == 1
+
+    def test_cache_if_skips_storing(self):
+        cache = SingleFlightCache(max_size=10)
+        assert cache.get_or_load("k", lambda: None, 60, cache_if=lambda v: v is not None) is None
+        assert len(cache) == 0
+
+    def test_invalidate_during_load_discards_stale_result(self):
+        cache = SingleFlightCache(max_size=10)
+        started, release = threading.Event(), threading.Event()
+        results = []
+
+        def slow_loader():
+            started.set()
+            release.wait(5)
+            return "stale"
+
+        t = threading.Thread(target=lambda: results.append(cache.get_or_load("k", slow_loader, 60)))
+        t.start()
+        assert started.wait(5)
+        cache.invalidate("k")
+        # A caller after the invalidation starts its own load instead of joining the stale one
+        assert cache.get_or_load("k", lambda: "fresh", ttl_seconds=60) == "fresh"
+        release.set()
+        t.join(5)
+
+        assert results == ["stale"]
+        assert cache.get_or_load("k", lambda: "reloaded", ttl_seconds=60) == "fresh"
+        assert cache.get_stats()["inflight"] == 0
+
+    def test_clear_during_load_discards_stale_result(self):
+        cache = SingleFlightCache(max_size=10)
+
+        def loader():
+            cache.clear()
+            return "stale"
+
+        assert cache.get_or_load("k", loader, ttl_seconds=60) == "stale"
+        assert len(cache) == 0
+
+    def test_evicts_oldest_when_full(self):
+        cache = SingleFlightCache(max_size=20)
+        for i in range(21):
+            cache.get_or_load(f"k{i}", lambda i=i: i, ttl_seconds=60)
+        assert len(cache) == 10
+        assert cache.get_stats()["evictions"] == 11
+
+
+class TestGetCachedOhlcvSingleFlight:
+    def test_returns_copy_on_hit(self):
+        with patch.object(data_fetcher, "fetch_ohlcv_yf", return_value=_frame()) as mock_fetch:
+            first = data_fetcher.get_cached_ohlcv(
+                "RELIANCE.NS", days=200, add_current_day=False, end_date=END_DATE
+            )
+            first.loc[0, "close"] = -1.0
+            second = data_fetcher.get_cached_ohlcv(
+                "RELIANCE.NS", days=200, add_current_day=False, end_date=END_DATE
+            )
+
+        mock_fetch.assert_called_once()
+        assert second.loc[0, "close"] == 100.0
+        stats = data_fetcher.get_ohlcv_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_empty_result_not_cached(self):
+        with patch.object(
+            data_fetcher, "fetch_ohlcv_yf", return_value=pd.DataFrame()
+        ) as mock_fetch:
+            assert data_fetcher.get_cached_ohlcv("TCS.NS", days=60, end_date=END_DATE) is None
+            assert data_fetcher.get_cached_ohlcv("TCS.NS", days=60, end_date=END_DATE) is None
+
+        assert mock_fetch.call_count == 2
+
+    def test_fetch_error_returns_none(self):
+        with patch.object(data_fetcher, "fetch_ohlcv_yf", side_effect=RuntimeError("down")):
+            assert data_fetcher.get_cached_ohlcv("INFY.NS", days=60, end_date=END_DATE) is None
+        assert data_fetcher.get_ohlcv_cache_stats()["errors"] == 1
+
+    def test_concurrent_same_ticker_fetches_once(self):
+        release = threading.Event()
+        calls = []
+
+        def slow_fetch(*args, **kwargs):
+            calls.append(args[0])
+            release.wait(5)
+            return _frame()
+
+        results = []
+        with patch.object(data_fetcher, "fetch_ohlcv_yf", side_effect=slow_fetch):
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        data_fetcher.get_cached_ohlcv("SBIN.NS", days=200, end_date=END_DATE)
+                    )
+                )
+                for _ in range(4)
+            ]
+            for t in threads:
+                t.start()
+            deadline = time.monotonic() + 5
+            while data_fetcher.get_ohlcv_cache_stats()["waits"] < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            release.set()
+            for t in threads:
+                t.join(5)
+
+        assert calls == ["SBIN.NS"]
+        assert len(results) == 4
+        assert all(r is not None and len(r) == 1 for r in results)
+        # Each caller gets its own copy
+        assert len({id(r) for r in results}) == 4
@@ -0,0 +1,121 @@
+"""Streaming RSI/EMA state must reproduce the pandas_ta path used by compute_indicators."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+import pytest
+
+from core.indicators import compute_indicators
+from core.streaming_indicators import EmaState, StreamingIndicatorState, WilderRsiState
+
+
+def _closes(n: int = 300, seed: int = 7) -> pd.Series:
+    rng = np.random.default_rng(seed)
+    return pd.Series(1000 + np.cumsum(rng.normal(0, 12, n)), dtype="float64")
+
+
+def _daily_frame(closes: pd.Series, end: str = "2026-05-25") -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": pd.bdate_range(end=end, periods=len(closes)),
+            "open": closes,
+            "high": closes + 5,
+            "low": closes - 5,
+            "close": closes,
+            "volume": 1000,
+        }
+    )
+
+
+class TestWilderRsiState:
+    def test_peek_matches_pandas_ta_with_live_close(self):
+        closes = _closes()
+        state = WilderRsiState.seed(closes.iloc[:-1], 10)
+        expected = ta.rsi(closes, length=10).iloc[-1]
+        assert state.peek(closes.iloc[-1]) == pytest.approx(expected, rel=1e-12)
+
+    def test_value_matches_pandas_ta_on_history(self):
+        closes = _closes()
+        state = WilderRsiState.seed(closes, 10)
+        assert state.value == pytest.approx(ta.rsi(closes, length=10).iloc[-1], rel=1e-12)
+
+    def test_update_is_equivalent_to_reseed(self):
+        closes = _closes()
+        state = WilderRsiState.seed(closes.iloc[:-30], 10)
+        for close in closes.iloc[-30:]:
+            state.update(close)
+        assert state.value == pytest.approx(ta.rsi(closes, length=10).iloc[-1], rel=1e-9)
+
+    def test_peek_does_not_commit(self):
+        state = WilderRsiState.seed(_closes(), 10)
+        before = state.value
+        state.peek(1.0)
+        assert state.value == before
+
+    def test_insufficient_history(self):
+        assert WilderRsiState.seed(pd.Series([1.0, 2.0, 3.0]), 10) is None
+
+    def test_flat_prices_have_no_rsi(self):
+        state = WilderRsiState.seed(pd.Series([100.0] * 20), 10)
+        assert state.peek(100.0) is None
+
+
+class TestEmaState:
+    @pytest.mark.parametrize("period", [9, 200])
+    def test_peek_matches_pandas_ta(self, period):
+        closes = _closes()
+        state = EmaState.seed(closes.iloc[:-1], period)
+        expected = ta.ema(closes, length=period).iloc[-1]
+        assert state.peek(closes.iloc[-1]) == pytest.approx(expected, rel=1e-12)
+
+    def test_update_is_equivalent_to_reseed(self):
+        closes = _closes()
+        state = EmaState.seed(closes.iloc[:-10], 9)
+        for close in closes.iloc[-10:]:
+            state.update(close)
+        assert state.value == pytest.approx(ta.ema(closes, length=9).iloc[-1], rel=1e-9)
+
+    def test_insufficient_history(self):
+        assert EmaState.seed(pd.Series([1.0] * 8), 9) is None
+
+
+class TestStreamingIndicatorState:
+    def test_snapshot_matches_compute_indicators_with_live_bar(self):
+        closes = _closes()
+        df = _daily_frame(closes)
+        session = df["date"].iloc[-1].date()
+
+        # History includes today's partial bar: it must be excluded from the seed
+        state = StreamingIndicatorState.from_history(df, session_date=session)
+        snap = state.snapshot(closes.iloc[-1])
+
+        expected = compute_indicators(df).iloc[-1]
+        assert state.prev_close == closes.iloc[-2]
+        assert snap["rsi10"] == pytest.approx(expected["rsi10"], rel=1e-12)
+        assert snap["ema9"] == pytest.approx(expected["ema9"], rel=1e-12)
+        assert snap["ema200"] == pytest.approx(expected["ema200"], rel=1e-12)
+
+    def test_snapshot_without_ltp_returns_previous_close_values(self):
+        closes = _closes()
+        df = _daily_frame(closes)
+        state = StreamingIndicatorState.from_history(df, session_date=date(2026, 5, 26))
+        snap = state.snapshot()
+
+        expected = compute_indicators(df).iloc[-1]
+        assert snap["close"] == closes.iloc[-1]
+        assert snap["rsi10"] == pytest.approx(expected["rsi10"], rel=1e-12)
+
+    def test_short_history_leaves_ema200_unset(self):
+        df = _daily_frame(_closes(50))
+        state = StreamingIndicatorState.from_history(df, session_date=date(2026, 5, 26))
+        snap = state.snapshot(1000.0)
+        assert snap["ema200"] is None
+        assert snap["rsi10"] is not None
+
+    def test_empty_history(self):
+        assert StreamingIndicatorState.from_history(pd.DataFrame(), date(2026, 5, 26)) is None
+        assert StreamingIndicatorState.from_history(None, date(2026, 5, 26)) is None
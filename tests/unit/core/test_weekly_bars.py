@@ -0,0 +1,105 @@
+"""Weekly bars resampled from the daily series instead of a second Yahoo ``1wk`` fetch."""
+
+from __future__ import annotations
+
+from datetime import date
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from core import data_fetcher
+from core.weekly_bars import is_week_complete, resample_daily_to_weekly
+
+
+def _daily_frame(start: str, end: str) -> pd.DataFrame:
+    dates = [d for d in pd.bdate_range(start=start, end=end) if d.date() != date(2026, 4, 3)]
+    closes = [100.0 + i for i in range(len(dates))]
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "open": [c - 0.5 for c in closes],
+            "high": [c + 1 for c in closes],
+            "low": [c - 1 for c in closes],
+            "close": closes,
+            "volume": [1000] * len(dates),
+        }
+    )
+
+
+def test_resample_aggregates_iso_weeks_dated_on_last_session():
+    # 2026-03-30 .. 2026-04-10: second week is complete, Good Friday (Apr 3) shortens the first
+    weekly = resample_daily_to_weekly(_daily_frame("2026-03-30", "2026-04-10"))
+
+    assert list(weekly["date"]) == [pd.Timestamp("2026-04-02"), pd.Timestamp("2026-04-10")]
+    first = weekly.iloc[0]
+    assert (first["open"], first["close"], first["high"], first["low"]) == (
+        99.5,
+        103.0,
+        104.0,
+        99.0,
+    )
+    assert first["volume"] == 4000
+    assert weekly.iloc[1]["volume"] == 5000
+
+
+def test_resample_keeps_partial_current_week_unless_dropped():
+    daily = _daily_frame("2026-03-30", "2026-04-08")  # Wednesday of an open week
+
+    weekly = resample_daily_to_weekly(daily)
+    assert weekly["date"].iloc[-1] == pd.Timestamp("2026-04-08")
+    assert weekly["close"].iloc[-1] == daily["close"].iloc[-1]
+
+    closed = resample_daily_to_weekly(daily, drop_partial_week=True)
+    assert list(closed["date"]) == [pd.Timestamp("2026-04-02")]
+
+
+def test_resample_window_starts_on_a_whole_week():
+    daily = _daily_frame("2026-01-05", "2026-04-10")
+
+    weekly = resample_daily_to_weekly(daily, days=30, end_date=date(2026, 4, 10))
+
+    # 30 days before Apr 10 is Wednesday Mar 11 -> the window starts on Monday Mar 9
+    assert weekly["date"].iloc[0] == pd.Timestamp("2026-03-13")
+    assert weekly.iloc[0]["volume"] == 5000
+
+
+def test_is_week_complete_uses_nse_holidays():
+    assert is_week_complete(date(2026, 4, 2))  # Good Friday holiday -> Thursday ends the week
+    assert not is_week_complete(date(2026, 4, 8))
+    assert is_week_complete(date(2026, 4, 10))
+
+
+def test_weekly_from_daily_skips_yahoo_when_daily_covers_window():
+    daily = _daily_frame("2025-06-02", "2026-04-10")
+
+    with patch.object(data_fetcher, "fetch_ohlcv_yf") as yahoo:
+        weekly = data_fetcher.weekly_from_daily(
+            "RELIANCE.NS", daily, days=200, daily_days=400, end_date="2026-04-10"
+        )
+
+    yahoo.assert_not_called()
+    assert len(weekly) >= 28
+    assert weekly["date"].iloc[-1] == pd.Timestamp("2026-04-10")
+
+
+def test_weekly_from_daily_falls_back_to_yahoo_for_longer_window():
+    daily = _daily_frame("2026-01-05", "2026-04-10")
+    yahoo_weekly = resample_daily_to_weekly(daily)
+
+    with patch.object(data_fetcher, "fetch_ohlcv_yf", return_value=yahoo_weekly) as yahoo:
+        weekly = data_fetcher.weekly_from_daily(
+            "RELIANCE.NS", daily, days=1095, daily_days=800, add_current_day=False
+        )
+
+    yahoo.assert_called_once_with(
+        "RELIANCE.NS", days=1095, interval="1wk", end_date=None, add_current_day=False
+    )
+    assert weekly is yahoo_weekly
+
+
+def test_weekly_from_daily_raises_for_too_few_weeks():
+    daily = _daily_frame("2026-03-02", "2026-04-10")
+
+    with pytest.raises(ValueError, match="Insufficient weekly data"):
+        data_fetcher.weekly_from_daily("NEW.NS", daily, days=365)
@@ -2,12 +2,13 @@
 Tests for timezone utilities
 """
 
-from datetime import UTC, datetime, timedelta, timezone
+from datetime import UTC, date, datetime, timedelta, timezone
 
 import pytest
 
 from src.infrastructure.db.timezone_utils import (
     IST,
+    day_range,
     db_timestamp_to_utc_for_api,
     ist_now,
     ist_now_naive,
@@ -156,3 +157,9 @@ def test_service_status_heartbeat_to_utc_matches_age_for_utc_naive_legacy():
     assert age is not None
     assert 5 < age < 120
 
+
+def test_day_range_is_half_open_over_whole_days():
+    start, end = day_range(date(2026, 2, 27), date(2026, 2, 28))
+    assert start == datetime(2026, 2, 27)
+    assert end == datetime(2026, 3, 1)
+    assert start <= datetime(2026, 2, 28, 23, 59, 59, 999999) < end
@@ -0,0 +1,132 @@
+"""Asynchronous batched JSONL writer behind UserFileLogHandler."""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from pathlib import Path
+
+from src.infrastructure.logging.async_jsonl_writer import AsyncJsonlWriter
+from src.infrastructure.logging.file_log_reader import FileLogReader
+from src.infrastructure.logging.user_file_log_handler import UserFileLogHandler
+
+
+def _record(message: str, **extra) -> logging.LogRecord:
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg=message,
+        args=(),
+        exc_info=None,
+    )
+    record.__dict__.update({"log_module": "test_module", "user_id": 1, **extra})
+    return record
+
+
+def _read_lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_writer_batches_and_flushes(tmp_path):
+    writer = AsyncJsonlWriter(queue_size=1000, batch_size=50, flush_interval_s=0.05)
+    path = str(tmp_path / "service.jsonl")
+
+    for i in range(120):
+        assert writer.submit(path, {"message": f"m{i}", "user_id": 1})
+    assert writer.flush()
+
+    assert [row["message"] for row in _read_lines(Path(path))] == [f"m{i}" for i in range(120)]
+    stats = writer.get_stats()
+    assert stats["written"] == 120
+    assert stats["batches"] < 120
+    writer.shutdown()
+
+
+def test_full_queue_drops_and_reports(tmp_path):
+    writer = AsyncJsonlWriter(queue_size=5, batch_size=10, flush_interval_s=0.05)
+    path = str(tmp_path / "service.jsonl")
+    gate = threading.Event()
+    original_write_batch = writer._write_batch
+
+    def blocked_write_batch(records):
+        gate.wait(2)
+        original_write_batch(records)
+
+    writer._write_batch = blocked_write_batch
+    writer.submit(path, {"message": "first", "user_id": 1})
+    accepted = sum(writer.submit(path, {"message": "x", "user_id": 1}) for _ in range(20))
+    gate.set()
+    writer.flush()
+    writer.submit(path, {"message": "after", "user_id": 1})
+    writer.flush()
+
+    dropped = writer.get_stats()["dropped"]
+    assert dropped == 20 - accepted > 0
+    warnings = [row for row in _read_lines(Path(path)) if row.get("level") == "WARNING"]
+    assert warnings[0]["context"] == {"dropped": dropped}
+    assert warnings[0]["user_id"] == 1
+    writer.shutdown()
+
+
+def test_async_handler_output_matches_sync(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    unserializable = object()
+
+    for async_writes, user_id in ((False, 1), (True, 2)):
+        handler = UserFileLogHandler(user_id=user_id, async_writes=async_writes)
+        handler.emit(_record("hello", user_id=user_id, order_id="A1", obj=unserializable))
+        handler.close()
+
+    sync_row, async_row = (
+        _read_lines(next((tmp_path / "logs" / "users" / f"user_{uid}").glob("service_*.jsonl")))[0]
+        for uid in (1, 2)
+    )
+    assert async_row["message"] == sync_row["message"] == "hello"
+    assert async_row["context"] == sync_row["context"]
+    assert async_row["context"]["obj"] == str(unserializable)
+
+
+def test_reader_sees_queued_records(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    handler = UserFileLogHandler(user_id=3, async_writes=True)
+    handler.emit(_record("queued", user_id=3))
+
+    logs = FileLogReader(base_dir="logs").read_logs(user_id=3)
+
+    assert [row["message"] for row in logs] == ["queued"]
+    handler.close()
+
+
+def test_context_is_snapshotted_at_emit(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    handler = UserFileLogHandler(user_id=4, async_writes=True)
+    order = {"qty": 1, "fills": [1]}
+    circular: list = []
+    circular.append(circular)
+
+    handler.emit(_record("placed", user_id=4, order=order, circular=circular))
+    # Top-level changes after emit are not logged (serialization runs on the writer thread)
+    order["qty"] = 2
+    order["fills"] = [1, 2]
+    circular.append(1)
+    handler.close()
+
+    row = _read_lines(next((tmp_path / "logs" / "users" / "user_4").glob("service_*.jsonl")))[0]
+    assert row["context"]["order"] == {"qty": 1, "fills": [1]}
+    assert isinstance(row["context"]["circular"], str)
+
+
+def test_unserializable_record_is_reported_at_warning(tmp_path, caplog):
+    writer = AsyncJsonlWriter(queue_size=10, batch_size=10, flush_interval_s=0.05)
+    path = str(tmp_path / "service.jsonl")
+
+    with caplog.at_level(logging.WARNING, logger="src.infrastructure.logging.async_jsonl_writer"):
+        writer._write_batch([(path, {"message": "x", ("bad",): 1}), (path, {"message": "ok"})])
+
+    assert any("unserializable" in r.message for r in caplog.records)
+    assert [row["message"] for row in _read_lines(Path(path))] == ["ok"]
+    assert writer.get_stats()["dropped"] == 1
+    writer.shutdown()
@@ -0,0 +1,122 @@
+"""Sidecar index behind FileLogReader: incremental refresh, seek, cursor pages, persistence."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.infrastructure.db.timezone_utils import IST, ist_now
+from src.infrastructure.logging.file_log_reader import FileLogReader
+from src.infrastructure.logging.log_index import LogFileIndex, index_path_for
+
+
+def _line(ts: datetime, message: str, level: str = "INFO", module: str = "sell_engine") -> str:
+    payload = {
+        "timestamp": ts.isoformat(),
+        "level": level,
+        "module": module,
+        "message": message,
+        "context": None,
+        "user_id": 1,
+    }
+    return json.dumps(payload) + "\n"
+
+
+def _log_file(days_ago: int = 0) -> Path:
+    log_dir = Path("logs") / "users" / "user_1"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    day = ist_now().date() - timedelta(days=days_ago)
+    return log_dir / f"service_{day.strftime('%Y%m%d')}.jsonl"
+
+
+def test_refresh_indexes_only_appended_complete_lines(tmp_path):
+    path = tmp_path / "service_20260410.jsonl"
+    start = datetime(2026, 4, 10, 9, 15, tzinfo=IST)
+    path.write_text(_line(start, "a") + "not json\n" + _line(start, "b"), encoding="utf-8")
+
+    index = LogFileIndex(path)
+    index.refresh()
+    assert len(index) == 2
+    assert index.line_nos == [1, 3]
+
+    with path.open("a", encoding="utf-8") as f:
+        f.write(_line(start + timedelta(seconds=1), "c") + '{"partial": ')
+    index.refresh()
+    assert len(index) == 3
+    assert index.seekable
+
+    with path.open("a", encoding="utf-8") as f:
+        f.write('1, "level": "INFO", "module": "m", "message": "d", "user_id": 1}\n')
+    index.refresh()
+    assert len(index) == 4
+    # No timestamp: file can no longer be range-seeked, but stays queryable
+    assert not index.seekable
+
+    path.write_text(_line(start, "rotated"), encoding="utf-8")
+    index.refresh()
+    assert len(index) == 1
+
+
+def test_reader_filters_newest_first_and_pages_with_cursor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    now = ist_now().replace(microsecond=0)
+    yesterday, today = _log_file(days_ago=1), _log_file()
+    with yesterday.open("w", encoding="utf-8") as f:
+        for i in range(5):
+            f.write(_line(now - timedelta(days=1, minutes=10 - i), f"old {i}"))
+    with today.open("w", encoding="utf-8") as f:
+        for i in range(5):
+            level = "ERROR" if i % 2 else "INFO"
+            f.write(_line(now - timedelta(minutes=10 - i), f"new {i}", level=level))
+        f.write(_line(now, "buy placed", module="buy_engine"))
+
+    reader = FileLogReader(base_dir="logs")
+
+    first = reader.read_logs(user_id=1, limit=4)
+    assert [row["message"] for row in first] == ["buy placed", "new 4", "new 3", "new 2"]
+    second = reader.read_logs(user_id=1, limit=4, cursor=first[-1]["id"])
+    assert [row["message"] for row in second] == ["new 1", "new 0", "old 4", "old 3"]
+
+    errors = reader.read_logs(user_id=1, level="error")
+    assert [row["message"] for row in errors] == ["new 3", "new 1"]
+    assert [r["message"] for r in reader.read_logs(user_id=1, module="BUY")] == ["buy placed"]
+
+    window = reader.read_logs(
+        user_id=1,
+        start_time=now - timedelta(minutes=8),
+        end_time=now - timedelta(minutes=7),
+    )
+    assert [row["message"] for row in window] == ["new 3", "new 2"]
+    assert [r["message"] for r in reader.read_logs(user_id=1, search="OLD 2")] == ["old 2"]
+
+
+def test_index_is_persisted_and_reused(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = _log_file()
+    now = ist_now()
+    path.write_text("".join(_line(now, f"m{i}") for i in range(3)), encoding="utf-8")
+    quiet = time.time() - 3600
+    os.utime(path, (quiet, quiet))
+
+    FileLogReader(base_dir="logs").read_logs(user_id=1)
+
+    sidecar = index_path_for(path.resolve())
+    assert sidecar.exists()
+    loaded = LogFileIndex.load(path.resolve())
+    assert len(loaded) == 3
+    assert loaded.size == path.stat().st_size
+
+
+def test_tail_logs_uses_real_line_numbers(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = _log_file()
+    now = ist_now()
+    path.write_text("".join(_line(now, f"m{i}") for i in range(10)), encoding="utf-8")
+
+    tail = FileLogReader(base_dir="logs").tail_logs(user_id=1, tail_lines=3)
+
+    assert [row["message"] for row in tail] == ["m9", "m8", "m7"]
+    assert [row["id"] for row in tail] == [f"{path.name}:{n}" for n in (10, 9, 8)]
@@ -12,6 +12,7 @@ from src.infrastructure.data_providers.nse_bhavcopy_fetcher import (
     NseBhavcopyFetcher,
     bhavcopy_url,
     find_equity_bar,
+    index_equity_bars,
     parse_equity_bars,
 )
 from src.infrastructure.data_providers.nse_symbol import to_cache_ticker
@@ -58,6 +59,24 @@ def test_find_equity_bar_be_series(sample_df):
     assert bar.close == 698.85
 
 
+def test_index_equity_bars_matches_find_equity_bar(sample_df):
+    bars = index_equity_bars(sample_df)
+    assert set(bars) == {"DMART", "TCS", "AXISCADES"}
+    for sym, bar in bars.items():
+        assert bar == find_equity_bar(sample_df, sym)
+
+
+def test_index_equity_bars_prefers_eq_series_and_filters_symbols(sample_df):
+    be_row = sample_df[sample_df["TckrSymb"] == "TCS"].assign(SctySrs="BE", ClsPric=1.0)
+    df = pd.concat([be_row, sample_df], ignore_index=True)
+
+    bars = index_equity_bars(df, {"TCS"})
+
+    assert set(bars) == {"TCS"}
+    assert bars["TCS"].close == 2446.9
+    assert bars["TCS"] == find_equity_bar(df, "TCS")
+
+
 def test_to_cache_ticker():
     assert to_cache_ticker("DMART") == "DMART.NS"
     assert to_cache_ticker("RELIANCE.NS") == "RELIANCE.NS"
@@ -97,3 +116,26 @@ def test_download_uses_disk_cache(tmp_path, sample_df, monkeypatch):
     df = fetcher.download_bhavcopy(date(2026, 6, 2))
     assert df is not None
     assert len(df) == 3
+
+
+def test_download_refetches_when_store_read_fails(tmp_path, sample_df, monkeypatch):
+    fetcher = NseBhavcopyFetcher(cache_dir=tmp_path / "bhav", request_delay_s=0)
+    fetcher.store.write_day(date(2026, 6, 2), sample_df)
+
+    def corrupt_read(_trade_date):
+        raise ValueError("cannot reshape array")
+
+    def fake_http(_url, **_kw):
+        import io
+        import zipfile
+
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            zf.writestr("data.csv", sample_df.to_csv(index=False))
+        return buf.getvalue()
+
+    monkeypatch.setattr(fetcher.store, "read_day", corrupt_read)
+    monkeypatch.setattr(fetcher, "_http_get", fake_http)
+    df = fetcher.download_bhavcopy(date(2026, 6, 2))
+    assert df is not None
+    assert len(df) == len(sample_df)
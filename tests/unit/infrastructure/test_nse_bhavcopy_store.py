@@ -0,0 +1,187 @@
+"""Tests for the columnar NSE bhavcopy store."""
+
+from __future__ import annotations
+
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.infrastructure.data_providers.nse_bhavcopy_fetcher import (
+    NseBhavcopyFetcher,
+    find_equity_bar,
+    parse_equity_bars,
+)
+from src.infrastructure.data_providers.nse_bhavcopy_store import NseBhavcopyStore
+
+FIXTURE = Path(__file__).resolve().parents[2] / "fixtures" / "nse_bhavcopy_sample.csv"
+DAYS = [date(2025, 12, 31), date(2026, 1, 1), date(2026, 1, 2)]
+
+
+@pytest.fixture
+def sample_df() -> pd.DataFrame:
+    return pd.read_csv(FIXTURE)
+
+
+def _bhavcopy(sample_df: pd.DataFrame, trade_date: date, close_shift: float = 0.0):
+    """Sample file re-dated to ``trade_date`` (TCS/DMART only) with shifted closes."""
+    df = sample_df[sample_df["TckrSymb"].isin(["DMART", "TCS"])]
+    return df.assign(
+        TradDt=trade_date.isoformat(),
+        BizDt=trade_date.isoformat(),
+        ClsPric=df["ClsPric"] + close_shift,
+    )
+
+
+def test_read_day_round_trips_equity_bars(tmp_path, sample_df):
+    store = NseBhavcopyStore(tmp_path, compact_threshold=0)
+    store.write_day(date(2026, 6, 2), sample_df)
+
+    assert store.has_day(date(2026, 6, 2))
+    assert not store.has_day(date(2026, 6, 3))
+    stored = store.read_day(date(2026, 6, 2))
+    assert parse_equity_bars(stored) == parse_equity_bars(sample_df)
+    assert find_equity_bar(stored, "DMART") == find_equity_bar(sample_df, "DMART")
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_symbol_history_across_days_and_years(tmp_path, sample_df, compact):
+    store = NseBhavcopyStore(tmp_path, compact_threshold=0)
+    for i, day in enumerate(DAYS):
+        store.write_day(day, _bhavcopy(sample_df, day, close_shift=i))
+    if compact:
+        assert store.compact() == len(DAYS)
+        assert not list((tmp_path / "pending").glob("*.npz"))
+
+    history = store.symbol_history("TCS", columns=("close",))
+
+    assert list(history.columns) == ["date", "close"]
+    assert [d.date() for d in history["date"]] == DAYS
+    assert history["close"].tolist() == [2446.9, 2447.9, 2448.9]
+    ranged = store.symbol_history("tcs", date(2026, 1, 1), date(2026, 1, 31))
+    assert len(ranged) == 2
+    assert store.symbol_history("NOPE").empty
+    assert store.read_day(DAYS[1])["ClsPric"].tolist() == [4058.0, 2447.9]
+
+
+def test_compaction_replaces_rewritten_day(tmp_path, sample_df):
+    store = NseBhavcopyStore(tmp_path, compact_threshold=2)
+    store.write_day(DAYS[1], _bhavcopy(sample_df, DAYS[1]))
+    store.write_day(DAYS[2], _bhavcopy(sample_df, DAYS[2]))
+    assert (store._partition_dir(2026) / "close.npy").exists()
+
+    store.write_day(DAYS[1], _bhavcopy(sample_df, DAYS[1], close_shift=10))
+    store.compact()
+
+    history = NseBhavcopyStore(tmp_path).symbol_history("DMART", columns=("close",))
+    assert history["close"].tolist() == [4067.0, 4057.0]
+
+
+def test_symbol_history_prefers_eq_series(tmp_path, sample_df):
+    day = DAYS[1]
+    df = _bhavcopy(sample_df, day)
+    be_row = df[df["TckrSymb"] == "TCS"].assign(SctySrs="BE", ClsPric=1.0)
+    store = NseBhavcopyStore(tmp_path, compact_threshold=0)
+    store.write_day(day, pd.concat([be_row, df], ignore_index=True))
+    store.compact()
+
+    assert store.symbol_history("TCS", columns=("close",))["close"].tolist() == [2446.9]
+
+
+def test_fetcher_converts_legacy_csv_once(tmp_path, sample_df, monkeypatch):
+    cache_dir = tmp_path / "bhav"
+    cache_dir.mkdir()
+    sample_df.to_csv(cache_dir / "bhav_20260602.csv", index=False)
+    fetcher = NseBhavcopyFetcher(cache_dir=cache_dir, request_delay_s=0)
+    fetcher.use_disk_cache = True
+
+    def fail_http(_url, **_kw):
+        raise AssertionError("should not HTTP when cached")
+
+    monkeypatch.setattr(fetcher, "_http_get", fail_http)
+    first = fetcher.download_bhavcopy(date(2026, 6, 2))
+    assert len(first) == 3
+    assert not (cache_dir / "bhav_20260602.csv").exists()
+    assert fetcher.has_cached_bhavcopy(date(2026, 6, 2))
+
+    second = fetcher.download_bhavcopy(date(2026, 6, 2))
+    assert parse_equity_bars(second) == parse_equity_bars(first)
+
+
+def test_migrate_csv_cache(tmp_path, sample_df):
+    for day in DAYS:
+        _bhavcopy(sample_df, day).to_csv(tmp_path / f"bhav_{day:%Y%m%d}.csv", index=False)
+    fetcher = NseBhavcopyFetcher(cache_dir=tmp_path, request_delay_s=0)
+
+    assert fetcher.migrate_csv_cache() == len(DAYS)
+    assert not list(tmp_path.glob("bhav_*.csv"))
+    history = fetcher.symbol_history("DMART", DAYS[0], DAYS[-1], columns=("close", "volume"))
+    assert len(history) == len(DAYS)
+    assert history["volume"].tolist() == [467977.0] * len(DAYS)
+
+
+def test_stores_sharing_a_root_see_each_others_compactions(tmp_path, sample_df):
+    reader = NseBhavcopyStore(tmp_path, compact_threshold=0)
+    writer = NseBhavcopyStore(tmp_path, compact_threshold=0)
+    writer.write_day(DAYS[1], _bhavcopy(sample_df, DAYS[1]))
+    writer.compact()
+    assert reader.has_day(DAYS[1]) and not reader.has_day(DAYS[2])
+
+    writer.write_day(DAYS[2], _bhavcopy(sample_df, DAYS[2]))
+    writer.compact()
+    # The reader's cached day list for 2026 is refreshed, not reused
+    assert reader.has_day(DAYS[2])
+    # Staging directories are unique per rewrite and removed afterwards
+    assert sorted(p.name for p in tmp_path.iterdir() if p.is_dir()) == ["pending", "year=2026"]
+
+
+def test_rewrite_swaps_current_version_and_drops_superseded_ones(tmp_path, sample_df):
+    store = NseBhavcopyStore(tmp_path, compact_threshold=0)
+    store.write_day(DAYS[1], _bhavcopy(sample_df, DAYS[1]))
+    store.compact()
+    first = store._partition_dir(2026)
+    orphan = tmp_path / "year=2026" / "v-crashed"
+    orphan.mkdir()
+
+    store.write_day(DAYS[2], _bhavcopy(sample_df, DAYS[2]))
+    store.compact()
+
+    current = store._partition_dir(2026)
+    assert current != first
+    assert (tmp_path / "year=2026" / "CURRENT").read_text() == current.name
+    assert sorted(p.name for p in (tmp_path / "year=2026").iterdir()) == ["CURRENT", current.name]
+    assert len(store.symbol_history("TCS")) == 2
+
+
+def test_flat_partition_layout_is_read_and_migrated(tmp_path, sample_df):
+    store = NseBhavcopyStore(tmp_path, compact_threshold=0)
+    store.write_day(DAYS[1], _bhavcopy(sample_df, DAYS[1]))
+    store.compact()
+    year_dir = tmp_path / "year=2026"
+    version = store._partition_dir(2026)
+    for path in version.iterdir():
+        path.rename(year_dir / path.name)
+    version.rmdir()
+    (year_dir / "CURRENT").unlink()
+
+    assert store.has_day(DAYS[1])
+    store.write_day(DAYS[2], _bhavcopy(sample_df, DAYS[2]))
+    store.compact()
+
+    assert not list(year_dir.glob("*.npy"))
+    assert len(store.symbol_history("TCS")) == 2
+
+
+def test_pending_day_removed_by_another_process_is_skipped(tmp_path, sample_df, monkeypatch):
+    store = NseBhavcopyStore(tmp_path, compact_threshold=0)
+    for day in DAYS[1:]:
+        store.write_day(day, _bhavcopy(sample_df, day))
+    gone = store._pending_path(DAYS[2])
+    listed = store._pending_days()
+    gone.unlink()
+    monkeypatch.setattr(store, "_pending_days", lambda: listed)
+
+    assert len(store.symbol_history("TCS")) == 1
+    assert store.compact() == 1
+    assert store.has_day(DAYS[1]) and not store.has_day(DAYS[2])
@@ -0,0 +1,120 @@
+"""
+Tests for OrdersRepository.list and the schema capability registry
+
+Tests verify that:
+1. Orders columns are introspected once per engine and refreshed after create_all/invalidation
+2. Window-function counts match the separate COUNT query
+3. Projection mode returns OrderRow tuples with the same values as Orders
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import inspect, text
+
+from src.infrastructure.db import schema_registry
+from src.infrastructure.db.models import Orders, OrderStatus, TradeMode, UserRole, Users
+from src.infrastructure.persistence.orders_repository import OrderRow, OrdersRepository
+
+
+@pytest.fixture
+def user(db_session):
+    user = Users(
+        email="orders-list@example.com",
+        name="Orders List",
+        password_hash="dummy",
+        role=UserRole.USER,
+        is_active=True,
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+@pytest.fixture
+def orders(db_session, user):
+    placed = datetime(2025, 1, 15, 10, 0)
+    rows = [
+        Orders(
+            user_id=user.id,
+            symbol=f"SYM{i}-EQ",
+            side="buy",
+            order_type="limit",
+            quantity=10,
+            price=100.0 + i,
+            status=OrderStatus.PENDING if i % 2 else OrderStatus.CLOSED,
+            placed_at=placed + timedelta(minutes=i),
+            order_metadata={"i": i},
+            trade_mode=TradeMode.BROKER,
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(rows)
+    db_session.commit()
+    return rows
+
+
+def test_orders_columns_are_introspected_once_per_engine(db_session, user, orders):
+    repo = OrdersRepository(db_session)
+    schema_registry.invalidate_schema_cache(db_session.bind)
+
+    with patch.object(schema_registry, "inspect", wraps=inspect) as spy:
+        repo.list(user.id)
+        repo.list(user.id, status=OrderStatus.PENDING, limit=2)
+
+    assert spy.call_count == 1
+
+
+def test_invalidate_refreshes_cached_columns_after_raw_ddl(db_session):
+    bind = db_session.bind
+    assert "extra_col" not in schema_registry.table_columns(bind, "orders")
+
+    db_session.execute(text("ALTER TABLE orders ADD COLUMN extra_col VARCHAR(8)"))
+    schema_registry.invalidate_schema_cache(bind)
+
+    assert schema_registry.has_column(bind, "orders", "extra_col")
+
+
+def test_metadata_create_all_drops_cached_columns(db_session):
+    bind = db_session.bind
+    schema_registry.table_columns(bind, "orders")
+
+    Orders.metadata.create_all(bind=bind)
+
+    with patch.object(schema_registry, "inspect", wraps=inspect) as spy:
+        schema_registry.table_columns(bind, "orders")
+    assert spy.call_count == 1
+
+
+def test_window_count_matches_count_query(db_session, user, orders):
+    repo = OrdersRepository(db_session)
+
+    for status in (None, OrderStatus.PENDING):
+        for offset in (0, 2, 10):
+            expected = repo.list(user.id, status=status, limit=2, offset=offset)
+            actual = repo.list(user.id, status=status, limit=2, offset=offset, window_count=True)
+            assert [o.id for o in actual[0]] == [o.id for o in expected[0]]
+            assert actual[1] == expected[1]
+
+    assert repo.list(user.id)[1] == 5
+    assert repo.list(user.id, limit=2, window_count=True)[1] == 5
+
+
+def test_projection_returns_order_rows(db_session, user, orders):
+    repo = OrdersRepository(db_session)
+
+    full, total = repo.list(user.id)
+    rows, projected_total = repo.list(user.id, projection=True)
+
+    assert total == projected_total == 5
+    assert all(isinstance(row, OrderRow) for row in rows)
+    assert [r.symbol for r in rows] == ["SYM4-EQ", "SYM3-EQ", "SYM2-EQ", "SYM1-EQ", "SYM0-EQ"]
+    for order, row in zip(full, rows, strict=True):
+        for field in OrderRow._fields:
+            assert getattr(row, field) == getattr(order, field), field
+    assert rows[0].status == OrderStatus.CLOSED
+    assert rows[0].trade_mode == TradeMode.BROKER
+    assert rows[0].order_metadata == {"i": 4}
+    assert isinstance(rows[0].placed_at, datetime)
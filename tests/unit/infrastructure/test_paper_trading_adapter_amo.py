@@ -22,7 +22,7 @@ from modules.kotak_neo_auto_trader.infrastructure.broker_adapters.paper_trading_
 
 
 @pytest.fixture
-def paper_broker():
+def paper_broker(tmp_path):
     """Create paper trading broker"""
     config = PaperTradingConfig(
         enforce_market_hours=True,
@@ -30,7 +30,7 @@ def paper_broker():
         market_close_time="15:30",
         amo_execution_time="09:15",
     )
-    broker = PaperTradingBrokerAdapter(user_id=1, config=config, storage_path="paper_trading/test_amo")
+    broker = PaperTradingBrokerAdapter(user_id=1, config=config, storage_path=str(tmp_path / "test_amo"))
     broker.connect()
     yield broker
     broker.reset()
@@ -0,0 +1,130 @@
+"""
+Query-plan regression tests for closed-trade queries on positions
+
+Tests verify that the statements issued by the closed-trade query builders
+(trades CSV export, closed-trade stats, realized P&L by date range) search
+positions through the (user_id, closed_at) composite indexes instead of
+scanning the table. SQLite always runs; PostgreSQL runs when
+TEST_POSTGRES_URL points at a scratch database (all DDL is rolled back).
+"""
+
+import os
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from server.app.routers import export as export_router
+from server.app.routers import pnl as pnl_router
+from server.app.services.pnl_calculation_service import PnlCalculationService
+from src.infrastructure.db.base import Base
+from src.infrastructure.db.models import Positions, TradeMode, UserRole, Users
+
+COMPOSITE_INDEXES = ("ix_positions_user_closed_at", "ix_positions_user_symbol_closed_at")
+
+
+def _seed(session: Session) -> Users:
+    user = Users(
+        email="plans@example.com",
+        name="Plans",
+        password_hash="dummy",
+        role=UserRole.USER,
+        is_active=True,
+    )
+    session.add(user)
+    session.flush()
+    opened = datetime(2025, 1, 2, 10, 0)
+    session.add_all(
+        Positions(
+            user_id=user.id,
+            symbol=f"SYM{i}-EQ",
+            quantity=0.0,
+            avg_price=100.0,
+            opened_at=opened,
+            closed_at=opened + timedelta(days=i),
+            exit_price=101.0,
+            realized_pnl=10.0,
+        )
+        for i in range(20)
+    )
+    session.flush()
+    return user
+
+
+@contextmanager
+def _capture_positions_sql(session: Session):
+    statements: list[tuple[str, object]] = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):  # noqa: PLR0913
+        if "FROM positions" in statement and statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+
+def _run_closed_trade_queries(session: Session, user: Users) -> list[tuple[str, object]]:
+    with _capture_positions_sql(session) as statements:
+        export_router.export_trades_csv(
+            start_date=date(2025, 1, 5),
+            end_date=date(2025, 1, 10),
+            trade_mode=TradeMode.PAPER,
+            db=session,
+            current=user,
+        )
+        pnl_router._compute_closed_trade_stats(user.id, session, None)
+        PnlCalculationService(session).calculate_realized_pnl(
+            user.id, date_range=(date(2025, 1, 5), date(2025, 1, 10))
+        )
+    assert len(statements) >= 3
+    return statements
+
+
+def test_closed_trade_queries_use_composite_index_sqlite(db_session):
+    user = _seed(db_session)
+    statements = _run_closed_trade_queries(db_session, user)
+
+    conn = db_session.connection()
+    for statement, parameters in statements:
+        plan = " | ".join(
+            row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        )
+        assert any(index in plan for index in COMPOSITE_INDEXES), (statement, plan)
+        assert "SCAN positions" not in plan, (statement, plan)
+
+
+def test_closed_trade_queries_have_no_date_function(db_session):
+    user = _seed(db_session)
+    for statement, _ in _run_closed_trade_queries(db_session, user):
+        assert "date(positions.closed_at)" not in statement.lower()
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_POSTGRES_URL"), reason="TEST_POSTGRES_URL not set (PostgreSQL plans)"
+)
+def test_closed_trade_queries_use_composite_index_postgresql():
+    engine = create_engine(os.environ["TEST_POSTGRES_URL"], future=True)
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            Base.metadata.create_all(bind=conn)
+            session = Session(bind=conn, join_transaction_mode="create_savepoint")
+            user = _seed(session)
+            statements = _run_closed_trade_queries(session, user)
+            # Tiny tables would otherwise always be read sequentially
+            conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+            for statement, parameters in statements:
+                plan = " | ".join(
+                    row[0] for row in conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+                )
+                assert any(index in plan for index in COMPOSITE_INDEXES), (statement, plan)
+            session.close()
+        finally:
+            trans.rollback()
+    engine.dispose()
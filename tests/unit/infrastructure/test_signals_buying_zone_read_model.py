@@ -0,0 +1,197 @@
+"""
+Tests for the read-only buying zone query (SignalsRepository.buying_zone)
+
+Tests verify that:
+1. Time-based expiry is computed at read time without writing signal rows
+2. Open positions / pending buy orders keep signals from expiring
+3. Per-user statuses and the user's open positions give the effective status
+4. Date ranges and keyset pagination select the expected pages
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from freezegun import freeze_time
+
+from src.infrastructure.db.models import (
+    Orders,
+    OrderStatus,
+    Positions,
+    Signals,
+    SignalStatus,
+    UserRole,
+    Users,
+    UserSignalStatus,
+)
+from src.infrastructure.db.timezone_utils import IST
+from src.infrastructure.persistence.signals_repository import SignalsRepository
+
+# Monday, before the market close
+NOW = "2025-01-13 12:00:00+05:30"
+
+
+@pytest.fixture
+def test_user(db_session):
+    user = Users(
+        email="zone@example.com",
+        name="Zone User",
+        password_hash="dummy",
+        role=UserRole.USER,
+        is_active=True,
+    )
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def _signal(db_session, symbol, ts, status=SignalStatus.ACTIVE):
+    signal = Signals(symbol=symbol, status=status, ts=ts)
+    db_session.add(signal)
+    db_session.commit()
+    db_session.refresh(signal)
+    return signal
+
+
+def test_time_expiry_cutoff_follows_next_trading_day_close(db_session):
+    repo = SignalsRepository(db_session)
+
+    # Monday before 3:30 PM: Friday's signals are live until today's close
+    assert repo.time_expiry_cutoff(datetime(2025, 1, 13, 12, 0, tzinfo=IST)) == datetime(
+        2025, 1, 10
+    )
+    # Monday after the close: everything before Monday has expired
+    assert repo.time_expiry_cutoff(datetime(2025, 1, 13, 15, 30, tzinfo=IST)) == datetime(
+        2025, 1, 13
+    )
+
+
+def test_expiry_is_computed_without_writes(db_session, test_user):
+    with freeze_time(NOW):
+        stale = _signal(db_session, "STALE", datetime(2025, 1, 9, 16, 0))  # Thursday
+        fresh = _signal(db_session, "FRESH", datetime(2025, 1, 10, 16, 0))  # Friday
+        repo = SignalsRepository(db_session, user_id=test_user.id)
+
+        rows = {s.symbol: (eff, base) for s, eff, base in repo.buying_zone(test_user.id)}
+        active = repo.buying_zone(test_user.id, status_filter=SignalStatus.ACTIVE)
+
+    assert rows["STALE"] == (SignalStatus.EXPIRED, SignalStatus.EXPIRED)
+    assert rows["FRESH"] == (SignalStatus.ACTIVE, SignalStatus.ACTIVE)
+    assert [s.symbol for s, _, _ in active] == ["FRESH"]
+    db_session.refresh(stale)
+    db_session.refresh(fresh)
+    assert stale.status == SignalStatus.ACTIVE  # Persisting expiry is the job's work
+
+
+def test_held_symbols_do_not_expire(db_session, test_user):
+    with freeze_time(NOW):
+        _signal(db_session, "HELD", datetime(2025, 1, 8, 16, 0))
+        _signal(db_session, "ORDERED", datetime(2025, 1, 8, 16, 0))
+        db_session.add_all(
+            [
+                Positions(
+                    user_id=test_user.id,
+                    symbol="HELD",
+                    quantity=5.0,
+                    avg_price=10.0,
+                    opened_at=datetime(2025, 1, 9, 10, 0),
+                ),
+                Orders(
+                    user_id=test_user.id,
+                    symbol="ORDERED",
+                    side="buy",
+                    order_type="limit",
+                    quantity=10,
+                    price=50.0,
+                    status=OrderStatus.PENDING,
+                ),
+            ]
+        )
+        db_session.commit()
+        repo = SignalsRepository(db_session, user_id=test_user.id)
+
+        rows = {s.symbol: (eff, base) for s, eff, base in repo.buying_zone(test_user.id)}
+
+    # Same exclusions as mark_time_expired_signals; the user's own position also means TRADED
+    assert rows["HELD"] == (SignalStatus.TRADED, SignalStatus.ACTIVE)
+    assert rows["ORDERED"] == (SignalStatus.ACTIVE, SignalStatus.ACTIVE)
+
+
+def test_effective_status_matches_get_signals_with_user_status(db_session, test_user):
+    now = datetime.now(IST).replace(tzinfo=None)
+    rejected = _signal(db_session, "REJ", now - timedelta(minutes=5))
+    _signal(db_session, "MIRZAINT.NS", now - timedelta(minutes=4))
+    _signal(db_session, "OLD", now - timedelta(minutes=3), status=SignalStatus.EXPIRED)
+    _signal(db_session, "OPEN", now - timedelta(minutes=2))
+    db_session.add_all(
+        [
+            UserSignalStatus(
+                user_id=test_user.id,
+                signal_id=rejected.id,
+                symbol="REJ",
+                status=SignalStatus.REJECTED,
+            ),
+            Positions(
+                user_id=test_user.id,
+                symbol="MIRZAINT-EQ",
+                quantity=10.0,
+                avg_price=35.0,
+                opened_at=now - timedelta(days=1),
+            ),
+        ]
+    )
+    db_session.commit()
+    repo = SignalsRepository(db_session, user_id=test_user.id)
+
+    for status_filter in (None, SignalStatus.ACTIVE, SignalStatus.TRADED):
+        expected = repo.get_signals_with_user_status(test_user.id, status_filter=status_filter)
+        actual = repo.buying_zone(test_user.id, status_filter=status_filter)
+        assert [(s.id, eff) for s, eff, _ in actual] == [(s.id, eff) for s, eff in expected]
+
+
+def test_open_position_matches_signal_symbol_variants(db_session, test_user):
+    now = datetime.now(IST).replace(tzinfo=None)
+    for minutes, symbol in enumerate(["FOO-BE", "FOOD-BE", "BAR", "QUX-BE", "ABC", "MXM-BE"]):
+        _signal(db_session, symbol, now - timedelta(minutes=minutes + 1))
+    db_session.add_all(
+        [
+            Positions(
+                user_id=test_user.id,
+                symbol=symbol,
+                quantity=1.0,
+                avg_price=10.0,
+                opened_at=now - timedelta(days=1),
+            )
+            for symbol in ("FOO-EQ", "BAR.NS", "QUX.NS", "ABC-BE", "M_M-EQ")
+        ]
+    )
+    db_session.commit()
+    repo = SignalsRepository(db_session, user_id=test_user.id)
+
+    actual = {s.symbol: eff for s, eff, _ in repo.buying_zone(test_user.id)}
+    expected = {s.symbol: eff for s, eff in repo.get_signals_with_user_status(test_user.id)}
+
+    assert actual == expected
+    assert {symbol for symbol, eff in actual.items() if eff == SignalStatus.TRADED} == {
+        "FOO-BE",
+        "BAR",
+        "QUX-BE",
+        "ABC",
+    }
+
+
+def test_date_range_and_keyset_pages(db_session, test_user):
+    base = datetime(2030, 6, 14, 10, 0)
+    for i in range(5):
+        _signal(db_session, f"S{i}", base + timedelta(hours=i))
+    _signal(db_session, "S_SAME_TS", base + timedelta(hours=4))
+    _signal(db_session, "EARLIER", base - timedelta(days=2))
+    repo = SignalsRepository(db_session, user_id=test_user.id)
+
+    kwargs = {"start_date": date(2030, 6, 14), "end_date": date(2030, 6, 14), "limit": 4}
+    first = repo.buying_zone(test_user.id, **kwargs)
+    last_signal = first[-1][0]
+    second = repo.buying_zone(test_user.id, before=(last_signal.ts, last_signal.id), **kwargs)
+
+    assert [s.symbol for s, _, _ in first] == ["S_SAME_TS", "S4", "S3", "S2"]
+    assert [s.symbol for s, _, _ in second] == ["S1", "S0"]
@@ -392,3 +392,114 @@ class TestIndicatorService:
             check_names=False,
             rtol=1e-10,
         )
+
+
+class TestStreamingIndicators:
+    """Tests for once-per-day streaming RSI10/EMA9 state"""
+
+    @staticmethod
+    def _history(periods=150):
+        return pd.DataFrame(
+            {
+                "close": [100 + (i % 7) * 1.5 + i * 0.1 for i in range(periods)],
+                "date": pd.date_range("2024-01-01", periods=periods),
+            }
+        )
+
+    def test_state_seeded_once_per_day(self):
+        mock_price_service = Mock()
+        mock_price_service.get_price.return_value = self._history()
+        service = IndicatorService(price_service=mock_price_service, enable_caching=False)
+
+        service.calculate_realtime_indicators("RELIANCE.NS", current_ltp=120.0)
+        service.calculate_realtime_indicators("RELIANCE.NS", current_ltp=121.0)
+        service.calculate_ema9_realtime("RELIANCE.NS", current_ltp=122.0)
+
+        mock_price_service.get_price.assert_called_once_with(
+            "RELIANCE.NS", days=200, interval="1d", add_current_day=False
+        )
+
+    def test_realtime_indicators_match_calculate_all_indicators(self):
+        history = self._history()
+        mock_price_service = Mock()
+        mock_price_service.get_price.return_value = history
+        service = IndicatorService(price_service=mock_price_service, enable_caching=False)
+
+        result = service.calculate_realtime_indicators("RELIANCE.NS", current_ltp=118.25)
+
+        live = pd.concat(
+            [history, pd.DataFrame({"close": [118.25], "date": [pd.Timestamp("2024-06-01")]})],
+            ignore_index=True,
+        )
+        expected = service.calculate_all_indicators(live).iloc[-1]
+        assert abs(result["rsi10"] - expected["rsi10"]) < 1e-9
+        assert abs(result["ema9"] - expected["ema9"]) < 1e-9
+
+    def test_ema9_realtime_matches_pandas_ta(self):
+        history = self._history()
+        mock_price_service = Mock()
+        mock_price_service.get_price.return_value = history
+        service = IndicatorService(price_service=mock_price_service, enable_caching=False)
+
+        result = service.calculate_ema9_realtime("RELIANCE.NS", current_ltp=118.25)
+
+        live_close = pd.concat([history["close"], pd.Series([118.25])], ignore_index=True)
+        expected = service.calculate_ema(pd.DataFrame({"close": live_close}), period=9).iloc[-1]
+        assert abs(result - expected) < 1e-9
+
+    def test_short_history_is_not_cached(self):
+        mock_price_service = Mock()
+        mock_price_service.get_price.return_value = self._history(periods=5)
+        service = IndicatorService(price_service=mock_price_service, enable_caching=False)
+
+        assert service.calculate_realtime_indicators("RELIANCE.NS", 110.0)["rsi10"] is None
+        service.calculate_realtime_indicators("RELIANCE.NS", 110.0)
+
+        assert mock_price_service.get_price.call_count == 2
+
+    def test_no_history_returns_none(self):
+        mock_price_service = Mock()
+        mock_price_service.get_price.return_value = None
+        service = IndicatorService(price_service=mock_price_service, enable_caching=False)
+
+        assert service.calculate_realtime_indicators("RELIANCE.NS", 110.0) is None
+
+    def test_clear_cache_drops_streaming_state(self):
+        mock_price_service = Mock()
+        mock_price_service.get_price.return_value = self._history()
+        service = IndicatorService(price_service=mock_price_service, enable_caching=True)
+
+        service.calculate_realtime_indicators("RELIANCE.NS", 110.0)
+        service.clear_cache()
+        service.calculate_realtime_indicators("RELIANCE.NS", 110.0)
+
+        assert mock_price_service.get_price.call_count == 2
+
+    def test_state_reseeded_when_previous_session_bar_lands(self):
+        module = "modules.kotak_neo_auto_trader.services.indicator_service"
+        stale = self._history()
+        stale["date"] = pd.date_range(end="2026-04-08", periods=len(stale))  # missing Apr 9
+        fresh = pd.concat(
+            [stale, pd.DataFrame({"close": [90.0], "date": [pd.Timestamp("2026-04-09")]})],
+            ignore_index=True,
+        )
+        mock_price_service = Mock()
+        mock_price_service.get_price.side_effect = [stale, fresh]
+        service = IndicatorService(price_service=mock_price_service, enable_caching=False)
+
+        with (
+            patch(f"{module}.ist_now_naive", return_value=pd.Timestamp("2026-04-10 09:20")),
+            patch(f"{module}.time.monotonic", side_effect=[0.0, 10.0, 400.0, 400.0, 1000.0]),
+        ):
+            assert service.get_streaming_state("RELIANCE.NS").last_bar_date.isoformat() == (
+                "2026-04-08"
+            )
+            # Within the re-check interval the incomplete seed is reused
+            service.get_streaming_state("RELIANCE.NS")
+            assert mock_price_service.get_price.call_count == 1
+            state = service.get_streaming_state("RELIANCE.NS")
+            assert (state.prev_close, state.last_bar_date.isoformat()) == (90.0, "2026-04-09")
+            # Complete seeds are kept for the rest of the day
+            assert service.get_streaming_state("RELIANCE.NS") is state
+
+        assert mock_price_service.get_price.call_count == 2
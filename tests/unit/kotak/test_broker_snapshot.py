@@ -0,0 +1,213 @@
+"""Per-cycle broker snapshot: one broker read per resource, coalesced callers, order index."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from modules.kotak_neo_auto_trader.broker_snapshot import (
+    HOLDINGS,
+    ORDERS,
+    BrokerOrderIndex,
+    BrokerSnapshotService,
+    broker_snapshot_cycle,
+    get_broker_snapshot_service,
+    invalidates_snapshot,
+)
+
+
+def _loader(payload):
+    return MagicMock(return_value=payload)
+
+
+def test_pass_through_outside_cycle():
+    service = BrokerSnapshotService()
+    loader = _loader({"data": []})
+
+    service.fetch(ORDERS, loader)
+    service.fetch(ORDERS, loader)
+
+    assert loader.call_count == 2
+
+
+def test_cycle_fetches_each_resource_once_and_counts_hits():
+    service = BrokerSnapshotService(ttl_seconds=60)
+    orders = _loader({"data": [{"nOrdNo": "1"}]})
+    holdings = _loader({"data": []})
+
+    with service.cycle("sell_monitor"):
+        first = service.fetch(ORDERS, orders)
+        assert service.fetch(ORDERS, orders) == first
+        service.fetch(ORDERS, orders)
+        service.fetch(HOLDINGS, holdings)
+
+    assert orders.call_count == 1
+    assert holdings.call_count == 1
+    stats = service.get_cycle_stats()
+    assert stats[ORDERS] == {"calls": 3, "hits": 2, "fetches": 1}
+    assert stats[HOLDINGS] == {"calls": 1, "hits": 0, "fetches": 1}
+
+    # Snapshot is dropped when the cycle ends
+    with service.cycle():
+        service.fetch(ORDERS, orders)
+    assert orders.call_count == 2
+
+
+def test_callers_get_private_copies_of_the_snapshot():
+    service = BrokerSnapshotService(ttl_seconds=60)
+    loader = _loader({"data": [{"nOrdNo": "1", "status": "open"}]})
+
+    with service.cycle():
+        first = service.fetch(ORDERS, loader)
+        first["data"][0]["status"] = "mutated"
+        first["data"].append({"nOrdNo": "2"})
+        second = service.fetch(ORDERS, loader)
+
+    assert loader.call_count == 1
+    assert second == {"data": [{"nOrdNo": "1", "status": "open"}]}
+    assert second is not first
+
+
+def test_error_responses_are_not_cached():
+    service = BrokerSnapshotService(ttl_seconds=60)
+    loader = MagicMock(
+        side_effect=[{"error": [{"message": "timeout"}]}, {"stat": "not_ok"}, {"data": []}]
+    )
+
+    with service.cycle():
+        service.fetch(ORDERS, loader)
+        service.fetch(ORDERS, loader)
+        service.fetch(ORDERS, loader)
+        service.fetch(ORDERS, loader)
+
+    assert loader.call_count == 3
+
+
+def test_concurrent_callers_share_one_fetch():
+    service = BrokerSnapshotService(ttl_seconds=60)
+    calls = []
+
+    def slow_order_book():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"data": []}
+
+    with service.cycle():
+        threads = [
+            threading.Thread(target=service.fetch, args=(ORDERS, slow_order_book)) for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert len(calls) == 1
+    assert service.get_cycle_stats()[ORDERS] == {"calls": 5, "hits": 4, "fetches": 1}
+
+
+def test_order_placement_invalidates_cached_order_book():
+    auth = MagicMock()
+
+    class Orders:
+        def __init__(self):
+            self.auth = auth
+
+        @invalidates_snapshot(ORDERS)
+        def place(self):
+            return {"stat": "Ok"}
+
+    loader = _loader({"data": []})
+    with broker_snapshot_cycle(auth, "test") as service:
+        service.fetch(ORDERS, loader)
+        Orders().place()
+        service.fetch(ORDERS, loader)
+
+    assert loader.call_count == 2
+
+
+def test_in_flight_fetch_does_not_restore_pre_mutation_order_book():
+    auth = MagicMock()
+    started, release = threading.Event(), threading.Event()
+
+    class Orders:
+        def __init__(self):
+            self.auth = auth
+
+        @invalidates_snapshot(ORDERS)
+        def place(self):
+            return {"stat": "Ok"}
+
+    def stale_loader():
+        started.set()
+        release.wait(5)
+        return {"data": [{"neoOrdNo": "1"}]}
+
+    fresh_loader = _loader({"data": [{"neoOrdNo": "1"}, {"neoOrdNo": "2"}]})
+    with broker_snapshot_cycle(auth, "test") as service:
+        reader = threading.Thread(target=service.fetch, args=(ORDERS, stale_loader))
+        reader.start()
+        assert started.wait(5)
+        Orders().place()
+        release.set()
+        reader.join(5)
+        orders = service.fetch(ORDERS, fresh_loader)
+
+    assert fresh_loader.call_count == 1
+    assert len(orders["data"]) == 2
+
+
+def test_prefetch_loads_resources_with_one_concurrent_snapshot():
+    auth = MagicMock()
+    rest = auth.get_rest_client.return_value
+    rest.get_account_snapshot.return_value = {
+        "order_book": {"data": [{"nOrdNo": "1"}]},
+        "holdings": {"stat": "not_ok"},
+        "positions": {"data": []},
+        "errors": {},
+    }
+    orders, holdings = _loader({"data": []}), _loader({"data": ["fresh"]})
+
+    with broker_snapshot_cycle(auth, "sell_monitor", prefetch=True) as service:
+        assert service.fetch(ORDERS, orders) == {"data": [{"nOrdNo": "1"}]}
+        assert service.fetch(HOLDINGS, holdings) == {"data": ["fresh"]}
+        with broker_snapshot_cycle(auth, "nested", prefetch=True):
+            pass
+
+    rest.get_account_snapshot.assert_called_once()
+    assert list(rest.get_account_snapshot.call_args.kwargs["keys"]) == [
+        "order_book",
+        "holdings",
+        "positions",
+    ]
+    orders.assert_not_called()
+    holdings.assert_called_once()
+    assert service.get_cycle_stats()[ORDERS] == {"calls": 1, "hits": 1, "fetches": 1}
+
+
+def test_service_is_shared_per_auth_session():
+    auth_a, auth_b = MagicMock(), MagicMock()
+
+    assert get_broker_snapshot_service(auth_a) is get_broker_snapshot_service(auth_a)
+    assert get_broker_snapshot_service(auth_a) is not get_broker_snapshot_service(auth_b)
+    with broker_snapshot_cycle(None) as service:
+        assert service is None
+
+
+def test_order_index_lookups():
+    orders = [
+        {"neoOrdNo": "111", "trdSym": "reliance-eq"},
+        {"nOrdNo": 222, "tradingSymbol": "TCS-EQ"},
+        {"orderId": "333", "symbol": "RELIANCE-EQ"},
+        {"neoOrdNo": "111", "trdSym": "DUPLICATE-EQ"},
+    ]
+    index = BrokerOrderIndex.from_response({"data": orders})
+
+    assert len(index) == 4
+    assert index.get("111") is orders[0]
+    assert index.get("222") is orders[1]
+    assert index.get(333) is orders[2]
+    assert index.get("999") is None
+    assert index.get(None) is None
+    assert index.for_symbol("Reliance-EQ") == [orders[0], orders[2]]
+    assert BrokerOrderIndex.from_response({"error": "x"}).orders == []
@@ -0,0 +1,147 @@
+"""KotakRestClient: pooled keep-alive session, per-endpoint timeouts and snapshot fan-out."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from modules.kotak_neo_auto_trader.infrastructure.clients.kotak_rest_client import (
+    KotakHttpSettings,
+    KotakRestClient,
+)
+
+
+def _client(**kwargs) -> KotakRestClient:
+    return KotakRestClient(
+        base_url="https://neo.example/",
+        session_token=" tok ",
+        session_sid="sid",
+        access_token="key",
+        **kwargs,
+    )
+
+
+def _response(payload):
+    resp = MagicMock()
+    resp.json.return_value = payload
+    return resp
+
+
+def test_calls_share_one_pooled_session():
+    client = _client(http=KotakHttpSettings(pool_maxsize=32))
+    adapter = client._http.get_adapter("https://neo.example/quick/user/orders")
+    assert adapter._pool_maxsize == 32
+
+    client._http = MagicMock()
+    client._http.get.return_value = _response({"data": []})
+    client._http.post.return_value = _response({"stat": "Ok"})
+
+    client.get_order_book()
+    client.get_holdings()
+    client.place_order({"ts": "RELIANCE-EQ"})
+
+    assert client._http.get.call_count == 2
+    url = client._http.post.call_args.args[0]
+    assert url == "https://neo.example/quick/order/rule/ms/place"
+    assert client._http.post.call_args.kwargs["headers"]["Auth"] == "tok"
+
+
+def test_per_endpoint_group_timeouts():
+    client = _client(http=KotakHttpSettings(timeout=10.0, timeouts={"orders": 3.0, "quotes": 2.0}))
+    client._http = MagicMock()
+    client._http.get.return_value = _response({})
+    client._http.post.return_value = _response({})
+
+    client.place_order({})
+    assert client._http.post.call_args.kwargs["timeout"] == 3.0
+    client.get_limits()
+    assert client._http.post.call_args.kwargs["timeout"] == 10.0
+    client.get_quotes_neosymbol("nse_cm|26000")
+    assert client._http.get.call_args.kwargs["timeout"] == 2.0
+
+
+def test_legacy_timeout_keyword_sets_default_timeout():
+    client = _client(timeout=4.0, http=KotakHttpSettings(timeouts={"orders": 3.0}))
+
+    assert client.timeout == 4.0
+    assert client.timeouts["limits"] == 4.0
+    assert client.timeouts["orders"] == 3.0
+
+
+def test_unknown_timeout_group_rejected():
+    with pytest.raises(ValueError, match="Unknown endpoint groups"):
+        KotakHttpSettings(timeouts={"order": 3.0})
+
+
+def test_account_snapshot_runs_calls_concurrently_and_reports_errors():
+    client = _client()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _wait_for_peers(payload):
+        barrier.wait()  # Fails unless the three calls are in flight together
+        return payload
+
+    client.get_order_book = lambda: _wait_for_peers({"data": ["order"]})
+    client.get_holdings = lambda: _wait_for_peers({"data": ["holding"]})
+    client.get_positions = lambda: _wait_for_peers({"data": ["position"]})
+    client.get_limits = MagicMock(side_effect=ConnectionError("limits down"))
+
+    snapshot = client.get_account_snapshot()
+
+    assert snapshot["order_book"] == {"data": ["order"]}
+    assert snapshot["holdings"] == {"data": ["holding"]}
+    assert snapshot["positions"] == {"data": ["position"]}
+    assert snapshot["limits"] is None
+    assert snapshot["errors"] == {"limits": "limits down"}
+    client.close()
+
+
+def test_account_snapshot_fetches_only_requested_keys():
+    client = _client()
+    client.get_order_book = MagicMock(return_value={"data": []})
+    client.get_limits = MagicMock()
+
+    snapshot = client.get_account_snapshot(keys=["order_book"])
+
+    assert snapshot == {"errors": {}, "order_book": {"data": []}}
+    client.get_limits.assert_not_called()
+    client.close()
+
+
+def test_account_snapshot_fan_out_bounded_by_pool_size():
+    client = _client(http=KotakHttpSettings(pool_maxsize=2))
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def _call():
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        threading.Event().wait(0.05)
+        with lock:
+            in_flight.pop()
+        return {}
+
+    for name in ("get_order_book", "get_holdings", "get_positions", "get_limits"):
+        setattr(client, name, _call)
+
+    snapshot = client.get_account_snapshot()
+
+    assert snapshot["errors"] == {}
+    assert max(peak) <= 2
+    client.close()
+
+
+def test_close_releases_session_and_executor():
+    client = _client()
+    client._http = MagicMock()
+    client._fan_out_executor()
+
+    with client:
+        pass
+
+    client._http.close.assert_called_once()
+    assert client._executor is None
@@ -2,6 +2,7 @@
 Tests for order variety selection based on market hours
 """
 
+import threading
 import types
 from unittest.mock import Mock, patch
 
@@ -101,6 +102,8 @@ class TestOrderVarietyMarketHours:
             engine.db = None  # Add db attribute
             engine.user_id = 1  # Add user_id attribute
             engine.portfolio = Mock()  # Add portfolio attribute
+            engine._order_view = None  # Run order view state (set up by __init__)
+            engine._order_view_lock = threading.RLock()
             engine.strategy_config = Mock()
             engine.strategy_config.default_variety = "AMO"
 
@@ -141,6 +144,8 @@ class TestOrderVarietyMarketHours:
             engine.db = None
             engine.user_id = 1
             engine.portfolio = Mock()
+            engine._order_view = None  # Run order view state (set up by __init__)
+            engine._order_view_lock = threading.RLock()
             engine.strategy_config = Mock()
             engine.strategy_config.default_variety = "AMO"
 
@@ -186,6 +191,8 @@ class TestOrderVarietyMarketHours:
             engine.db = None  # Add db attribute
             engine.user_id = 1  # Add user_id attribute
             engine.portfolio = Mock()  # Add portfolio attribute
+            engine._order_view = None  # Run order view state (set up by __init__)
+            engine._order_view_lock = threading.RLock()
             engine.strategy_config = Mock()
             engine.strategy_config.default_variety = "AMO"
 
@@ -228,6 +235,8 @@ class TestOrderVarietyMarketHours:
             engine.db = None
             engine.user_id = 1
             engine.portfolio = Mock()
+            engine._order_view = None  # Run order view state (set up by __init__)
+            engine._order_view_lock = threading.RLock()
             engine.strategy_config = Mock()
             engine.strategy_config.default_variety = "AMO"
 
@@ -0,0 +1,129 @@
+"""Run-scoped order/position view used by AutoTradeEngine entry and re-entry loops."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from modules.kotak_neo_auto_trader.run_order_view import RunOrderView
+from src.infrastructure.db.models import Orders
+from src.infrastructure.db.models import OrderStatus as DbOrderStatus
+from src.infrastructure.persistence.orders_repository import OrderRow
+
+
+def _order(order_id, symbol, side="buy", status=DbOrderStatus.PENDING, placed_at=None):
+    return SimpleNamespace(
+        id=order_id,
+        symbol=symbol,
+        side=side,
+        status=status,
+        placed_at=placed_at or datetime(2026, 4, 10, 9, 0),
+        execution_qty=None,
+    )
+
+
+def _position(symbol, closed_at=None):
+    return SimpleNamespace(symbol=symbol, closed_at=closed_at, reentries=None)
+
+
+def test_orders_are_keyed_like_the_engine_trades_history():
+    view = RunOrderView([_order(1, "BAJAJ-AUTO-EQ"), _order(2, "salsteel-be")])
+
+    assert [o.id for o in view.orders_for("BAJAJ-AUTO")] == [1]
+    assert [o.id for o in view.orders_for("BAJAJ-AUTO-EQ", side="buy")] == [1]
+    assert [o.id for o in view.orders_for("SALSTEEL")] == [2]
+    assert view.orders_for(None) == []
+
+
+def test_orders_for_filters_by_base_symbol_side_and_day():
+    orders = [
+        _order(1, "RELIANCE-EQ"),
+        _order(2, "TCS-EQ"),
+        _order(3, "RELIANCE-BE", status=DbOrderStatus.CLOSED),
+        _order(4, "RELIANCE-EQ", side="sell"),
+        _order(5, "RELIANCE", placed_at="2026-04-09T15:00:00"),
+    ]
+    view = RunOrderView(orders)
+
+    assert [o.id for o in view.orders_for("RELIANCE")] == [1, 3, 4, 5]
+    assert [o.id for o in view.orders_for("reliance-eq", side="buy")] == [1, 3, 5]
+    assert [o.id for o in view.orders_for("RELIANCE", placed_on=datetime(2026, 4, 9).date())] == [5]
+    assert view.orders_for("INFY") == []
+    assert [o.id for o in view.all_orders()] == [1, 2, 3, 4, 5]
+
+
+def test_record_order_reindexes_updated_and_new_orders():
+    pending = _order(1, "RELIANCE-EQ")
+    view = RunOrderView([pending])
+
+    cancelled = _order(1, "RELIANCE-EQ", status=DbOrderStatus.CANCELLED)
+    view.record_order(cancelled)
+    view.record_order(_order(9, "RELIANCE-EQ"))
+    view.record_order(_order(10, "RELIANCE-EQ"))
+
+    assert len(view) == 3
+    assert [o.status for o in view.orders_for("RELIANCE")] == [
+        DbOrderStatus.PENDING,
+        DbOrderStatus.PENDING,
+        DbOrderStatus.CANCELLED,
+    ]
+    # Updated rows keep their original position; new rows come first, newest first, like the
+    # repository's placed_at DESC order
+    assert [o.id for o in view.orders_for("RELIANCE")] == [10, 9, 1]
+    assert [o.id for o in view.all_orders()] == [10, 9, 1]
+
+
+def test_recorded_orm_orders_are_held_as_detached_snapshots():
+    orm_order = Orders(
+        id=3,
+        user_id=7,
+        symbol="RELIANCE-EQ",
+        side="buy",
+        order_type="market",
+        quantity=10,
+        status=DbOrderStatus.PENDING,
+        placed_at=datetime(2026, 4, 10, 9, 0),
+        order_metadata={"ticker": "RELIANCE.NS"},
+    )
+    view = RunOrderView()
+
+    view.record_order(orm_order)
+    orm_order.status = DbOrderStatus.CANCELLED
+
+    (row,) = view.orders_for("RELIANCE", side="buy")
+    assert isinstance(row, OrderRow)
+    assert (row.id, row.status, row.order_metadata) == (
+        3,
+        DbOrderStatus.PENDING,
+        {"ticker": "RELIANCE.NS"},
+    )
+
+
+def test_open_positions_keep_most_recent_and_track_writes():
+    newest, older = _position("RELIANCE-EQ"), _position("RELIANCE-EQ")
+    closed = _position("TCS-EQ", closed_at=datetime(2026, 4, 1))
+    view = RunOrderView(positions=[newest, older, closed])
+
+    assert view.open_position("RELIANCE-EQ") is newest
+    assert view.open_position("TCS-EQ") is None
+
+    refreshed = _position("RELIANCE-EQ")
+    view.record_position("RELIANCE-EQ", refreshed)
+    assert view.open_position("RELIANCE-EQ") is refreshed
+    view.record_position("RELIANCE-EQ", None)
+    assert view.open_position("RELIANCE-EQ") is None
+
+
+def test_load_uses_one_query_per_table():
+    orders_repo, positions_repo = MagicMock(), MagicMock()
+    orders_repo.list.return_value = ([_order(1, "RELIANCE-EQ")], 1)
+    positions_repo.list.return_value = [_position("RELIANCE-EQ")]
+
+    view = RunOrderView.load(orders_repo, positions_repo, user_id=7)
+    for _ in range(50):
+        view.orders_for("RELIANCE", side="buy")
+        view.open_position("RELIANCE-EQ")
+
+    orders_repo.list.assert_called_once_with(7, projection=True)
+    positions_repo.list.assert_called_once_with(7)
@@ -219,6 +219,72 @@ class TestGetCurrentRSI10:
         assert rsi10 is None
 
 
+class TestStreamingRSI10:
+    """Test streaming RSI10 path (state seeded once per day, LTP as today's close)"""
+
+    @patch("modules.kotak_neo_auto_trader.sell_engine.KotakNeoAuth")
+    @patch("modules.kotak_neo_auto_trader.sell_engine.KotakNeoScripMaster")
+    def test_get_current_rsi10_uses_streaming_state_with_ltp(self, mock_scrip_master, mock_auth):
+        """Streaming RSI10 is used when seeded history and LTP are available"""
+        import pandas as pd
+
+        from core.streaming_indicators import StreamingIndicatorState
+
+        mock_auth_instance = Mock()
+        mock_auth_instance.client = None
+        mock_auth.return_value = mock_auth_instance
+
+        manager = SellOrderManager(auth=mock_auth_instance, history_path="test_history.json")
+
+        closes = [100 + (i % 5) * 2 + i * 0.05 for i in range(150)]
+        history = pd.DataFrame({"close": closes, "date": pd.date_range("2024-01-01", periods=150)})
+        state = StreamingIndicatorState.from_history(
+            history, session_date=pd.Timestamp.now().date()
+        )
+        manager.indicator_service.get_streaming_state = Mock(return_value=state)
+        manager.indicator_service.calculate_all_indicators = Mock()
+        manager.get_current_ltp = Mock(return_value=112.0)
+        manager.rsi10_cache = {}
+
+        rsi10 = manager._get_current_rsi10("RELIANCE", "RELIANCE.NS")
+
+        assert rsi10 == state.rsi.peek(112.0)
+        assert manager.rsi10_cache["RELIANCE"] == rsi10
+        manager.get_current_ltp.assert_called_once_with("RELIANCE.NS")
+        manager.indicator_service.calculate_all_indicators.assert_not_called()
+
+    @patch("modules.kotak_neo_auto_trader.sell_engine.KotakNeoAuth")
+    @patch("modules.kotak_neo_auto_trader.sell_engine.KotakNeoScripMaster")
+    def test_get_current_rsi10_falls_back_without_ltp(self, mock_scrip_master, mock_auth):
+        """Without an LTP the pandas recalculation path is used"""
+        import pandas as pd
+
+        from core.streaming_indicators import StreamingIndicatorState
+
+        mock_auth_instance = Mock()
+        mock_auth_instance.client = None
+        mock_auth.return_value = mock_auth_instance
+
+        manager = SellOrderManager(auth=mock_auth_instance, history_path="test_history.json")
+
+        history = pd.DataFrame(
+            {
+                "close": [100 + (i % 5) for i in range(150)],
+                "date": pd.date_range("2024-01-01", periods=150),
+            }
+        )
+        state = StreamingIndicatorState.from_history(
+            history, session_date=pd.Timestamp.now().date()
+        )
+        manager.indicator_service.get_streaming_state = Mock(return_value=state)
+        manager.get_current_ltp = Mock(return_value=None)
+        mock_df = pd.DataFrame({"close": [100, 101, 102], "rsi10": [None, None, 47.0]})
+        manager.price_service.get_price = Mock(return_value=mock_df)
+        manager.indicator_service.calculate_all_indicators = Mock(return_value=mock_df)
+
+        assert manager._get_current_rsi10("RELIANCE", "RELIANCE.NS") == 47.0
+
+
 class TestRSIExitConditionCheck:
     """Test RSI exit condition checking"""
 
@@ -240,13 +306,21 @@ class TestRSIExitConditionCheck:
         mock_get_rsi.return_value = 55.0
         mock_convert.return_value = True
 
-        order_info = {"order_id": "ORDER123", "ticker": "RELIANCE.NS", "qty": 10}
+        manager.get_current_ltp = Mock(return_value=2510.0)
+
+        order_info = {
+            "order_id": "ORDER123",
+            "ticker": "RELIANCE.NS",
+            "qty": 10,
+            "placed_symbol": "RELIANCE-EQ",
+        }
 
         result = manager._check_rsi_exit_condition("RELIANCE", order_info)
 
-        # Verify conversion was attempted
+        # Verify conversion was attempted with the LTP fetched once for the broker symbol
         assert result is True
-        mock_get_rsi.assert_called_once_with("RELIANCE", "RELIANCE.NS")
+        manager.get_current_ltp.assert_called_once_with("RELIANCE.NS", broker_symbol="RELIANCE-EQ")
+        mock_get_rsi.assert_called_once_with("RELIANCE", "RELIANCE.NS", current_ltp=2510.0)
         mock_convert.assert_called_once_with("RELIANCE", order_info, 55.0)
 
     @patch("modules.kotak_neo_auto_trader.sell_engine.KotakNeoAuth")
@@ -0,0 +1,101 @@
+"""Point-in-time feature store: parity with per-date extraction, one fetch per ticker."""
+
+import os
+import sys
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../..")))
+
+from scripts.collect_training_data import extract_features_at_date
+from services.indicator_service import IndicatorService
+from services.ml_feature_store import PointInTimeFeatureStore
+from services.signal_service import SignalService
+
+SIGNAL_ENTRY_DATES = ["2024-03-05", "2024-06-11", "2024-06-12", "2024-09-02", "2024-12-31"]
+
+
+def _history() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2022-01-03", "2024-12-31")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, len(dates))))
+    open_ = close * (1 + rng.normal(0, 0.01, len(dates)))
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, 0.02, len(dates)))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, 0.03, len(dates)))
+    volume = rng.integers(100_000, 1_000_000, len(dates)).astype(float)
+    return pd.DataFrame(
+        {"date": dates, "open": open_, "high": high, "low": low, "close": close, "volume": volume}
+    )
+
+
+def _fake_fetch(history: pd.DataFrame):
+    """fetch_ohlcv_yf stand-in: everything up to end_date (same warm-up start for both paths)."""
+
+    def fetch(ticker, days, interval="1d", end_date=None, add_current_day=False):
+        return history[history["date"] <= pd.Timestamp(end_date)].reset_index(drop=True)
+
+    return Mock(side_effect=fetch)
+
+
+def _assert_same(expected: dict, actual: dict) -> None:
+    assert list(actual) == list(expected)
+    for key, value in expected.items():
+        if isinstance(value, float):
+            assert actual[key] == pytest.approx(value, rel=1e-9, abs=1e-9), key
+        else:
+            assert actual[key] == value, key
+
+
+def test_store_matches_per_date_extraction(tmp_path):
+    history = _history()
+    indicator_service, signal_service = IndicatorService(), SignalService()
+    store_fetch = _fake_fetch(history)
+    store = PointInTimeFeatureStore(tmp_path, fetch=store_fetch)
+
+    for entry_date in SIGNAL_ENTRY_DATES:
+        with patch("core.data_fetcher.fetch_ohlcv_yf", _fake_fetch(history)):
+            legacy = extract_features_at_date(
+                "TEST.NS", entry_date, Mock(), indicator_service, signal_service, Mock()
+            )
+        stored = extract_features_at_date(
+            "TEST.NS",
+            entry_date,
+            Mock(),
+            indicator_service,
+            signal_service,
+            Mock(),
+            feature_store=store,
+        )
+        _assert_same(legacy, stored)
+
+
+def test_prepare_builds_once_and_reloads_from_disk(tmp_path):
+    history = _history()
+    fetch = _fake_fetch(history)
+    store = PointInTimeFeatureStore(tmp_path, fetch=fetch)
+
+    store.prepare("TEST.NS", ["2024-03-04", "2024-12-30"])
+    for signal_date in ("2024-03-04", "2024-06-10", "2024-12-30"):
+        assert store.features_at("TEST.NS", signal_date) is not None
+    assert fetch.call_count == 1
+    assert (tmp_path / "TEST.NS.npz").exists()
+
+    reloaded = PointInTimeFeatureStore(tmp_path, fetch=fetch)
+    assert reloaded.features_at("TEST.NS", "2024-06-10") == store.features_at(
+        "TEST.NS", "2024-06-10"
+    )
+    assert fetch.call_count == 1
+    assert reloaded.stats["disk_loads"] == 1
+
+
+def test_weekend_lookup_uses_last_bar_and_short_history_is_none(tmp_path):
+    history = _history()
+    store = PointInTimeFeatureStore(tmp_path, fetch=_fake_fetch(history))
+
+    # Saturday resolves to Friday's bar (as of, never a later bar)
+    assert store.features_at("TEST.NS", "2024-06-08") == store.features_at("TEST.NS", "2024-06-07")
+    # Fewer than 50 bars of history before the signal date
+    assert store.features_at("TEST.NS", "2022-02-15") is None
@@ -73,11 +73,12 @@ def test_start_scheduler_adds_job_and_starts(monkeypatch: pytest.MonkeyPatch):
     mod.start_scheduler()
 
     assert fake.running is True
-    assert len(fake.jobs) == 3
+    assert len(fake.jobs) == 4
     assert {j.id for j in fake.jobs} == {
         "mtm_daily_update",
         "billing_reconcile_daily",
         "performance_bills_month_close",
+        "signal_expiry",
     }
 
 
@@ -162,6 +163,43 @@ def test_job_billing_reconcile_swallows_errors(monkeypatch: pytest.MonkeyPatch):
     mod.job_billing_reconcile()
 
 
+def test_job_signal_expiry_marks_expired_signals(monkeypatch: pytest.MonkeyPatch):
+    mod = _import_scheduler_module()
+    ran = {}
+
+    class _Repo:
+        def __init__(self, db):
+            ran["db"] = db
+
+        def mark_time_expired_signals(self):
+            ran["ok"] = True
+            return 2
+
+    class _Ctx:
+        def __enter__(self):
+            return "db"
+
+        def __exit__(self, *args):
+            return False
+
+    monkeypatch.setattr("src.infrastructure.db.session.SessionLocal", lambda: _Ctx())
+    monkeypatch.setattr(
+        "src.infrastructure.persistence.signals_repository.SignalsRepository", _Repo
+    )
+    mod.job_signal_expiry()
+    assert ran == {"db": "db", "ok": True}
+
+
+def test_job_signal_expiry_swallows_errors(monkeypatch: pytest.MonkeyPatch):
+    mod = _import_scheduler_module()
+
+    def _bad():
+        raise RuntimeError("no db")
+
+    monkeypatch.setattr("src.infrastructure.db.session.SessionLocal", _bad)
+    mod.job_signal_expiry()
+
+
 def test_job_performance_bills_month_close_swallows_errors(monkeypatch: pytest.MonkeyPatch):
     mod = _import_scheduler_module()
     monkeypatch.setattr(
@@ -121,7 +121,7 @@ def _no_network_price_and_history_fetch(monkeypatch):
     def _dummy_ticker(_symbol: str):
         return SimpleNamespace(info={})
 
-    monkeypatch.setattr(paper_trading.yf, "Ticker", _dummy_ticker, raising=True)
+    monkeypatch.setattr("yfinance.Ticker", _dummy_ticker, raising=True)
     monkeypatch.setattr(paper_trading, "compute_sell_target", lambda *a, **k: None, raising=True)
 
 
@@ -232,7 +232,7 @@ def test_get_paper_trading_portfolio_success(monkeypatch):
     def mock_yf_ticker(symbol):
         return mock_ticker
 
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
         mock_ticker_instance = MagicMock()
         mock_ticker_instance.info = {"currentPrice": 2600.0}
         mock_ticker_class.return_value = mock_ticker_instance
@@ -336,7 +336,7 @@ def test_get_paper_trading_portfolio_yfinance_fallback(monkeypatch):
     # Mock yfinance to fail (patch the router module alias directly)
     # and avoid any historical-data fetches during target calculations.
     with (
-        patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class,
+        patch("yfinance.Ticker") as mock_ticker_class,
         patch("server.app.routers.paper_trading.compute_sell_target", return_value=None),
     ):
         mock_ticker_instance = MagicMock()
@@ -360,7 +360,7 @@ def test_get_paper_trading_portfolio_with_target_prices(monkeypatch):
     _user = DummyUser(id=42)
 
     # Mock yfinance
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
         mock_ticker_instance = MagicMock()
         mock_ticker_instance.info = {"currentPrice": 2600.0}
         mock_ticker_class.return_value = mock_ticker_instance
@@ -587,7 +587,7 @@ def test_get_paper_trading_portfolio_order_statistics(monkeypatch):
 
     monkeypatch.setattr(paper_trading, "OrdersRepository", DummyOrdersRepository)
 
-    with patch("server.app.routers.paper_trading.yf.Ticker"):
+    with patch("yfinance.Ticker"):
 
         def mock_path_exists(self):
             return False if "active_sell_orders.json" in str(self) else True
@@ -629,7 +629,7 @@ def test_get_paper_trading_portfolio_trade_win_rate_uses_paper_closed_only(monke
         lambda db, user_id, all_orders, user_settings: paper_closed,  # noqa: ARG005
     )
 
-    with patch("server.app.routers.paper_trading.yf.Ticker"):
+    with patch("yfinance.Ticker"):
         result = paper_trading.get_paper_trading_portfolio(db=MagicMock(), current=user)
 
     assert result.order_statistics["trade_win_rate"] == 100.0
@@ -703,7 +703,7 @@ def test_get_paper_trading_portfolio_return_percentage_calculation(monkeypatch):
     monkeypatch.setattr(paper_trading, "OrdersRepository", DummyOrdersRepository)
     monkeypatch.setattr(paper_trading, "SettingsRepository", DummySettingsRepository)
 
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
         mock_ticker_instance = MagicMock()
         mock_ticker_instance.info = {"currentPrice": 2750.0}
         mock_ticker_class.return_value = mock_ticker_instance
@@ -757,7 +757,7 @@ def test_get_paper_trading_portfolio_return_percentage_negative_pnl(monkeypatch)
     monkeypatch.setattr(paper_trading, "OrdersRepository", DummyOrdersRepository)
     monkeypatch.setattr(paper_trading, "SettingsRepository", DummySettingsRepository)
 
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
         mock_ticker_instance = MagicMock()
         mock_ticker_instance.info = {"currentPrice": 2400.0}
         mock_ticker_class.return_value = mock_ticker_instance
@@ -783,7 +783,7 @@ def test_get_paper_trading_portfolio_return_percentage_zero_initial_capital(monk
     """Test return_percentage calculation with zero initial capital"""
     user = DummyUser(id=42)
 
-    with patch("server.app.routers.paper_trading.yf.Ticker"):
+    with patch("yfinance.Ticker"):
 
         def mock_path_exists(self):
             return False if "active_sell_orders.json" in str(self) else True
@@ -849,7 +849,7 @@ def test_get_paper_trading_portfolio_return_percentage_consistency(monkeypatch):
 
     call_count = [0]
 
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
 
         def create_mock_ticker(symbol):
             call_count[0] += 1
@@ -922,7 +922,7 @@ def test_get_paper_trading_portfolio_portfolio_value_calculation(monkeypatch):
 
     call_count = [0]
 
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
 
         def create_mock_ticker(ticker_symbol):
             call_count[0] += 1
@@ -983,7 +983,7 @@ def test_get_paper_trading_portfolio_total_value_calculation(monkeypatch):
     monkeypatch.setattr(paper_trading, "OrdersRepository", DummyOrdersRepository)
     monkeypatch.setattr(paper_trading, "SettingsRepository", DummySettingsRepository)
 
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
         mock_ticker_instance = MagicMock()
         mock_ticker_instance.info = {"currentPrice": 2600.0}
         mock_ticker_class.return_value = mock_ticker_instance
@@ -1044,7 +1044,7 @@ def test_get_paper_trading_portfolio_unrealized_pnl_calculation(monkeypatch):
 
     call_count = [0]
 
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
 
         def create_mock_ticker(ticker_symbol):
             call_count[0] += 1
@@ -1119,7 +1119,7 @@ def test_get_paper_trading_portfolio_holding_pnl_percentage_calculation(monkeypa
 
     call_count = [0]
 
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
 
         def create_mock_ticker(ticker_symbol):
             call_count[0] += 1
@@ -1189,7 +1189,7 @@ def test_get_paper_trading_portfolio_cost_basis_calculation(monkeypatch):
     monkeypatch.setattr(paper_trading, "OrdersRepository", DummyOrdersRepository)
     monkeypatch.setattr(paper_trading, "SettingsRepository", DummySettingsRepository)
 
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
         mock_ticker_instance = MagicMock()
         mock_ticker_instance.info = {"currentPrice": 2600.0}
         mock_ticker_class.return_value = mock_ticker_instance
@@ -1241,7 +1241,7 @@ def test_get_paper_trading_portfolio_market_value_calculation(monkeypatch):
     monkeypatch.setattr(paper_trading, "OrdersRepository", DummyOrdersRepository)
     monkeypatch.setattr(paper_trading, "SettingsRepository", DummySettingsRepository)
 
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
         mock_ticker_instance = MagicMock()
         mock_ticker_instance.info = {"currentPrice": 2600.0}
         mock_ticker_class.return_value = mock_ticker_instance
@@ -1293,7 +1293,7 @@ def test_get_paper_trading_portfolio_total_pnl_consistency(monkeypatch):
     monkeypatch.setattr(paper_trading, "OrdersRepository", DummyOrdersRepository)
     monkeypatch.setattr(paper_trading, "SettingsRepository", DummySettingsRepository)
 
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
         mock_ticker_instance = MagicMock()
         mock_ticker_instance.info = {"currentPrice": 2600.0}
         mock_ticker_class.return_value = mock_ticker_instance
@@ -1325,7 +1325,7 @@ def test_get_paper_trading_portfolio_zero_quantity_holding(monkeypatch):
     """Test handling of holdings with zero quantity"""
     user = DummyUser(id=42)
 
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
         mock_ticker_instance = MagicMock()
         mock_ticker_instance.info = {"currentPrice": 2600.0}
         mock_ticker_class.return_value = mock_ticker_instance
@@ -1389,7 +1389,7 @@ def test_get_paper_trading_portfolio_zero_average_price(monkeypatch):
     monkeypatch.setattr(paper_trading, "OrdersRepository", DummyOrdersRepository)
     monkeypatch.setattr(paper_trading, "SettingsRepository", DummySettingsRepository)
 
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
         mock_ticker_instance = MagicMock()
         mock_ticker_instance.info = {"currentPrice": 2600.0}
         mock_ticker_class.return_value = mock_ticker_instance
@@ -102,7 +102,7 @@ def portfolio_mocks(monkeypatch):
     mock_ticker = MagicMock()
     mock_ticker.info = {"currentPrice": 105.0, "regularMarketPrice": 105.0}
     monkeypatch.setattr(
-        "server.app.routers.paper_trading.yf.Ticker",
+        "yfinance.Ticker",
         lambda _symbol: mock_ticker,
     )
     monkeypatch.setattr(
@@ -81,7 +81,7 @@ class TestPaperTradingPortfolioEdgeCases:
 
         # Ensure unit tests never call out to yfinance/data fetchers.
         monkeypatch.setattr(
-            "server.app.routers.paper_trading.yf.Ticker",
+            "yfinance.Ticker",
             self.mock_ticker_factory,
         )
 
@@ -323,7 +323,7 @@ class TestPaperTradingPortfolioEdgeCases:
         self.mock_positions_repo.list.return_value = [position]
         self.mock_orders_repo.list.return_value = ([paper_order], 1)
 
-        with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+        with patch("yfinance.Ticker") as mock_ticker_class:
             mock_ticker_instance = MagicMock()
             mock_ticker_instance.info = {"currentPrice": 100.0, "regularMarketPrice": 100.0}
             mock_ticker_class.return_value = mock_ticker_instance
@@ -64,7 +64,7 @@ def _install_router_repo_stubs(monkeypatch, *, positions, orders):
 def _run_portfolio(monkeypatch, user, positions, orders, *, current_price: float = 2600.0):
     """Call portfolio with DB repo stubs and mocked live prices."""
     _install_router_repo_stubs(monkeypatch, positions=positions, orders=orders)
-    with patch("server.app.routers.paper_trading.yf.Ticker") as mock_ticker_class:
+    with patch("yfinance.Ticker") as mock_ticker_class:
         mock_ticker_instance = MagicMock()
         mock_ticker_instance.info = {"currentPrice": current_price}
         mock_ticker_class.return_value = mock_ticker_instance
@@ -253,7 +253,7 @@ def test_get_paper_trading_portfolio_reentry_data_symbol_normalization(monkeypat
             mock_ticker.info = {"currentPrice": 3600.0}
         return mock_ticker
 
-    with patch("server.app.routers.paper_trading.yf.Ticker", side_effect=create_mock_ticker):
+    with patch("yfinance.Ticker", side_effect=create_mock_ticker):
         db_session = MagicMock()
         db_session.query.return_value.filter.return_value.all.return_value = []
         result = paper_trading.get_paper_trading_portfolio(db=db_session, current=user)
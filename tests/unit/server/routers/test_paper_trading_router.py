@@ -37,8 +37,8 @@ def test_get_paper_trading_portfolio_builds_holdings(monkeypatch):
         def info(self):
             return {"currentPrice": 115.0}
 
-    # paper_trading_router already imports yfinance as `yf`; patch that directly.
-    monkeypatch.setattr(paper_trading_router.yf, "Ticker", FakeTicker)
+    # Live prices come from the shared quote service, which calls yfinance.Ticker.
+    monkeypatch.setattr("yfinance.Ticker", FakeTicker)
 
     # Mock PositionsRepository to return position objects
     from datetime import datetime
@@ -80,46 +80,40 @@ def test_calculate_portfolio_unrealized_pnl_yfinance_inner_failure(tmp_path, mon
 
 
 def test_ensure_pnl_records_empty_orders(monkeypatch):
-    class _Repo:
-        def list(self, user_id):
-            return []
+    class _Svc:
+        def materialize(self, user_id, start, end):
+            return False
 
-    monkeypatch.setattr(pnl_router, "OrdersRepository", lambda db: _Repo())
-    monkeypatch.setattr(pnl_router, "PnlRepository", lambda db: MagicMock())
+    pnl_repo = MagicMock()
+    monkeypatch.setattr(pnl_router, "PnlCalculationService", lambda db: _Svc())
+    monkeypatch.setattr(pnl_router, "PnlRepository", lambda db: pnl_repo)
     out = pnl_router._ensure_pnl_records(1, date(2024, 1, 1), date(2024, 1, 5), MagicMock())
     assert out == []
+    pnl_repo.range.assert_not_called()
 
 
 def test_ensure_pnl_records_runs_backfill(monkeypatch):
     d1 = date(2024, 2, 1)
 
-    class _Ord:
-        def __init__(self):
-            self.placed_at = datetime(2024, 1, 15, 12, 0, 0)
-
-    class _OrdersRepo:
-        def list(self, user_id):
-            return [_Ord()]
-
     class _PnlRepo:
         def range(self, user_id, start, end):
             return [{"date": start}]
 
     class _Svc:
         def __init__(self, db):
-            self.called = False
+            self.called_with = None
 
-        def calculate_date_range(self, user_id, start, end):
-            self.called = True
+        def materialize(self, user_id, start, end):
+            self.called_with = (user_id, start, end)
+            return True
 
     svc = _Svc(MagicMock())
-    monkeypatch.setattr(pnl_router, "OrdersRepository", lambda db: _OrdersRepo())
     monkeypatch.setattr(pnl_router, "PnlRepository", lambda db: _PnlRepo())
     monkeypatch.setattr(pnl_router, "PnlCalculationService", lambda db: svc)
 
     db = MagicMock()
     out = pnl_router._ensure_pnl_records(3, d1, date(2024, 2, 10), db)
-    assert svc.called
+    assert svc.called_with == (3, d1, date(2024, 2, 10))
     assert out == [{"date": d1}]
 
 
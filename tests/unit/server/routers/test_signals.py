@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 from types import SimpleNamespace
 
 import pytest
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Response, status
 
 from server.app.routers import signals
 from src.infrastructure.db.models import SignalStatus, UserRole
@@ -92,12 +92,8 @@ class DummySignalsRepo:
     def __init__(self, db, user_id=None):
         self.db = db
         self.user_id = user_id
-        self.recent_items = []
-        self.by_date_items = {}
-        self.last_n_dates_items = []
-        self.recent_called = []
-        self.by_date_called = []
-        self.last_n_dates_called = []
+        self.items = []
+        self.buying_zone_called = []
         self.mark_rejected_called = []
         self.mark_rejected_result = True
         self.mark_active_called = []
@@ -111,41 +107,31 @@ class DummySignalsRepo:
         self.mark_active_called.append((symbol, reason))
         return self.mark_active_result
 
-    def recent(self, limit=100, active_only=False):
-        self.recent_called.append((limit, active_only))
-        return self.recent_items
-
-    def by_date(self, target_date, limit=100):
-        self.by_date_called.append((target_date, limit))
-        return self.by_date_items.get(target_date, [])
-
-    def last_n_dates(self, n, limit=100):
-        self.last_n_dates_called.append((n, limit))
-        return self.last_n_dates_items
-
-    def mark_time_expired_signals(self):
-        """Mock method for marking time-expired signals - returns count of expired signals"""
-        # For testing, just return 0 (no signals expired)
-        return 0
-
-    def get_signals_with_user_status(self, user_id, limit=100, status_filter=None):
-        """Mock method for per-user status - returns signals with effective status"""
-        # For testing, just return signals as (signal, signal.status) tuples
-        if hasattr(self, "recent_items") and self.recent_items:
-            items = self.recent_items
-        elif hasattr(self, "by_date_items") and self.by_date_items:
-            items = list(self.by_date_items.values())[0] if self.by_date_items else []
-        elif hasattr(self, "last_n_dates_items") and self.last_n_dates_items:
-            items = self.last_n_dates_items
-        else:
-            items = []
-
-        # Apply status filter if provided
+    def buying_zone(
+        self,
+        user_id,
+        *,
+        limit=100,
+        status_filter=None,
+        start_date=None,
+        end_date=None,
+        before=None,
+    ):
+        """Returns (signal, effective_status, base_status) with the signal's own status"""
+        self.buying_zone_called.append(
+            {
+                "user_id": user_id,
+                "limit": limit,
+                "status_filter": status_filter,
+                "start_date": start_date,
+                "end_date": end_date,
+                "before": before,
+            }
+        )
+        items = self.items
         if status_filter:
             items = [s for s in items if s.status == status_filter]
-
-        # Return as (signal, effective_status) tuples
-        return [(s, s.status) for s in items]
+        return [(s, s.status, s.status) for s in items]
 
 
 @pytest.fixture
@@ -174,67 +160,98 @@ def mock_ist_now(monkeypatch):
 # GET /buying-zone tests
 def test_buying_zone_default_recent(signals_repo, current_user, mock_ist_now):
     signal = DummySignal(id=1, symbol="RELIANCE.NS", status=SignalStatus.ACTIVE)
-    signals_repo.recent_items = [signal]
+    signals_repo.items = [signal]
 
-    result = signals.buying_zone(limit=100, status_filter="active", db=None, user=current_user)
+    result = signals.buying_zone(
+        response=Response(), limit=100, status_filter="active", db=None, user=current_user
+    )
 
     assert len(result) == 1
     assert result[0]["symbol"] == "RELIANCE.NS"
     assert result[0]["status"] == "active"
-    assert len(signals_repo.recent_called) == 1
-    assert signals_repo.recent_called[0] == (100, False)
+    assert len(signals_repo.buying_zone_called) == 1
+    call = signals_repo.buying_zone_called[0]
+    assert call["user_id"] == 42
+    assert call["limit"] == 100
+    assert call["status_filter"] == SignalStatus.ACTIVE
+    assert call["start_date"] is None and call["end_date"] is None
+    assert call["before"] is None
 
 
 def test_buying_zone_today_filter(signals_repo, current_user, mock_ist_now):
     signal = DummySignal(id=1, symbol="TCS.NS", status=SignalStatus.ACTIVE)
     today = mock_ist_now.date()
-    signals_repo.by_date_items[today] = [signal]
+    signals_repo.items = [signal]
 
     result = signals.buying_zone(
-        limit=100, date_filter="today", status_filter="active", db=None, user=current_user
+        response=Response(),
+        limit=100,
+        date_filter="today",
+        status_filter="active",
+        db=None,
+        user=current_user,
     )
 
     assert len(result) == 1
     assert result[0]["symbol"] == "TCS.NS"
-    assert len(signals_repo.by_date_called) == 1
-    assert signals_repo.by_date_called[0][0] == today
+    assert len(signals_repo.buying_zone_called) == 1
+    call = signals_repo.buying_zone_called[0]
+    assert call["start_date"] == today
+    assert call["end_date"] == today
 
 
 def test_buying_zone_yesterday_filter(signals_repo, current_user, mock_ist_now):
     signal = DummySignal(id=1, symbol="INFY.NS", status=SignalStatus.ACTIVE)
     yesterday = (mock_ist_now - timedelta(days=1)).date()
-    signals_repo.by_date_items[yesterday] = [signal]
+    signals_repo.items = [signal]
 
     result = signals.buying_zone(
-        limit=100, date_filter="yesterday", status_filter="active", db=None, user=current_user
+        response=Response(),
+        limit=100,
+        date_filter="yesterday",
+        status_filter="active",
+        db=None,
+        user=current_user,
     )
 
     assert len(result) == 1
     assert result[0]["symbol"] == "INFY.NS"
-    assert len(signals_repo.by_date_called) == 1
-    assert signals_repo.by_date_called[0][0] == yesterday
+    assert len(signals_repo.buying_zone_called) == 1
+    call = signals_repo.buying_zone_called[0]
+    assert call["start_date"] == yesterday
+    assert call["end_date"] == yesterday
 
 
 def test_buying_zone_last_10_days_filter(signals_repo, current_user, mock_ist_now):
     signal = DummySignal(id=1, symbol="WIPRO.NS", status=SignalStatus.ACTIVE)
-    signals_repo.last_n_dates_items = [signal]
+    signals_repo.items = [signal]
 
     result = signals.buying_zone(
-        limit=100, date_filter="last_10_days", status_filter="active", db=None, user=current_user
+        response=Response(),
+        limit=100,
+        date_filter="last_10_days",
+        status_filter="active",
+        db=None,
+        user=current_user,
     )
 
     assert len(result) == 1
     assert result[0]["symbol"] == "WIPRO.NS"
-    assert len(signals_repo.last_n_dates_called) == 1
-    assert signals_repo.last_n_dates_called[0] == (10, 100)
+    assert len(signals_repo.buying_zone_called) == 1
+    call = signals_repo.buying_zone_called[0]
+    assert call["start_date"] == (mock_ist_now - timedelta(days=9)).date()
+    assert call["end_date"] == mock_ist_now.date()
+    assert call["limit"] == 100
 
 
 def test_buying_zone_status_filter_active(signals_repo, current_user):
     active_signal = DummySignal(id=1, symbol="RELIANCE.NS", status=SignalStatus.ACTIVE)
     expired_signal = DummySignal(id=2, symbol="TCS.NS", status=SignalStatus.EXPIRED)
-    signals_repo.recent_items = [active_signal, expired_signal]
+    signals_repo.items = [active_signal, expired_signal]
 
-    result = signals.buying_zone(limit=100, status_filter="active", db=None, user=current_user)
+    result = signals.buying_zone(
+        response=Response(), limit=100, status_filter="active", db=None, user=current_user
+    )
 
     assert len(result) == 1
     assert result[0]["status"] == "active"
@@ -244,9 +261,11 @@ def test_buying_zone_status_filter_active(signals_repo, current_user):
 def test_buying_zone_status_filter_expired(signals_repo, current_user):
     active_signal = DummySignal(id=1, symbol="RELIANCE.NS", status=SignalStatus.ACTIVE)
     expired_signal = DummySignal(id=2, symbol="TCS.NS", status=SignalStatus.EXPIRED)
-    signals_repo.recent_items = [active_signal, expired_signal]
+    signals_repo.items = [active_signal, expired_signal]
 
-    result = signals.buying_zone(limit=100, status_filter="expired", db=None, user=current_user)
+    result = signals.buying_zone(
+        response=Response(), limit=100, status_filter="expired", db=None, user=current_user
+    )
 
     assert len(result) == 1
     assert result[0]["status"] == "expired"
@@ -257,19 +276,21 @@ def test_buying_zone_status_filter_all(signals_repo, current_user):
     active_signal = DummySignal(id=1, symbol="RELIANCE.NS", status=SignalStatus.ACTIVE)
     expired_signal = DummySignal(id=2, symbol="TCS.NS", status=SignalStatus.EXPIRED)
     traded_signal = DummySignal(id=3, symbol="INFY.NS", status=SignalStatus.TRADED)
-    signals_repo.recent_items = [active_signal, expired_signal, traded_signal]
+    signals_repo.items = [active_signal, expired_signal, traded_signal]
 
-    result = signals.buying_zone(limit=100, status_filter="all", db=None, user=current_user)
+    result = signals.buying_zone(
+        response=Response(), limit=100, status_filter="all", db=None, user=current_user
+    )
 
     assert len(result) == 3  # All signals returned
 
 
 def test_buying_zone_status_filter_invalid_ignored(signals_repo, current_user):
     signal = DummySignal(id=1, symbol="RELIANCE.NS", status=SignalStatus.ACTIVE)
-    signals_repo.recent_items = [signal]
+    signals_repo.items = [signal]
 
     result = signals.buying_zone(
-        limit=100, status_filter="invalid_status", db=None, user=current_user
+        response=Response(), limit=100, status_filter="invalid_status", db=None, user=current_user
     )
 
     # Invalid status filter is ignored, returns all
@@ -277,22 +298,84 @@ def test_buying_zone_status_filter_invalid_ignored(signals_repo, current_user):
 
 
 def test_buying_zone_custom_limit(signals_repo, current_user):
-    signals_repo.recent_items = [DummySignal(id=i) for i in range(50)]
+    signals_repo.items = [DummySignal(id=i) for i in range(50)]
 
-    result = signals.buying_zone(limit=25, status_filter="active", db=None, user=current_user)
+    result = signals.buying_zone(
+        response=Response(), limit=25, status_filter="active", db=None, user=current_user
+    )
 
     assert len(result) == 50  # Returns all items from repo (limit applied at repo level)
-    assert signals_repo.recent_called[0][0] == 25
+    assert signals_repo.buying_zone_called[0]["limit"] == 25
+
+
+def test_buying_zone_full_page_sets_next_cursor(signals_repo, current_user):
+    signals_repo.items = [
+        DummySignal(id=7, ts=datetime(2025, 1, 15, 10, 0, 0)),
+        DummySignal(id=5, ts=datetime(2025, 1, 14, 16, 30, 0)),
+    ]
+    response = Response()
+
+    signals.buying_zone(response=response, limit=2, status_filter="all", db=None, user=current_user)
+    cursor = response.headers["X-Next-Cursor"]
+    assert cursor == "2025-01-14T16:30:00_5"
+
+    next_response = Response()
+    signals.buying_zone(
+        response=next_response,
+        limit=2,
+        status_filter="all",
+        cursor=cursor,
+        db=None,
+        user=current_user,
+    )
+    assert signals_repo.buying_zone_called[1]["before"] == (datetime(2025, 1, 14, 16, 30), 5)
+
+
+def test_buying_zone_partial_page_has_no_cursor(signals_repo, current_user):
+    signals_repo.items = [DummySignal(id=1)]
+    response = Response()
+
+    signals.buying_zone(response=response, limit=2, status_filter="all", db=None, user=current_user)
+
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_next_cursor_header_exposed_to_cross_origin_clients():
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from server.app.main import app
+
+    (cors,) = [m for m in app.user_middleware if m.cls is CORSMiddleware]
+    assert "X-Next-Cursor" in cors.kwargs["expose_headers"]
+
+
+def test_buying_zone_invalid_cursor(signals_repo, current_user):
+    with pytest.raises(HTTPException) as exc:
+        signals.buying_zone(
+            response=Response(),
+            limit=10,
+            status_filter="all",
+            cursor="not-a-cursor",
+            db=None,
+            user=current_user,
+        )
+
+    assert exc.value.status_code == status.HTTP_400_BAD_REQUEST
 
 
 def test_buying_zone_combined_filters(signals_repo, current_user, mock_ist_now):
     active_signal = DummySignal(id=1, symbol="RELIANCE.NS", status=SignalStatus.ACTIVE)
     expired_signal = DummySignal(id=2, symbol="TCS.NS", status=SignalStatus.EXPIRED)
     today = mock_ist_now.date()
-    signals_repo.by_date_items[today] = [active_signal, expired_signal]
+    signals_repo.items = [active_signal, expired_signal]
 
     result = signals.buying_zone(
-        limit=100, date_filter="today", status_filter="active", db=None, user=current_user
+        response=Response(),
+        limit=100,
+        date_filter="today",
+        status_filter="active",
+        db=None,
+        user=current_user,
     )
 
     assert len(result) == 1
@@ -300,9 +383,11 @@ def test_buying_zone_combined_filters(signals_repo, current_user, mock_ist_now):
 
 
 def test_buying_zone_empty_result(signals_repo, current_user):
-    signals_repo.recent_items = []
+    signals_repo.items = []
 
-    result = signals.buying_zone(limit=100, status_filter="active", db=None, user=current_user)
+    result = signals.buying_zone(
+        response=Response(), limit=100, status_filter="active", db=None, user=current_user
+    )
 
     assert len(result) == 0
     assert result == []
@@ -327,9 +412,11 @@ def test_buying_zone_maps_all_fields(signals_repo, current_user):
         vol_ok=True,
         verdict="strong_buy",
     )
-    signals_repo.recent_items = [signal]
+    signals_repo.items = [signal]
 
-    result = signals.buying_zone(limit=100, status_filter="active", db=None, user=current_user)
+    result = signals.buying_zone(
+        response=Response(), limit=100, status_filter="active", db=None, user=current_user
+    )
 
     assert len(result) == 1
     assert result[0]["id"] == 1
@@ -352,9 +439,11 @@ def test_buying_zone_handles_none_fields(signals_repo, current_user):
         target=None,
         ml_verdict=None,
     )
-    signals_repo.recent_items = [signal]
+    signals_repo.items = [signal]
 
-    result = signals.buying_zone(limit=100, status_filter="active", db=None, user=current_user)
+    result = signals.buying_zone(
+        response=Response(), limit=100, status_filter="active", db=None, user=current_user
+    )
 
     assert len(result) == 1
     assert result[0]["rsi10"] is None
@@ -399,9 +488,11 @@ def test_reject_signal_not_found(signals_repo, current_user):
 def test_buying_zone_status_filter_traded(signals_repo, current_user):
     active_signal = DummySignal(id=1, symbol="RELIANCE.NS", status=SignalStatus.ACTIVE)
     traded_signal = DummySignal(id=2, symbol="TCS.NS", status=SignalStatus.TRADED)
-    signals_repo.recent_items = [active_signal, traded_signal]
+    signals_repo.items = [active_signal, traded_signal]
 
-    result = signals.buying_zone(limit=100, status_filter="traded", db=None, user=current_user)
+    result = signals.buying_zone(
+        response=Response(), limit=100, status_filter="traded", db=None, user=current_user
+    )
 
     assert len(result) == 1
     assert result[0]["status"] == "traded"
@@ -410,9 +501,11 @@ def test_buying_zone_status_filter_traded(signals_repo, current_user):
 def test_buying_zone_status_filter_rejected(signals_repo, current_user):
     active_signal = DummySignal(id=1, symbol="RELIANCE.NS", status=SignalStatus.ACTIVE)
     rejected_signal = DummySignal(id=2, symbol="TCS.NS", status=SignalStatus.REJECTED)
-    signals_repo.recent_items = [active_signal, rejected_signal]
+    signals_repo.items = [active_signal, rejected_signal]
 
-    result = signals.buying_zone(limit=100, status_filter="rejected", db=None, user=current_user)
+    result = signals.buying_zone(
+        response=Response(), limit=100, status_filter="rejected", db=None, user=current_user
+    )
 
     assert len(result) == 1
     assert result[0]["status"] == "rejected"
@@ -422,9 +515,11 @@ def test_buying_zone_status_filter_rejected(signals_repo, current_user):
 def test_buying_zone_includes_base_status_for_expired(signals_repo, current_user):
     """Test that base_status is included and shows expired status"""
     expired_signal = DummySignal(id=1, symbol="EXPIRED.NS", status=SignalStatus.EXPIRED)
-    signals_repo.recent_items = [expired_signal]
+    signals_repo.items = [expired_signal]
 
-    result = signals.buying_zone(limit=100, status_filter="expired", db=None, user=current_user)
+    result = signals.buying_zone(
+        response=Response(), limit=100, status_filter="expired", db=None, user=current_user
+    )
 
     assert len(result) == 1
     assert result[0]["status"] == "expired"
@@ -433,9 +528,11 @@ def test_buying_zone_includes_base_status_for_expired(signals_repo, current_user
 
 def test_buying_zone_status_filter_case_insensitive(signals_repo, current_user):
     signal = DummySignal(id=1, symbol="RELIANCE.NS", status=SignalStatus.ACTIVE)
-    signals_repo.recent_items = [signal]
+    signals_repo.items = [signal]
 
-    result = signals.buying_zone(limit=100, status_filter="ACTIVE", db=None, user=current_user)
+    result = signals.buying_zone(
+        response=Response(), limit=100, status_filter="ACTIVE", db=None, user=current_user
+    )
 
     # Should work because status_filter.lower() is used
     assert len(result) == 1
@@ -443,9 +540,11 @@ def test_buying_zone_status_filter_case_insensitive(signals_repo, current_user):
 
 def test_buying_zone_none_status_filter(signals_repo, current_user):
     signal = DummySignal(id=1, symbol="RELIANCE.NS", status=SignalStatus.ACTIVE)
-    signals_repo.recent_items = [signal]
+    signals_repo.items = [signal]
 
-    result = signals.buying_zone(limit=100, status_filter=None, db=None, user=current_user)
+    result = signals.buying_zone(
+        response=Response(), limit=100, status_filter=None, db=None, user=current_user
+    )
 
     # None status filter means no filtering - all items returned
     assert len(result) == 1
@@ -61,12 +61,10 @@ def test_update_mtm_for_user_counts_updates_and_skips(monkeypatch):
     ]
     db = DummySession(positions)
 
-    def fake_get_live_price(symbol: str):
-        if symbol == "NO_PRICE":
-            return None
-        return 75.0
+    def fake_get_live_prices(symbols):
+        return {symbol: None if symbol == "NO_PRICE" else 75.0 for symbol in symbols}
 
-    monkeypatch.setattr(mtm_updater, "get_live_price", fake_get_live_price)
+    monkeypatch.setattr(mtm_updater, "get_live_prices", fake_get_live_prices)
 
     stats = mtm_updater.update_mtm_for_user(user_id=1, db=db)
 
@@ -151,7 +149,9 @@ def test_update_mtm_for_user_closes_session_when_db_omitted(monkeypatch):
 
     db = _Session()
     monkeypatch.setattr(mtm_updater, "SessionLocal", lambda: db)
-    monkeypatch.setattr(mtm_updater, "get_live_price", lambda symbol: 100.0)
+    monkeypatch.setattr(
+        mtm_updater, "get_live_prices", lambda symbols: dict.fromkeys(symbols, 100.0)
+    )
 
     stats = mtm_updater.update_mtm_for_user(7, db=None)
 
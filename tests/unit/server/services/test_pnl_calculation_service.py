@@ -5,7 +5,14 @@ import pytest
 
 from server.app.services import pnl_calculation_service as pnl_module
 from server.app.services.pnl_calculation_service import PnlCalculationService
-from src.infrastructure.db.models import Orders, PnlDaily, Positions, TradeMode, Users
+from src.infrastructure.db.models import (
+    Orders,
+    PnlDaily,
+    PnlMaterializationMark,
+    Positions,
+    TradeMode,
+    Users,
+)
 
 
 class FakeResult:
@@ -390,3 +397,157 @@ def test_get_buy_order_returns_none_if_outside_window(db_session, sample_user):
     found = service._get_buy_order_for_position(sample_user.id, position.symbol, position.opened_at)
 
     assert found is None
+
+
+def test_calculate_date_range_matches_daily_calculation(db_session, sample_user):
+    service = PnlCalculationService(db_session)
+    _create_position(
+        db_session, sample_user.id, closed_at=datetime(2026, 3, 1, 10, 0), realized_pnl=100.0
+    )
+    _create_position(
+        db_session, sample_user.id, closed_at=datetime(2026, 3, 3, 23, 59), realized_pnl=-40.0
+    )
+    _create_position(db_session, sample_user.id, closed_at=None, unrealized_pnl=25.0)
+    _create_order(
+        db_session,
+        sample_user.id,
+        quantity=2,
+        avg_price=150.0,
+        placed_at=datetime(2026, 3, 1, 8, 0),
+    )
+    _create_order(
+        db_session, sample_user.id, quantity=1, price=90.0, placed_at=datetime(2026, 3, 4, 0, 0)
+    )
+
+    records = service.calculate_date_range(sample_user.id, date(2026, 3, 1), date(2026, 3, 4))
+    bulk = [(r.date, r.realized_pnl, r.unrealized_pnl, r.fees) for r in records]
+    daily = [
+        (r.date, r.realized_pnl, r.unrealized_pnl, r.fees)
+        for r in (
+            service.calculate_daily_pnl(sample_user.id, date(2026, 3, 1) + timedelta(days=i))
+            for i in range(4)
+        )
+    ]
+
+    assert bulk == daily
+    assert [r[1] for r in bulk] == [100.0, 0.0, -40.0, 0.0]
+    assert db_session.query(PnlDaily).filter(PnlDaily.user_id == sample_user.id).count() == 4
+
+
+def test_materialize_recomputes_only_touched_days(db_session, sample_user, monkeypatch):
+    service = PnlCalculationService(db_session)
+    assert service.materialize(sample_user.id, date(2026, 3, 1), date(2026, 3, 10)) is False
+
+    _create_order(db_session, sample_user.id, placed_at=datetime(2026, 3, 2, 9, 0))
+    assert service.materialize(sample_user.id, date(2026, 3, 5), date(2026, 3, 10)) is True
+    rows = db_session.query(PnlDaily).filter(PnlDaily.user_id == sample_user.id).all()
+    assert sorted(r.date for r in rows) == [date(2026, 3, 2) + timedelta(days=i) for i in range(9)]
+
+    computed = []
+    original = service.calculate_dates
+
+    def _spy(user_id, days, trade_mode=None):
+        computed.append(sorted(days))
+        return original(user_id, days, trade_mode)
+
+    monkeypatch.setattr(service, "calculate_dates", _spy)
+
+    # Nothing changed: only the last materialized day is refreshed
+    service.materialize(sample_user.id, date(2026, 3, 5), date(2026, 3, 10))
+    assert computed[-1] == [date(2026, 3, 10)]
+
+    # A position closed on an already materialized day and a later end date
+    _create_position(
+        db_session, sample_user.id, closed_at=datetime(2026, 3, 4, 15, 0), realized_pnl=60.0
+    )
+    service.materialize(sample_user.id, date(2026, 3, 5), date(2026, 3, 12))
+    assert computed[-1] == [
+        date(2026, 3, 4),
+        date(2026, 3, 10),
+        date(2026, 3, 11),
+        date(2026, 3, 12),
+    ]
+    day = db_session.query(PnlDaily).filter(PnlDaily.date == date(2026, 3, 4)).one()
+    assert day.realized_pnl == 60.0
+
+
+def test_materialize_mark_is_persisted_per_trade_mode(db_session, sample_user, monkeypatch):
+    _create_order(db_session, sample_user.id, placed_at=datetime(2026, 3, 2, 9, 0))
+    assert PnlCalculationService(db_session).materialize(
+        sample_user.id, date(2026, 3, 2), date(2026, 3, 6)
+    )
+
+    # A fresh service (new request or process) resumes from the stored mark
+    service = PnlCalculationService(db_session)
+    computed = []
+    original = service.calculate_dates
+
+    def _spy(user_id, days, trade_mode=None):
+        computed.append((sorted(days), trade_mode))
+        return original(user_id, days, trade_mode)
+
+    monkeypatch.setattr(service, "calculate_dates", _spy)
+    service.materialize(sample_user.id, date(2026, 3, 2), date(2026, 3, 6))
+    assert computed[-1] == ([date(2026, 3, 6)], None)
+
+    # Another trade mode has no mark yet, and its rows replace the all-modes mark
+    service.materialize(sample_user.id, date(2026, 3, 2), date(2026, 3, 6), TradeMode.PAPER)
+    assert computed[-1] == (
+        [date(2026, 3, 2) + timedelta(days=i) for i in range(5)],
+        TradeMode.PAPER,
+    )
+    marks = db_session.query(PnlMaterializationMark).filter_by(user_id=sample_user.id).all()
+    assert [m.trade_mode for m in marks] == ["paper"]
+
+    # Unrealized P&L of past days follows the open positions
+    _create_position(db_session, sample_user.id, unrealized_pnl=25.0)
+    service.materialize(sample_user.id, date(2026, 3, 2), date(2026, 3, 6))
+    rows = db_session.query(PnlDaily).filter(PnlDaily.user_id == sample_user.id).all()
+    assert {r.unrealized_pnl for r in rows} == {25.0}
+
+
+def _realized_on(db_session, user_id: int, day: date) -> float:
+    row = db_session.query(PnlDaily).filter_by(user_id=user_id, date=day).one()
+    return row.realized_pnl
+
+
+def test_materialize_shorter_end_keeps_later_dirty_days(db_session, sample_user):
+    service = PnlCalculationService(db_session)
+    _create_order(db_session, sample_user.id, placed_at=datetime(2026, 3, 2, 9, 0))
+    service.materialize(sample_user.id, date(2026, 3, 2), date(2026, 3, 20))
+
+    _create_position(
+        db_session, sample_user.id, closed_at=datetime(2026, 3, 15, 15, 0), realized_pnl=60.0
+    )
+    service.materialize(sample_user.id, date(2026, 3, 2), date(2026, 3, 10))
+    service.materialize(sample_user.id, date(2026, 3, 2), date(2026, 3, 20))
+
+    assert _realized_on(db_session, sample_user.id, date(2026, 3, 15)) == 60.0
+
+
+def test_materialize_detects_reopened_and_reclosed_positions(db_session, sample_user):
+    service = PnlCalculationService(db_session)
+    _create_order(db_session, sample_user.id, placed_at=datetime(2026, 3, 2, 9, 0))
+    position = _create_position(
+        db_session, sample_user.id, closed_at=datetime(2026, 3, 5, 15, 0), realized_pnl=10.0
+    )
+    service.materialize(sample_user.id, date(2026, 3, 2), date(2026, 3, 14))
+    assert _realized_on(db_session, sample_user.id, date(2026, 3, 5)) == 10.0
+
+    # Reopened (sell_engine / paper adapter reset closed_at), then closed again later
+    position.closed_at = None
+    db_session.commit()
+    position.closed_at = datetime(2026, 3, 12, 15, 0)
+    position.realized_pnl = 30.0
+    db_session.commit()
+    service.materialize(sample_user.id, date(2026, 3, 2), date(2026, 3, 14))
+
+    assert _realized_on(db_session, sample_user.id, date(2026, 3, 5)) == 0.0
+    assert _realized_on(db_session, sample_user.id, date(2026, 3, 12)) == 30.0
+
+    # Reopened and left open: the old closing day is cleared
+    position.closed_at = None
+    db_session.commit()
+    service.materialize(sample_user.id, date(2026, 3, 2), date(2026, 3, 14))
+
+    assert _realized_on(db_session, sample_user.id, date(2026, 3, 12)) == 0.0
@@ -0,0 +1,154 @@
+"""Shared quote cache: batching, TTL, in-flight dedupe and stale-while-revalidate."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime
+
+from server.app.services import quote_service
+from server.app.services.quote_service import QuoteService, to_yahoo_ticker
+from src.infrastructure.db.timezone_utils import IST
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _service(fetcher, clock, **kwargs) -> QuoteService:
+    kwargs.setdefault("stale_grace_s", 60.0)
+    return QuoteService(
+        fetcher, ttl_market_s=10.0, ttl_closed_s=10.0, clock=clock, max_workers=4, **kwargs
+    )
+
+
+def test_to_yahoo_ticker_strips_segment_and_keeps_exchange():
+    assert to_yahoo_ticker("reliance") == "RELIANCE.NS"
+    assert to_yahoo_ticker("SALSTEEL-BE") == "SALSTEEL.NS"
+    assert to_yahoo_ticker("TCS.BO") == "TCS.BO"
+    assert to_yahoo_ticker("INFY-EQ.NS") == "INFY.NS"
+
+
+def test_batch_fetches_each_ticker_once_and_caches_within_ttl():
+    calls = []
+    clock = _Clock()
+
+    def fetcher(ticker):
+        calls.append(ticker)
+        return {"ABC.NS": 10.0, "XYZ.NS": 20.0}.get(ticker)
+
+    service = _service(fetcher, clock)
+
+    prices = service.get_quotes(["ABC", "ABC-EQ", "XYZ.NS", "NOPE"])
+    assert prices == {"ABC": 10.0, "ABC-EQ": 10.0, "XYZ.NS": 20.0, "NOPE": None}
+    assert sorted(calls) == ["ABC.NS", "NOPE.NS", "XYZ.NS"]
+
+    clock.now += 5
+    assert service.get_quote("XYZ") == 20.0
+    assert len(calls) == 3
+    assert service.stats["hits"] == 1
+
+
+def test_expired_quote_is_served_stale_while_refreshing():
+    clock = _Clock()
+    price = {"value": 100.0}
+    service = _service(lambda ticker: price["value"], clock)
+    assert service.get_quote("ABC") == 100.0
+
+    price["value"] = 105.0
+    clock.now += 30  # past TTL, within the stale grace
+    assert service.get_quote("ABC") == 100.0
+    assert service.stats["stale"] == 1
+    for _ in range(100):
+        if service.get_quote("ABC") == 105.0:
+            break
+        time.sleep(0.01)
+    assert service.get_quote("ABC") == 105.0
+
+    clock.now += 500  # beyond the grace: wait for a fresh fetch
+    price["value"] = 110.0
+    assert service.get_quote("ABC") == 110.0
+
+
+def test_failed_refresh_falls_back_to_last_price():
+    clock = _Clock()
+    outcome = {"fail": False}
+
+    def fetcher(ticker):
+        if outcome["fail"]:
+            raise RuntimeError("yahoo down")
+        return 50.0
+
+    service = _service(fetcher, clock, stale_grace_s=0.0)
+    assert service.get_quote("ABC") == 50.0
+
+    outcome["fail"] = True
+    clock.now += 20
+    assert service.get_quote("ABC") == 50.0
+    assert service.stats["failures"] == 1
+    assert service.get_quote("NEW") is None
+
+
+def test_failed_lookup_is_retried_after_the_failure_ttl():
+    clock = _Clock()
+    calls = []
+
+    def fetcher(ticker):
+        calls.append(ticker)
+        if len(calls) == 1:
+            raise RuntimeError("yahoo down")
+        return 75.0
+
+    service = QuoteService(
+        fetcher, ttl_market_s=600.0, ttl_closed_s=600.0, failure_ttl_s=5.0, clock=clock
+    )
+    assert service.get_quote("ABC") is None
+
+    clock.now += 2
+    assert service.get_quote("ABC") is None
+    assert len(calls) == 1
+
+    clock.now += 5
+    assert service.get_quote("ABC") == 75.0
+    assert len(calls) == 2
+
+
+def test_concurrent_requests_share_one_fetch():
+    release = threading.Event()
+    calls = []
+
+    def fetcher(ticker):
+        calls.append(ticker)
+        release.wait(5)
+        return 1.0
+
+    service = _service(fetcher, _Clock())
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(service.get_quote("ABC"))) for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert results == [1.0] * 5
+    assert calls == ["ABC.NS"]
+
+
+def test_ttl_is_short_only_during_the_session(monkeypatch):
+    service = QuoteService(lambda ticker: 1.0, ttl_market_s=15.0, ttl_closed_s=600.0)
+
+    monkeypatch.setattr(quote_service, "ist_now", lambda: datetime(2026, 10, 15, 11, 0, tzinfo=IST))
+    assert service.ttl() == 15.0
+    monkeypatch.setattr(quote_service, "ist_now", lambda: datetime(2026, 10, 15, 18, 0, tzinfo=IST))
+    assert service.ttl() == 600.0
+    # Saturday
+    monkeypatch.setattr(quote_service, "ist_now", lambda: datetime(2026, 10, 17, 11, 0, tzinfo=IST))
+    assert service.ttl() == 600.0
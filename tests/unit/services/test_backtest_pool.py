@@ -0,0 +1,212 @@
+"""Tests for process-pool backtest scoring."""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from services.backtest_pool import (
+    BacktestOutcome,
+    BacktestTask,
+    prefetch_backtest_ohlcv,
+    resolve_backtest_workers,
+    run_backtests_parallel,
+)
+from services.backtest_service import BacktestService
+
+
+def fake_backtest(ticker, years_back, dip_mode, config):
+    """Module-level (picklable) stand-in for _run_stock_backtest_impl."""
+    if ticker == "BOOM.NS":
+        raise ValueError("no data")
+    if ticker == "SLOW.NS":
+        time.sleep(30)
+    return {"symbol": ticker, "backtest_score": len(ticker) * 10, "years": years_back}
+
+
+def _tasks(*tickers):
+    return [BacktestTask(t, 5, False) for t in tickers]
+
+
+def test_resolve_backtest_workers():
+    assert resolve_backtest_workers(3) == 3
+    assert resolve_backtest_workers(0) == (os.cpu_count() or 1)
+    with patch("services.backtest_pool.BACKTEST_SCORING_WORKERS", 0):
+        assert resolve_backtest_workers() == (os.cpu_count() or 1)
+
+
+def test_results_keep_input_order_with_timing():
+    tickers = ["A.NS", "BB.NS", "CCC.NS", "DDDD.NS", "E.NS"]
+    outcomes = run_backtests_parallel(
+        _tasks(*tickers), workers=3, prefetch=False, start_method="fork", backtest_fn=fake_backtest
+    )
+
+    assert [o.ticker for o in outcomes] == tickers
+    assert [o.result["backtest_score"] for o in outcomes] == [len(t) * 10 for t in tickers]
+    assert all(o.error is None and o.elapsed_s >= 0 for o in outcomes)
+
+
+def test_failed_and_timed_out_tasks_do_not_abort_batch():
+    outcomes = run_backtests_parallel(
+        _tasks("A.NS", "BOOM.NS", "SLOW.NS", "D.NS"),
+        workers=2,
+        timeout=1.0,
+        prefetch=False,
+        start_method="fork",
+        backtest_fn=fake_backtest,
+    )
+
+    assert [o.ticker for o in outcomes] == ["A.NS", "BOOM.NS", "SLOW.NS", "D.NS"]
+    assert outcomes[0].result["symbol"] == "A.NS"
+    assert outcomes[1].result is None and "no data" in outcomes[1].error
+    assert outcomes[2].result is None and "timed out" in outcomes[2].error
+    assert outcomes[3].result["symbol"] == "D.NS"
+
+
+def test_timeout_runs_from_each_task_start():
+    started = time.perf_counter()
+    outcomes = run_backtests_parallel(
+        _tasks("SLOW.NS", "SLOW.NS", "A.NS"),
+        workers=3,
+        timeout=1.0,
+        prefetch=False,
+        start_method="fork",
+        backtest_fn=fake_backtest,
+    )
+
+    # Both slow tasks share one deadline instead of waiting a timeout each in turn
+    assert time.perf_counter() - started < 1.9
+    assert ["timed out" in (o.error or "") for o in outcomes] == [True, True, False]
+
+
+def test_tasks_fail_unrun_when_every_worker_is_stuck():
+    outcomes = run_backtests_parallel(
+        _tasks("SLOW.NS", "A.NS"),
+        workers=1,
+        timeout=0.5,
+        prefetch=False,
+        start_method="fork",
+        backtest_fn=fake_backtest,
+    )
+
+    assert "timed out" in outcomes[0].error
+    assert outcomes[1].result is None and "not run" in outcomes[1].error
+
+
+def test_service_applies_parallel_outcomes_in_order():
+    service = BacktestService(default_years_back=2)
+    stock_results = [
+        {"ticker": "A.NS", "strength_score": 40},
+        {"ticker": "B.NS", "strength_score": 40},
+    ]
+    outcomes = [
+        BacktestOutcome("A.NS", {"backtest_score": 60, "total_trades": 6}, 1.5, yahoo_calls=2),
+        BacktestOutcome("B.NS", None, 0.1, yahoo_calls=1, error="Backtest timed out after 600s"),
+    ]
+
+    with (
+        patch(
+            "services.backtest_service.iter_backtests_parallel", return_value=iter(outcomes)
+        ) as run,
+        patch.object(service, "run_stock_backtest") as serial,
+        patch(
+            "src.application.services.ohlcv_bulk_ops._read_cache_health_status",
+            return_value="ok",
+        ),
+    ):
+        streamed = []
+        results = service.add_backtest_scores_to_results(
+            stock_results, workers=4, on_result=lambda r: streamed.append(r["ticker"])
+        )
+
+    serial.assert_not_called()
+    assert streamed == ["A.NS", "B.NS"]
+    tasks = run.call_args.args[0]
+    assert [t.ticker for t in tasks] == ["A.NS", "B.NS"]
+    assert all(t.years_back == 2 for t in tasks)
+    assert results[0]["backtest"]["score"] == 60
+    assert results[0]["backtest"]["duration_s"] == 1.5
+    assert results[0]["yahoo_calls"] == 2
+    assert results[1]["backtest"] == {"score": 0, "error": "Backtest timed out after 600s"}
+    assert results[1]["yahoo_calls"] == 1
+
+
+def test_service_falls_back_to_serial_when_pool_breaks():
+    service = BacktestService(default_years_back=2)
+
+    def broken_pool(*_args, **_kwargs):
+        raise RuntimeError("pool died")
+        yield
+
+    with (
+        patch("services.backtest_service.iter_backtests_parallel", side_effect=broken_pool),
+        patch.object(service, "run_stock_backtest", return_value={"backtest_score": 30}) as serial,
+    ):
+        results = service.add_backtest_scores_to_results(
+            [{"ticker": "A.NS"}, {"ticker": "B.NS"}], workers=4
+        )
+
+    assert results[0]["backtest"] == {"score": 0, "error": "pool died"}
+    assert results[1]["backtest"]["score"] == 30
+    serial.assert_called_once()
+
+
+@pytest.mark.parametrize("workers", [None, 1])
+def test_service_serial_mode_with_one_worker(workers):
+    service = BacktestService(default_years_back=2)
+    with (
+        patch("services.backtest_pool.BACKTEST_SCORING_WORKERS", 1),
+        patch("services.backtest_service.iter_backtests_parallel") as run,
+        patch.object(service, "run_stock_backtest", return_value={"backtest_score": 30}),
+    ):
+        results = service.add_backtest_scores_to_results(
+            [{"ticker": "A.NS"}, {"ticker": "B.NS"}], workers=workers
+        )
+
+    run.assert_not_called()
+    assert [r["backtest"]["score"] for r in results] == [30, 30]
+    assert all("duration_s" in r["backtest"] for r in results)
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_core_scoring_uses_per_stock_config(workers):
+    from core import backtest_scoring  # noqa: PLC0415
+
+    stock_config, default_config = object(), object()
+    stock_results = [{"ticker": "A.NS", "_config": stock_config}, {"ticker": "B.NS"}]
+    outcomes = [BacktestOutcome(r["ticker"], {"backtest_score": 30}, 0.1) for r in stock_results]
+    with (
+        patch.object(
+            backtest_scoring, "_run_stock_backtest_impl", return_value={"backtest_score": 30}
+        ) as serial,
+        patch("services.backtest_pool.run_backtests_parallel", return_value=outcomes) as run,
+    ):
+        backtest_scoring.add_backtest_scores_to_results(
+            stock_results, years_back=2, config=default_config, workers=workers
+        )
+
+    if workers == 1:
+        configs = [c.args[3] for c in serial.call_args_list]
+    else:
+        configs = [t.config for t in run.call_args.args[0]]
+    assert configs == [stock_config, default_config]
+
+
+@pytest.mark.parametrize(
+    ("weekly_from_daily", "intervals"), [(True, ["1d"]), (False, ["1d", "1wk"])]
+)
+def test_prefetch_skips_weekly_when_resampled_from_daily(weekly_from_daily, intervals):
+    fetched = []
+
+    def fake_fetch(ticker, days, interval, end_date, add_current_day):
+        fetched.append((ticker, interval))
+
+    with (
+        patch("services.backtest_pool.OHLCV_CACHE_ENABLED", True),
+        patch("services.backtest_pool.OHLCV_WEEKLY_FROM_DAILY", weekly_from_daily),
+        patch("core.data_fetcher.fetch_ohlcv_yf", side_effect=fake_fetch),
+    ):
+        prefetch_backtest_ohlcv(["AAA.NS", "BBB.NS", "AAA.NS"], 2)
+
+    assert fetched == [(t, i) for t in ("AAA.NS", "BBB.NS") for i in intervals]
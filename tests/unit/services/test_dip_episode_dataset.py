@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import io
+
+import numpy as np
 import pandas as pd
 
-from services.dip_episode_dataset import DipEpisodeParams, generate_dip_episode_rows
+from services.dip_episode_dataset import (
+    DipEpisodeParams,
+    generate_dip_episode_dataset,
+    generate_dip_episode_rows,
+    generate_dip_episode_rows_vectorized,
+    load_dip_episode_shards,
+)
 
 
 def _df(prices: list[float], rsis: list[float], ema9s: list[float]) -> pd.DataFrame:
@@ -58,3 +67,56 @@ def test_reactivation_add_requires_rsi_above_30_seen() -> None:
     out = generate_dip_episode_rows(df, ticker="TEST", params=params)
     assert len(out) == 1
     assert out.iloc[0]["n_adds"] == 2
+
+
+def _ohlcv(seed: int, n: int = 600) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.025, n)))
+    return pd.DataFrame(
+        {
+            "date": pd.bdate_range("2018-01-01", periods=n),
+            "open": close * (1 + rng.normal(0, 0.01, n)),
+            "high": close * 1.02,
+            "low": close * 0.97,
+            "close": close,
+            "volume": rng.integers(1_000, 100_000, n).astype(float),
+        }
+    )
+
+
+def test_vectorized_rows_match_reference() -> None:
+    params = DipEpisodeParams(rsi_entry=35.0, rsi_add_20=25.0, rsi_add_10=15.0)
+    for seed in range(5):
+        df = _ohlcv(seed)
+        df.loc[[50, 51, 300], "close"] = np.nan
+        for p in (DipEpisodeParams(), params):
+            expected = generate_dip_episode_rows(df, ticker="TEST", params=p)
+            actual = generate_dip_episode_rows_vectorized(df, ticker="TEST", params=p)
+            assert len(expected) > 0
+            pd.testing.assert_frame_equal(actual, expected, check_exact=False, rtol=1e-9)
+
+
+def test_dataset_shards_match_per_ticker_rows(tmp_path) -> None:
+    ohlcv_dir = tmp_path / "ohlcv"
+    ohlcv_dir.mkdir()
+    expected = []
+    for n, ticker in enumerate(["AAA.NS", "BBB.NS", "CCC.NS"]):
+        df = _ohlcv(n)
+        df.to_csv(ohlcv_dir / f"{ticker}.csv", index=False)
+        expected.append(
+            generate_dip_episode_rows(pd.read_csv(ohlcv_dir / f"{ticker}.csv"), ticker=ticker)
+        )
+    expected_df = pd.concat(expected, ignore_index=True)
+
+    for workers in (1, 2):
+        out_dir = tmp_path / f"shards_{workers}"
+        shards = generate_dip_episode_dataset(
+            ohlcv_dir, output_dir=out_dir, workers=workers, tickers_per_shard=2
+        )
+        assert [s.name for s in shards] == ["dip_episodes_00000.csv", "dip_episodes_00001.csv"]
+        pd.testing.assert_frame_equal(
+            load_dip_episode_shards(out_dir),
+            pd.read_csv(io.StringIO(expected_df.to_csv(index=False))),
+            check_exact=False,
+            rtol=1e-9,
+        )
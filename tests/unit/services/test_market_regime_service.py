@@ -207,7 +207,8 @@ class TestMarketRegimeService:
         vix_min = self.service._get_vix("2024-11-10")
         assert vix_min == 10.0
 
-        # Test maximum boundary
+        # Test maximum boundary (the VIX history now persists for the instance)
+        self.service.clear_cache()
         dates_max = pd.date_range(start="2024-11-05", periods=1, freq="D")
         mock_data_max = pd.DataFrame({"Close": [50.0]}, index=dates_max)
         mock_download.return_value = mock_data_max
@@ -391,3 +392,91 @@ class TestMarketRegimeService:
         # Should convert to timezone-naive
         assert result is not None
         assert result.index.tz is None
+
+
+def _index_history(start: str, end: str, base: float, step: float = 1.0) -> pd.DataFrame:
+    dates = pd.bdate_range(start, end)
+    return pd.DataFrame({"Close": base + step * np.arange(len(dates))}, index=dates)
+
+
+class TestMarketRegimeHistory:
+    """Date-indexed Nifty/VIX history behind MarketRegimeService"""
+
+    @staticmethod
+    def _download(nifty: pd.DataFrame, vix: pd.DataFrame):
+        def download(ticker, start=None, end=None, **kwargs):
+            frame = nifty if ticker == "^NSEI" else vix
+            return frame[(frame.index >= start) & (frame.index < end)]
+
+        return download
+
+    @patch("services.market_regime_service.yf.download")
+    def test_many_dates_fetch_each_index_once(self, mock_download):
+        nifty = _index_history("2023-01-02", "2024-12-31", 17000.0)
+        vix = _index_history("2023-01-02", "2024-12-31", 15.0, step=0.0)
+        mock_download.side_effect = self._download(nifty, vix)
+        service = MarketRegimeService(history_start="2023-01-01")
+
+        dates = pd.bdate_range("2024-03-01", "2024-09-30")
+        features = [service.get_market_regime_features(d.strftime("%Y-%m-%d")) for d in dates]
+
+        assert mock_download.call_count == 2
+        closes = nifty["Close"]
+        sma20 = closes.rolling(20).mean()
+        target = pd.Timestamp("2024-06-14")
+        expected = round((closes[target] - sma20[target]) / sma20[target] * 100, 2)
+        assert features[list(dates).index(target)]["nifty_vs_sma20_pct"] == expected
+        assert all(f["nifty_trend"] == 1.0 and f["india_vix"] == 15.0 for f in features)
+
+    @patch("services.market_regime_service.yf.download")
+    def test_history_is_extended_incrementally_and_persisted(self, mock_download, tmp_path):
+        nifty = _index_history("2024-01-01", "2024-12-31", 17000.0)
+        vix = _index_history("2024-01-01", "2024-12-31", 15.0, step=0.0)
+        mock_download.side_effect = self._download(nifty, vix)
+        checked = datetime(2024, 6, 28, 18, 0)
+
+        with patch("services.market_regime_service.ist_now_naive", return_value=checked):
+            service = MarketRegimeService(history_dir=str(tmp_path), history_start="2024-01-01")
+            service._get_nifty_data("2024-06-28")
+        assert mock_download.call_args.kwargs["end"] == "2024-06-29"
+
+        later = datetime(2024, 7, 12, 18, 0)
+        with patch("services.market_regime_service.ist_now_naive", return_value=later):
+            reloaded = MarketRegimeService(history_dir=str(tmp_path))
+            reloaded._get_nifty_data("2024-06-14")
+            assert mock_download.call_count == 1  # served from the persisted history
+            row = reloaded._get_nifty_data("2024-07-12")
+
+        assert mock_download.call_count == 2
+        tail = mock_download.call_args.kwargs
+        assert (tail["start"], tail["end"]) == ("2024-06-21", "2024-07-13")
+        assert float(row["Close"].iloc[0]) == float(nifty.loc["2024-07-12", "Close"])
+
+    @patch("services.market_regime_service.yf.download")
+    def test_vix_older_than_lookback_falls_back_to_default(self, mock_download):
+        vix = _index_history("2024-01-01", "2024-03-29", 18.0, step=0.0)
+        mock_download.side_effect = self._download(
+            _index_history("2024-01-01", "2024-12-31", 1.0), vix
+        )
+        service = MarketRegimeService(history_start="2024-01-01")
+
+        assert service._get_vix("2024-04-01") == 18.0
+        assert service._get_vix("2024-06-03") == 20.0
+
+    @patch("services.market_regime_service.yf.download")
+    def test_empty_head_fetch_is_not_repeated(self, mock_download):
+        nifty = _index_history("2024-01-01", "2024-12-31", 17000.0)
+        mock_download.side_effect = self._download(nifty, nifty)
+        checked = datetime(2024, 6, 28, 18, 0)
+
+        with patch("services.market_regime_service.ist_now_naive", return_value=checked):
+            service = MarketRegimeService(history_start="2024-01-01")
+            service._get_nifty_data("2024-06-28")
+            assert service._get_nifty_data("2023-06-01") is None
+            assert mock_download.call_count == 2  # head before the first listed bar: empty
+
+            assert service._get_nifty_data("2023-06-02") is None
+            assert mock_download.call_count == 2  # remembered for the session
+
+            service._get_nifty_data("2022-06-01")
+            assert mock_download.call_count == 3  # an earlier head is still asked for
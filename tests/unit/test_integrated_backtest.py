@@ -50,7 +50,7 @@ def _isolate_yfinance_for_unit_tests(monkeypatch):
             index=idx,
         )
 
-    monkeypatch.setattr(data_fetcher.yf, "download", _fake_download)
+    monkeypatch.setattr(data_fetcher, "_download_history", _fake_download)
 
     yield
 
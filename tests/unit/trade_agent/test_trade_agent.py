@@ -25,7 +25,7 @@ class StubBacktestService:
     def __init__(self, **kwargs):
         self.kwargs = kwargs
 
-    def add_backtest_scores_to_results(self, results, config=None):
+    def add_backtest_scores_to_results(self, results, config=None, on_result=None):
         return results
 
 
@@ -392,7 +392,8 @@ def test_process_results_with_backtest(monkeypatch):
     mock_backtest.add_backtest_scores_to_results.assert_called_once()
 
 
-def test_process_results_backtest_exports_csv(monkeypatch):
+def test_process_results_backtest_exports_csv(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
     stock = _valid_stock()
     stock.update(
         {
@@ -414,7 +415,7 @@ def test_process_results_backtest_exports_csv(monkeypatch):
         def __init__(self, **kwargs):
             self.kwargs = kwargs
 
-        def add_backtest_scores_to_results(self, results, config=None):
+        def add_backtest_scores_to_results(self, results, config=None, on_result=None):
             return results
 
     captured = {}
@@ -523,6 +524,28 @@ def test_finalize_results_calls_json(monkeypatch, tmp_path):
     assert str(out_path) == called["path"]
 
 
+def test_process_results_streams_ndjson(monkeypatch, tmp_path):
+    stock1 = _valid_stock(verdict="buy")
+    stock2 = _valid_stock(index=2, verdict="avoid")
+    monkeypatch.setattr(trade_agent, "compute_strength_score", lambda r: 10)
+    monkeypatch.setattr(trade_agent, "compute_trading_priority_score", lambda r: 50)
+    monkeypatch.setattr(trade_agent, "send_telegram", lambda msg: None)
+    out_path = tmp_path / "results.ndjson"
+
+    stream = trade_agent._open_result_stream(str(out_path))
+    results = trade_agent._process_results(
+        [stock1, stock2], enable_backtest_scoring=False, result_stream=stream
+    )
+    trade_agent._finalize_results(results, None, stream)
+
+    lines = [json.loads(line) for line in out_path.read_text().splitlines()]
+    tickers = [line.get("ticker") for line in lines[:-1]]
+    # Every result once, then the buy candidate again after news enrichment
+    assert tickers == [stock1["ticker"], stock2["ticker"], stock1["ticker"]]
+    assert lines[-1] == {"_stream": "end", "count": 3}
+    assert trade_agent._open_result_stream(None) is None
+
+
 def test_write_results_json(tmp_path):
     class CustomObj:
         pass
@@ -10,6 +10,11 @@ from trade_agent import _process_results
 class TestDefaultMLConfidenceThreshold:
     """Test that default ML confidence threshold is 100% (1.0)"""
 
+    @pytest.fixture(autouse=True)
+    def _export_to_tmp_path(self, tmp_path, monkeypatch):
+        """Keep the analysis_results/ CSV export out of the working tree"""
+        monkeypatch.chdir(tmp_path)
+
     @pytest.fixture
     def mock_config_default(self):
         """Create a mock StrategyConfig with default threshold"""
@@ -10,6 +10,11 @@ from trade_agent import _process_results
 class TestQualityFocusedFiltering:
     """Test quality-focused filtering with backtest quality filters"""
 
+    @pytest.fixture(autouse=True)
+    def _export_to_tmp_path(self, tmp_path, monkeypatch):
+        """Keep the analysis_results/ CSV export out of the working tree"""
+        monkeypatch.chdir(tmp_path)
+
     @pytest.fixture
     def mock_config(self):
         """Create a mock StrategyConfig"""
@@ -5,6 +5,7 @@ Backfill NSE UDiFF bhavcopy into Postgres/SQLite ``price_cache``.
 Examples:
     .venv/bin/python tools/nse_bhavcopy_backfill.py backfill-symbol DMART.NS --days 500
     .venv/bin/python tools/nse_bhavcopy_backfill.py backfill-cached --days 500
+    .venv/bin/python tools/nse_bhavcopy_backfill.py backfill-cached --days 500 --gaps-only
     .venv/bin/python tools/nse_bhavcopy_backfill.py backfill-dates --from 2024-07-08 --to 2026-06-02 --symbols DMART.NS,LINDEINDIA.NS
 """
 
@@ -46,12 +47,16 @@ def cmd_backfill_symbol(symbol: str, days: int) -> int:
         db.close()
 
 
-def cmd_backfill_cached(days: int, *, limit: int | None = None) -> int:
+def cmd_backfill_cached(days: int, *, limit: int | None = None, gaps_only: bool = False) -> int:
     """
     Backfill every distinct daily symbol already present in ``price_cache``.
 
     Discovers tickers from existing cache rows, then ingests one bhavcopy zip per
-    trading day (shared across all symbols — efficient for large universes).
+    trading day (shared across all symbols — efficient for large universes), overwriting
+    rows already cached so bad days are repaired.
+
+    With ``gaps_only`` only their missing trading days are fetched: each bhavcopy zip is
+    downloaded and parsed once and shared across all symbols missing that day.
     """
     from src.application.services.ohlcv_fetch_validation import validate_cached_symbol
 
@@ -68,9 +73,16 @@ def cmd_backfill_cached(days: int, *, limit: int | None = None) -> int:
             return 0
 
         tickers = [ensure_cache_ticker(s) for s in symbols]
-        print(f"backfill-cached: {len(tickers)} symbol(s), range {start_d}..{end_d}")
+        mode = "missing days only" if gaps_only else "all trading days"
+        print(f"backfill-cached: {len(tickers)} symbol(s), range {start_d}..{end_d} ({mode})")
 
         svc = NseBhavcopyIngestService(db)
+        if gaps_only:
+            totals = svc.fill_symbols_range(tickers, start_d, end_d)
+            total = sum(totals.values())
+            print(f"backfill-cached done: {total} rows upserted for {len(tickers)} symbol(s)")
+            return 0
+
         total = 0
         trading_days = list(iter_trading_days(start_d, end_d))
         for i, trade_day in enumerate(trading_days, start=1):
@@ -129,6 +141,11 @@ def main() -> int:
     )
     p_cached.add_argument("--days", type=int, default=500)
     p_cached.add_argument("--limit", type=int, default=None, help="Max symbols (testing)")
+    p_cached.add_argument(
+        "--gaps-only",
+        action="store_true",
+        help="Only fetch trading days missing from the cache (cached days are not refreshed)",
+    )
 
     p_dates = sub.add_parser("backfill-dates", help="Backfill one bhavcopy file per trading day")
     p_dates.add_argument("--from", dest="from_date", required=True, help="YYYY-MM-DD")
@@ -147,7 +164,7 @@ def main() -> int:
     if args.command == "backfill-symbol":
         return cmd_backfill_symbol(args.symbol, args.days)
     if args.command == "backfill-cached":
-        return cmd_backfill_cached(args.days, limit=args.limit)
+        return cmd_backfill_cached(args.days, limit=args.limit, gaps_only=args.gaps_only)
     if args.command == "backfill-dates":
         symbols = None
         if args.symbols:
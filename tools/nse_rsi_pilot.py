@@ -24,7 +24,7 @@ from config.settings import NSE_BHAVCOPY_CACHE_DIR  # noqa: E402
 from core.data_fetcher import fetch_ohlcv_yf  # noqa: E402
 from src.infrastructure.data_providers.nse_bhavcopy_fetcher import (  # noqa: E402
     NseBhavcopyFetcher,
-    find_equity_bar,
+    index_equity_bars,
 )
 from src.infrastructure.data_providers.nse_symbol import base_from_cache_ticker  # noqa: E402
 
@@ -55,31 +55,40 @@ def fetch_nse_closes(
     sym_set = {base_from_cache_ticker(s) for s in symbols}
     rows: list[dict] = []
     start = end_date - timedelta(days=calendar_lookback)
+    use_store = fetcher.use_disk_cache
+    if use_store:
+        fetcher.migrate_csv_cache()
     d = end_date
     fetched = 0
     while d >= start:
-        df = fetcher.download_bhavcopy(d)
-        if df is not None:
+        if use_store and fetcher.has_cached_bhavcopy(d):
             fetched += 1
-            for sym in sym_set:
-                bar = find_equity_bar(df, sym)
-                if bar is not None:
-                    rows.append(
-                        {
-                            "date": bar.trade_date,
-                            "symbol": sym,
-                            "close": bar.close,
-                        }
-                    )
+        else:
+            df = fetcher.download_bhavcopy(d)
+            if df is not None:
+                fetched += 1
+                if not use_store:
+                    for sym, bar in index_equity_bars(df, sym_set).items():
+                        rows.append({"date": bar.trade_date, "symbol": sym, "close": bar.close})
         d -= timedelta(days=1)
 
+    if use_store:
+        # Per-symbol column reads from the store; other symbols and days are never parsed
+        for sym in sym_set:
+            history = fetcher.symbol_history(sym, start, end_date, columns=("close",))
+            rows.extend(
+                {"date": dt, "symbol": sym, "close": close}
+                for dt, close in zip(history["date"], history["close"], strict=True)
+                if pd.notna(close)
+            )
+
     if not rows:
         raise RuntimeError("No NSE bhavcopy rows downloaded — check network / dates")
 
     frame = pd.DataFrame(rows)
     frame["date"] = pd.to_datetime(frame["date"]).dt.normalize()
     frame = frame.sort_values(["symbol", "date"]).drop_duplicates(["symbol", "date"], keep="last")
-    print(f"NSE: downloaded {fetched} trading-day files, {len(frame)} symbol-bars")
+    print(f"NSE: {fetched} trading-day files available, {len(frame)} symbol-bars")
     return frame
 
 
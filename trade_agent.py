@@ -11,6 +11,7 @@ from core.telegram import send_telegram  # TODO Phase 4: Migrate to infrastructu
 
 # Phase 4: Use services instead of core modules
 from services import BacktestService, ScoringService, compute_strength_score
+from src.application.services.analysis_result_stream import AnalysisResultStreamWriter
 from src.infrastructure.db.timezone_utils import ist_now, ist_now_naive
 from src.infrastructure.web_scraping.screener_symbol_filters import (
     parse_and_filter_tradable_screener_csv,
@@ -326,6 +327,7 @@ async def main_async(
     user_id: int | None = None,
     db_session=None,
     enable_ml: bool = False,
+    ndjson_output_path: str | None = None,
 ):
     """
     Async main function using async batch analysis
@@ -343,6 +345,8 @@ async def main_async(
         db_session: Optional database session for loading user config
         enable_ml: If True and no DB-backed config was loaded, use ``StrategyConfig(ml_enabled=True)``
             for analysis (same as ``--ml`` / ``--ml-enabled`` on the CLI).
+        ndjson_output_path: Optional path to stream results as NDJSON, one line per ticker
+            as soon as its scoring is final
     """
     tickers = get_stocks()
 
@@ -407,10 +411,11 @@ async def main_async(
             first_result = results[0]
             if isinstance(first_result, dict) and "_config" in first_result:
                 config = first_result.get("_config")
+        result_stream = _open_result_stream(ndjson_output_path)
         processed_results = _process_results(
-            results, enable_backtest_scoring, dip_mode, config=config
+            results, enable_backtest_scoring, dip_mode, config=config, result_stream=result_stream
         )
-        return _finalize_results(processed_results, json_output_path)
+        return _finalize_results(processed_results, json_output_path, result_stream)
 
     except ImportError:
         logger.warning("Async service not available, falling back to sequential analysis")
@@ -422,6 +427,7 @@ async def main_async(
             dip_mode,
             json_output_path=json_output_path,
             enable_ml=enable_ml,
+            ndjson_output_path=ndjson_output_path,
         )
         return processed_results
 
@@ -433,6 +439,7 @@ def main_sequential(
     dip_mode=False,
     json_output_path: str | None = None,
     enable_ml: bool = False,
+    ndjson_output_path: str | None = None,
 ):
     """
     Sequential main function (backward compatible)
@@ -503,8 +510,11 @@ def main_sequential(
                 results.append({"ticker": t, "status": "fatal_error", "error": str(e)})
 
     # Continue with scoring and Telegram (same for both async and sequential)
-    processed_results = _process_results(results, enable_backtest_scoring, dip_mode)
-    return _finalize_results(processed_results, json_output_path)
+    result_stream = _open_result_stream(ndjson_output_path)
+    processed_results = _process_results(
+        results, enable_backtest_scoring, dip_mode, result_stream=result_stream
+    )
+    return _finalize_results(processed_results, json_output_path, result_stream)
 
 
 def main(
@@ -517,6 +527,7 @@ def main(
     user_id: int | None = None,
     db_session=None,
     enable_ml: bool = False,
+    ndjson_output_path: str | None = None,
 ):
     """
     Main function - supports both async and sequential modes
@@ -530,6 +541,7 @@ def main(
         user_id: Optional user ID to load user-specific config
         db_session: Optional database session for loading user config
         enable_ml: When no DB-backed config is loaded, use ``StrategyConfig(ml_enabled=True)`` (CLI ``--ml``).
+        ndjson_output_path: Optional path to stream results as NDJSON (CLI ``--ndjson-output``)
     """
     if use_async:
         # Use async analysis (Phase 2)
@@ -546,6 +558,7 @@ def main(
                     user_id=user_id,
                     db_session=db_session,
                     enable_ml=enable_ml,
+                    ndjson_output_path=ndjson_output_path,
                 )
             )
         except Exception as e:
@@ -557,6 +570,7 @@ def main(
                 dip_mode=dip_mode,
                 json_output_path=json_output_path,
                 enable_ml=enable_ml,
+                ndjson_output_path=ndjson_output_path,
             )
     else:
         # Use sequential analysis (backward compatible)
@@ -567,11 +581,20 @@ def main(
             dip_mode=dip_mode,
             json_output_path=json_output_path,
             enable_ml=enable_ml,
+            ndjson_output_path=ndjson_output_path,
         )
 
 
-def _process_results(results, enable_backtest_scoring=False, dip_mode=False, config=None):
-    """Process analysis results (common for both async and sequential)"""
+def _process_results(
+    results, enable_backtest_scoring=False, dip_mode=False, config=None, result_stream=None
+):
+    """
+    Process analysis results (common for both async and sequential)
+
+    With ``result_stream`` each result is streamed as soon as it is final: after backtest
+    scoring when enabled, else right after strength scoring. Recommendations are streamed
+    again after news enrichment.
+    """
 
     # ENHANCEMENT 1: Extract config FIRST (before any filtering or processing)
     # This ensures we have config available for all subsequent operations
@@ -613,17 +636,23 @@ def _process_results(results, enable_backtest_scoring=False, dip_mode=False, con
     if enable_backtest_scoring:
         mode_info = " (DIP MODE)" if dip_mode else ""
         try:
-            from config.settings import API_RATE_LIMIT_DELAY, MAX_CONCURRENT_ANALYSES
+            from config.settings import (
+                API_RATE_LIMIT_DELAY,
+                BACKTEST_SCORING_WORKERS,
+                MAX_CONCURRENT_ANALYSES,
+            )
             from services.backtest_service import BACKTEST_MODE as available_backtest_engine
 
             logger.info(
                 "Bulk backtest scoring%s: available_engine=%s, "
-                "MAX_CONCURRENT_ANALYSES=%s, API_RATE_LIMIT_DELAY=%s "
+                "MAX_CONCURRENT_ANALYSES=%s, API_RATE_LIMIT_DELAY=%s, "
+                "BACKTEST_SCORING_WORKERS=%s "
                 "(reliability profile: config/bulk_reliability.env.example)",
                 mode_info,
                 available_backtest_engine,
                 MAX_CONCURRENT_ANALYSES,
                 API_RATE_LIMIT_DELAY,
+                BACKTEST_SCORING_WORKERS,
             )
         except Exception:
             logger.info(f"Running backtest scoring analysis{mode_info}...")
@@ -631,7 +660,11 @@ def _process_results(results, enable_backtest_scoring=False, dip_mode=False, con
         # Config is already extracted above
 
         backtest_service = BacktestService(default_years_back=5, dip_mode=dip_mode)
-        results = backtest_service.add_backtest_scores_to_results(results, config=config)
+        results = backtest_service.add_backtest_scores_to_results(
+            results,
+            config=config,
+            on_result=result_stream.write if result_stream is not None else None,
+        )
         # Re-sort by priority score for better trading decisions
         results = [r for r in results if r is not None]  # Filter out None values
         results.sort(key=lambda x: -compute_trading_priority_score(x))
@@ -764,6 +797,9 @@ def _process_results(results, enable_backtest_scoring=False, dip_mode=False, con
             logger.warning(f"Failed to export final post-scored CSV: {e}")
     else:
         results = [r for r in results if r is not None]  # Filter out None values
+        if result_stream is not None:
+            for result in results:
+                result_stream.write(result)
         results.sort(key=lambda x: -compute_trading_priority_score(x))
 
     # Include both 'buy' and 'strong_buy' candidates, but exclude failed analysis
@@ -984,6 +1020,10 @@ def _process_results(results, enable_backtest_scoring=False, dip_mode=False, con
                 results[idx] = enriched_by_ticker[ticker]
         strong_buys = [enriched_by_ticker.get(r.get("ticker"), r) for r in strong_buys]
         buys = [enriched_by_ticker.get(r.get("ticker"), r) for r in buys]
+        if result_stream is not None:
+            # Supersedes the earlier line for these tickers (readers keep the last one)
+            for rec in all_recommendations:
+                result_stream.write(rec)
 
     # Create a set of strong_buy tickers for quick lookup
     strong_buy_tickers = {s.get("ticker") for s in strong_buys}
@@ -1165,10 +1205,24 @@ def _process_results(results, enable_backtest_scoring=False, dip_mode=False, con
     return results
 
 
-def _finalize_results(results, json_output_path: str | None = None):
+def _open_result_stream(ndjson_output_path: str | None) -> AnalysisResultStreamWriter | None:
+    """NDJSON writer for ``--ndjson-output`` (None when not requested or not writable)."""
+    if not ndjson_output_path:
+        return None
+    try:
+        return AnalysisResultStreamWriter(ndjson_output_path)
+    except OSError as e:
+        logger.warning(f"Failed to open analysis results stream {ndjson_output_path}: {e}")
+        return None
+
+
+def _finalize_results(results, json_output_path: str | None = None, result_stream=None):
     """Handle common post-processing (e.g., JSON export) and return results."""
     if json_output_path:
         _write_results_json(results, json_output_path)
+    if result_stream is not None:
+        # End-of-stream marker: tells readers the run completed
+        result_stream.close()
     return results
 
 
@@ -1226,6 +1280,14 @@ if __name__ == "__main__":
         type=str,
         help="Optional path to write analysis results as JSON for downstream services",
     )
+    parser.add_argument(
+        "--ndjson-output",
+        type=str,
+        help=(
+            "Optional path to stream analysis results as NDJSON, one line per ticker as soon "
+            "as it is scored (followed by an end-of-stream marker)"
+        ),
+    )
     parser.add_argument(
         "--ml",
         "--ml-enabled",
@@ -1298,6 +1360,7 @@ if __name__ == "__main__":
         dip_mode=getattr(args, "dip_mode", False),
         use_async=args.use_async,
         json_output_path=args.json_output,
+        ndjson_output_path=args.ndjson_output,
         user_id=user_id,
         db_session=db_session,
         enable_ml=getattr(args, "ml_enabled", False),
@@ -0,0 +1,44 @@
+"""
+Advisory inter-process file lock
+
+Lets several processes that share an on-disk store serialize their writes.
+"""
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def locked_file(path: Path, *, exclusive: bool) -> Iterator[None]:
+    """
+    Hold an advisory lock on ``path`` (flock on POSIX, msvcrt on Windows)
+
+    The lock file is created if missing. Locks are per open file, so a process
+    must not re-acquire a lock it already holds.
+
+    Args:
+        path: Lock file path
+        exclusive: Exclusive (writer) lock; otherwise shared (reader)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as handle:
+        if os.name == "nt":  # Windows has no shared locks; readers lock exclusively
+            import msvcrt  # noqa: PLC0415
+
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl  # noqa: PLC0415
+
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)